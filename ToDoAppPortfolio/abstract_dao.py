@@ -6,28 +6,38 @@ Demonstrates abstract classes and Dependency Inversion Principle:
 - Consistent interface across storage mechanisms (Week 6)
 - Support for all task types including PriorityTask
 - Polymorphic behavior for different storage backends
+- Loaded titles and descriptions deduplicated through a string pool
+- Owner storage (AbstractUserDAO, UserCsvDAO) kept alongside task storage
+- Append-mode CSV storage (TaskAppendCsvDAO) with background compaction
 
 Author: [IKENNA FRAKLIN EZEMA]
 """
 
 import csv
 import datetime
+import os
+import threading
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 from task import AbstractTask, Task, RecurringTask, PriorityTask
+from string_pool import StringPool, shared_pool
+from users import Owner
 
 
 class AbstractDAO(ABC):
     """Abstract base class for all DAO implementations - demonstrates Week 8 concepts."""
 
-    def __init__(self, storage_path: str) -> None:
+    def __init__(self, storage_path: str, string_pool: StringPool = shared_pool) -> None:
         """
         Initialize DAO with storage path.
         
         Args:
             storage_path: Path to the data storage location
+            string_pool: Pool deduplicating loaded titles and descriptions
         """
         self.storage_path = storage_path
+        self.string_pool = string_pool
+        self.announce = True  # Print a confirmation after each save (off for background saves)
     
     @abstractmethod
     def get_all_tasks(self) -> List[AbstractTask]:
@@ -44,15 +54,83 @@ class AbstractDAO(ABC):
         """
         Abstract method to save all tasks to storage.
         
+        Implementations let errors propagate, so callers such as the
+        controller, autosave and workspace eviction know the save failed.
+        
         Args:
             tasks: List of tasks to save
+            
+        Raises:
+            Exception: If the tasks could not be saved (e.g. OSError)
         """
         pass
     
+    def save_changes(self, tasks: List[AbstractTask], changes: List[Any]) -> None:
+        """
+        Save the tasks, knowing what changed since this DAO's previous save.
+        
+        DAOs that can store changes incrementally override this; the default
+        saves the whole list.
+        
+        Args:
+            tasks: Complete list of tasks, in list order
+            changes: Change records (see command_log) made since the previous
+                save through this DAO, in order
+            
+        Raises:
+            Exception: If the tasks could not be saved (e.g. OSError)
+        """
+        self.save_all_tasks(tasks)
+    
     def get_storage_info(self) -> str:
         """Get information about the storage location (common implementation)."""
         return f"{self.__class__.__name__} using: {self.storage_path}"
 
+    @staticmethod
+    def _restore_tasks(typed_rows: List[Tuple[str, tuple]], keep_placeholders: bool = False) -> List[AbstractTask]:
+        """
+        Rebuild tasks from trusted rows through the bulk restore path (common implementation).
+        
+        Rows are grouped by type so each type is validated once per batch, and
+        the tasks are returned in the original row order. If a batch fails
+        validation, its rows are restored one by one and the invalid ones skipped.
+        
+        Args:
+            typed_rows: (task type name, row for AbstractTask.restore_many) pairs
+            keep_placeholders: Return None for invalid rows instead of dropping them,
+                so the result lines up with typed_rows
+            
+        Returns:
+            List[AbstractTask]: Restored tasks in row order
+        """
+        task_classes = AbstractTask.registered_types()
+        batches: Dict[str, Tuple[List[int], List[tuple]]] = {}
+        for position, (task_type, row) in enumerate(typed_rows):
+            positions, rows = batches.setdefault(task_type, ([], []))
+            positions.append(position)
+            rows.append(row)
+        
+        restored: List[Any] = [None] * len(typed_rows)
+        for task_type, (positions, rows) in batches.items():
+            task_class = task_classes[task_type]
+            try:
+                tasks = task_class.restore_many(rows)
+            except ValueError:
+                # Rare: find the offending rows individually
+                tasks = []
+                for row in rows:
+                    try:
+                        tasks.extend(task_class.restore_many([row]))
+                    except ValueError as e:
+                        print(f"Error parsing task row: {e}")
+                        tasks.append(None)
+            for position, task in zip(positions, tasks):
+                restored[position] = task
+        
+        if keep_placeholders:
+            return restored
+        return [task for task in restored if task is not None]
+
 
 # TEST DAO IMPLEMENTATION
 
@@ -73,20 +151,21 @@ class TaskTestDAO(AbstractDAO):
             List[AbstractTask]: List of test tasks
         """
         # Create test tasks using all available task types
-        tasks = [
-            Task("Buy groceries", datetime.datetime.now() + datetime.timedelta(days=1), 
-                 "Weekly grocery shopping"),
-            Task("Complete assignment", datetime.datetime.now() + datetime.timedelta(days=3),
-                 "Finish the programming assignment"),
-            RecurringTask("Weekly team meeting", datetime.datetime.now() + datetime.timedelta(days=2),
-                         datetime.timedelta(days=7), "Regular team sync meeting"),
-            PriorityTask("Important client call", datetime.datetime.now() + datetime.timedelta(hours=4),
-                        3, "High priority client discussion"),
-            PriorityTask("Review documents", datetime.datetime.now() + datetime.timedelta(days=2),
-                        2, "Medium priority document review"),
-            PriorityTask("Organize desk", datetime.datetime.now() + datetime.timedelta(days=5),
-                        1, "Low priority office organization")
-        ]
+        now = AbstractTask.clock.now()
+        tasks = self._restore_tasks([
+            ("Task", ("Buy groceries", now + datetime.timedelta(days=1),
+                      "Weekly grocery shopping", now, False)),
+            ("Task", ("Complete assignment", now + datetime.timedelta(days=3),
+                      "Finish the programming assignment", now, False)),
+            ("RecurringTask", ("Weekly team meeting", now + datetime.timedelta(days=2),
+                               "Regular team sync meeting", now, False, datetime.timedelta(days=7), [])),
+            ("PriorityTask", ("Important client call", now + datetime.timedelta(hours=4),
+                              "High priority client discussion", now, False, 3)),
+            ("PriorityTask", ("Review documents", now + datetime.timedelta(days=2),
+                              "Medium priority document review", now, False, 2)),
+            ("PriorityTask", ("Organize desk", now + datetime.timedelta(days=5),
+                              "Low priority office organization", now, False, 1)),
+        ])
         
         print(f"Loaded {len(tasks)} test tasks from {self.storage_path}")
         return tasks
@@ -98,6 +177,8 @@ class TaskTestDAO(AbstractDAO):
         Args:
             tasks: List of tasks to save
         """
+        if not self.announce:
+            return
         print(f"Simulated saving {len(tasks)} tasks to {self.storage_path}")
         for i, task in enumerate(tasks, 1):
             status = "Completed" if task.completed else "Not Completed"
@@ -120,15 +201,109 @@ class TaskCsvDAO(AbstractDAO):
     including the new PriorityTask.
     """
     
-    def __init__(self, storage_path: str) -> None:
+    def __init__(self, storage_path: str, string_pool: StringPool = shared_pool) -> None:
         """Initialize CSV DAO with file path."""
-        super().__init__(storage_path)
+        super().__init__(storage_path, string_pool)
         # Define fieldnames for CSV structure including priority support
         self.fieldnames = [
             "title", "type", "date_due", "completed", "interval", 
             "completed_dates", "date_created", "description", "priority_level"
         ]
     
+    @staticmethod
+    def _parse_row(row: Dict[str, str], parse_date: Callable[[str], datetime.datetime],
+                   intern: Callable[[str], str]) -> Tuple[str, tuple]:
+        """
+        Convert a CSV row into a (task type, restore_many row) pair.
+        
+        Args:
+            row: CSV row keyed by field name
+            parse_date: Date parser (memoized by the caller)
+            intern: String deduplicator for titles and descriptions
+            
+        Returns:
+            Tuple[str, tuple]: Task type name and row for AbstractTask.restore_many
+            
+        Raises:
+            ValueError, KeyError: If the row is malformed
+        """
+        # Parse common task data
+        task_type = row["type"]
+        date_due = parse_date(row["date_due"])
+        date_created = parse_date(row["date_created"])
+        completed = row["completed"].lower() == 'true'
+        common = (intern(row["title"]), date_due, intern(row.get("description", "")),
+                  date_created, completed)
+        
+        # Parse type-specific data
+        if task_type == "PriorityTask":
+            type_fields = (int(row["priority_level"]),)
+            
+        elif task_type == "RecurringTask":
+            task_interval = row["interval"]
+            interval_days = int(task_interval.split()[0]) if task_interval else 7
+            completed_dates = [parse_date(date_str.strip())
+                               for date_str in row["completed_dates"].split(',') if date_str.strip()]
+            type_fields = (datetime.timedelta(days=interval_days), completed_dates)
+            
+        else:
+            task_type = "Task"  # Regular task
+            type_fields = ()
+        
+        return task_type, common + type_fields
+    
+    @staticmethod
+    def _format_row(task: AbstractTask) -> Dict[str, str]:
+        """
+        Convert a task into a CSV row keyed by field name.
+        
+        Args:
+            task: Task to convert
+            
+        Returns:
+            Dict[str, str]: CSV row
+        """
+        row = {}
+        
+        # Common fields
+        row["title"] = task.title
+        row["type"] = task.get_task_type()
+        row["date_due"] = task.date_due.strftime("%Y-%m-%d")
+        row["completed"] = str(task.completed)
+        row["date_created"] = task.date_created.strftime("%Y-%m-%d")
+        row["description"] = task.description
+        
+        # Type-specific fields
+        if isinstance(task, PriorityTask):
+            row["priority_level"] = str(task.priority_level)
+            row["interval"] = ""
+            row["completed_dates"] = ""
+            
+        elif isinstance(task, RecurringTask):
+            row["priority_level"] = ""
+            row["interval"] = str(task.interval.days)
+            row["completed_dates"] = ','.join([
+                date.strftime("%Y-%m-%d") for date in task.completed_dates
+            ])
+            
+        else:  # Regular Task
+            row["priority_level"] = ""
+            row["interval"] = ""
+            row["completed_dates"] = ""
+        
+        return row
+    
+    def _date_parser(self) -> Callable[[str], datetime.datetime]:
+        """Create a memoized parser for the CSV date format (files repeat dates heavily)."""
+        parsed_dates: Dict[str, datetime.datetime] = {}
+        
+        def parse_date(text: str) -> datetime.datetime:
+            parsed = parsed_dates.get(text)
+            if parsed is None:
+                parsed = parsed_dates[text] = datetime.datetime.strptime(text, "%Y-%m-%d")
+            return parsed
+        return parse_date
+    
     def get_all_tasks(self) -> List[AbstractTask]:
         """
         Load all tasks from CSV file including PriorityTask support.
@@ -139,62 +314,24 @@ class TaskCsvDAO(AbstractDAO):
         task_list = []
         
         try:
+            typed_rows: List[Tuple[str, tuple]] = []
+            parse_date = self._date_parser()
+            intern = self.string_pool.intern  # Titles and descriptions repeat too
+            parse_row = self._parse_row
+            
             with open(self.storage_path, 'r', encoding='utf-8') as file:
                 reader = csv.DictReader(file)
                 
                 for row in reader:
                     try:
-                        # Parse common task data
-                        task_type = row["type"]
-                        task_title = row["title"]
-                        task_date_due = row["date_due"]
-                        task_completed = row["completed"]
-                        task_date_created = row["date_created"]
-                        task_description = row.get("description", "")
-                        
-                        # Parse dates
-                        date_due = datetime.datetime.strptime(task_date_due, "%Y-%m-%d")
-                        date_created = datetime.datetime.strptime(task_date_created, "%Y-%m-%d")
-                        completed = task_completed.lower() == 'true'
-                        
-                        # Create task based on type
-                        if task_type == "PriorityTask":
-                            # Parse priority level
-                            priority_level = int(row["priority_level"])
-                            task = PriorityTask(task_title, date_due, priority_level, task_description)
-                            
-                        elif task_type == "RecurringTask":
-                            # Parse interval and completed dates
-                            task_interval = row["interval"]
-                            task_completed_dates = row["completed_dates"]
-                            
-                            interval_days = int(task_interval.split()[0]) if task_interval else 7
-                            interval = datetime.timedelta(days=interval_days)
-                            
-                            task = RecurringTask(task_title, date_due, interval, task_description)
-                            
-                            # Parse completed dates list
-                            if task_completed_dates:
-                                completed_dates_list = task_completed_dates.split(',')
-                                task.completed_dates = []
-                                for date_str in completed_dates_list:
-                                    if date_str.strip():
-                                        completed_date = datetime.datetime.strptime(date_str.strip(), "%Y-%m-%d")
-                                        task.completed_dates.append(completed_date)
-                        else:
-                            # Create regular task
-                            task = Task(task_title, date_due, task_description)
-                        
-                        # Set common properties
-                        task.date_created = date_created
-                        task.completed = completed
-                        
-                        task_list.append(task)
-                        
+                        typed_rows.append(parse_row(row, parse_date, intern))
                     except (ValueError, KeyError) as e:
                         print(f"Error parsing task row: {e}")
                         continue
             
+            # Build all tasks through the trusted bulk path, validated once per type
+            task_list = self._restore_tasks(typed_rows)
+            
             print(f"Loaded {len(task_list)} tasks from {self.storage_path}")
             
         except FileNotFoundError:
@@ -210,44 +347,533 @@ class TaskCsvDAO(AbstractDAO):
         
         Args:
             tasks: List of tasks to save to CSV
+            
+        Raises:
+            OSError: If the file cannot be written
+        """
+        with open(self.storage_path, 'w', newline='', encoding='utf-8') as file:
+            writer = csv.DictWriter(file, fieldnames=self.fieldnames)
+            writer.writeheader()
+            writer.writerows(map(self._format_row, tasks))
+        
+        if self.announce:
+            print(f"Saved {len(tasks)} tasks to {self.storage_path}")
+
+
+# APPEND-MODE CSV DAO IMPLEMENTATION
+
+
+class TaskAppendCsvDAO(TaskCsvDAO):
+    """
+    Append-optimized CSV DAO for large task files.
+    
+    Instead of rewriting the whole file, a save appends one row per change:
+    - a 'put' row with the full state of a new or edited task, keyed by its
+      id in the file (the first put of an id adds the task at the end of the
+      list, later ones override it in place)
+    - a 'delete' row (tombstone) for each removed task
+    
+    File ids are assigned by the DAO and mapped to the tasks' task_id, which
+    only identifies a task within one process. Loaded tasks keep the fresh
+    task_id they were restored with, so they never clash with tasks created
+    before the load.
+    
+    Saving after a single add or edit therefore writes one row, whatever the
+    size of the file. save_changes() finds the changed tasks from the
+    controller's command log in O(changes); save_all_tasks() compares the
+    version of every task instead. Superseded rows are dropped by compaction, which
+    rewrites the file from the latest save once it holds more than
+    compact_ratio rows per live task. Compaction runs in a background
+    thread; saves made meanwhile go to the old file and are replayed onto
+    the compacted one before it replaces the old file.
+    
+    The file stores the list order as the order in which task ids first
+    appear. A save whose task order no longer matches it (e.g. after undoing
+    a removal) rewrites the file instead of appending.
+    """
+    
+    OP_PUT = "put"
+    OP_DELETE = "delete"
+    
+    def __init__(self, storage_path: str, string_pool: StringPool = shared_pool,
+                 compact_ratio: float = 2.0, compact_min_rows: int = 1000,
+                 background_compaction: bool = True) -> None:
+        """
+        Initialize append-mode CSV DAO with file path.
+        
+        Args:
+            storage_path: Path to the CSV file
+            string_pool: Pool deduplicating loaded titles and descriptions
+            compact_ratio: File rows per live task that trigger a compaction
+            compact_min_rows: Files with fewer rows are never compacted
+            background_compaction: Compact in a background thread (False compacts during the save)
+        """
+        super().__init__(storage_path, string_pool)
+        self.fieldnames = self.fieldnames + ["task_id", "op"]
+        self.compact_ratio = compact_ratio
+        self.compact_min_rows = compact_min_rows
+        self.background_compaction = background_compaction
+        self._lock = threading.RLock()
+        self._saved: Dict[int, List[int]] = {}  # task_id -> [rank of first appearance, saved version, file id]
+        self._next_rank = 0
+        self._next_file_id = 1
+        self._file_rows = 0  # Data rows in the file, superseded ones included
+        self._needs_rewrite = True  # Until the file has been loaded or written in this format
+        self._rewrites = 0  # Incremented by every full rewrite, cancelling a running compaction
+        self._compactor: Optional[threading.Thread] = None
+        self._replay: Optional[List[Dict[str, str]]] = None  # Rows appended while compacting
+        self._metrics: Dict[str, int] = {"appended_rows": 0, "overrides": 0, "tombstones": 0,
+                                         "full_rewrites": 0, "compactions": 0}
+    
+    def get_all_tasks(self) -> List[AbstractTask]:
+        """
+        Load all tasks by replaying the file's put and delete rows.
+        
+        Plain CSV files written by TaskCsvDAO load as well; they are
+        converted to the append format by the first save.
+        
+        Returns:
+            List[AbstractTask]: List of tasks loaded from the file
         """
+        self.wait_for_compaction()
+        task_list: List[AbstractTask] = []
+        
         try:
-            with open(self.storage_path, 'w', newline='', encoding='utf-8') as file:
-                writer = csv.DictWriter(file, fieldnames=self.fieldnames)
-                writer.writeheader()
+            with self._lock:
+                live: Dict[int, Tuple[str, tuple]] = {}  # file id -> typed row, in order of first appearance
+                parse_date = self._date_parser()
+                intern = self.string_pool.intern
+                file_rows = 0
                 
-                for task in tasks:
-                    row = {}
-                    
-                    # Common fields
-                    row["title"] = task.title
-                    row["type"] = task.get_task_type()
-                    row["date_due"] = task.date_due.strftime("%Y-%m-%d")
-                    row["completed"] = str(task.completed)
-                    row["date_created"] = task.date_created.strftime("%Y-%m-%d")
-                    row["description"] = task.description
-                    
-                    # Type-specific fields
-                    if isinstance(task, PriorityTask):
-                        row["priority_level"] = str(task.priority_level)
-                        row["interval"] = ""
-                        row["completed_dates"] = ""
-                        
-                    elif isinstance(task, RecurringTask):
-                        row["priority_level"] = ""
-                        row["interval"] = str(task.interval.days)
-                        row["completed_dates"] = ','.join([
-                            date.strftime("%Y-%m-%d") for date in task.completed_dates
-                        ])
-                        
-                    else:  # Regular Task
-                        row["priority_level"] = ""
-                        row["interval"] = ""
-                        row["completed_dates"] = ""
+                with open(self.storage_path, 'r', encoding='utf-8') as file:
+                    reader = csv.DictReader(file)
+                    has_ids = "task_id" in (reader.fieldnames or [])
                     
-                    writer.writerow(row)
+                    for row in reader:
+                        file_rows += 1
+                        try:
+                            file_id = int(row["task_id"]) if has_ids else file_rows
+                            if row.get("op") == self.OP_DELETE:
+                                live.pop(file_id, None)
+                            else:
+                                live[file_id] = self._parse_row(row, parse_date, intern)
+                        except (ValueError, KeyError) as e:
+                            print(f"Error parsing task row: {e}")
+                            continue
+                
+                restored = self._restore_tasks(list(live.values()), keep_placeholders=True)
+                self._saved = {}
+                for file_id, task in zip(live, restored):
+                    if task is None:
+                        continue
+                    self._saved[task.task_id] = [len(task_list), task.version, file_id]
+                    task_list.append(task)
+                
+                self._next_rank = len(task_list)
+                self._next_file_id = max(live, default=0) + 1
+                self._file_rows = file_rows
+                self._needs_rewrite = not has_ids or restored.count(None) > 0
             
+            print(f"Loaded {len(task_list)} tasks from {self.storage_path}")
+            
+        except FileNotFoundError:
+            print(f"No existing task file found at {self.storage_path}. Starting with empty task list.")
+        except Exception as e:
+            print(f"Error loading tasks from {self.storage_path}: {e}")
+        
+        return task_list
+    
+    def _put_row(self, task: AbstractTask, file_id: int) -> Dict[str, str]:
+        """Format the put row of a task stored under a file id."""
+        row = self._format_row(task)
+        row["task_id"] = str(file_id)
+        row["op"] = self.OP_PUT
+        return row
+    
+    def save_all_tasks(self, tasks: List[AbstractTask]) -> None:
+        """
+        Save the tasks by appending rows for what changed since the last save.
+        
+        Args:
+            tasks: Complete list of tasks, in list order
+            
+        Raises:
+            OSError: If the file cannot be written
+        """
+        with self._lock:
+            appended = self._append_changes(tasks)
+        self._announce_save(tasks, appended)
+    
+    def save_changes(self, tasks: List[AbstractTask], changes: List[Any]) -> None:
+        """
+        Save the tasks by appending rows for the given changes only.
+        
+        This costs O(changes) instead of a scan of every task. If the changes
+        cannot be appended in place (a saved task was re-inserted, or the
+        list does not match the file plus the changes), the tasks are saved
+        as by save_all_tasks.
+        
+        Args:
+            tasks: Complete list of tasks, in list order
+            changes: Change records made since the previous save through this DAO
+            
+        Raises:
+            OSError: If the file cannot be written
+        """
+        with self._lock:
+            appended = self._append_feed(tasks, changes)
+            if appended is None:
+                appended = self._append_changes(tasks)
+        self._announce_save(tasks, appended)
+    
+    def _announce_save(self, tasks: List[AbstractTask], appended: Optional[int]) -> None:
+        """Print the confirmation of a save, unless announcing is off."""
+        if not self.announce:
+            return
+        if appended is None:
             print(f"Saved {len(tasks)} tasks to {self.storage_path}")
+        else:
+            print(f"Saved {len(tasks)} tasks to {self.storage_path} ({appended} rows appended)")
+    
+    def _append_changes(self, tasks: List[AbstractTask]) -> Optional[int]:
+        """
+        Append the rows describing the changes since the last save; caller holds the lock.
+        
+        Returns:
+            Optional[int]: Number of appended rows, or None if the file was rewritten
+        """
+        if self._needs_rewrite:
+            self._rewrite(tasks)
+            return None
+        
+        saved = self._saved
+        changed: List[AbstractTask] = []
+        added = 0
+        last_rank = -1
+        for task in tasks:
+            entry = saved.get(task.task_id)
+            if entry is None:
+                added += 1
+                changed.append(task)
+            elif added or entry[0] < last_rank:
+                # An existing task after a new one, or out of order: the file order no longer fits
+                self._rewrite(tasks)
+                return None
+            else:
+                last_rank = entry[0]
+                if entry[1] != task.version:
+                    changed.append(task)
+        
+        file_ids = [saved[task.task_id][2] if task.task_id in saved else None for task in changed]
+        next_file_id = self._next_file_id
+        for position, file_id in enumerate(file_ids):
+            if file_id is None:
+                file_ids[position] = next_file_id
+                next_file_id += 1
+        rows = [self._put_row(task, file_id) for task, file_id in zip(changed, file_ids)]
+        self._metrics["overrides"] += len(changed) - added
+        removed: List[int] = []
+        if len(saved) + added != len(tasks):  # Some saved tasks are gone
+            present = {task.task_id for task in tasks}
+            removed = [task_id for task_id in saved if task_id not in present]
+            rows.extend({"task_id": str(saved[task_id][2]), "op": self.OP_DELETE} for task_id in removed)
+        
+        if rows:
+            with open(self.storage_path, 'a', newline='', encoding='utf-8') as file:
+                csv.DictWriter(file, fieldnames=self.fieldnames, restval="").writerows(rows)
+            for task_id in removed:
+                del saved[task_id]
+            self._metrics["tombstones"] += len(removed)
+            for task, file_id in zip(changed, file_ids):
+                entry = saved.get(task.task_id)
+                if entry is None:
+                    saved[task.task_id] = [self._next_rank, task.version, file_id]
+                    self._next_rank += 1
+                else:
+                    entry[1] = task.version
+            self._next_file_id = next_file_id
+            self._file_rows += len(rows)
+            self._metrics["appended_rows"] += len(rows)
+            if self._replay is not None:
+                self._replay.extend(rows)
+        
+        if self._should_compact():
+            self._start_compaction(tasks)
+        return len(rows)
+    
+    def _append_feed(self, tasks: List[AbstractTask], changes: List[Any]) -> Optional[int]:
+        """
+        Append the rows for a list of changes; caller holds the lock.
+        
+        New tasks must be the last ones in the list, and saved tasks must not
+        have moved, which holds unless a saved task was added again (undoing
+        its removal). Edited tasks are written from the frozen state their
+        latest change recorded.
+        
+        Returns:
+            Optional[int]: Number of appended rows, or None if the changes
+            cannot be appended in place
+        """
+        if self._needs_rewrite:
+            return None
+        
+        saved = self._saved
+        latest: Dict[int, Any] = {}  # task_id -> latest change of the task
+        for change in changes:
+            task_id = change.task.task_id
+            if change.kind == "add" and task_id in saved:
+                return None  # Re-inserted, possibly at another position
+            latest[task_id] = change
+        
+        removed = [task_id for task_id, change in latest.items() if change.kind == "remove" and task_id in saved]
+        added = [task_id for task_id, change in latest.items() if change.kind != "remove" and task_id not in saved]
+        new_tasks = tasks[len(tasks) - len(added):] if added else []
+        if (len(saved) - len(removed) + len(added) != len(tasks)
+                or {task.task_id for task in new_tasks} != set(added)):
+            return None  # The list is not the file plus these changes
+        edited = [change.after for task_id, change in latest.items()
+                  if task_id in saved and change.kind != "remove" and change.after is not None
+                  and change.after.version != saved[task_id][1]]
+        
+        next_file_id = self._next_file_id
+        rows = [self._put_row(state, saved[state.task_id][2]) for state in edited]
+        rows.extend(self._put_row(task, file_id) for file_id, task in enumerate(new_tasks, next_file_id))
+        rows.extend({"task_id": str(saved[task_id][2]), "op": self.OP_DELETE} for task_id in removed)
+        if rows:
+            with open(self.storage_path, 'a', newline='', encoding='utf-8') as file:
+                csv.DictWriter(file, fieldnames=self.fieldnames, restval="").writerows(rows)
+            for state in edited:
+                saved[state.task_id][1] = state.version
+            for file_id, task in enumerate(new_tasks, next_file_id):
+                saved[task.task_id] = [self._next_rank, task.version, file_id]
+                self._next_rank += 1
+            for task_id in removed:
+                del saved[task_id]
+            self._next_file_id = next_file_id + len(new_tasks)
+            self._file_rows += len(rows)
+            self._metrics["appended_rows"] += len(rows)
+            self._metrics["overrides"] += len(edited)
+            self._metrics["tombstones"] += len(removed)
+            if self._replay is not None:
+                self._replay.extend(rows)
+        
+        if self._should_compact():
+            self._start_compaction(tasks)
+        return len(rows)
+    
+    def _write_file(self, path: str, tasks: List[AbstractTask], file_ids: Sequence[int]) -> None:
+        """Write a complete file holding one put row per task."""
+        with open(path, 'w', newline='', encoding='utf-8') as file:
+            writer = csv.DictWriter(file, fieldnames=self.fieldnames)
+            writer.writeheader()
+            writer.writerows(map(self._put_row, tasks, file_ids))
+    
+    def _rewrite(self, tasks: List[AbstractTask]) -> None:
+        """Replace the file with one put row per task, numbering file ids afresh; caller holds the lock."""
+        temporary_path = self.storage_path + ".tmp"
+        try:
+            self._write_file(temporary_path, tasks, range(1, len(tasks) + 1))
+            os.replace(temporary_path, self.storage_path)
+        except BaseException:
+            if os.path.isfile(temporary_path):
+                os.remove(temporary_path)  # Leave no partial file behind
+            raise
+        self._saved = {task.task_id: [rank, task.version, rank + 1] for rank, task in enumerate(tasks)}
+        self._next_rank = len(tasks)
+        self._next_file_id = len(tasks) + 1
+        self._file_rows = len(tasks)
+        self._needs_rewrite = False
+        self._rewrites += 1
+        self._replay = None  # Any running compaction is now obsolete
+        self._metrics["full_rewrites"] += 1
+    
+    def _should_compact(self) -> bool:
+        """Check whether superseded rows outweigh live ones; caller holds the lock."""
+        return (self._compactor is None and self._file_rows >= self.compact_min_rows
+                and self._file_rows > self.compact_ratio * max(1, len(self._saved)))
+    
+    def _start_compaction(self, tasks: List[AbstractTask]) -> None:
+        """Compact the file from a save's task list, in the background if enabled; caller holds the lock."""
+        tasks = list(tasks)
+        file_ids = [self._saved[task.task_id][2] for task in tasks]  # The save just stored every task
+        self._replay = []
+        if not self.background_compaction:
+            self._compact(tasks, file_ids, self._rewrites)
+            return
+        self._compactor = threading.Thread(target=self._compact, args=(tasks, file_ids, self._rewrites),
+                                           name="csv-compaction", daemon=True)
+        self._compactor.start()
+    
+    def _compact(self, tasks: List[AbstractTask], file_ids: List[int], generation: int) -> None:
+        """
+        Rewrite the file without superseded rows, then swap it in.
+        
+        The bulk of the writing happens without the lock. Rows appended in
+        the meantime are replayed onto the new file under the lock, so the
+        swap loses nothing.
+        """
+        temporary_path = self.storage_path + ".compact"
+        try:
+            self._write_file(temporary_path, tasks, file_ids)
+            with self._lock:
+                if generation != self._rewrites or self._replay is None:
+                    os.remove(temporary_path)  # A full rewrite superseded this compaction
+                    return
+                replay = self._replay
+                if replay:
+                    with open(temporary_path, 'a', newline='', encoding='utf-8') as file:
+                        csv.DictWriter(file, fieldnames=self.fieldnames, restval="").writerows(replay)
+                os.replace(temporary_path, self.storage_path)
+                
+                # Ranks follow the new file: compacted tasks first, then ids first put since
+                ranks = {file_id: rank for rank, file_id in enumerate(file_ids)}
+                for row in replay:
+                    file_id = int(row["task_id"])
+                    if row["op"] == self.OP_PUT and file_id not in ranks:
+                        ranks[file_id] = len(ranks)
+                for entry in self._saved.values():
+                    entry[0] = ranks[entry[2]]
+                self._next_rank = len(ranks)
+                self._file_rows = len(tasks) + len(replay)
+                self._metrics["compactions"] += 1
+        except Exception as e:
+            print(f"Error compacting {self.storage_path}: {e}")
+        finally:
+            with self._lock:
+                self._replay = None
+                self._compactor = None
+    
+    def wait_for_compaction(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until a running background compaction has finished.
+        
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+            
+        Returns:
+            bool: True if no compaction is running any more
+        """
+        compactor = self._compactor
+        if compactor is not None:
+            compactor.join(timeout)
+            return not compactor.is_alive()
+        return True
+    
+    def get_metrics(self) -> Dict[str, int]:
+        """
+        Get append and compaction statistics.
+        
+        Returns:
+            Dict[str, int]: Appended rows, overrides, tombstones, full rewrites,
+            compactions, live tasks and rows in the file
+        """
+        with self._lock:
+            metrics = dict(self._metrics)
+            metrics["live_tasks"] = len(self._saved)
+            metrics["file_rows"] = self._file_rows
+        return metrics
+
+
+# USER DAO IMPLEMENTATIONS
+
+
+class AbstractUserDAO(ABC):
+    """Abstract base class for storing owners, kept alongside the task DAOs."""
+
+    def __init__(self, storage_path: str) -> None:
+        """
+        Initialize DAO with storage path.
+        
+        Args:
+            storage_path: Path to the data storage location
+        """
+        self.storage_path = storage_path
+    
+    @abstractmethod
+    def get_all_owners(self) -> List[Owner]:
+        """
+        Abstract method to retrieve all owners from storage.
+        
+        Returns:
+            List[Owner]: List of all owners from storage
+        """
+        pass
+    
+    @abstractmethod
+    def save_all_owners(self, owners: List[Owner]) -> None:
+        """
+        Abstract method to save all owners to storage.
+        
+        Args:
+            owners: List of owners to save
+            
+        Raises:
+            OSError: If the storage cannot be written
+        """
+        pass
+
+
+class UserCsvDAO(AbstractUserDAO):
+    """CSV file DAO for owners, one row per owner."""
+    
+    def __init__(self, storage_path: str) -> None:
+        """Initialize CSV DAO with file path."""
+        super().__init__(storage_path)
+        self.fieldnames = ["name", "email", "date_joined", "permissions", "tasks_created"]
+    
+    def get_all_owners(self) -> List[Owner]:
+        """
+        Load all owners from CSV file.
+        
+        Returns:
+            List[Owner]: List of owners loaded from CSV file
+        """
+        owners = []
+        
+        try:
+            with open(self.storage_path, 'r', encoding='utf-8') as file:
+                reader = csv.DictReader(file)
+                
+                for row in reader:
+                    try:
+                        owner = Owner(row["name"], row["email"])
+                        owner.date_joined = datetime.datetime.strptime(row["date_joined"], "%Y-%m-%d %H:%M:%S")
+                        owner.permissions = [permission for permission in row["permissions"].split(',') if permission]
+                        owner.tasks_created = int(row["tasks_created"] or 0)
+                        owners.append(owner)
+                        
+                    except (ValueError, KeyError, AttributeError) as e:
+                        print(f"Error parsing owner row: {e}")
+                        continue
+            
+            print(f"Loaded {len(owners)} owners from {self.storage_path}")
             
+        except FileNotFoundError:
+            print(f"No existing owner file found at {self.storage_path}. Starting with no owners.")
         except Exception as e:
-            print(f"Error saving tasks to {self.storage_path}: {e}")
+            print(f"Error loading owners from {self.storage_path}: {e}")
+        
+        return owners
+    
+    def save_all_owners(self, owners: List[Owner]) -> None:
+        """
+        Save all owners to CSV file.
+        
+        Args:
+            owners: List of owners to save to CSV
+            
+        Raises:
+            OSError: If the file cannot be written
+        """
+        with open(self.storage_path, 'w', newline='', encoding='utf-8') as file:
+            writer = csv.DictWriter(file, fieldnames=self.fieldnames)
+            writer.writeheader()
+            writer.writerows({
+                "name": owner.name,
+                "email": owner.email,
+                "date_joined": owner.date_joined.strftime("%Y-%m-%d %H:%M:%S"),
+                "permissions": ','.join(owner.permissions),
+                "tasks_created": str(owner.tasks_created),
+            } for owner in owners)
+        
+        print(f"Saved {len(owners)} owners to {self.storage_path}")
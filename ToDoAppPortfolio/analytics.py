@@ -0,0 +1,255 @@
+"""
+Analytics Module - Portfolio Quality Implementation
+
+This module answers reporting questions over whole task lists with NumPy,
+instead of looping over AbstractTask objects in Python for every question.
+
+The analytics provide:
+- A one-pass export of the tasks into column arrays (datetime64 due
+  dates, completion flags, type codes and priority levels)
+- Tasks due per day over a horizon, as a histogram
+- A burndown series of open tasks still scheduled after each day
+- Completion rates per week of the due date
+- Totals, completion and overdue rates per task type
+
+NumPy is an optional dependency: the rest of the application runs without
+it, and creating a TaskAnalytics without it raises an ImportError that
+explains how to install it.
+
+Classes:
+- TaskAnalytics: Column arrays of a task population and the vectorized reports
+
+Author: [Moses Gana]
+Date: 2024
+Version: 8.0 (Portfolio Quality with PriorityTask Support)
+"""
+
+
+# IMPORTS
+
+
+import datetime  # For report start dates and date conversion
+from typing import Any, Dict, Iterable, Optional, Sequence, Tuple  # For type hints
+from task import AbstractTask, PriorityTask  # Import task classes
+
+try:
+    import numpy as np  # For vectorized analytics (optional dependency)
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None
+
+
+# Reference point for converting datetimes to datetime64 seconds
+_EPOCH = datetime.datetime(1970, 1, 1)
+_SECOND = datetime.timedelta(seconds=1)
+
+
+# HELPER FUNCTIONS
+
+
+def numpy_available() -> bool:
+    """Check whether NumPy can be imported."""
+    return np is not None
+
+
+def _require_numpy() -> None:
+    """
+    Raise a helpful error if NumPy is missing.
+
+    Raises:
+        ImportError: If NumPy is not installed
+    """
+    if np is None:
+        raise ImportError("Task analytics require NumPy. Install it with: pip install numpy")
+
+
+def _datetime_column(values: Iterable[datetime.datetime], count: int) -> "np.ndarray":
+    """
+    Convert naive datetimes to a datetime64[s] array.
+
+    NumPy converts datetime objects at several microseconds each, and due
+    dates repeat heavily, so each distinct value is converted once (with
+    integer timedelta arithmetic) and the column is gathered by index.
+
+    Args:
+        values (Iterable[datetime.datetime]): Datetimes to convert
+        count (int): Number of values
+
+    Returns:
+        np.ndarray: The datetimes truncated to whole seconds
+    """
+    distinct: Dict[datetime.datetime, int] = {}
+    codes = np.fromiter((distinct.setdefault(value, len(distinct)) for value in values),
+                        dtype=np.int64, count=count)
+    seconds = np.fromiter(((value - _EPOCH) // _SECOND for value in distinct),
+                          dtype=np.int64, count=len(distinct))
+    return seconds.astype("datetime64[s]")[codes]
+
+
+# TASK ANALYTICS CLASS DEFINITION
+
+
+class TaskAnalytics:
+    """
+    Column arrays of a task population and the reports computed from them.
+
+    The export costs one pass over the tasks; every report afterwards is a
+    handful of vectorized NumPy operations. The arrays are a copy: create a
+    new TaskAnalytics to see later changes to the tasks.
+
+    Attributes:
+        type_names (Tuple[str, ...]): Task type name for each type code
+        due (np.ndarray): Due dates, datetime64[s]
+        completed (np.ndarray): Completion flags, bool
+        type_codes (np.ndarray): Index into type_names, int8
+        priority (np.ndarray): Priority level, 0 for non-priority tasks, int8
+    """
+
+    def __init__(self, tasks: Sequence[AbstractTask], now: Optional[datetime.datetime] = None) -> None:
+        """
+        Export tasks into column arrays.
+
+        Args:
+            tasks (Sequence[AbstractTask]): Tasks to analyze, e.g. a TaskList snapshot
+            now (Optional[datetime.datetime]): Reference time (AbstractTask.clock if None)
+
+        Raises:
+            ImportError: If NumPy is not installed
+        """
+        _require_numpy()
+        count = len(tasks)
+        self.now = now if now is not None else AbstractTask.clock.now()
+        self.type_names: Tuple[str, ...] = tuple(AbstractTask.registered_types())
+        codes = {name: code for code, name in enumerate(self.type_names)}
+
+        self.due = _datetime_column((task.date_due for task in tasks), count)
+        self.completed = np.fromiter((task.completed for task in tasks), dtype=bool, count=count)
+        self.type_codes = np.fromiter((codes[task.TASK_TYPE] for task in tasks), dtype=np.int8, count=count)
+        self.priority = np.fromiter((getattr(task, "priority_level", 0) for task in tasks),
+                                    dtype=np.int8, count=count)
+
+    @classmethod
+    def from_task_list(cls, task_list: Any, now: Optional[datetime.datetime] = None) -> "TaskAnalytics":
+        """
+        Export the current contents of a TaskList.
+
+        Args:
+            task_list (TaskList): List to analyze
+            now (Optional[datetime.datetime]): Reference time (AbstractTask.clock if None)
+
+        Returns:
+            TaskAnalytics: Analytics over a snapshot of the list
+        """
+        return cls(task_list.snapshot(), now)
+
+    def __len__(self) -> int:
+        """Get the number of exported tasks."""
+        return len(self.due)
+
+    def _start_day(self, start: Optional[datetime.date]) -> "np.datetime64":
+        """Get a report's first day (today by default) as datetime64[D]."""
+        return np.datetime64(start if start is not None else self.now.date(), "D")
+
+    def due_histogram(self, days: int = 90, start: Optional[datetime.date] = None,
+                      include_completed: bool = False) -> Tuple["np.ndarray", "np.ndarray"]:
+        """
+        Count the tasks due on each day of a horizon.
+
+        Args:
+            days (int): Number of days in the horizon
+            start (Optional[datetime.date]): First day (today if None)
+            include_completed (bool): Also count completed tasks
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Days (datetime64[D]) and task counts per day
+        """
+        first = self._start_day(start)
+        offsets = (self.due.astype("datetime64[D]") - first).astype(np.int64)
+        mask = (offsets >= 0) & (offsets < days)
+        if not include_completed:
+            mask &= ~self.completed
+        counts = np.bincount(offsets[mask], minlength=days)
+        return first + np.arange(days), counts
+
+    def burndown(self, days: int = 90, start: Optional[datetime.date] = None) -> Tuple["np.ndarray", "np.ndarray"]:
+        """
+        Count the open tasks still scheduled after each day of a horizon.
+
+        The series starts with every open task due on or after the first
+        day and drops by the tasks due on each day, as if every task were
+        finished on its due date. Tasks that are already overdue are not
+        included.
+
+        Args:
+            days (int): Number of days in the horizon
+            start (Optional[datetime.date]): First day (today if None)
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Days (datetime64[D]) and open tasks remaining at the end of each
+        """
+        first = self._start_day(start)
+        scheduled = int(np.count_nonzero(~self.completed & (self.due.astype("datetime64[D]") >= first)))
+        dates, due_per_day = self.due_histogram(days, start)
+        return dates, scheduled - np.cumsum(due_per_day)
+
+    def weekly_completion(self) -> Dict[str, "np.ndarray"]:
+        """
+        Compute the completion rate per week of the due date.
+
+        Weeks start on Monday; only weeks with at least one task are reported.
+
+        Returns:
+            Dict[str, np.ndarray]: 'week' (Monday, datetime64[D]), 'total', 'completed'
+            and 'rate' (completed / total), sorted by week
+        """
+        day_numbers = self.due.astype("datetime64[D]").astype(np.int64)
+        mondays = day_numbers - (day_numbers + 3) % 7  # 1970-01-01 was a Thursday
+        weeks, week_index = np.unique(mondays, return_inverse=True)
+        totals = np.bincount(week_index, minlength=len(weeks))
+        completed = np.bincount(week_index, weights=self.completed, minlength=len(weeks)).astype(np.int64)
+        return {
+            "week": weeks.astype("datetime64[D]"),
+            "total": totals,
+            "completed": completed,
+            "rate": completed / np.maximum(totals, 1),
+        }
+
+    def type_rates(self) -> Dict[str, Dict[str, float]]:
+        """
+        Compute totals, completion and overdue rates per task type.
+
+        Returns:
+            Dict[str, Dict[str, float]]: Type name -> 'total', 'completed', 'overdue',
+            'completion_rate' and 'overdue_rate' (types without tasks are omitted)
+        """
+        kinds = len(self.type_names)
+        overdue_mask = ~self.completed & (self.due < np.datetime64(self.now, "s"))
+        totals = np.bincount(self.type_codes, minlength=kinds)
+        completed = np.bincount(self.type_codes, weights=self.completed, minlength=kinds)
+        overdue = np.bincount(self.type_codes, weights=overdue_mask, minlength=kinds)
+
+        rates: Dict[str, Dict[str, float]] = {}
+        for code, name in enumerate(self.type_names):
+            total = int(totals[code])
+            if total:
+                rates[name] = {
+                    "total": total,
+                    "completed": int(completed[code]),
+                    "overdue": int(overdue[code]),
+                    "completion_rate": float(completed[code]) / total,
+                    "overdue_rate": float(overdue[code]) / total,
+                }
+        return rates
+
+    def priority_counts(self, include_completed: bool = False) -> Dict[int, int]:
+        """
+        Count priority tasks per priority level.
+
+        Args:
+            include_completed (bool): Also count completed tasks
+
+        Returns:
+            Dict[int, int]: Priority level -> number of tasks, for every valid level
+        """
+        levels = self.priority if include_completed else self.priority[~self.completed]
+        counts = np.bincount(levels, minlength=max(PriorityTask.get_valid_priority_levels()) + 1)
+        return {level: int(counts[level]) for level in PriorityTask.get_valid_priority_levels()}
@@ -0,0 +1,203 @@
+"""
+Autosave Module - Portfolio Quality Implementation
+
+This module saves a controller's tasks in the background, so interactive
+edits never wait for the disk.
+
+The autosave scheduler provides:
+- A worker thread fed by the controller's mutation notifications
+- Debouncing: a burst of edits is coalesced into a single save
+- A maximum delay, bounding how much work is at risk after a crash
+- A bounded notification queue; overflow triggers an immediate save
+  instead of blocking the editing thread (backpressure)
+- Saves from consistent snapshots, so editing continues during a save
+- Failed saves keep the changes pending and are retried every
+  max_delay_seconds; each failure is reported to an optional callback
+  (the UI shows it before the next menu) instead of being printed
+
+Classes:
+- AutosaveScheduler: Debounced background saver for a TaskManagerController
+
+Author: [Moses Gana]
+Date: 2024
+Version: 8.0 (Portfolio Quality with PriorityTask Support)
+"""
+
+
+# IMPORTS
+
+
+import queue  # For the bounded notification queue
+import threading  # For the worker thread
+import time  # For debounce and deadline timing
+from typing import Any, Callable, Dict, Optional  # For type hints
+
+
+# Sentinel placed on the queue to stop the worker
+_STOP = object()
+
+
+# AUTOSAVE SCHEDULER CLASS DEFINITION
+
+
+class AutosaveScheduler:
+    """
+    Debounced background saver for a TaskManagerController.
+
+    After the first unsaved mutation, the scheduler waits until no further
+    mutations arrive for debounce_seconds, but never longer than
+    max_delay_seconds, then saves a snapshot through the controller's DAO.
+    At most max_delay_seconds of edits (plus one save) are therefore at risk.
+
+    Mutation notifications never block: when the queue is full, the
+    notification is dropped (the pending save covers it anyway) and the
+    worker is told to save immediately.
+    """
+
+    def __init__(self, controller, debounce_seconds: float = 2.0,
+                 max_delay_seconds: float = 10.0, max_pending: int = 1000,
+                 on_failure: Optional[Callable[[str], None]] = None) -> None:
+        """
+        Initialize the scheduler (call start() to begin saving).
+
+        Args:
+            controller (TaskManagerController): Controller whose tasks are saved
+            debounce_seconds (float): Quiet period that triggers a save
+            max_delay_seconds (float): Longest time a mutation may stay unsaved,
+                and the interval between retries of a failed save
+            max_pending (int): Capacity of the notification queue
+            on_failure (Optional[Callable[[str], None]]): Called with the error
+                message of each failed save; must not block
+        """
+        self.controller = controller
+        self.debounce_seconds = debounce_seconds
+        self.max_delay_seconds = max_delay_seconds
+        self.on_failure = on_failure
+        self.last_error: Optional[str] = None  # Message of the latest failed save, if it has not succeeded since
+        self._events: "queue.Queue[object]" = queue.Queue(maxsize=max_pending)
+        self._overflow = threading.Event()
+        self._save_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._dirty = False
+        self._metrics: Dict[str, int] = {
+            "mutations": 0, "saves": 0, "coalesced": 0, "overflows": 0, "skipped": 0, "failures": 0
+        }
+
+    def start(self) -> None:
+        """Start the background worker thread."""
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="autosave", daemon=True)
+            self._thread.start()
+
+    def stop(self, flush: bool = True) -> None:
+        """
+        Stop the worker thread.
+
+        Args:
+            flush (bool): Save any pending changes before returning
+        """
+        if self._thread is not None and self._thread.is_alive():
+            self._events.put(_STOP)  # The worker drains the queue, so this wait is short
+            self._thread.join()
+        self._thread = None
+        if flush and self._dirty:
+            self.flush_now()
+
+    def notify(self, kind: str = "mutation", task: Optional[Any] = None) -> None:
+        """
+        Record a mutation without blocking the caller.
+
+        Loads are ignored: the loaded tasks are already in storage.
+
+        Args:
+            kind (str): Name of the mutating operation
+            task (Optional[Any]): Affected task (unused; every save writes all tasks)
+        """
+        if kind == "load":
+            return
+        self._metrics["mutations"] += 1
+        self._dirty = True
+        try:
+            self._events.put_nowait(kind)
+        except queue.Full:
+            self._metrics["overflows"] += 1
+            self._overflow.set()
+
+    def flush_now(self, announce: bool = True) -> bool:
+        """
+        Save pending changes immediately on the calling thread.
+
+        Args:
+            announce (bool): Let the DAO print its confirmation (the worker
+                thread saves silently)
+
+        Returns:
+            bool: True if the tasks were saved
+        """
+        with self._save_lock:
+            if self.controller.dao is None:
+                self._metrics["skipped"] += 1  # Nowhere to save yet; stay dirty
+                return False
+
+            self._dirty = False
+            success, message = self.controller.save_snapshot(self.controller.take_snapshot(), announce)
+            if success:
+                self._metrics["saves"] += 1
+                self.last_error = None
+            else:
+                self._dirty = True
+                self._metrics["failures"] += 1
+                self.last_error = message
+        if not success and self.on_failure is not None:
+            self.on_failure(message)
+        return success
+
+    def _run(self) -> None:
+        """Worker loop: wait for a mutation, debounce the burst, then save."""
+        retry = False  # A save failed; try again after max_delay_seconds even without mutations
+        while True:
+            try:
+                event = self._events.get(timeout=self.max_delay_seconds if retry else None)
+            except queue.Empty:
+                event = None
+            if event is _STOP:
+                return
+
+            deadline = time.monotonic() + self.max_delay_seconds
+            stop = False
+
+            # Coalesce further mutations until a quiet period or the deadline
+            while event is not None and not self._overflow.is_set():
+                timeout = min(self.debounce_seconds, deadline - time.monotonic())
+                if timeout <= 0:
+                    break
+                try:
+                    event = self._events.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if event is _STOP:
+                    stop = True
+                    break
+                self._metrics["coalesced"] += 1
+
+            self._overflow.clear()
+            retry = False
+            if self._dirty:
+                retry = not self.flush_now(announce=False) and self.last_error is not None
+            if stop:
+                return
+
+    @property
+    def pending(self) -> bool:
+        """Check whether there are mutations not yet saved."""
+        return self._dirty
+
+    def get_metrics(self) -> Dict[str, int]:
+        """
+        Get autosave statistics.
+
+        Returns:
+            Dict[str, int]: Mutations seen, saves, coalesced notifications,
+            queue overflows, skipped saves (no DAO) and failed saves
+        """
+        return dict(self._metrics)
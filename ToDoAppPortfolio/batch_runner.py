@@ -0,0 +1,269 @@
+"""
+Batch Runner Module - Portfolio Quality Implementation
+
+This module implements a non-interactive front end for the ToDo application,
+so the controller can be driven from scripts and scheduled jobs.
+
+The batch runner provides:
+- Line-based command scripts read from a file or standard input
+- Execution through TaskManagerController (same business logic as the UI)
+- A single load before the first command and a single save after the last
+- Suppression of per-task console feedback for fast bulk runs
+
+Command syntax (one command per line, POSIX shell quoting as in shlex.split,
+'#' for comments; "" passes an empty argument):
+    add task "<title>" <YYYY-MM-DD> ["<description>"]
+    add recurring "<title>" <YYYY-MM-DD> <interval days> ["<description>"]
+    add priority "<title>" <YYYY-MM-DD> <level 1-3> ["<description>"]
+    complete <task number>
+    remove <task number>
+    edit <task number> title|date|description|priority "<value>"
+    list [uncompleted|overdue|priority]
+    undo
+    redo
+    save
+
+Classes:
+- BatchCommandRunner: Executes command scripts against a controller
+
+Author: [Moses Gana]
+Date: 2024
+Version: 8.0 (Portfolio Quality with PriorityTask Support)
+"""
+
+
+# IMPORTS
+
+
+import contextlib  # For silencing model-layer console feedback
+import datetime  # For date parsing
+import os  # For the null output device
+import re  # For splitting quoted command lines
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple  # For type hints
+from task_manager_controller import TaskManagerController  # Import controller
+
+
+# One piece of a command line: whitespace between arguments, unquoted text,
+# a double-quoted string (where backslash escapes only \ and "), a
+# single-quoted string, a backslash-escaped character, or an unmatched quote
+# or trailing backslash
+_COMMAND_PART = re.compile(r'''(\s+)|([^\s'"\\]+)|"((?:[^"\\]|\\.)*)"|'([^']*)'|\\(.)|(.)''', re.S)
+_DOUBLE_QUOTED_ESCAPE = re.compile(r'\\([\\"])')
+
+
+# HELPER FUNCTIONS
+
+
+@contextlib.contextmanager
+def model_output(verbose: bool = False) -> Iterator[None]:
+    """
+    Redirect the model layer's per-task print calls unless verbose.
+
+    Args:
+        verbose (bool): Leave console output untouched
+    """
+    if verbose:
+        yield
+        return
+    with open(os.devnull, "w", encoding="utf-8") as null_output:
+        with contextlib.redirect_stdout(null_output):
+            yield
+
+
+# BATCH COMMAND RUNNER CLASS DEFINITION
+
+
+class BatchCommandRunner:
+    """
+    Executes scripted commands against a TaskManagerController.
+
+    This class demonstrates:
+    - Single Responsibility Principle (only parses and dispatches commands)
+    - Separation of concerns (business logic stays in the controller)
+    - Exception handling per command, so one bad line does not stop the run
+
+    Persistence is deliberately kept out of the command loop: tasks are
+    loaded once before the first command and saved once after the last.
+    """
+
+    def __init__(self, controller: TaskManagerController, output: TextIO,
+                 verbose: bool = False) -> None:
+        """
+        Initialize the runner.
+
+        Args:
+            controller (TaskManagerController): Controller that executes the commands
+            output (TextIO): Stream for command results and error reports
+            verbose (bool): Keep the model layer's per-task console feedback
+        """
+        self.controller = controller
+        self.output = output
+        self.verbose = verbose
+        self.save_requested = False
+        self.errors = 0
+        self._parsed_dates: Dict[str, datetime.datetime] = {}  # Scripts repeat dates heavily
+        self._commands: Dict[str, Callable[[List[str]], Tuple[bool, str]]] = {
+            "add": self._add,
+            "complete": self._complete,
+            "remove": self._remove,
+            "edit": self._edit,
+            "list": self._list,
+            "save": self._save,
+            "undo": lambda args: self.controller.undo(),
+            "redo": lambda args: self.controller.redo(),
+        }
+
+    def run(self, lines: Iterable[str]) -> int:
+        """
+        Execute every command in a script.
+
+        Args:
+            lines (Iterable[str]): Script lines
+
+        Returns:
+            int: Number of commands that failed
+        """
+        with model_output(self.verbose):
+            for line_number, line in enumerate(lines, start=1):
+                line = line.strip()
+                if not line or line.startswith("#"):
+                    continue
+
+                try:
+                    args = self._split_command(line)
+                    handler = self._commands.get(args[0].lower())
+                    if handler is None:
+                        success, message = False, f"Unknown command '{args[0]}'"
+                    else:
+                        success, message = handler(args[1:])
+                except (ValueError, IndexError) as e:
+                    success, message = False, f"Invalid arguments: {e}"
+
+                if not success:
+                    self.errors += 1
+                    self.output.write(f"line {line_number}: {message}\n")
+
+        return self.errors
+
+    @staticmethod
+    def _split_command(line: str) -> List[str]:
+        """
+        Split a command line into arguments with POSIX shell quoting.
+
+        The result is that of shlex.split, including empty quoted arguments
+        and adjacent quoted parts joining into one argument. shlex is pure
+        Python and dominates long runs, so lines are split with one regular
+        expression instead; lines without quotes or backslashes, where the
+        rules reduce to splitting on whitespace, use str.split.
+
+        Args:
+            line (str): Stripped, non-empty command line
+
+        Returns:
+            List[str]: Command name followed by its arguments
+
+        Raises:
+            ValueError: If a quote is not closed or the line ends with a backslash
+        """
+        if '"' not in line and "'" not in line and "\\" not in line:
+            return line.split()
+
+        args: List[str] = []
+        current: Optional[str] = None  # Argument being built; None between arguments
+        for part in _COMMAND_PART.finditer(line):
+            kind, text = part.lastindex, part.group(part.lastindex)
+            if kind == 1:
+                if current is not None:
+                    args.append(current)
+                current = None
+                continue
+            if kind == 6:
+                raise ValueError("No escaped character" if text == "\\" else "No closing quotation")
+            if kind == 3:
+                text = _DOUBLE_QUOTED_ESCAPE.sub(r"\1", text)
+            current = text if current is None else current + text
+        if current is not None:
+            args.append(current)
+        return args
+
+    def _parse_date(self, text: str) -> datetime.datetime:
+        """Parse a YYYY-MM-DD date, reusing earlier results for repeated dates."""
+        parsed = self._parsed_dates.get(text)
+        if parsed is None:
+            parsed = datetime.datetime.strptime(text, "%Y-%m-%d")
+            self._parsed_dates[text] = parsed
+        return parsed
+
+    def _add(self, args: List[str]) -> Tuple[bool, str]:
+        """Handle 'add task|recurring|priority <title> <date> [...]'."""
+        task_type, title, due_date = args[0].lower(), args[1], self._parse_date(args[2])
+
+        if task_type == "task":
+            description = args[3] if len(args) > 3 else ""
+            success = self.controller.create_regular_task(title, due_date, description)
+        elif task_type == "recurring":
+            description = args[4] if len(args) > 4 else ""
+            success = self.controller.create_recurring_task(title, due_date, int(args[3]), description)
+        elif task_type == "priority":
+            description = args[4] if len(args) > 4 else ""
+            success = self.controller.create_priority_task(title, due_date, int(args[3]), description)
+        else:
+            return False, f"Unknown task type '{args[0]}'. Use task, recurring or priority."
+
+        return success, "" if success else f"Failed to create {task_type} task '{title}'"
+
+    def _complete(self, args: List[str]) -> Tuple[bool, str]:
+        """Handle 'complete <task number>'."""
+        return self.controller.mark_task_completed(int(args[0]))
+
+    def _remove(self, args: List[str]) -> Tuple[bool, str]:
+        """Handle 'remove <task number>'."""
+        return self.controller.remove_task(int(args[0]))
+
+    def _edit(self, args: List[str]) -> Tuple[bool, str]:
+        """Handle 'edit <task number> title|date|description|priority <value>'."""
+        task_number, field, value = int(args[0]), args[1].lower(), args[2]
+
+        if field == "title":
+            return self.controller.edit_task_title(task_number, value)
+        elif field == "date":
+            return self.controller.edit_task_date(task_number, self._parse_date(value))
+        elif field == "description":
+            return self.controller.edit_task_description(task_number, value)
+        elif field == "priority":
+            return self.controller.edit_task_priority(task_number, int(value))
+        return False, f"Unknown field '{args[1]}'. Use title, date, description or priority."
+
+    def _list(self, args: List[str]) -> Tuple[bool, str]:
+        """Handle 'list [uncompleted|overdue|priority]'."""
+        view = args[0].lower() if args else "uncompleted"
+        limit = max(1, len(self.controller.get_all_tasks()))
+        rows, _ = self.controller.get_task_page(view, 0, limit)
+
+        if rows:
+            self.output.write("\n".join(f"{number}. {task}" for number, task in rows) + "\n")
+        return True, ""
+
+    def _save(self, args: List[str]) -> Tuple[bool, str]:
+        """Handle 'save' - deferred so the run saves once, after the last command."""
+        self.save_requested = True
+        return True, ""
+
+    def finish(self, save_path: Optional[str] = None, dao_type: str = "csv") -> Tuple[bool, str]:
+        """
+        Perform the single save at the end of a run, if one was requested.
+
+        Args:
+            save_path (Optional[str]): Save target; defaults to the DAO used for loading
+            dao_type (str): Type of DAO for save_path ('test', 'csv', 'csv-append', 'jsonl', 'columnar')
+
+        Returns:
+            Tuple[bool, str]: (Success status, Message)
+        """
+        if not (self.save_requested or save_path):
+            return True, "No save requested."
+
+        with model_output(self.verbose):
+            if save_path:
+                self.controller.dao = None  # Save to the requested target
+            return self.controller.save_tasks_to_dao(save_path, dao_type)
@@ -0,0 +1,17 @@
+"""
+Benchmarks Package - Portfolio Quality Implementation
+
+Performance benchmarks for the task engine, reporting JSON results that can
+be compared between runs to catch regressions.
+
+Run from the ToDoAppPortfolio directory:
+    python -m benchmarks.run_benchmarks --sizes 1000 10000 100000
+
+Modules:
+- population: Synthetic task populations with a realistic mix of task types
+- run_benchmarks: Timed benchmarks and the command-line runner
+
+Author: [Moses Gana]
+Date: 2024
+Version: 8.0 (Portfolio Quality with PriorityTask Support)
+"""
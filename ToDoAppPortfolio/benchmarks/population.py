@@ -0,0 +1,121 @@
+"""
+Population Module - Portfolio Quality Implementation
+
+This module generates synthetic task populations for the benchmarks.
+
+The generator provides:
+- A configurable mix of Task, RecurringTask and PriorityTask
+- Due dates spread around the present, so some tasks are overdue
+- A share of completed tasks and of tasks with descriptions
+- Deterministic output for a given seed, so runs are comparable
+
+Functions:
+- generate_specs: Factory arguments for a population, without building tasks
+- build_population: Tasks built through TaskFactory from generated specs
+
+Author: [Moses Gana]
+Date: 2024
+Version: 8.0 (Portfolio Quality with PriorityTask Support)
+"""
+
+
+# IMPORTS
+
+
+import datetime  # For due dates and recurrence intervals
+import random  # For deterministic pseudo-random populations
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple  # For type hints
+from task import AbstractTask, RecurringTask  # Import task classes
+from task_factory import TaskFactory  # Import Factory for task creation
+
+
+# Share of each task type: (regular, recurring, priority)
+DEFAULT_MIX: Tuple[float, float, float] = (0.6, 0.2, 0.2)
+
+# Vocabulary for titles; real lists repeat a small set of words heavily
+_TITLE_WORDS = [
+    "Review", "Prepare", "Call", "Email", "Pay", "Book", "Clean", "Update",
+    "Plan", "Submit", "Renew", "Order", "Fix", "Write", "Check", "Organize",
+]
+_TITLE_OBJECTS = [
+    "report", "invoice", "meeting notes", "dentist", "groceries", "budget",
+    "presentation", "car service", "insurance", "newsletter", "backlog", "garden",
+]
+_INTERVALS = [1, 7, 14, 30]  # Typical recurrence intervals in days
+
+
+class TaskSpec(NamedTuple):
+    """Factory arguments for one synthetic task."""
+
+    title: str
+    date_due: datetime.datetime
+    kwargs: Dict[str, Any]
+    completed: bool
+
+
+# POPULATION FUNCTIONS
+
+
+def generate_specs(size: int, seed: int = 0, mix: Tuple[float, float, float] = DEFAULT_MIX,
+                   now: Optional[datetime.datetime] = None) -> List[TaskSpec]:
+    """
+    Generate factory arguments for a synthetic population.
+
+    Due dates fall on whole days between 30 days ago and 60 days ahead,
+    about a quarter of non-recurring tasks are completed, and about half
+    of all tasks have a description.
+
+    Args:
+        size (int): Number of tasks
+        seed (int): Random seed
+        mix (Tuple[float, float, float]): Shares of regular, recurring and priority tasks
+        now (Optional[datetime.datetime]): Reference time (defaults to today at midnight)
+
+    Returns:
+        List[TaskSpec]: One spec per task
+    """
+    rng = random.Random(seed)
+    if now is None:
+        now = datetime.datetime.combine(datetime.date.today(), datetime.time())
+    due_dates = [now + datetime.timedelta(days=offset) for offset in range(-30, 61)]
+    intervals = [datetime.timedelta(days=days) for days in _INTERVALS]
+    recurring_cutoff = mix[0] + mix[1]
+
+    specs = []
+    for number in range(size):
+        title = f"{rng.choice(_TITLE_WORDS)} {rng.choice(_TITLE_OBJECTS)} #{number}"
+        kwargs: Dict[str, Any] = {}
+        if rng.random() < 0.5:
+            kwargs["description"] = f"Synthetic task {number} for benchmarking"
+
+        kind = rng.random()
+        completed = False
+        if kind < mix[0]:
+            completed = rng.random() < 0.25
+        elif kind < recurring_cutoff:
+            kwargs["interval"] = rng.choice(intervals)
+        else:
+            kwargs["priority_level"] = rng.choice((1, 2, 3))
+            completed = rng.random() < 0.25
+
+        specs.append(TaskSpec(title, rng.choice(due_dates), kwargs, completed))
+    return specs
+
+
+def build_population(specs: List[TaskSpec]) -> List[AbstractTask]:
+    """
+    Build tasks from specs through TaskFactory.
+
+    Args:
+        specs (List[TaskSpec]): Specs from generate_specs
+
+    Returns:
+        List[AbstractTask]: The tasks, in spec order
+    """
+    tasks = []
+    for spec in specs:
+        task = TaskFactory.create_task(spec.title, spec.date_due, **spec.kwargs)
+        if spec.completed and not isinstance(task, RecurringTask):
+            task.completed = True
+        tasks.append(task)
+    return tasks
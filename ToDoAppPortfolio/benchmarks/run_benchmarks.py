@@ -0,0 +1,416 @@
+"""
+Run Benchmarks Module - Portfolio Quality Implementation
+
+This module times the key paths of the task engine on synthetic populations
+and reports the results as JSON.
+
+The runner provides:
+- Benchmarks for TaskFactory (single and bulk), TaskList add/remove, controller queries,
+  get_task_count and CSV load/save through TaskCsvDAO
+- NumPy analytics (export, due-date histogram, weekly completion, per-type rates) timed
+  next to the equivalent Python loops, when NumPy is installed
+- Population sizes chosen on the command line (1k to 1M tasks)
+- Best-of-N timing with setup kept outside the timed region
+- Comparison against an earlier JSON report, failing on regressions
+
+Usage (from the ToDoAppPortfolio directory):
+    python -m benchmarks.run_benchmarks --sizes 1000 10000 100000 --output results.json
+    python -m benchmarks.run_benchmarks --sizes 1000000 --repeat 1 --only csv
+    python -m benchmarks.run_benchmarks --sizes 1000000 --repeat 1 --only analytics
+    python -m benchmarks.run_benchmarks --compare results.json
+
+Functions:
+- run_suite: Run the selected benchmarks and build the JSON report
+- compare_reports: Find benchmarks that slowed down against a baseline report
+- main: Command-line entry point
+
+Author: [Moses Gana]
+Date: 2024
+Version: 8.0 (Portfolio Quality with PriorityTask Support)
+"""
+
+
+# IMPORTS
+
+
+import argparse  # For command-line options
+import datetime  # For report timestamps
+import gc  # For collecting garbage outside timed regions
+import json  # For the report format
+import os  # For temporary file paths
+import platform  # For recording the environment
+import random  # For removal positions
+import sys  # For progress output on standard error
+import tempfile  # For the CSV working directory
+import time  # For the high-resolution timer
+from typing import Any, Callable, Dict, List, Optional, Tuple  # For type hints
+from abstract_dao import TaskCsvDAO  # Import CSV DAO
+from analytics import TaskAnalytics, numpy_available  # Import vectorized analytics
+from batch_runner import model_output  # For silencing model-layer console feedback
+from task_factory import TaskFactory  # Import Factory for task creation
+from task_manager_controller import TaskManagerController  # Import controller
+from tasklist import TaskList  # Import TaskList class
+from users import Owner  # Import Owner class
+from benchmarks.population import build_population, generate_specs  # Synthetic populations
+
+
+# BENCHMARK CONTEXT CLASS DEFINITION
+
+
+class BenchmarkContext:
+    """
+    Shared inputs for all benchmarks at one population size.
+
+    Attributes:
+        size (int): Number of tasks in the population
+        specs (List[TaskSpec]): Factory arguments for the population
+        tasks (List[AbstractTask]): Prebuilt tasks for benchmarks that do not time construction
+        rng (random.Random): Seeded generator for benchmark-specific choices
+        csv_path (str): Scratch CSV file for the DAO benchmarks
+    """
+
+    def __init__(self, size: int, seed: int, work_dir: str) -> None:
+        """Generate the population for one size."""
+        self.size = size
+        self.specs = generate_specs(size, seed)
+        self.tasks = build_population(self.specs)
+        self.rng = random.Random(seed)
+        self.csv_path = os.path.join(work_dir, f"tasks_{size}.csv")
+
+    def owner(self) -> Owner:
+        """Create the owner for a fresh task list."""
+        return Owner("benchmark", "benchmark@example.com")
+
+    def filled_controller(self) -> TaskManagerController:
+        """Create a controller holding the whole population."""
+        controller = TaskManagerController(self.owner())
+        controller.task_list.apply_batch(lambda tasks: tasks.extend(self.tasks))
+        return controller
+
+
+# A benchmark prepares its state untimed and returns (timed callable, operation count)
+Benchmark = Callable[[BenchmarkContext], Tuple[Callable[[], Any], int]]
+
+
+# BENCHMARK DEFINITIONS
+
+
+def _query_calls(size: int) -> int:
+    """Repeat cheap whole-list queries so small sizes still take measurable time."""
+    return max(1, 100_000 // size)
+
+
+def bench_factory_create(ctx: BenchmarkContext) -> Tuple[Callable[[], Any], int]:
+    """Time TaskFactory.create_task over the whole population."""
+    specs = ctx.specs
+    create = TaskFactory.create_task
+
+    def run() -> None:
+        for spec in specs:
+            create(spec.title, spec.date_due, **spec.kwargs)
+    return run, len(specs)
+
+
+def bench_factory_create_many(ctx: BenchmarkContext) -> Tuple[Callable[[], Any], int]:
+    """Time TaskFactory.create_many over the population, grouped into one batch per type."""
+    rows_by_type: Dict[str, List[tuple]] = {}
+    for spec in ctx.specs:
+        if "priority_level" in spec.kwargs:
+            task_type, row = "PriorityTask", (spec.title, spec.date_due, spec.kwargs["priority_level"])
+        elif "interval" in spec.kwargs:
+            task_type, row = "RecurringTask", (spec.title, spec.date_due, spec.kwargs["interval"])
+        else:
+            task_type, row = "Task", (spec.title, spec.date_due)
+        if "description" in spec.kwargs:
+            row += (spec.kwargs["description"],)
+        rows_by_type.setdefault(task_type, []).append(row)
+
+    def run() -> None:
+        for task_type, rows in rows_by_type.items():
+            TaskFactory.create_many(task_type, rows)
+    return run, len(ctx.specs)
+
+
+def bench_tasklist_add(ctx: BenchmarkContext) -> Tuple[Callable[[], Any], int]:
+    """Time TaskList.add_task for every task into an empty list."""
+    task_list = TaskList(ctx.owner())
+    tasks = ctx.tasks
+
+    def run() -> None:
+        for task in tasks:
+            task_list.add_task(task)
+    return run, len(tasks)
+
+
+def bench_tasklist_remove(ctx: BenchmarkContext) -> Tuple[Callable[[], Any], int]:
+    """Time TaskList.remove_task at random positions (up to 1000 removals)."""
+    task_list = TaskList(ctx.owner())
+    task_list.apply_batch(lambda tasks: tasks.extend(ctx.tasks))
+    removals = min(ctx.size, 1000)
+    positions = [ctx.rng.randrange(ctx.size - i) for i in range(removals)]
+
+    def run() -> None:
+        for position in positions:
+            task_list.remove_task(position)
+    return run, removals
+
+
+def _controller_query(method: str, *args: Any) -> Benchmark:
+    """Build a benchmark timing repeated calls of one controller method."""
+    def bench(ctx: BenchmarkContext) -> Tuple[Callable[[], Any], int]:
+        query = getattr(ctx.filled_controller(), method)
+        calls = _query_calls(ctx.size)
+
+        def run() -> None:
+            for _ in range(calls):
+                query(*args)
+        return run, calls
+    bench.__doc__ = f"Time TaskManagerController.{method} on the whole population."
+    return bench
+
+
+def bench_csv_save(ctx: BenchmarkContext) -> Tuple[Callable[[], Any], int]:
+    """Time TaskCsvDAO.save_all_tasks for the whole population."""
+    dao = TaskCsvDAO(ctx.csv_path)
+    tasks = ctx.tasks
+    return (lambda: dao.save_all_tasks(tasks)), len(tasks)
+
+
+def bench_csv_load(ctx: BenchmarkContext) -> Tuple[Callable[[], Any], int]:
+    """Time TaskCsvDAO.get_all_tasks for a file holding the whole population."""
+    dao = TaskCsvDAO(ctx.csv_path)
+    if not os.path.exists(ctx.csv_path):
+        dao.save_all_tasks(ctx.tasks)
+    return dao.get_all_tasks, ctx.size
+
+
+# Fixed reference time, so vectorized and loop analytics see the same overdue tasks
+_ANALYTICS_NOW = datetime.datetime(2024, 6, 1)
+
+
+def bench_analytics_export(ctx: BenchmarkContext) -> Tuple[Callable[[], Any], int]:
+    """Time the export of the whole population into TaskAnalytics column arrays."""
+    tasks = ctx.tasks
+    return (lambda: TaskAnalytics(tasks, _ANALYTICS_NOW)), len(tasks)
+
+
+def _analytics_query(method: str, *args: Any) -> Benchmark:
+    """Build a benchmark timing one TaskAnalytics report on already exported arrays."""
+    def bench(ctx: BenchmarkContext) -> Tuple[Callable[[], Any], int]:
+        report = getattr(TaskAnalytics(ctx.tasks, _ANALYTICS_NOW), method)
+        return (lambda: report(*args)), ctx.size
+    bench.__doc__ = f"Time TaskAnalytics.{method} on the whole population."
+    return bench
+
+
+def bench_due_histogram_loop(ctx: BenchmarkContext) -> Tuple[Callable[[], Any], int]:
+    """Time the Python loop equivalent of TaskAnalytics.due_histogram(90)."""
+    tasks, today = ctx.tasks, _ANALYTICS_NOW.date()
+
+    def run() -> List[int]:
+        counts = [0] * 90
+        for task in tasks:
+            offset = (task.date_due.date() - today).days
+            if 0 <= offset < 90 and not task.completed:
+                counts[offset] += 1
+        return counts
+    return run, len(tasks)
+
+
+def bench_weekly_completion_loop(ctx: BenchmarkContext) -> Tuple[Callable[[], Any], int]:
+    """Time the Python loop equivalent of TaskAnalytics.weekly_completion()."""
+    tasks = ctx.tasks
+
+    def run() -> Dict[datetime.date, float]:
+        weeks: Dict[datetime.date, List[int]] = {}
+        for task in tasks:
+            due = task.date_due.date()
+            counts = weeks.setdefault(due - datetime.timedelta(days=due.weekday()), [0, 0])
+            counts[0] += 1
+            counts[1] += task.completed
+        return {week: completed / total for week, (total, completed) in sorted(weeks.items())}
+    return run, len(tasks)
+
+
+def bench_type_rates_loop(ctx: BenchmarkContext) -> Tuple[Callable[[], Any], int]:
+    """Time the Python loop equivalent of TaskAnalytics.type_rates()."""
+    tasks = ctx.tasks
+
+    def run() -> Dict[str, Dict[str, float]]:
+        counts: Dict[str, List[int]] = {}
+        for task in tasks:
+            row = counts.setdefault(task.get_task_type(), [0, 0, 0])
+            row[0] += 1
+            row[1] += task.completed
+            row[2] += task.date_due < _ANALYTICS_NOW and not task.completed
+        return {name: {"total": total, "completed": completed, "overdue": overdue,
+                       "completion_rate": completed / total, "overdue_rate": overdue / total}
+                for name, (total, completed, overdue) in counts.items()}
+    return run, len(tasks)
+
+
+# Benchmark name -> benchmark, in report order
+BENCHMARKS: Dict[str, Benchmark] = {
+    "factory.create_task": bench_factory_create,
+    "factory.create_many": bench_factory_create_many,
+    "tasklist.add_task": bench_tasklist_add,
+    "tasklist.remove_task": bench_tasklist_remove,
+    "controller.get_uncompleted_tasks": _controller_query("get_uncompleted_tasks"),
+    "controller.get_overdue_tasks": _controller_query("get_overdue_tasks"),
+    "controller.get_priority_tasks": _controller_query("get_priority_tasks"),
+    "controller.get_task_page": _controller_query("get_task_page", "uncompleted", 0, 20),
+    "controller.get_task_count": _controller_query("get_task_count"),
+    "csv.save_all_tasks": bench_csv_save,
+    "csv.get_all_tasks": bench_csv_load,
+}
+
+# The analytics benchmarks need the optional NumPy dependency
+if numpy_available():
+    BENCHMARKS.update({
+        "analytics.export": bench_analytics_export,
+        "analytics.due_histogram": _analytics_query("due_histogram", 90),
+        "analytics.due_histogram_loop": bench_due_histogram_loop,
+        "analytics.weekly_completion": _analytics_query("weekly_completion"),
+        "analytics.weekly_completion_loop": bench_weekly_completion_loop,
+        "analytics.type_rates": _analytics_query("type_rates"),
+        "analytics.type_rates_loop": bench_type_rates_loop,
+    })
+
+
+# RUNNER FUNCTIONS
+
+
+def _time_benchmark(benchmark: Benchmark, ctx: BenchmarkContext, repeat: int) -> Dict[str, Any]:
+    """Run one benchmark repeat times, each on freshly prepared state."""
+    timings = []
+    ops = 0
+    for _ in range(repeat):
+        run, ops = benchmark(ctx)
+        gc.collect()
+        start = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - start)
+
+    best = min(timings)
+    return {
+        "ops": ops,
+        "best_seconds": best,
+        "mean_seconds": sum(timings) / len(timings),
+        "us_per_op": best / ops * 1e6,
+        "ops_per_second": ops / best if best > 0 else None,
+    }
+
+
+def run_suite(sizes: List[int], repeat: int = 3, seed: int = 0,
+              only: Optional[List[str]] = None) -> Dict[str, Any]:
+    """
+    Run the selected benchmarks at every size.
+
+    Args:
+        sizes (List[int]): Population sizes
+        repeat (int): Timed runs per benchmark; the best is reported
+        seed (int): Seed for the synthetic populations
+        only (Optional[List[str]]): Run only benchmarks whose name contains one of these
+
+    Returns:
+        Dict[str, Any]: JSON-compatible report
+    """
+    selected = {name: bench for name, bench in BENCHMARKS.items()
+                if not only or any(part in name for part in only)}
+    results = []
+
+    with tempfile.TemporaryDirectory() as work_dir, model_output():
+        for size in sizes:
+            ctx = BenchmarkContext(size, seed, work_dir)
+            for name, benchmark in selected.items():
+                result = _time_benchmark(benchmark, ctx, repeat)
+                results.append(dict(benchmark=name, size=size, **result))
+                print(f"{name:<36} {size:>9,} tasks  {result['us_per_op']:>12.3f} us/op",
+                      file=sys.stderr)
+
+    return {
+        "suite": "todo-task-engine",
+        "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "seed": seed,
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def compare_reports(baseline: Dict[str, Any], current: Dict[str, Any],
+                    threshold: float = 1.25) -> List[Dict[str, Any]]:
+    """
+    Find benchmarks that are slower than in a baseline report.
+
+    Args:
+        baseline (Dict[str, Any]): Earlier report from run_suite
+        current (Dict[str, Any]): New report from run_suite
+        threshold (float): Slowdown ratio above which a benchmark counts as regressed
+
+    Returns:
+        List[Dict[str, Any]]: Regressed benchmarks with their old and new times
+    """
+    previous = {(r["benchmark"], r["size"]): r["us_per_op"] for r in baseline.get("results", [])}
+    regressions = []
+    for result in current["results"]:
+        old = previous.get((result["benchmark"], result["size"]))
+        if old and result["us_per_op"] / old > threshold:
+            regressions.append({
+                "benchmark": result["benchmark"],
+                "size": result["size"],
+                "baseline_us_per_op": old,
+                "us_per_op": result["us_per_op"],
+                "ratio": result["us_per_op"] / old,
+            })
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Command-line entry point.
+
+    Args:
+        argv (Optional[List[str]]): Arguments (defaults to sys.argv[1:])
+
+    Returns:
+        int: Exit code (1 if a comparison found regressions)
+    """
+    parser = argparse.ArgumentParser(description="Benchmark the ToDo task engine")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000],
+                        help="population sizes (e.g. 1000 10000 100000 1000000)")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per benchmark")
+    parser.add_argument("--seed", type=int, default=0, help="population seed")
+    parser.add_argument("--only", nargs="+", help="run benchmarks whose name contains any of these")
+    parser.add_argument("--output", help="write the JSON report to this file (default: stdout)")
+    parser.add_argument("--compare", help="baseline JSON report to check for regressions")
+    parser.add_argument("--threshold", type=float, default=1.25,
+                        help="slowdown ratio counted as a regression")
+    args = parser.parse_args(argv)
+
+    report = run_suite(args.sizes, args.repeat, args.seed, args.only)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as baseline_file:
+            report["regressions"] = compare_reports(json.load(baseline_file), report, args.threshold)
+        for regression in report["regressions"]:
+            print(f"REGRESSION {regression['benchmark']} at {regression['size']:,} tasks: "
+                  f"{regression['ratio']:.2f}x slower", file=sys.stderr)
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output_file:
+            output_file.write(text + "\n")
+    else:
+        print(text)
+
+    return 1 if report.get("regressions") else 0
+
+
+# PROGRAM ENTRY POINT
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+"""
+Clock Module - Portfolio Quality Implementation
+
+This module decouples "now" from the wall clock, so time-dependent
+behaviour (overdue status, days until due, creation and completion dates)
+can be driven deterministically.
+
+The clocks provide:
+- SystemClock: the real local time, used by default
+- VirtualClock: a manually advanced time for tests, simulations and demos
+
+The model layer reads the time from AbstractTask.clock; assign a
+VirtualClock there to move every task, view and tracker through virtual
+time together.
+
+Classes:
+- Clock: Interface of all clocks
+- SystemClock: Wall-clock time
+- VirtualClock: Manually controlled time
+
+Author: [Moses Gana]
+Date: 2024
+Version: 8.0 (Portfolio Quality with PriorityTask Support)
+"""
+
+
+# IMPORTS
+
+
+import datetime  # For timestamps
+import threading  # For the virtual clock lock
+from abc import ABC, abstractmethod  # For the clock interface
+from typing import Optional  # For type hints
+
+
+# CLOCK CLASS DEFINITIONS
+
+
+class Clock(ABC):
+    """Source of the current time."""
+
+    @abstractmethod
+    def now(self) -> datetime.datetime:
+        """
+        Get the current time.
+
+        Returns:
+            datetime.datetime: Naive local time, like datetime.datetime.now()
+        """
+        pass
+
+
+class SystemClock(Clock):
+    """The real local time."""
+
+    def now(self) -> datetime.datetime:
+        """Get the current wall-clock time."""
+        return datetime.datetime.now()
+
+
+class VirtualClock(Clock):
+    """
+    A clock that only moves when told to.
+
+    Example:
+        >>> clock = VirtualClock(datetime.datetime(2024, 1, 1))
+        >>> clock.advance(days=2)
+        datetime.datetime(2024, 1, 3, 0, 0)
+        >>> clock.now()
+        datetime.datetime(2024, 1, 3, 0, 0)
+    """
+
+    def __init__(self, start: Optional[datetime.datetime] = None) -> None:
+        """
+        Initialize the clock.
+
+        Args:
+            start (Optional[datetime.datetime]): Initial time (defaults to the real time now)
+        """
+        self._now = start if start is not None else datetime.datetime.now()
+        self._lock = threading.Lock()
+
+    def now(self) -> datetime.datetime:
+        """Get the virtual time."""
+        return self._now
+
+    def advance(self, delta: Optional[datetime.timedelta] = None, **kwargs: float) -> datetime.datetime:
+        """
+        Move the clock forward.
+
+        Args:
+            delta (Optional[datetime.timedelta]): Amount to advance by
+            **kwargs: Alternatively, timedelta arguments such as days=1 or hours=2
+
+        Returns:
+            datetime.datetime: The new virtual time
+
+        Raises:
+            ValueError: If the amount is negative
+        """
+        step = delta if delta is not None else datetime.timedelta(**kwargs)
+        if step < datetime.timedelta(0):
+            raise ValueError("A clock cannot advance by a negative amount; use set() to go back")
+        with self._lock:
+            self._now += step
+            return self._now
+
+    def set(self, moment: datetime.datetime) -> None:
+        """
+        Jump to any time, including the past.
+
+        Args:
+            moment (datetime.datetime): New virtual time
+        """
+        with self._lock:
+            self._now = moment
+
+
+# Clock used when none is injected
+system_clock = SystemClock()
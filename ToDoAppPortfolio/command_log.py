@@ -0,0 +1,243 @@
+"""
+Command Log Module - Portfolio Quality Implementation
+
+This module records every controller mutation so it can be undone, redone
+and replayed by incremental savers.
+
+The command log provides:
+- One compact record per mutation holding what is needed to invert it:
+  the task, its list position, and frozen before/after states (shared with
+  snapshots, so unchanged fields cost nothing extra)
+- O(1) undo and redo over bounded ring buffers
+- A sequence-numbered change feed, including undos and redos, that
+  incremental savers can read from any position still in the buffer
+
+Classes:
+- Change: One recorded mutation
+- CommandLog: Undo/redo ring buffers and the change feed
+
+Author: [Moses Gana]
+Date: 2024
+Version: 8.0 (Portfolio Quality with PriorityTask Support)
+"""
+
+
+# IMPORTS
+
+
+import itertools  # For reading the feed from a position
+from collections import deque  # For the bounded ring buffers
+from typing import List, Optional  # For type hints
+from task import AbstractTask  # Import the task base class
+
+
+# CHANGE CLASS DEFINITION
+
+
+class Change:
+    """
+    One recorded mutation.
+
+    Attributes:
+        sequence (int): Position in the change feed
+        kind (str): 'add', 'remove', 'edit' or 'complete'
+        task (AbstractTask): The task that changed
+        index (Optional[int]): List position of an added or removed task
+        before (Optional[AbstractTask]): Frozen state before an edit or completion
+        after (Optional[AbstractTask]): Frozen state after an edit or completion
+    """
+
+    __slots__ = ("sequence", "kind", "task", "index", "before", "after")
+
+    def __init__(self, sequence: int, kind: str, task: AbstractTask, index: Optional[int] = None,
+                 before: Optional[AbstractTask] = None, after: Optional[AbstractTask] = None) -> None:
+        """Initialize the change."""
+        self.sequence = sequence
+        self.kind = kind
+        self.task = task
+        self.index = index
+        self.before = before
+        self.after = after
+
+    def inverse(self, sequence: int) -> "Change":
+        """Get the change that undoes this one; undoing a completion is an edit."""
+        kind = {"add": "remove", "remove": "add"}.get(self.kind, "edit")
+        return Change(sequence, kind, self.task, self.index, self.after, self.before)
+
+    def replay(self, sequence: int) -> "Change":
+        """Get a copy of this change for redoing it."""
+        return Change(sequence, self.kind, self.task, self.index, self.before, self.after)
+
+    def __repr__(self) -> str:
+        """Get a debugging representation."""
+        return f"Change({self.sequence}, {self.kind!r}, {self.task.title!r}, index={self.index})"
+
+
+# COMMAND LOG CLASS DEFINITION
+
+
+class CommandLog:
+    """
+    Undo/redo history and change feed for one task list.
+
+    Recording a new change discards the redo history, as in any editor.
+    When a ring buffer is full the oldest entry is dropped, so memory stays
+    bounded. The log is not locked itself: callers serialize access with
+    the task list's write lock.
+    """
+
+    def __init__(self, capacity: int = 1000, feed_capacity: int = 10000) -> None:
+        """
+        Initialize an empty log.
+
+        Args:
+            capacity (int): Maximum number of undoable changes
+            feed_capacity (int): Maximum number of changes kept for feed readers
+        """
+        self._undo: deque = deque(maxlen=capacity)
+        self._redo: deque = deque(maxlen=capacity)
+        self._feed: deque = deque(maxlen=feed_capacity)
+        self._sequence = 0
+        self._reset_sequence = 0  # Feed readers older than this must start over
+
+    @property
+    def sequence(self) -> int:
+        """Get the sequence number of the latest change (0 if none)."""
+        return self._sequence
+
+    @property
+    def can_undo(self) -> bool:
+        """Check whether there is a change to undo."""
+        return bool(self._undo)
+
+    @property
+    def can_redo(self) -> bool:
+        """Check whether there is an undone change to redo."""
+        return bool(self._redo)
+
+    def _next_sequence(self) -> int:
+        """Allocate the next feed sequence number."""
+        self._sequence += 1
+        return self._sequence
+
+    def record(self, kind: str, task: AbstractTask, index: Optional[int] = None,
+               before: Optional[AbstractTask] = None) -> Change:
+        """
+        Record a mutation that has just been applied.
+
+        Args:
+            kind (str): 'add', 'remove', 'edit' or 'complete'
+            task (AbstractTask): The task that changed
+            index (Optional[int]): List position for 'add' and 'remove'
+            before (Optional[AbstractTask]): frozen_copy() taken before an edit or completion
+
+        Returns:
+            Change: The recorded change
+        """
+        after = task.frozen_copy() if before is not None else None
+        change = Change(self._next_sequence(), kind, task, index, before, after)
+        self._undo.append(change)
+        self._redo.clear()
+        self._feed.append(change)
+        return change
+
+    @staticmethod
+    def _locate(change: Change, task_list) -> int:
+        """
+        Find the list position of a change's task, trusting the recorded index if it still matches.
+
+        Undo and redo run in LIFO order, so as long as every mutation goes
+        through the log the list is exactly as it was when the change was
+        made and the recorded index matches. Only changes made outside the
+        log (TaskList.apply_batch, or TaskList methods called directly) can
+        move the task; then it is found with an O(n) scan.
+        """
+        tasks = task_list.tasks
+        if change.index is not None and 0 <= change.index < len(tasks) and tasks[change.index] is change.task:
+            return change.index
+        for index, task in enumerate(tasks):
+            if task is change.task:
+                return index
+        raise ValueError(f"Task '{change.task.title}' is no longer in the list")
+
+    def _apply(self, change: Change, task_list) -> None:
+        """Apply a change to the task list."""
+        if change.kind == "add":
+            task_list.insert_task(min(change.index, len(task_list.tasks)), change.task)
+        elif change.kind == "remove":
+            task_list.remove_task(self._locate(change, task_list))
+        else:
+            change.task.restore_state(change.after)
+
+    def undo(self, task_list) -> Optional[Change]:
+        """
+        Undo the latest change.
+
+        Args:
+            task_list (TaskList): List the change was applied to
+
+        Returns:
+            Optional[Change]: The inverse change that was applied, or None if
+            there was nothing to undo
+        """
+        if not self._undo:
+            return None
+        change = self._undo[-1]
+        inverse = change.inverse(self._sequence + 1)
+        self._apply(inverse, task_list)  # Leaves the history untouched if it fails
+        self._undo.pop()
+        self._sequence += 1
+        self._redo.append(change)
+        self._feed.append(inverse)
+        return inverse
+
+    def redo(self, task_list) -> Optional[Change]:
+        """
+        Redo the latest undone change.
+
+        Args:
+            task_list (TaskList): List the change was applied to
+
+        Returns:
+            Optional[Change]: The change that was reapplied, or None if there
+            was nothing to redo
+        """
+        if not self._redo:
+            return None
+        change = self._redo[-1]
+        replayed = change.replay(self._sequence + 1)
+        self._apply(replayed, task_list)
+        self._redo.pop()
+        self._sequence += 1
+        self._undo.append(change)
+        self._feed.append(replayed)
+        return replayed
+
+    def reset(self) -> None:
+        """
+        Forget all history, e.g. after the whole list was replaced by a load.
+
+        Feed readers positioned before the reset must do a full save.
+        """
+        self._undo.clear()
+        self._redo.clear()
+        self._feed.clear()
+        self._reset_sequence = self._sequence
+
+    def changes_since(self, sequence: int) -> Optional[List[Change]]:
+        """
+        Get the changes recorded after a feed position.
+
+        Args:
+            sequence (int): Last sequence number the reader has processed
+
+        Returns:
+            Optional[List[Change]]: Changes in order, or None if some of them
+            are no longer available (the reader must do a full save)
+        """
+        if sequence >= self._sequence:
+            return []
+        if sequence < self._reset_sequence or not self._feed or sequence < self._feed[0].sequence - 1:
+            return None
+        start = sequence - self._feed[0].sequence + 1
+        return list(itertools.islice(self._feed, start, None))
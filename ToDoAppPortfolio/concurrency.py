@@ -0,0 +1,139 @@
+"""
+Concurrency Module - Portfolio Quality Implementation
+
+This module provides the locking primitives used by the thread-safe
+TaskList mode.
+
+The module provides:
+- A writer-preferring read-write lock (many readers or one writer)
+- A no-op lock with the same interface for single-threaded use
+
+Classes:
+- ReadWriteLock: Read-write lock with a reentrant write side
+- NullReadWriteLock: Drop-in replacement that performs no locking
+
+Author: [Moses Gana]
+Date: 2024
+Version: 8.0 (Portfolio Quality with PriorityTask Support)
+"""
+
+
+# IMPORTS
+
+
+import contextlib  # For lock context managers
+import threading  # For the underlying condition variable
+from typing import Iterator, Optional  # For type hints
+
+
+# READ-WRITE LOCK CLASS DEFINITION
+
+
+class ReadWriteLock:
+    """
+    Writer-preferring read-write lock.
+
+    Any number of threads may hold the read side at once; the write side is
+    exclusive. Waiting writers block new readers so writers cannot starve.
+
+    The write side is reentrant, and the thread holding it may also take the
+    read side. A thread holding only the read side must not request the
+    write side (upgrading deadlocks), nor nest read acquisitions while
+    writers may be waiting.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an unlocked read-write lock."""
+        self._condition = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer: Optional[int] = None  # Thread identifier of the writer
+        self._write_depth = 0
+        self._waiting_writers = 0
+
+    def acquire_read(self) -> None:
+        """Acquire the read side, waiting while a writer holds or awaits the lock."""
+        me = threading.get_ident()
+        with self._condition:
+            if self._writer == me:
+                self._write_depth += 1  # Reading inside our own write section
+                return
+            while self._writer is not None or self._waiting_writers:
+                self._condition.wait()
+            self._readers += 1
+
+    def release_read(self) -> None:
+        """Release the read side."""
+        with self._condition:
+            if self._writer == threading.get_ident():
+                self._write_depth -= 1
+                return
+            self._readers -= 1
+            if self._readers == 0:
+                self._condition.notify_all()
+
+    def acquire_write(self) -> None:
+        """Acquire the write side, waiting for readers and other writers to finish."""
+        me = threading.get_ident()
+        with self._condition:
+            if self._writer == me:
+                self._write_depth += 1
+                return
+            self._waiting_writers += 1
+            while self._writer is not None or self._readers:
+                self._condition.wait()
+            self._waiting_writers -= 1
+            self._writer = me
+            self._write_depth = 1
+
+    def release_write(self) -> None:
+        """Release the write side."""
+        with self._condition:
+            self._write_depth -= 1
+            if self._write_depth == 0:
+                self._writer = None
+                self._condition.notify_all()
+
+    @contextlib.contextmanager
+    def read_locked(self) -> Iterator[None]:
+        """Context manager holding the read side."""
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextlib.contextmanager
+    def write_locked(self) -> Iterator[None]:
+        """Context manager holding the write side."""
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
+
+
+# NULL LOCK CLASS DEFINITION
+
+
+class NullReadWriteLock:
+    """No-op lock with the ReadWriteLock interface, for single-threaded use."""
+
+    def acquire_read(self) -> None:
+        """Do nothing."""
+
+    def release_read(self) -> None:
+        """Do nothing."""
+
+    def acquire_write(self) -> None:
+        """Do nothing."""
+
+    def release_write(self) -> None:
+        """Do nothing."""
+
+    def read_locked(self) -> contextlib.nullcontext:
+        """Context manager that performs no locking."""
+        return contextlib.nullcontext()
+
+    def write_locked(self) -> contextlib.nullcontext:
+        """Context manager that performs no locking."""
+        return contextlib.nullcontext()
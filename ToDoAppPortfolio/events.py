@@ -0,0 +1,204 @@
+"""
+Events Module - Portfolio Quality Implementation
+
+This module lets indexes, caches, statistics and persistence learn about
+task mutations without the model layer knowing about any of them.
+
+The event bus provides:
+- Publish/subscribe of model-level events: a task changed (from
+  AbstractTask mutators), was added to or removed from a TaskList, or a
+  TaskList was changed wholesale by a batch operation
+- Buffered publishing that costs one append per mutation, and nothing at
+  all while nobody is subscribed
+- Delivery in coalesced batches: repeated changes to one task collapse
+  into a single event, and each subscriber is called once per batch
+- One bus per TaskList, shared by the tasks added to it, so subscribers
+  only hear about their own list
+- Automatic delivery when the buffer fills up; the controller also
+  flushes after each operation, once the list's write lock is released
+- Publish, delivery, coalescing and subscriber error metrics
+
+Classes:
+- TaskEvent: One model-level event
+- EventBus: Buffering publish/subscribe bus
+
+Author: [Moses Gana]
+Date: 2024
+Version: 8.0 (Portfolio Quality with PriorityTask Support)
+"""
+
+
+# IMPORTS
+
+
+import threading  # For serializing deliveries
+from collections import deque  # For a buffer safe to append to from any thread
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple  # For type hints
+
+
+# TASK EVENT CLASS DEFINITION
+
+
+class TaskEvent(NamedTuple):
+    """
+    One model-level event.
+
+    Attributes:
+        kind (str): 'changed', 'added', 'removed' or 'reset'
+        task (Any): The task concerned (None for 'reset')
+        source (Any): The TaskList for 'added', 'removed' and 'reset', None for 'changed'
+    """
+
+    kind: str
+    task: Any
+    source: Any = None
+
+
+# EVENT BUS CLASS DEFINITION
+
+
+class EventBus:
+    """
+    Buffering publish/subscribe bus for task events.
+
+    Publishing appends to a buffer; flush() delivers the buffered events to
+    every subscriber as one list. Subscribers run on the flushing thread and
+    must return quickly.
+    """
+
+    def __init__(self, max_pending: int = 1024) -> None:
+        """
+        Initialize a bus with no subscribers.
+
+        Args:
+            max_pending (int): Buffered events that trigger an automatic flush
+        """
+        self.max_pending = max_pending
+        self._subscribers: List[Callable[[List[TaskEvent]], None]] = []
+        self._pending: deque = deque()
+        self._flush_lock = threading.RLock()  # A subscriber's own publishing may trigger a flush
+        self._metrics: Dict[str, int] = {"published": 0, "delivered": 0, "batches": 0,
+                                         "coalesced": 0, "subscriber_errors": 0}
+
+    def subscribe(self, subscriber: Callable[[List[TaskEvent]], None]) -> Callable[[List[TaskEvent]], None]:
+        """
+        Register a subscriber, called with each delivered batch of events.
+
+        Args:
+            subscriber (Callable[[List[TaskEvent]], None]): Batch handler
+
+        Returns:
+            Callable[[List[TaskEvent]], None]: The subscriber, for use as a decorator
+        """
+        self._subscribers = self._subscribers + [subscriber]  # Copy on write; flush iterates freely
+        return subscriber
+
+    def unsubscribe(self, subscriber: Callable[[List[TaskEvent]], None]) -> None:
+        """Remove a subscriber (no error if it is not registered)."""
+        self._subscribers = [registered for registered in self._subscribers if registered != subscriber]
+
+    @property
+    def active(self) -> bool:
+        """Check whether anybody is subscribed."""
+        return bool(self._subscribers)
+
+    def publish(self, kind: str, task: Any, source: Any = None) -> None:
+        """
+        Buffer an event for the next delivery.
+
+        Args:
+            kind (str): 'changed', 'added', 'removed' or 'reset'
+            task (Any): The task concerned (None for 'reset')
+            source (Any): The TaskList for membership events
+        """
+        if not self._subscribers:
+            return
+        self._pending.append(TaskEvent(kind, task, source))
+        if len(self._pending) >= self.max_pending:
+            self.flush()
+
+    def publish_many(self, kind: str, tasks: Iterable[Any], source: Any = None) -> None:
+        """
+        Buffer one event per task, e.g. for a bulk load.
+
+        Args:
+            kind (str): 'changed', 'added' or 'removed'
+            tasks (Iterable[Any]): The tasks concerned
+            source (Any): The TaskList for membership events
+        """
+        if not self._subscribers:
+            return
+        self._pending.extend(TaskEvent(kind, task, source) for task in tasks)
+        if len(self._pending) >= self.max_pending:
+            self.flush()
+
+    @staticmethod
+    def _coalesce(events: List[TaskEvent]) -> List[TaskEvent]:
+        """
+        Keep one 'changed' event per task, at the position of its last change.
+
+        A change followed later in the batch by the task's removal is dropped,
+        since the removal supersedes it.
+        """
+        settled = set()  # ids of tasks whose final state is already represented
+        kept = []
+        for event in reversed(events):
+            key = id(event.task)
+            if event.kind == "changed":
+                if key in settled:
+                    continue
+                settled.add(key)
+            elif event.kind == "removed":
+                settled.add(key)
+            kept.append(event)
+        kept.reverse()
+        return kept
+
+    def flush(self) -> int:
+        """
+        Deliver all buffered events to every subscriber.
+
+        A subscriber that raises is counted in the metrics and does not stop
+        delivery to the others.
+
+        Returns:
+            int: Number of events delivered after coalescing
+        """
+        with self._flush_lock:
+            # Take exactly the events buffered so far; later appends wait for the next flush
+            pop = self._pending.popleft
+            pending = [pop() for _ in range(len(self._pending))]
+            if not pending:
+                return 0
+            batch = self._coalesce(pending)
+            self._metrics["published"] += len(pending)
+            self._metrics["coalesced"] += len(pending) - len(batch)
+            self._metrics["delivered"] += len(batch)
+            self._metrics["batches"] += 1
+            for subscriber in self._subscribers:
+                try:
+                    subscriber(batch)
+                except Exception:
+                    self._metrics["subscriber_errors"] += 1
+            return len(batch)
+
+    def pending(self) -> int:
+        """Get the number of buffered events awaiting delivery."""
+        return len(self._pending)
+
+    def get_metrics(self) -> Dict[str, int]:
+        """
+        Get bus statistics.
+
+        Returns:
+            Dict[str, int]: Published, delivered and coalesced events, delivered
+            batches, subscriber errors, subscribers and pending events
+        """
+        metrics = dict(self._metrics)
+        metrics["subscribers"] = len(self._subscribers)
+        metrics["pending"] = len(self._pending)
+        return metrics
+
+
+# Bus for tasks that belong to no TaskList yet; each TaskList has its own
+task_events = EventBus()
@@ -0,0 +1,547 @@
+"""
+Export Pipeline Module - Portfolio Quality Implementation
+
+This module exports task lists for other tools, such as the analytics
+team's, in two formats besides CSV, and imports them again.
+
+The export pipeline provides:
+- JSON Lines: one JSON object per task, written and read as a stream
+- A columnar format in the style of Parquet: tasks are split into row
+  groups, each row group stores one compressed chunk per field, and a
+  footer records where every chunk is, so readers can load single columns
+- Streaming in chunks, so memory use is bounded by the chunk size and the
+  number of chunks in flight rather than by the size of the list
+- Parallel encoding and decoding of chunks on a thread pool, written out
+  in the original order
+- Full-precision dates (unlike the date-only CSV format)
+- Re-import through the same bulk restore path as the CSV DAO
+  (AbstractTask.restore_many, validated once per type and chunk)
+
+Both formats are exposed as DAOs, so the controller can load and save them
+like CSV files.
+
+Classes:
+- ExportPipeline: Chunked, parallel encoding and decoding of task records
+- TaskJsonlDAO: DAO for JSON Lines files
+- TaskColumnarDAO: DAO for columnar files with row groups
+
+Author: [Moses Gana]
+Date: 2024
+Version: 8.0 (Portfolio Quality with PriorityTask Support)
+"""
+
+
+# IMPORTS
+
+
+import datetime  # For date encoding
+import itertools  # For chunking streams
+import json  # For record and column encoding
+import os  # For atomic file replacement
+import struct  # For the columnar footer length
+import tempfile  # For unique temporary file names
+import zlib  # For column chunk compression (releases the GIL while compressing)
+from collections import deque  # For the window of chunks in flight
+from concurrent.futures import ThreadPoolExecutor  # For parallel encoding
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple  # For type hints
+from abstract_dao import AbstractDAO  # Import DAO base class and bulk restore path
+from string_pool import StringPool, shared_pool  # Import text deduplication
+from task import AbstractTask  # Import task base class
+
+
+# Fields every task record has, before the type-specific TYPE_FIELDS
+COMMON_FIELDS: Tuple[str, ...] = ("type", "title", "date_due", "completed", "date_created", "description")
+
+# Type-specific fields that are not plain JSON values: field -> (encode, decode)
+_FIELD_CODECS: Dict[str, Tuple[Callable[[Any], Any], Callable[[Any, Callable[[str], datetime.datetime]], Any]]] = {
+    "interval": (lambda interval: interval.total_seconds(),
+                 lambda seconds, parse_date: datetime.timedelta(seconds=seconds)),
+    "completed_dates": (lambda dates: [date.isoformat() for date in dates],
+                        lambda texts, parse_date: [parse_date(text) for text in texts]),
+}
+
+
+# HELPER FUNCTIONS
+
+
+def record_fields() -> Tuple[str, ...]:
+    """
+    Get every field a task record can have, for all registered task types.
+
+    Returns:
+        Tuple[str, ...]: COMMON_FIELDS followed by each type's TYPE_FIELDS, without repeats
+    """
+    fields = list(COMMON_FIELDS)
+    for task_class in AbstractTask.registered_types().values():
+        fields.extend(field for field in task_class.TYPE_FIELDS if field not in fields)
+    return tuple(fields)
+
+
+def task_record(task: AbstractTask) -> Dict[str, Any]:
+    """
+    Convert a task into a JSON-compatible record.
+
+    Args:
+        task (AbstractTask): Task to convert
+
+    Returns:
+        Dict[str, Any]: Common fields followed by the task type's fields
+    """
+    record = {
+        "type": task.TASK_TYPE,
+        "title": task.title,
+        "date_due": task.date_due.isoformat(),
+        "completed": task.completed,
+        "date_created": task.date_created.isoformat(),
+        "description": task.description,
+    }
+    for field in task.TYPE_FIELDS:
+        value = getattr(task, field)
+        codec = _FIELD_CODECS.get(field)
+        record[field] = codec[0](value) if codec else value
+    return record
+
+
+# EXPORT PIPELINE CLASS DEFINITION
+
+
+class ExportPipeline:
+    """
+    Chunked, parallel encoding and decoding of task records.
+
+    Chunks are processed on a thread pool with at most max_in_flight chunks
+    queued or finished but not yet consumed, and results come out in input
+    order. Record building is Python code and shares the GIL; compression
+    and file I/O release it, so the columnar format gains the most.
+    """
+
+    def __init__(self, chunk_size: int = 10_000, workers: int = 4,
+                 max_in_flight: Optional[int] = None, string_pool: StringPool = shared_pool) -> None:
+        """
+        Initialize the pipeline.
+
+        Args:
+            chunk_size (int): Tasks per chunk (and per columnar row group)
+            workers (int): Encoding threads; 0 encodes on the calling thread
+            max_in_flight (Optional[int]): Chunks in flight (twice the workers if None)
+            string_pool (StringPool): Pool deduplicating imported titles and descriptions
+
+        Raises:
+            ValueError: If chunk_size is not positive or workers is negative
+        """
+        if chunk_size <= 0:
+            raise ValueError("Chunk size must be positive")
+        if workers < 0:
+            raise ValueError("Worker count cannot be negative")
+        self.chunk_size = chunk_size
+        self.workers = workers
+        self.max_in_flight = max_in_flight or max(1, 2 * workers)
+        self.string_pool = string_pool
+
+    def chunks(self, items: Iterable[Any]) -> Iterator[List[Any]]:
+        """
+        Split a stream into lists of at most chunk_size items.
+
+        Args:
+            items (Iterable[Any]): Items to split
+
+        Yields:
+            List[Any]: Consecutive chunks
+        """
+        iterator = iter(items)
+        while True:
+            chunk = list(itertools.islice(iterator, self.chunk_size))
+            if not chunk:
+                return
+            yield chunk
+
+    def map_ordered(self, function: Callable[[Any], Any], chunks: Iterable[Any]) -> Iterator[Any]:
+        """
+        Apply a function to every chunk in parallel, yielding results in order.
+
+        Args:
+            function (Callable[[Any], Any]): Work for one chunk
+            chunks (Iterable[Any]): Chunks to process
+
+        Yields:
+            Any: function(chunk) for each chunk, in input order
+        """
+        if self.workers == 0:
+            yield from map(function, chunks)
+            return
+
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="export") as executor:
+            pending: deque = deque()
+            for chunk in chunks:
+                pending.append(executor.submit(function, chunk))
+                if len(pending) >= self.max_in_flight:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+    def restore_records(self, records: Iterable[Dict[str, Any]]) -> List[AbstractTask]:
+        """
+        Rebuild tasks from records through the bulk restore path.
+
+        Invalid records are reported and skipped, as in the CSV DAO.
+
+        Args:
+            records (Iterable[Dict[str, Any]]): Records as produced by task_record
+
+        Returns:
+            List[AbstractTask]: Restored tasks in record order
+        """
+        task_classes = AbstractTask.registered_types()
+        parsed_dates: Dict[str, datetime.datetime] = {}  # Exports repeat dates heavily
+        intern = self.string_pool.intern  # ...and titles and descriptions
+
+        def parse_date(text: str) -> datetime.datetime:
+            parsed = parsed_dates.get(text)
+            if parsed is None:
+                parsed = parsed_dates[text] = datetime.datetime.fromisoformat(text)
+            return parsed
+
+        typed_rows: List[Tuple[str, tuple]] = []
+        for record in records:
+            try:
+                task_type = record["type"]
+                task_class = task_classes.get(task_type)
+                if task_class is None:
+                    raise ValueError(f"Unknown task type '{task_type}'")
+                row = (intern(record["title"]), parse_date(record["date_due"]), intern(record["description"]),
+                       parse_date(record["date_created"]), bool(record["completed"]))
+                for field in task_class.TYPE_FIELDS:
+                    codec = _FIELD_CODECS.get(field)
+                    row += (codec[1](record[field], parse_date) if codec else record[field],)
+                typed_rows.append((task_type, row))
+            except (ValueError, KeyError, TypeError) as e:
+                print(f"Error parsing task row: {e}")
+        return AbstractDAO._restore_tasks(typed_rows)
+
+
+def _replace_atomically(path: str, write: Callable[[BinaryIO], None]) -> None:
+    """
+    Write a file through a temporary sibling, so readers never see half a file.
+
+    The sibling has a unique name, so concurrent exports to the same path
+    never write into each other's temporary file; the last replace wins.
+    """
+    directory, name = os.path.split(os.path.abspath(path))
+    descriptor, temporary_path = tempfile.mkstemp(prefix=f".{name}.", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(descriptor, "wb") as file:
+            write(file)
+        os.replace(temporary_path, path)
+    except BaseException:
+        if os.path.isfile(temporary_path):
+            os.remove(temporary_path)  # Leave no partial file behind
+        raise
+
+
+# JSON LINES DAO IMPLEMENTATION
+
+
+class TaskJsonlDAO(AbstractDAO):
+    """
+    JSON Lines DAO: one task record per line.
+
+    Lines are encoded and decoded in chunks on the pipeline's thread pool,
+    so exports and imports stream with bounded memory.
+    """
+
+    def __init__(self, storage_path: str, string_pool: StringPool = shared_pool,
+                 pipeline: Optional[ExportPipeline] = None) -> None:
+        """Initialize JSON Lines DAO with file path."""
+        super().__init__(storage_path, string_pool)
+        self.pipeline = pipeline or ExportPipeline(string_pool=string_pool)
+
+    @staticmethod
+    def _encode_chunk(tasks: List[AbstractTask]) -> Tuple[int, bytes]:
+        """Encode a chunk of tasks as JSON Lines, returning (task count, bytes)."""
+        encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+        return len(tasks), "".join([encode(task_record(task)) + "\n" for task in tasks]).encode("utf-8")
+
+    def _decode_chunk(self, lines: List[bytes]) -> List[AbstractTask]:
+        """Decode and restore a chunk of lines, skipping blank ones."""
+        lines = [line for line in lines if line.strip()]
+        try:
+            # One parser call for the whole chunk instead of one per line
+            records = json.loads(b"[" + b",".join(lines) + b"]")
+        except ValueError:
+            # Rare: find the malformed lines individually
+            records = []
+            for line in lines:
+                try:
+                    records.append(json.loads(line))
+                except ValueError as e:
+                    print(f"Error parsing task row: {e}")
+        return self.pipeline.restore_records(records)
+
+    def export_tasks(self, tasks: Iterable[AbstractTask]) -> int:
+        """
+        Stream tasks into the file, replacing it.
+
+        Args:
+            tasks (Iterable[AbstractTask]): Tasks to export, e.g. a TaskList snapshot
+
+        Returns:
+            int: Number of exported tasks
+        """
+        exported = 0
+
+        def write(file: BinaryIO) -> None:
+            nonlocal exported
+            for count, encoded in self.pipeline.map_ordered(self._encode_chunk, self.pipeline.chunks(tasks)):
+                file.write(encoded)
+                exported += count
+
+        _replace_atomically(self.storage_path, write)
+        return exported
+
+    def iter_task_chunks(self) -> Iterator[List[AbstractTask]]:
+        """
+        Stream the file back as chunks of restored tasks.
+
+        Yields:
+            List[AbstractTask]: Tasks of consecutive chunks of lines
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+        """
+        with open(self.storage_path, "rb") as file:
+            yield from self.pipeline.map_ordered(self._decode_chunk, self.pipeline.chunks(file))
+
+    def get_all_tasks(self) -> List[AbstractTask]:
+        """
+        Load all tasks from the JSON Lines file.
+
+        Returns:
+            List[AbstractTask]: List of tasks loaded from the file
+        """
+        task_list: List[AbstractTask] = []
+        try:
+            for chunk in self.iter_task_chunks():
+                task_list.extend(chunk)
+            print(f"Loaded {len(task_list)} tasks from {self.storage_path}")
+        except FileNotFoundError:
+            print(f"No existing task file found at {self.storage_path}. Starting with empty task list.")
+        except Exception as e:
+            print(f"Error loading tasks from {self.storage_path}: {e}")
+        return task_list
+
+    def save_all_tasks(self, tasks: List[AbstractTask]) -> None:
+        """
+        Save all tasks to the JSON Lines file.
+
+        Args:
+            tasks: List of tasks to save
+
+        Raises:
+            OSError: If the file cannot be written
+        """
+        self.export_tasks(tasks)
+        if self.announce:
+            print(f"Saved {len(tasks)} tasks to {self.storage_path}")
+
+
+# COLUMNAR DAO IMPLEMENTATION
+
+
+class TaskColumnarDAO(AbstractDAO):
+    """
+    Columnar DAO in the style of Parquet.
+
+    File layout:
+        MAGIC
+        row group 1: one zlib-compressed JSON array per field
+        row group 2: ...
+        footer: JSON {"format", "fields", "rows", "row_groups": [{"rows", "columns":
+                {field: [offset, length]}}]}
+        footer length (8 bytes, little-endian) + MAGIC
+
+    Fields a task type does not have are stored as null. Because every
+    column chunk can be located from the footer, read_columns() loads only
+    the fields a reader asks for.
+    """
+
+    MAGIC = b"TCOL1"
+    FORMAT = "todo-columnar/1"
+
+    def __init__(self, storage_path: str, string_pool: StringPool = shared_pool,
+                 pipeline: Optional[ExportPipeline] = None, compression_level: int = 1) -> None:
+        """
+        Initialize columnar DAO with file path.
+
+        Args:
+            storage_path: Path to the columnar file
+            string_pool: Pool deduplicating loaded titles and descriptions
+            pipeline: Chunking and thread pool settings (chunk size = rows per row group)
+            compression_level: zlib level for column chunks (1 favours speed)
+        """
+        super().__init__(storage_path, string_pool)
+        self.pipeline = pipeline or ExportPipeline(string_pool=string_pool)
+        self.compression_level = compression_level
+
+    def _encode_row_group(self, tasks: List[AbstractTask]) -> Tuple[int, List[Tuple[str, bytes]]]:
+        """Encode a chunk of tasks as (row count, [(field, compressed column chunk)])."""
+        fields = record_fields()
+        records = [task_record(task) for task in tasks]
+        encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+        return len(tasks), [
+            (field, zlib.compress(encode([record.get(field) for record in records]).encode("utf-8"),
+                                  self.compression_level))
+            for field in fields
+        ]
+
+    def export_tasks(self, tasks: Iterable[AbstractTask]) -> int:
+        """
+        Stream tasks into the file as row groups, replacing it.
+
+        Args:
+            tasks (Iterable[AbstractTask]): Tasks to export, e.g. a TaskList snapshot
+
+        Returns:
+            int: Number of exported tasks
+        """
+        footer: Dict[str, Any] = {"format": self.FORMAT, "fields": list(record_fields()),
+                                  "rows": 0, "row_groups": []}
+
+        def write(file: BinaryIO) -> None:
+            file.write(self.MAGIC)
+            offset = len(self.MAGIC)
+            for rows, columns in self.pipeline.map_ordered(self._encode_row_group, self.pipeline.chunks(tasks)):
+                locations = {}
+                for field, chunk in columns:
+                    file.write(chunk)
+                    locations[field] = [offset, len(chunk)]
+                    offset += len(chunk)
+                footer["row_groups"].append({"rows": rows, "columns": locations})
+                footer["rows"] += rows
+            encoded_footer = json.dumps(footer, separators=(",", ":")).encode("utf-8")
+            file.write(encoded_footer)
+            file.write(struct.pack("<Q", len(encoded_footer)) + self.MAGIC)
+
+        _replace_atomically(self.storage_path, write)
+        return footer["rows"]
+
+    def read_footer(self) -> Dict[str, Any]:
+        """
+        Read the footer describing the fields and row groups of the file.
+
+        Returns:
+            Dict[str, Any]: Decoded footer
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+            ValueError: If the file is not a columnar task file
+        """
+        with open(self.storage_path, "rb") as file:
+            return self._read_footer(file)
+
+    def _read_footer(self, file: BinaryIO) -> Dict[str, Any]:
+        """Read the footer from an open file."""
+        trailer_size = 8 + len(self.MAGIC)
+        file.seek(0, os.SEEK_END)
+        size = file.tell()
+        file.seek(0)
+        if size < len(self.MAGIC) + trailer_size or file.read(len(self.MAGIC)) != self.MAGIC:
+            raise ValueError(f"{self.storage_path} is not a columnar task file")
+        file.seek(size - trailer_size)
+        trailer = file.read(trailer_size)
+        if trailer[8:] != self.MAGIC:
+            raise ValueError(f"{self.storage_path} is truncated (no footer)")
+        footer_size = struct.unpack("<Q", trailer[:8])[0]
+        file.seek(size - trailer_size - footer_size)
+        footer = json.loads(file.read(footer_size))
+        if footer.get("format") != self.FORMAT:
+            raise ValueError(f"Unsupported columnar format {footer.get('format')!r}")
+        return footer
+
+    def read_columns(self, fields: Optional[Sequence[str]] = None) -> Iterator[Dict[str, List[Any]]]:
+        """
+        Stream selected columns, one row group at a time.
+
+        Only the requested column chunks are read and decompressed. Values
+        are as stored: dates as ISO strings, intervals in seconds.
+
+        Args:
+            fields (Optional[Sequence[str]]): Fields to read (all if None)
+
+        Yields:
+            Dict[str, List[Any]]: Field -> values of one row group
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+            ValueError: If the file is not a columnar task file or lacks a field
+        """
+        with open(self.storage_path, "rb") as file:
+            footer = self._read_footer(file)
+            wanted = list(fields) if fields is not None else footer["fields"]
+            missing = [field for field in wanted if field not in footer["fields"]]
+            if missing:
+                raise ValueError(f"Unknown fields: {', '.join(missing)}")
+
+            def read_group(group: Dict[str, Any]) -> Dict[str, bytes]:
+                raw = {}
+                for field in wanted:
+                    offset, length = group["columns"][field]
+                    file.seek(offset)
+                    raw[field] = file.read(length)
+                return raw
+
+            def decode_group(raw: Dict[str, bytes]) -> Dict[str, List[Any]]:
+                return {field: json.loads(zlib.decompress(chunk)) for field, chunk in raw.items()}
+
+            # Reads stay on this thread (one file position); decompression runs in parallel
+            yield from self.pipeline.map_ordered(decode_group, map(read_group, footer["row_groups"]))
+
+    def _restore_row_group(self, columns: Dict[str, List[Any]]) -> List[AbstractTask]:
+        """Restore the tasks of one fully read row group."""
+        fields = list(columns)
+        return self.pipeline.restore_records(dict(zip(fields, values)) for values in zip(*columns.values()))
+
+    def iter_task_chunks(self) -> Iterator[List[AbstractTask]]:
+        """
+        Stream the file back as chunks of restored tasks, one per row group.
+
+        Yields:
+            List[AbstractTask]: Tasks of consecutive row groups
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+            ValueError: If the file is not a columnar task file
+        """
+        for columns in self.read_columns():
+            yield self._restore_row_group(columns)
+
+    def get_all_tasks(self) -> List[AbstractTask]:
+        """
+        Load all tasks from the columnar file.
+
+        Returns:
+            List[AbstractTask]: List of tasks loaded from the file
+        """
+        task_list: List[AbstractTask] = []
+        try:
+            for chunk in self.iter_task_chunks():
+                task_list.extend(chunk)
+            print(f"Loaded {len(task_list)} tasks from {self.storage_path}")
+        except FileNotFoundError:
+            print(f"No existing task file found at {self.storage_path}. Starting with empty task list.")
+        except Exception as e:
+            print(f"Error loading tasks from {self.storage_path}: {e}")
+        return task_list
+
+    def save_all_tasks(self, tasks: List[AbstractTask]) -> None:
+        """
+        Save all tasks to the columnar file.
+
+        Args:
+            tasks: List of tasks to save
+
+        Raises:
+            OSError: If the file cannot be written
+        """
+        self.export_tasks(tasks)
+        if self.announce:
+            print(f"Saved {len(tasks)} tasks to {self.storage_path}")
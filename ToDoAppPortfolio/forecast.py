@@ -0,0 +1,344 @@
+"""
+Forecast Module - Portfolio Quality Implementation
+
+This module forecasts the workload of a task list: how many task
+occurrences land in each day (or other bucket) of a planning horizon.
+
+The forecast engine provides:
+- Occurrence counts computed arithmetically instead of stepping every
+  RecurringTask interval: tasks are grouped by (interval in buckets, due
+  bucket), the first occurrence in the horizon follows from a modulo, and
+  each interval adds its occurrences to the series in one strided pass;
+  other intervals are grouped by their phase, and each bucket's share is
+  the difference of two floor divisions
+- Optional one-off tasks (uncompleted Task and PriorityTask) in the counts
+- An index kept up to date from the model event bus, so edits cost
+  O(1) each instead of a rescan of the list
+- Results cached per list version; the version changes whenever a task
+  of the list is added, removed or changed in a way that moves its
+  occurrences
+
+Classes:
+- Forecast: Occurrence counts per bucket of a horizon
+- ForecastEngine: Incrementally indexed, caching workload forecaster
+
+Author: [Moses Gana]
+Date: 2024
+Version: 8.0 (Portfolio Quality with PriorityTask Support)
+"""
+
+
+# IMPORTS
+
+
+import collections  # For the index counters and the result cache
+import datetime  # For bucket arithmetic
+import threading  # For the engine lock
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple  # For type hints
+from events import EventBus, TaskEvent  # Import the model event bus
+from task import AbstractTask, RecurringTask  # Import task classes
+
+
+# Bucket boundaries are counted from this Monday midnight, so daily buckets
+# start at midnight and weekly buckets on Mondays
+_ANCHOR = datetime.datetime(2000, 1, 3)
+
+
+# FORECAST CLASS DEFINITION
+
+
+class Forecast(NamedTuple):
+    """
+    Occurrence counts per bucket of a horizon.
+
+    Attributes:
+        start (datetime.datetime): Start of the first bucket
+        bucket (datetime.timedelta): Width of each bucket
+        counts (Tuple[int, ...]): Task occurrences in each bucket
+        version (int): Engine version the forecast was computed at
+    """
+
+    start: datetime.datetime
+    bucket: datetime.timedelta
+    counts: Tuple[int, ...]
+    version: int
+
+    def buckets(self) -> Iterator[Tuple[datetime.datetime, int]]:
+        """Yield (bucket start, occurrences) pairs in order."""
+        for index, count in enumerate(self.counts):
+            yield self.start + index * self.bucket, count
+
+    def total(self) -> int:
+        """Get the number of occurrences in the whole horizon."""
+        return sum(self.counts)
+
+
+# FORECAST ENGINE CLASS DEFINITION
+
+
+class ForecastEngine:
+    """
+    Workload forecaster for one task list.
+
+    Each task is indexed under one key:
+    - ('strided', interval in buckets, due bucket) for recurring tasks whose
+      interval is a whole number of buckets
+    - ('exact', interval, phase, due date) for other recurring tasks, where
+      the phase ((due - anchor) % interval) puts tasks whose occurrences
+      coincide on the same lattice; each lattice is counted in O(periods)
+    - ('single', due bucket) for uncompleted one-off tasks
+    - None for completed tasks, which never occur again
+
+    Forecasting works on the distinct keys, of which there are few (a few
+    intervals times the distinct due days), rather than on the tasks.
+    """
+
+    def __init__(self, task_list: Any, bucket: datetime.timedelta = datetime.timedelta(days=1),
+                 cache_size: int = 16, bus: Optional[EventBus] = None) -> None:
+        """
+        Index a task list and start following its changes.
+
+        Args:
+            task_list (TaskList): List to forecast
+            bucket (datetime.timedelta): Width of each forecast bucket
+            cache_size (int): Number of forecasts kept for the current version
+            bus (Optional[EventBus]): Event bus the model layer publishes to
+                (defaults to the task list's own bus)
+
+        Raises:
+            ValueError: If the bucket width is not positive
+        """
+        if bucket <= datetime.timedelta(0):
+            raise ValueError("Forecast bucket width must be positive")
+        self.task_list = task_list
+        self.bucket = bucket
+        self.cache_size = cache_size
+        self.version = 0
+        if bus is None:
+            bus = task_list.events
+        self._bus = bus
+        self._lock = threading.RLock()
+        self._entries: Dict[int, Optional[tuple]] = {}  # id(task) -> index key
+        self._groups: collections.Counter = collections.Counter()  # index key -> number of tasks
+        self._strides: Dict[datetime.timedelta, Tuple[int, datetime.timedelta]] = {}  # Intervals repeat heavily
+        self._cache: collections.OrderedDict = collections.OrderedDict()
+        self._metrics: Dict[str, int] = {"hits": 0, "misses": 0, "rebuilds": 0}
+        bus.flush()  # Earlier events describe changes the snapshot below already contains
+        bus.subscribe(self._on_events)
+        self.rebuild()
+
+    def close(self) -> None:
+        """Stop following the task list."""
+        self._bus.unsubscribe(self._on_events)
+
+    def _bucket_of(self, moment: datetime.datetime) -> int:
+        """Get the number of the bucket containing a moment."""
+        return (moment - _ANCHOR) // self.bucket
+
+    def _key_for(self, task: AbstractTask) -> Optional[tuple]:
+        """Compute the index key of a task (see the class docstring)."""
+        if task.completed:
+            return None
+        if isinstance(task, RecurringTask) and task.interval > datetime.timedelta(0):
+            stride_and_remainder = self._strides.get(task.interval)
+            if stride_and_remainder is None:
+                stride_and_remainder = self._strides[task.interval] = divmod(task.interval, self.bucket)
+            stride, remainder = stride_and_remainder
+            if not remainder:
+                return ("strided", stride, self._bucket_of(task.date_due))
+            return ("exact", task.interval, (task.date_due - _ANCHOR) % task.interval, task.date_due)
+        return ("single", self._bucket_of(task.date_due))
+
+    def _index(self, task: AbstractTask) -> bool:
+        """
+        Add a task to the index, replacing any earlier key; caller holds the lock.
+
+        Returns:
+            bool: True if the index changed (False e.g. after a title edit)
+        """
+        key = self._key_for(task)
+        if id(task) in self._entries and self._entries[id(task)] == key:
+            return False
+        self._unindex(task)
+        self._entries[id(task)] = key
+        if key is not None:
+            self._groups[key] += 1
+        return True
+
+    def _unindex(self, task: AbstractTask) -> bool:
+        """
+        Remove a task from the index; caller holds the lock.
+
+        Returns:
+            bool: True if the task was indexed
+        """
+        if id(task) not in self._entries:
+            return False
+        key = self._entries.pop(id(task))
+        if key is not None:
+            self._groups[key] -= 1
+            if not self._groups[key]:
+                del self._groups[key]
+        return True
+
+    def _changed(self) -> None:
+        """Move to a new version and drop the cached forecasts; caller holds the lock."""
+        self.version += 1
+        self._cache.clear()
+
+    def rebuild(self) -> None:
+        """Index every task of the list from scratch."""
+        with self._lock:
+            key_for = self._key_for
+            self._entries = {id(task): key_for(task) for task in self.task_list.snapshot()}
+            self._groups = collections.Counter(key for key in self._entries.values() if key is not None)
+            self._metrics["rebuilds"] += 1
+            self._changed()
+
+    def _on_events(self, events: List[TaskEvent]) -> None:
+        """Apply a delivered batch of model events to the index."""
+        with self._lock:
+            changed = False
+            for event in events:
+                if event.kind == "changed":
+                    if id(event.task) in self._entries:
+                        changed |= self._index(event.task)
+                elif event.source is self.task_list:
+                    if event.kind == "added":
+                        changed |= self._index(event.task)
+                    elif event.kind == "removed":
+                        changed |= self._unindex(event.task)
+                    elif event.kind == "reset":
+                        self.rebuild()
+            if changed:
+                self._changed()
+
+    def forecast(self, periods: int = 365, start: Optional[datetime.datetime] = None,
+                 include_one_off: bool = False) -> Forecast:
+        """
+        Count task occurrences per bucket.
+
+        A recurring task occurs on its due date and every interval after it;
+        a one-off task occurs once, on its due date, unless it is completed.
+
+        Args:
+            periods (int): Number of buckets in the horizon (365 days by default)
+            start (Optional[datetime.datetime]): Any moment in the first bucket (now if None)
+            include_one_off (bool): Also count uncompleted one-off tasks
+
+        Returns:
+            Forecast: Occurrence counts per bucket
+
+        Raises:
+            ValueError: If periods is negative
+        """
+        if periods < 0:
+            raise ValueError("Forecast periods cannot be negative")
+        self._bus.flush()  # Apply changes made since the last controller operation
+        first_bucket = self._bucket_of(start if start is not None else AbstractTask.clock.now())
+
+        with self._lock:
+            cache_key = (first_bucket, periods, include_one_off)
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                self._cache.move_to_end(cache_key)
+                self._metrics["hits"] += 1
+                return cached
+            self._metrics["misses"] += 1
+
+            counts = self._count(first_bucket, periods, include_one_off)
+            result = Forecast(_ANCHOR + first_bucket * self.bucket, self.bucket, tuple(counts), self.version)
+            self._cache[cache_key] = result
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+            return result
+
+    def _count(self, first_bucket: int, periods: int, include_one_off: bool) -> List[int]:
+        """Compute the occurrence counts of a horizon from the index; caller holds the lock."""
+        counts = [0] * periods
+        starts: Dict[int, List[int]] = {}  # interval in buckets -> tasks by first occurrence bucket
+        lattices: Dict[tuple, List[tuple]] = {}  # (interval, phase) -> (due date, tasks) pairs
+        horizon_start = _ANCHOR + first_bucket * self.bucket
+        horizon_end = horizon_start + periods * self.bucket
+
+        for key, tasks in self._groups.items():
+            kind = key[0]
+            if kind == "strided":
+                _, stride, due_bucket = key
+                offset = due_bucket - first_bucket
+                if offset < 0:
+                    offset %= stride  # First occurrence inside the horizon
+                if offset < periods:
+                    starts.setdefault(stride, [0] * periods)[offset] += tasks
+            elif kind == "single":
+                offset = key[1] - first_bucket
+                if include_one_off and 0 <= offset < periods:
+                    counts[offset] += tasks
+            else:
+                _, interval, phase, due = key
+                lattices.setdefault((interval, phase), []).append((due, tasks))
+
+        for (interval, phase), dues in lattices.items():
+            self._count_lattice(counts, horizon_start, interval, _ANCHOR + phase, dues)
+
+        # Every task starting at bucket b also occurs at b + stride, b + 2 * stride, ...
+        for stride, occurrences in starts.items():
+            for index in range(stride, periods):
+                occurrences[index] += occurrences[index - stride]
+            for index, count in enumerate(occurrences):
+                counts[index] += count
+        return counts
+
+    def _count_lattice(self, counts: List[int], horizon_start: datetime.datetime,
+                       interval: datetime.timedelta, origin: datetime.datetime, dues: List[tuple]) -> None:
+        """
+        Add the occurrences of tasks sharing one interval and phase to the counts.
+
+        All their occurrences fall on origin + k * interval, so the number of
+        lattice points before a moment is a floor division and a bucket holds
+        the difference of two of them. A task counts from its due date on:
+        those due before the horizon count in every bucket, the others from
+        their due bucket.
+
+        Args:
+            counts (List[int]): Occurrence counts per bucket, updated in place
+            horizon_start (datetime.datetime): Start of the first bucket
+            interval (datetime.timedelta): Interval of the tasks
+            origin (datetime.datetime): Any point of the lattice
+            dues (List[tuple]): (due date, tasks) pairs on the lattice
+        """
+        periods = len(counts)
+
+        def points_before(moment: datetime.datetime) -> int:
+            return -((origin - moment) // interval)
+
+        bounds = [points_before(horizon_start + index * self.bucket) for index in range(periods + 1)]
+        active = 0  # Tasks occurring in every bucket from the current one on
+        starting = [0] * periods  # Tasks whose due date falls in each bucket
+        partial = [0] * periods  # Their occurrences in that first bucket
+        for due, tasks in dues:
+            if due < horizon_start:
+                active += tasks
+                continue
+            index = (due - horizon_start) // self.bucket
+            if index < periods:
+                starting[index] += tasks
+                partial[index] += tasks * (bounds[index + 1] - points_before(due))
+        for index in range(periods):
+            counts[index] += active * (bounds[index + 1] - bounds[index]) + partial[index]
+            active += starting[index]
+
+    def get_metrics(self) -> Dict[str, int]:
+        """
+        Get forecast statistics.
+
+        Returns:
+            Dict[str, int]: Cache hits and misses, rebuilds, current version,
+            indexed tasks and distinct index keys
+        """
+        with self._lock:
+            metrics = dict(self._metrics)
+            metrics["version"] = self.version
+            metrics["indexed_tasks"] = len(self._entries)
+            metrics["groups"] = len(self._groups)
+        return metrics
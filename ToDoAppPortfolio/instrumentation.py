@@ -0,0 +1,344 @@
+"""
+Instrumentation Module - Portfolio Quality Implementation
+
+This module measures where time goes in a running application. It is
+opt-in: nothing is timed until a controller is attached.
+
+The instrumentation layer provides:
+- High-resolution timers and call counters on every public
+  TaskManagerController method and every AbstractDAO method
+- Log-scaled latency histograms with p50/p90/p99 in constant memory
+- Optional cProfile capture (function-level hot spots)
+- Optional tracemalloc capture (allocation sites and peak memory)
+- Text and JSON reports
+
+Classes:
+- LatencyHistogram: Thread-safe log-bucketed latency histogram
+- Instrumentation: Attaches timers to a controller and its DAO and builds reports
+
+Author: [Moses Gana]
+Date: 2024
+Version: 8.0 (Portfolio Quality with PriorityTask Support)
+"""
+
+
+# IMPORTS
+
+
+import cProfile  # For optional function-level profiling
+import functools  # For preserving wrapped method metadata
+import inspect  # For discovering public methods
+import io  # For capturing profiler output
+import json  # For JSON reports
+import math  # For logarithmic bucketing
+import pstats  # For formatting profiler statistics
+import threading  # For histogram locks
+import time  # For the nanosecond timer
+import tracemalloc  # For optional allocation tracking
+from typing import Any, Callable, Dict, List, Optional  # For type hints
+
+
+# LATENCY HISTOGRAM CLASS DEFINITION
+
+
+class LatencyHistogram:
+    """
+    Thread-safe latency histogram with logarithmic buckets.
+
+    Each power of two is split into BUCKETS_PER_OCTAVE buckets, so
+    percentiles are accurate to about 9% whatever the number of samples,
+    and memory stays bounded by the range of observed latencies.
+    """
+
+    BUCKETS_PER_OCTAVE = 8
+
+    def __init__(self) -> None:
+        """Initialize an empty histogram."""
+        self._lock = threading.Lock()
+        self.clear()
+
+    def clear(self) -> None:
+        """Discard all recorded calls."""
+        self._buckets: Dict[int, int] = {}
+        self.count = 0
+        self.errors = 0
+        self.total_ns = 0
+        self.min_ns: Optional[int] = None
+        self.max_ns = 0
+
+    def record(self, elapsed_ns: int, failed: bool = False) -> None:
+        """
+        Record one call.
+
+        Args:
+            elapsed_ns (int): Call duration in nanoseconds
+            failed (bool): The call raised an exception
+        """
+        bucket = int(math.log2(elapsed_ns) * self.BUCKETS_PER_OCTAVE) if elapsed_ns > 0 else 0
+        with self._lock:
+            self._buckets[bucket] = self._buckets.get(bucket, 0) + 1
+            self.count += 1
+            self.total_ns += elapsed_ns
+            self.errors += failed
+            if self.min_ns is None or elapsed_ns < self.min_ns:
+                self.min_ns = elapsed_ns
+            if elapsed_ns > self.max_ns:
+                self.max_ns = elapsed_ns
+
+    def percentile(self, fraction: float) -> float:
+        """
+        Estimate a latency percentile.
+
+        Args:
+            fraction (float): Percentile as a fraction (0.99 for p99)
+
+        Returns:
+            float: Upper bound of the bucket holding the percentile, in nanoseconds
+        """
+        with self._lock:
+            if not self.count:
+                return 0.0
+            rank = max(1, math.ceil(fraction * self.count))
+            seen = 0
+            for bucket in sorted(self._buckets):
+                seen += self._buckets[bucket]
+                if seen >= rank:
+                    upper = 2 ** ((bucket + 1) / self.BUCKETS_PER_OCTAVE)
+                    return min(max(upper, self.min_ns), self.max_ns)
+            return float(self.max_ns)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Summarize the histogram.
+
+        Returns:
+            Dict[str, Any]: Call and error counts, and total, mean, min,
+            p50, p90, p99 and max latency in microseconds
+        """
+        mean_us = self.total_ns / self.count / 1000 if self.count else 0.0
+        return {
+            "calls": self.count,
+            "errors": self.errors,
+            "total_ms": self.total_ns / 1e6,
+            "mean_us": mean_us,
+            "min_us": (self.min_ns or 0) / 1000,
+            "p50_us": self.percentile(0.50) / 1000,
+            "p90_us": self.percentile(0.90) / 1000,
+            "p99_us": self.percentile(0.99) / 1000,
+            "max_us": self.max_ns / 1000,
+        }
+
+
+# INSTRUMENTATION CLASS DEFINITION
+
+
+class Instrumentation:
+    """
+    Opt-in timing layer for a TaskManagerController and its DAO.
+
+    Public methods are wrapped on the instance only, so other controllers
+    are unaffected and detach() restores the original methods. The DAO is
+    created lazily by load and save, so it is instrumented as soon as it
+    appears on the controller.
+
+    Timings are inclusive: a public method that calls another public
+    method is counted under both names.
+    """
+
+    def __init__(self, profile: bool = False, trace_memory: bool = False) -> None:
+        """
+        Initialize the instrumentation (call attach() to start timing).
+
+        Args:
+            profile (bool): Capture a cProfile profile of the attaching thread
+            trace_memory (bool): Track allocations with tracemalloc
+        """
+        self.profile = profile
+        self.trace_memory = trace_memory
+        self.histograms: Dict[str, LatencyHistogram] = {}
+        self._wrapped: List[tuple] = []  # (object, method name) pairs to restore
+        self._controller = None
+        self._dao = None
+        self._profiler: Optional[cProfile.Profile] = None
+        self._started_tracemalloc = False
+        self.started_at: Optional[float] = None
+
+    def _histogram(self, name: str) -> LatencyHistogram:
+        """Get or create the histogram for an operation."""
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms.setdefault(name, LatencyHistogram())
+        return histogram
+
+    def _wrap(self, name: str, method: Callable[..., Any]) -> Callable[..., Any]:
+        """Wrap a bound method with a timer feeding the named histogram."""
+        histogram = self._histogram(name)
+        clock = time.perf_counter_ns
+
+        @functools.wraps(method)
+        def timed(*args: Any, **kwargs: Any) -> Any:
+            start = clock()
+            failed = True
+            try:
+                result = method(*args, **kwargs)
+                failed = False
+                return result
+            finally:
+                histogram.record(clock() - start, failed)
+                if self._controller is not None and self._controller.dao is not self._dao:
+                    self._instrument_dao()
+        return timed
+
+    def _instrument(self, obj: Any, prefix: str) -> None:
+        """Wrap every public method of an object on the instance."""
+        for name, _ in inspect.getmembers(type(obj), inspect.isfunction):
+            if name.startswith("_"):
+                continue
+            setattr(obj, name, self._wrap(f"{prefix}.{name}", getattr(obj, name)))
+            self._wrapped.append((obj, name))
+
+    def _instrument_dao(self) -> None:
+        """Instrument the controller's current DAO, if it is new."""
+        dao = self._controller.dao
+        self._dao = dao
+        if dao is not None and "get_all_tasks" not in vars(dao):
+            self._instrument(dao, f"dao.{type(dao).__name__}")
+
+    @property
+    def active(self) -> bool:
+        """Check whether a controller is currently being timed."""
+        return self._controller is not None
+
+    def attach(self, controller) -> "Instrumentation":
+        """
+        Start timing a controller and its DAO.
+
+        Args:
+            controller (TaskManagerController): Controller to instrument
+
+        Returns:
+            Instrumentation: self, for chaining
+        """
+        self._controller = controller
+        self._instrument(controller, "controller")
+        self._instrument_dao()
+        self.started_at = time.time()
+
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        if self.profile:
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+        return self
+
+    def detach(self) -> None:
+        """Stop timing and restore the original methods; collected data is kept."""
+        if self._profiler is not None:
+            self._profiler.disable()
+        for obj, name in self._wrapped:
+            vars(obj).pop(name, None)
+        self._wrapped.clear()
+        self._controller = None
+        self._dao = None
+
+    def reset(self) -> None:
+        """Discard all collected timings."""
+        for histogram in list(self.histograms.values()):
+            histogram.clear()
+
+    def profile_report(self, limit: int = 20) -> str:
+        """
+        Get the cProfile hot spots, sorted by cumulative time.
+
+        Args:
+            limit (int): Number of functions to list
+
+        Returns:
+            str: Formatted profiler statistics (empty if profiling is off)
+        """
+        if self._profiler is None:
+            return ""
+        output = io.StringIO()
+        self._profiler.disable()  # pstats needs a stopped profiler
+        pstats.Stats(self._profiler, stream=output).sort_stats("cumulative").print_stats(limit)
+        if self._controller is not None:
+            self._profiler.enable()
+        return output.getvalue()
+
+    def memory_report(self, limit: int = 10) -> Dict[str, Any]:
+        """
+        Get tracemalloc statistics.
+
+        Args:
+            limit (int): Number of allocation sites to list
+
+        Returns:
+            Dict[str, Any]: Current and peak traced bytes and the largest
+            allocation sites (empty if tracing is off)
+        """
+        if not tracemalloc.is_tracing():
+            return {}
+        current, peak = tracemalloc.get_traced_memory()
+        top = tracemalloc.take_snapshot().statistics("lineno")[:limit]
+        return {
+            "current_bytes": current,
+            "peak_bytes": peak,
+            "top_allocations": [{"site": str(stat.traceback), "bytes": stat.size, "blocks": stat.count}
+                                for stat in top],
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Build the JSON-compatible report.
+
+        Returns:
+            Dict[str, Any]: Per-operation histograms, plus memory statistics if traced
+        """
+        operations = {name: histogram.to_dict()
+                      for name, histogram in sorted(self.histograms.items()) if histogram.count}
+        report: Dict[str, Any] = {
+            "elapsed_seconds": time.time() - self.started_at if self.started_at else 0.0,
+            "operations": operations,
+        }
+        memory = self.memory_report()
+        if memory:
+            report["memory"] = memory
+        return report
+
+    def report_json(self) -> str:
+        """Get the report as a JSON document."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def report_text(self) -> str:
+        """
+        Get the report as a fixed-width table, followed by profiler output if enabled.
+
+        Returns:
+            str: Human-readable report
+        """
+        report = self.to_dict()
+        lines = [f"{'operation':<44} {'calls':>8} {'p50 us':>10} {'p99 us':>10} {'max us':>10} {'total ms':>10}"]
+        for name, stats in report["operations"].items():
+            lines.append(f"{name:<44} {stats['calls']:>8} {stats['p50_us']:>10.1f} {stats['p99_us']:>10.1f} "
+                         f"{stats['max_us']:>10.1f} {stats['total_ms']:>10.2f}")
+        if len(lines) == 1:
+            lines.append("No operations recorded yet.")
+
+        memory = report.get("memory")
+        if memory:
+            lines.append(f"\nTraced memory: {memory['current_bytes']:,} bytes (peak {memory['peak_bytes']:,})")
+            for allocation in memory["top_allocations"]:
+                lines.append(f"  {allocation['bytes']:>12,} bytes  {allocation['site']}")
+
+        profile = self.profile_report()
+        if profile:
+            lines.append("\n" + profile)
+        return "\n".join(lines)
+
+    def close(self) -> None:
+        """Detach and stop any tracemalloc session this instance started."""
+        self.detach()
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
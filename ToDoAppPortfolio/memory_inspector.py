@@ -0,0 +1,288 @@
+"""
+Memory Inspector Module - Portfolio Quality Implementation
+
+This module measures how much memory a task list really uses, for sizing
+hosts and checking the effect of memory optimizations.
+
+The memory inspector provides:
+- Deep byte sizes of every task, broken down by task type and by field
+- A breakdown by kind of storage: object headers, instance dictionaries,
+  strings, datetimes, numbers and containers
+- Objects shared between tasks (such as a common due date) counted once
+- Projected footprint for any number of tasks, for capacity planning
+
+Classes:
+- TaskTypeUsage: Memory used by all tasks of one type
+- MemoryReport: Result of inspecting a task list, with projections
+- MemoryInspector: Walks a task list and builds a MemoryReport
+
+Author: [Moses Gana]
+Date: 2024
+Version: 8.0 (Portfolio Quality with PriorityTask Support)
+"""
+
+
+# IMPORTS
+
+
+import datetime  # For recognizing datetime objects
+import sys  # For object sizes
+from typing import Any, Dict, List, Optional, Set  # For type hints
+from task import AbstractTask  # Import the task base class
+
+
+# Bytes per list slot (one pointer); lists over-allocate by about 1/8 when growing
+POINTER_BYTES = 8
+LIST_GROWTH_FACTOR = 1.125
+
+
+# TASK TYPE USAGE CLASS DEFINITION
+
+
+class TaskTypeUsage:
+    """
+    Memory used by all tasks of one type.
+
+    Attributes:
+        task_type (str): Task type name
+        count (int): Number of tasks of this type
+        field_bytes (Dict[str, int]): Deep bytes per attribute, over all tasks;
+            '(object)' is the instance header plus its attribute dictionary
+        category_bytes (Dict[str, int]): Deep bytes per kind of storage
+    """
+
+    def __init__(self, task_type: str) -> None:
+        """Initialize empty usage for a task type."""
+        self.task_type = task_type
+        self.count = 0
+        self.field_bytes: Dict[str, int] = {}
+        self.category_bytes: Dict[str, int] = {}
+
+    @property
+    def total_bytes(self) -> int:
+        """Get the deep bytes of all tasks of this type."""
+        return sum(self.field_bytes.values())
+
+    @property
+    def bytes_per_task(self) -> float:
+        """Get the average deep bytes of one task of this type."""
+        return self.total_bytes / self.count if self.count else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the usage to a JSON-compatible dictionary."""
+        return {
+            "count": self.count,
+            "total_bytes": self.total_bytes,
+            "bytes_per_task": self.bytes_per_task,
+            "fields": dict(sorted(self.field_bytes.items(), key=lambda item: -item[1])),
+            "categories": dict(sorted(self.category_bytes.items(), key=lambda item: -item[1])),
+        }
+
+
+# MEMORY REPORT CLASS DEFINITION
+
+
+class MemoryReport:
+    """
+    Result of inspecting a task list.
+
+    Attributes:
+        by_type (Dict[str, TaskTypeUsage]): Usage per task type
+        list_bytes (int): Bytes of the task list's own storage (list and cached snapshot)
+    """
+
+    def __init__(self, by_type: Dict[str, TaskTypeUsage], list_bytes: int) -> None:
+        """Initialize the report."""
+        self.by_type = by_type
+        self.list_bytes = list_bytes
+
+    @property
+    def task_count(self) -> int:
+        """Get the number of inspected tasks."""
+        return sum(usage.count for usage in self.by_type.values())
+
+    @property
+    def total_bytes(self) -> int:
+        """Get the deep bytes of the whole task list."""
+        return sum(usage.total_bytes for usage in self.by_type.values()) + self.list_bytes
+
+    def project(self, task_count: int, mix: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
+        """
+        Project the footprint of a list with a different number of tasks.
+
+        Per-task costs are taken from the inspected list. Objects that were
+        shared in the inspected list are assumed to stay shared equally.
+
+        Args:
+            task_count (int): Number of tasks to project for
+            mix (Optional[Dict[str, float]]): Share of each task type
+                (defaults to the mix of the inspected list)
+
+        Returns:
+            Dict[str, Any]: Projected bytes per task type, list storage and total
+
+        Raises:
+            ValueError: If no tasks were inspected or the mix names an unknown type
+        """
+        if not self.task_count:
+            raise ValueError("Cannot project from an empty task list")
+        if mix is None:
+            mix = {name: usage.count / self.task_count for name, usage in self.by_type.items()}
+        unknown = set(mix) - set(self.by_type)
+        if unknown:
+            raise ValueError(f"No inspected tasks of type(s): {sorted(unknown)}")
+
+        by_type = {name: int(task_count * share * self.by_type[name].bytes_per_task)
+                   for name, share in mix.items()}
+        # The task list and its cached snapshot tuple hold one pointer per task each
+        list_bytes = int(task_count * POINTER_BYTES * (LIST_GROWTH_FACTOR + 1))
+        return {
+            "task_count": task_count,
+            "by_type": by_type,
+            "list_bytes": list_bytes,
+            "total_bytes": sum(by_type.values()) + list_bytes,
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the report to a JSON-compatible dictionary."""
+        return {
+            "task_count": self.task_count,
+            "total_bytes": self.total_bytes,
+            "list_bytes": self.list_bytes,
+            "by_type": {name: usage.to_dict() for name, usage in sorted(self.by_type.items())},
+        }
+
+    def format_text(self, projections: Optional[List[int]] = None) -> str:
+        """
+        Format the report as a fixed-width table.
+
+        Args:
+            projections (Optional[List[int]]): Task counts to project for
+
+        Returns:
+            str: Human-readable report
+        """
+        lines = [f"Memory report: {self.task_count:,} tasks, {self.total_bytes:,} bytes deep",
+                 f"{'type':<16} {'count':>10} {'total bytes':>14} {'bytes/task':>11}"]
+        for name, usage in sorted(self.by_type.items()):
+            lines.append(f"{name:<16} {usage.count:>10,} {usage.total_bytes:>14,} {usage.bytes_per_task:>11,.0f}")
+            summary = usage.to_dict()
+            fields = ", ".join(f"{field} {size / usage.count:,.0f}" for field, size in summary["fields"].items())
+            categories = ", ".join(f"{category} {size / usage.count:,.0f}"
+                                   for category, size in summary["categories"].items())
+            lines.append(f"    per task by field: {fields}")
+            lines.append(f"    per task by kind:  {categories}")
+        lines.append(f"List storage: {self.list_bytes:,} bytes")
+
+        for task_count in projections or []:
+            projected = self.project(task_count)
+            lines.append(f"Projected for {task_count:,} tasks: {projected['total_bytes']:,} bytes "
+                         f"({projected['total_bytes'] / 1024 ** 2:,.1f} MiB)")
+        return "\n".join(lines)
+
+
+# MEMORY INSPECTOR CLASS DEFINITION
+
+
+class MemoryInspector:
+    """
+    Walks a task list and measures the deep size of every task.
+
+    Sizes come from sys.getsizeof, following references into instance
+    dictionaries and containers. Every object is counted once, by the
+    first task that references it. Interpreter-wide singletons (None,
+    booleans and small integers) are not counted.
+    """
+
+    _DATETIME_TYPES = (datetime.date, datetime.time, datetime.timedelta)
+    _CONTAINER_TYPES = (list, tuple, set, frozenset)
+
+    def __init__(self) -> None:
+        """Initialize an inspector with no objects seen yet."""
+        self._seen: Set[int] = set()
+
+    @staticmethod
+    def _is_singleton(value: Any) -> bool:
+        """Check whether a value is an interpreter-wide shared object."""
+        return value is None or isinstance(value, bool) or (type(value) is int and -5 <= value <= 256)
+
+    def deep_size(self, value: Any, categories: Dict[str, int]) -> int:
+        """
+        Measure an object and everything it references, skipping objects already seen.
+
+        Args:
+            value (Any): Object to measure
+            categories (Dict[str, int]): Bytes per kind of storage, updated in place
+
+        Returns:
+            int: Bytes not already counted
+        """
+        total = 0
+        stack = [value]
+        while stack:
+            obj = stack.pop()
+            if id(obj) in self._seen or self._is_singleton(obj):
+                continue
+            self._seen.add(id(obj))
+            size = sys.getsizeof(obj)
+
+            if isinstance(obj, str):
+                category = "strings"
+            elif isinstance(obj, self._DATETIME_TYPES):
+                category = "datetimes"
+            elif isinstance(obj, (int, float)):
+                category = "numbers"
+            elif isinstance(obj, dict):
+                category = "containers"
+                stack.extend(obj.keys())
+                stack.extend(obj.values())
+            elif isinstance(obj, self._CONTAINER_TYPES):
+                category = "containers"
+                stack.extend(obj)
+            elif isinstance(obj, AbstractTask):
+                category = "objects"  # E.g. the cached frozen copy of a task
+                stack.append(vars(obj))
+            else:
+                category = "other"
+
+            categories[category] = categories.get(category, 0) + size
+            total += size
+        return total
+
+    def inspect(self, task_list) -> MemoryReport:
+        """
+        Measure every task in a task list.
+
+        Args:
+            task_list (TaskList): Task list to inspect
+
+        Returns:
+            MemoryReport: Usage by task type and field
+        """
+        self._seen = set()
+        by_type: Dict[str, TaskTypeUsage] = {}
+        tasks = task_list.snapshot()
+
+        for task in tasks:
+            task_type = task.get_task_type()
+            usage = by_type.get(task_type)
+            if usage is None:
+                usage = by_type[task_type] = TaskTypeUsage(task_type)
+            usage.count += 1
+
+            attributes = vars(task)
+            self._seen.update((id(task), id(attributes)))
+            header = sys.getsizeof(task) + sys.getsizeof(attributes)
+            usage.field_bytes["(object)"] = usage.field_bytes.get("(object)", 0) + header
+            usage.category_bytes["objects"] = usage.category_bytes.get("objects", 0) + sys.getsizeof(task)
+            usage.category_bytes["instance dicts"] = (usage.category_bytes.get("instance dicts", 0)
+                                                      + sys.getsizeof(attributes))
+
+            for name, value in attributes.items():
+                self._seen.add(id(name))  # Attribute names are interned and shared
+                usage.field_bytes[name] = (usage.field_bytes.get(name, 0)
+                                           + self.deep_size(value, usage.category_bytes))
+
+        list_bytes = sys.getsizeof(task_list.tasks) + sys.getsizeof(tasks)
+        self._seen = set()
+        return MemoryReport(by_type, list_bytes)
@@ -0,0 +1,305 @@
+"""
+Overdue Tracker Module - Portfolio Quality Implementation
+
+This module keeps the set of overdue tasks up to date incrementally,
+instead of comparing every task with the current time on each view.
+
+The overdue tracker provides:
+- A min-heap of (due date, token, task) entries for uncompleted tasks
+  that are not yet overdue
+- A set of overdue tasks that advances with time: each tick pops only the
+  tasks that became overdue since the previous tick, O(k log n) for k of them
+- O(log n) updates from controller mutations, with lazily invalidated heap
+  entries and periodic compaction (as in the reminder engine)
+- The overdue tasks kept in list order: tasks entering the set are
+  inserted by binary search and tasks leaving it are deleted in place, so
+  paging the overdue view never sorts it
+- Time taken from an injectable clock (AbstractTask.clock by default), so
+  virtual time can drive it deterministically; a clock moved backwards
+  triggers a full rebuild
+
+Classes:
+- OverdueTracker: Incrementally maintained overdue set for one task list
+
+Author: [Moses Gana]
+Date: 2024
+Version: 8.0 (Portfolio Quality with PriorityTask Support)
+"""
+
+
+# IMPORTS
+
+
+import bisect  # For ordered insertion into the overdue list
+import datetime  # For due date comparisons
+import heapq  # For the due-date min-heap
+import itertools  # For unique entry tokens
+import threading  # For the tracker lock
+from typing import Dict, Iterable, List, Optional, Tuple  # For type hints
+from clock import Clock  # Import the clock interface
+from task import AbstractTask  # Import the task base class
+
+
+# OVERDUE TRACKER CLASS DEFINITION
+
+
+class OverdueTracker:
+    """
+    Incrementally maintained set of overdue tasks.
+
+    A task is overdue when it is not completed and its due date is before
+    the current time, exactly as AbstractTask.is_overdue() decides. Every
+    tracked uncompleted task is either in the overdue set or has one valid
+    heap entry; edits push a fresh entry and invalidate the old one.
+
+    The tracker learns about changes from the controller's mutation
+    listeners. If the task list's membership changes behind the
+    controller's back (e.g. through TaskList.apply_batch), the generation
+    counter reveals it and the next tick rebuilds the tracker in O(n).
+    """
+
+    COMPACT_MIN_SIZE = 1024  # Below this heap size, stale entries are simply skipped
+
+    def __init__(self, clock: Optional[Clock] = None) -> None:
+        """
+        Initialize an empty tracker (call attach() to follow a controller).
+
+        Args:
+            clock (Optional[Clock]): Source of the current time (AbstractTask.clock if None)
+        """
+        self._clock = clock
+        self._heap: List[Tuple[datetime.datetime, int, AbstractTask]] = []
+        self._tokens: Dict[int, int] = {}  # id(task) -> token of its valid heap entry
+        self._overdue: Dict[int, AbstractTask] = {}  # id(task) -> overdue task
+        # The overdue tasks in list order as of the last ordered_tasks(), and the
+        # tasks that entered or left the set since
+        self._ordered: List[AbstractTask] = []
+        self._entered: List[AbstractTask] = []
+        self._left: List[AbstractTask] = []
+        self._reorder = True
+        self._counter = itertools.count()
+        self._stale = 0
+        self._lock = threading.RLock()
+        self._controller = None  # Set by attach()
+        self._generation = -1  # Task list generation the tracker is in step with
+        self._last_tick: Optional[datetime.datetime] = None
+        self._metrics: Dict[str, int] = {"ticks": 0, "became_overdue": 0, "rebuilds": 0, "compactions": 0}
+
+    @property
+    def clock(self) -> Clock:
+        """Get the clock the tracker reads the time from."""
+        return self._clock or AbstractTask.clock
+
+    def _track_locked(self, task: AbstractTask, now: datetime.datetime) -> None:
+        """Classify a task as overdue, pending or untracked; caller holds the lock."""
+        key = id(task)
+        if self._tokens.pop(key, None) is not None:
+            self._stale += 1
+        was_overdue = self._overdue.pop(key, None) is not None
+        if not task.completed and task.date_due < now:
+            self._overdue[key] = task
+            if not was_overdue:  # An edit that keeps a task overdue keeps its place
+                self._entered.append(task)
+            return
+        if was_overdue:
+            self._left.append(task)
+        if not task.completed:
+            token = next(self._counter)
+            self._tokens[key] = token
+            heapq.heappush(self._heap, (task.date_due, token, task))
+
+    def track(self, task: AbstractTask) -> None:
+        """
+        Start tracking a task, or reclassify it after an edit or completion.
+
+        Args:
+            task (AbstractTask): Task to (re)classify
+        """
+        with self._lock:
+            self._track_locked(task, self._last_tick or self.clock.now())
+            self._compact_if_needed_locked()
+
+    def untrack(self, task: AbstractTask) -> None:
+        """
+        Stop tracking a task, e.g. after it was removed from the list.
+
+        Args:
+            task (AbstractTask): Task to forget
+        """
+        with self._lock:
+            if self._tokens.pop(id(task), None) is not None:
+                self._stale += 1
+            if self._overdue.pop(id(task), None) is not None:
+                self._left.append(task)
+            self._compact_if_needed_locked()
+
+    def rebuild(self, tasks: Iterable[AbstractTask]) -> None:
+        """
+        Reclassify every task from scratch in O(n).
+
+        Args:
+            tasks (Iterable[AbstractTask]): All tasks to track
+        """
+        with self._lock:
+            now = self.clock.now()
+            self._heap, self._tokens, self._overdue, self._stale = [], {}, {}, 0
+            for task in tasks:
+                if task.completed:
+                    continue
+                if task.date_due < now:
+                    self._overdue[id(task)] = task
+                else:
+                    token = next(self._counter)
+                    self._tokens[id(task)] = token
+                    self._heap.append((task.date_due, token, task))
+            heapq.heapify(self._heap)
+            self._entered, self._left, self._reorder = [], [], True
+            self._last_tick = now
+            if self._controller is not None:
+                self._generation = self._controller.task_list.generation
+            self._metrics["rebuilds"] += 1
+
+    def _compact_if_needed_locked(self) -> None:
+        """Rebuild the heap when stale entries outnumber valid ones."""
+        if len(self._heap) >= self.COMPACT_MIN_SIZE and self._stale * 2 > len(self._heap):
+            tokens = self._tokens
+            self._heap = [entry for entry in self._heap if tokens.get(id(entry[2])) == entry[1]]
+            heapq.heapify(self._heap)
+            self._stale = 0
+            self._metrics["compactions"] += 1
+
+    def tick(self) -> int:
+        """
+        Advance to the current time, moving newly overdue tasks into the overdue set.
+
+        Returns:
+            int: Number of tasks that became overdue since the previous tick
+        """
+        with self._lock:
+            now = self.clock.now()
+            if self._controller is not None and (
+                    self._controller.task_list.generation != self._generation
+                    or (self._last_tick is not None and now < self._last_tick)):
+                # Missed membership changes, or time went backwards
+                self.rebuild(self._controller.task_list.snapshot())
+                return 0
+
+            self._metrics["ticks"] += 1
+            self._last_tick = now
+            heap, tokens, overdue = self._heap, self._tokens, self._overdue
+            became_overdue = 0
+            while heap and heap[0][0] < now:
+                _, token, task = heapq.heappop(heap)
+                if tokens.get(id(task)) == token:
+                    del tokens[id(task)]
+                    overdue[id(task)] = task
+                    self._entered.append(task)
+                    became_overdue += 1
+                else:
+                    self._stale -= 1
+            self._metrics["became_overdue"] += became_overdue
+            return became_overdue
+
+    def overdue_tasks(self) -> List[AbstractTask]:
+        """
+        Get the overdue tasks as of now, in no particular order.
+
+        Returns:
+            List[AbstractTask]: Tasks past their due date and not completed
+        """
+        with self._lock:
+            self.tick()
+            return list(self._overdue.values())
+
+    def ordered_tasks(self, positions: Dict[int, int], start: int = 0,
+                      stop: Optional[int] = None) -> List[AbstractTask]:
+        """
+        Get a slice of the overdue tasks as of now, in list order.
+
+        The ordered list is kept between calls and updated in place: tasks
+        that entered the set are inserted by binary search on their list
+        position and tasks that left it are deleted, so a call costs
+        O(stop - start) when nothing changed. Only a rebuild sorts all the
+        overdue tasks. Adding or removing a task keeps the relative order of
+        the others; reorderings behind the controller's back change the list
+        generation, which triggers a rebuild.
+
+        Args:
+            positions (Dict[int, int]): id(task) -> list index, from TaskList.positions()
+            start (int): Index of the first overdue task to return
+            stop (Optional[int]): Index after the last one (None for all)
+
+        Returns:
+            List[AbstractTask]: Copy of the requested slice
+        """
+        def position(task: AbstractTask) -> int:
+            return positions.get(id(task), -1)  # Removed by another thread since the tick
+
+        with self._lock:
+            self.tick()
+            overdue, ordered = self._overdue, self._ordered
+            if self._reorder or len(self._entered) + len(self._left) > len(ordered):
+                self._ordered = sorted(overdue.values(), key=position)
+            else:
+                for task in self._left:
+                    if task in ordered:  # Removed tasks have no position to search for
+                        ordered.remove(task)
+                for task in self._entered:
+                    if overdue.get(id(task)) is task:
+                        ix = bisect.bisect_left(ordered, position(task), key=position)
+                        if ix == len(ordered) or ordered[ix] is not task:  # Entered twice
+                            ordered.insert(ix, task)
+            self._entered, self._left, self._reorder = [], [], False
+            return self._ordered[start:stop]
+
+    def count(self) -> int:
+        """Get the number of overdue tasks as of now."""
+        with self._lock:
+            self.tick()
+            return len(self._overdue)
+
+    def attach(self, controller) -> None:
+        """
+        Keep the overdue set in step with a controller's task list.
+
+        Args:
+            controller (TaskManagerController): Controller to follow
+        """
+        self._controller = controller
+        self.rebuild(controller.task_list.snapshot())
+        controller.add_mutation_listener(self._on_mutation)
+
+    def detach(self) -> None:
+        """Stop following the controller passed to attach()."""
+        if self._controller is not None:
+            self._controller.remove_mutation_listener(self._on_mutation)
+            self._controller = None
+
+    def _on_mutation(self, kind: str, task: Optional[AbstractTask]) -> None:
+        """Reclassify the task affected by a controller mutation."""
+        with self._lock:
+            in_step = self._controller.task_list.generation - self._generation
+            if kind == "load":
+                self.rebuild(self._controller.task_list.snapshot())
+                return
+            if kind == "remove":
+                self.untrack(task)
+            elif task is not None:
+                self.track(task)
+            if kind in ("add", "remove") and in_step == 1:
+                self._generation += 1  # The one membership change we were told about
+
+    def get_metrics(self) -> Dict[str, int]:
+        """
+        Get tracker statistics.
+
+        Returns:
+            Dict[str, int]: Ticks, tasks that became overdue, rebuilds, compactions,
+            overdue and pending tasks, and heap size (including stale entries)
+        """
+        with self._lock:
+            metrics = dict(self._metrics)
+            metrics["overdue"] = len(self._overdue)
+            metrics["pending"] = len(self._tokens)
+            metrics["heap_size"] = len(self._heap)
+        return metrics
@@ -0,0 +1,163 @@
+"""
+Priority Index Module - Portfolio Quality Implementation
+
+This module keeps the priority tasks of a task list bucketed by priority
+level, so the priority view can be paged without rescanning the list.
+
+The priority index provides:
+- One bucket per priority level, each holding its tasks in list order
+- Updates from controller mutations in place: a task is inserted into its
+  bucket by binary search on its list position and moved when its level
+  is edited, so no mutation rescans the list
+- Slices copied out under the index lock, so readers on other threads
+  never see a bucket half updated
+- A full rebuild only after a load, or when the task list's membership
+  changed behind the controller's back (detected by its generation)
+
+Classes:
+- PriorityIndex: Incrementally maintained priority buckets for one task list
+
+Author: [Moses Gana]
+Date: 2024
+Version: 8.0 (Portfolio Quality with PriorityTask Support)
+"""
+
+
+# IMPORTS
+
+
+import bisect  # For ordered insertion into the buckets
+import threading  # For the index lock
+from typing import Dict, List, Optional  # For type hints
+from task import AbstractTask, PriorityTask  # Import task classes
+
+
+# PRIORITY INDEX CLASS DEFINITION
+
+
+class PriorityIndex:
+    """
+    Priority tasks of one task list, bucketed by level in list order.
+
+    The index orders the tasks from the highest level to the lowest, in
+    list order within a level: the order of
+    TaskManagerController.get_priority_tasks(). Like the overdue tracker,
+    the index learns about changes from the controller's mutation listeners.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index (call attach() to follow a controller)."""
+        levels = sorted(PriorityTask.get_valid_priority_levels(), reverse=True)
+        self._buckets: Dict[int, List[AbstractTask]] = {level: [] for level in levels}
+        self._levels: Dict[int, int] = {}  # id(task) -> level of the bucket holding it
+        self._lock = threading.RLock()
+        self._controller = None  # Set by attach()
+        self._task_list = None  # Kept after detach(), so a closed controller's view still reads
+        self._generation = -1  # Task list generation the index is in step with
+        self._metrics: Dict[str, int] = {"rebuilds": 0, "updates": 0}
+
+    def rebuild(self) -> None:
+        """Bucket every task of the followed list from scratch in O(n)."""
+        with self._lock:
+            task_list = self._task_list
+            self._generation = task_list.generation
+            buckets: Dict[int, List[AbstractTask]] = {level: [] for level in self._buckets}
+            levels: Dict[int, int] = {}
+            for task in task_list.snapshot():
+                if isinstance(task, PriorityTask) and task.priority_level in buckets:
+                    buckets[task.priority_level].append(task)
+                    levels[id(task)] = task.priority_level
+            self._buckets, self._levels = buckets, levels
+            self._metrics["rebuilds"] += 1
+
+    def _remove_locked(self, task: AbstractTask) -> None:
+        """Take a task out of its bucket; caller holds the lock."""
+        level = self._levels.pop(id(task), None)
+        if level is not None and task in self._buckets[level]:
+            self._buckets[level].remove(task)  # A removed task has no position to search for
+
+    def _insert_locked(self, task: AbstractTask) -> None:
+        """Put a task into the bucket of its current level; caller holds the lock."""
+        if not isinstance(task, PriorityTask) or task.priority_level not in self._buckets:
+            return
+        positions = self._task_list.positions()
+        if id(task) not in positions:
+            return  # Removed again by another thread
+        bisect.insort(self._buckets[task.priority_level], task, key=lambda other: positions.get(id(other), -1))
+        self._levels[id(task)] = task.priority_level
+
+    def ordered_tasks(self, start: int = 0, stop: Optional[int] = None) -> List[AbstractTask]:
+        """
+        Get a slice of the priority tasks, from the highest level to the lowest.
+
+        Args:
+            start (int): Index of the first task to return
+            stop (Optional[int]): Index after the last one (None for all)
+
+        Returns:
+            List[AbstractTask]: Copy of the requested slice, in O(stop - start)
+        """
+        if self._task_list is None:
+            return []
+        with self._lock:
+            if self._task_list.generation != self._generation:
+                self.rebuild()  # Membership changed without a mutation notification
+            wanted = None if stop is None else max(stop - start, 0)
+            result: List[AbstractTask] = []
+            for bucket in self._buckets.values():
+                if wanted is not None and len(result) >= wanted:
+                    break
+                if start >= len(bucket):
+                    start -= len(bucket)  # The slice begins in a later bucket
+                    continue
+                end = None if wanted is None else start + wanted - len(result)
+                result.extend(bucket[start:end])
+                start = 0
+            return result
+
+    def attach(self, controller) -> None:
+        """
+        Keep the buckets in step with a controller's task list.
+
+        Args:
+            controller (TaskManagerController): Controller to follow
+        """
+        self._controller = controller
+        self._task_list = controller.task_list
+        self.rebuild()
+        controller.add_mutation_listener(self._on_mutation)
+
+    def detach(self) -> None:
+        """Stop following the controller passed to attach()."""
+        if self._controller is not None:
+            self._controller.remove_mutation_listener(self._on_mutation)
+            self._controller = None
+
+    def _on_mutation(self, kind: str, task: Optional[AbstractTask]) -> None:
+        """Move the task affected by a controller mutation to its bucket."""
+        with self._lock:
+            in_step = self._task_list.generation - self._generation
+            if kind == "load" or (kind in ("add", "remove") and in_step != 1) or (
+                    kind not in ("add", "remove") and in_step != 0):
+                self.rebuild()
+                return
+            if kind == "remove":
+                self._remove_locked(task)
+            elif task is not None and self._levels.get(id(task)) != getattr(task, "priority_level", None):
+                self._remove_locked(task)
+                self._insert_locked(task)
+            if kind in ("add", "remove"):
+                self._generation += 1  # The one membership change we were told about
+            self._metrics["updates"] += 1
+
+    def get_metrics(self) -> Dict[str, int]:
+        """
+        Get index statistics.
+
+        Returns:
+            Dict[str, int]: Rebuilds, incremental updates and indexed tasks
+        """
+        with self._lock:
+            metrics = dict(self._metrics)
+            metrics["indexed_tasks"] = len(self._levels)
+        return metrics
@@ -0,0 +1,297 @@
+"""
+Rate Limiter Module - Portfolio Quality Implementation
+
+This module stops one owner from starving everyone else in a shared process
+by bulk-creating tasks.
+
+The rate limiter provides:
+- Token buckets limiting how fast each owner can create tasks, with bursts
+- Task-count and estimated-memory quotas per owner
+- Policies chosen from the owner's permissions: owners without
+  'create_tasks' cannot create tasks, owners with 'unlimited_tasks' are
+  exempt, and other permissions can map to their own policy
+- Metrics on allowed, throttled, delayed and rejected creations
+
+Classes:
+- QuotaExceededError: Raised when a creation is refused
+- TokenBucket: Thread-safe token bucket
+- QuotaPolicy: Limits applied to one owner
+- QuotaManager: Per-owner buckets and metrics, shared by many controllers
+
+Author: [Moses Gana]
+Date: 2024
+Version: 8.0 (Portfolio Quality with PriorityTask Support)
+"""
+
+
+# IMPORTS
+
+
+import threading  # For bucket and metric locks
+import time  # For the monotonic clock and delays
+from typing import Callable, Dict, Optional  # For type hints
+from users import Owner  # Import Owner class
+
+
+# QUOTA EXCEEDED ERROR CLASS DEFINITION
+
+
+class QuotaExceededError(ValueError):
+    """
+    Raised when an owner may not create more tasks.
+
+    Attributes:
+        reason (str): 'denied', 'throttled', 'task_quota' or 'memory_quota'
+        retry_after (float): Seconds until a throttled request could succeed (0 otherwise)
+    """
+
+    def __init__(self, reason: str, message: str, retry_after: float = 0.0) -> None:
+        """Initialize the error."""
+        super().__init__(message)
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+# TOKEN BUCKET CLASS DEFINITION
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    Tokens accrue continuously at `rate` per second up to `capacity`, so an
+    idle owner may burst up to `capacity` operations and is then held to
+    the steady rate.
+    """
+
+    def __init__(self, rate: float, capacity: float,
+                 clock: Callable[[], float] = time.monotonic) -> None:
+        """
+        Initialize a full bucket.
+
+        Args:
+            rate (float): Tokens added per second
+            capacity (float): Maximum number of stored tokens (the burst size)
+            clock (Callable[[], float]): Monotonic time source in seconds
+        """
+        if rate <= 0 or capacity < 1:
+            raise ValueError("Token bucket needs a positive rate and a capacity of at least 1")
+        self.rate = rate
+        self.capacity = capacity
+        self.clock = clock
+        self._tokens = float(capacity)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill_locked(self) -> None:
+        """Add the tokens accrued since the last update."""
+        now = self.clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_acquire(self, tokens: float = 1.0) -> float:
+        """
+        Take tokens if they are available.
+
+        Args:
+            tokens (float): Number of tokens needed
+
+        Returns:
+            float: 0.0 if the tokens were taken, otherwise the seconds to wait
+            until enough tokens will have accrued
+        """
+        with self._lock:
+            self._refill_locked()
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return 0.0
+            return (tokens - self._tokens) / self.rate
+
+    @property
+    def available(self) -> float:
+        """Get the number of tokens currently available."""
+        with self._lock:
+            self._refill_locked()
+            return self._tokens
+
+
+# QUOTA POLICY CLASS DEFINITION
+
+
+class QuotaPolicy:
+    """
+    Limits applied to one owner; None disables a limit.
+
+    Attributes:
+        max_tasks (Optional[int]): Maximum tasks in the owner's list
+        max_bytes (Optional[int]): Maximum estimated memory of the owner's tasks
+        rate (Optional[float]): Sustained task creations per second
+        burst (int): Creations allowed at once before the rate applies
+        max_wait (float): Seconds a creation may wait for a token before it is throttled
+        bytes_per_task (int): Estimated memory per task, for the memory quota
+    """
+
+    def __init__(self, max_tasks: Optional[int] = None, max_bytes: Optional[int] = None,
+                 rate: Optional[float] = None, burst: int = 100, max_wait: float = 0.0,
+                 bytes_per_task: int = 1024) -> None:
+        """Initialize the policy."""
+        self.max_tasks = max_tasks
+        self.max_bytes = max_bytes
+        self.rate = rate
+        self.burst = burst
+        self.max_wait = max_wait
+        self.bytes_per_task = bytes_per_task
+
+    @property
+    def unlimited(self) -> bool:
+        """Check whether the policy imposes no limit at all."""
+        return self.max_tasks is None and self.max_bytes is None and self.rate is None
+
+
+# QUOTA MANAGER CLASS DEFINITION
+
+
+class QuotaManager:
+    """
+    Enforces quota policies for many owners, keyed by email.
+
+    One manager is shared by every controller in a process, so an owner's
+    bucket survives their workspace being evicted and reloaded. The policy
+    is chosen on each check from the owner's current permissions: the
+    first entry of permission_policies the owner holds wins, otherwise the
+    default policy applies.
+    """
+
+    CREATE_PERMISSION = "create_tasks"  # Required to create tasks at all
+    UNLIMITED_PERMISSION = "unlimited_tasks"  # Exempts the owner from all limits
+
+    def __init__(self, default_policy: Optional[QuotaPolicy] = None,
+                 permission_policies: Optional[Dict[str, QuotaPolicy]] = None,
+                 clock: Callable[[], float] = time.monotonic,
+                 sleep: Optional[Callable[[float], None]] = None) -> None:
+        """
+        Initialize the manager.
+
+        Args:
+            default_policy (Optional[QuotaPolicy]): Policy for owners without a
+                more specific permission (unlimited if None)
+            permission_policies (Optional[Dict[str, QuotaPolicy]]): Policy per
+                permission, checked in order
+            clock (Callable[[], float]): Monotonic time source for the buckets
+            sleep (Optional[Callable[[float], None]]): Waits for the rate limit
+                on the given clock; defaults to time.sleep for the real clock.
+                With another clock and no sleep, creations are never delayed:
+                a request that would have to wait is throttled at once
+        """
+        self.default_policy = default_policy or QuotaPolicy()
+        self.permission_policies = dict(permission_policies or {})
+        self.clock = clock
+        if sleep is None and clock is time.monotonic:
+            sleep = time.sleep
+        self.sleep = sleep
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+        self._metrics: Dict[str, int] = {"allowed": 0, "delayed": 0, "throttled": 0, "denied": 0,
+                                         "task_quota_rejections": 0, "memory_quota_rejections": 0}
+        self._owner_rejections: Dict[str, int] = {}
+
+    def policy_for(self, owner: Owner) -> QuotaPolicy:
+        """
+        Choose the policy for an owner from their permissions.
+
+        Args:
+            owner (Owner): Owner creating tasks
+
+        Returns:
+            QuotaPolicy: The applicable policy
+        """
+        for permission, policy in self.permission_policies.items():
+            if permission in owner.permissions:
+                return policy
+        return self.default_policy
+
+    def _bucket_for(self, email: str, policy: QuotaPolicy) -> TokenBucket:
+        """Get the owner's bucket, replacing it if the policy's rate has changed."""
+        bucket = self._buckets.get(email)
+        if bucket is None or bucket.rate != policy.rate or bucket.capacity != policy.burst:
+            with self._lock:
+                bucket = self._buckets.get(email)
+                if bucket is None or bucket.rate != policy.rate or bucket.capacity != policy.burst:
+                    bucket = self._buckets[email] = TokenBucket(policy.rate, policy.burst, self.clock)
+        return bucket
+
+    def _reject(self, owner: Owner, metric: str, error: QuotaExceededError) -> None:
+        """Count a refused creation and raise its error."""
+        with self._lock:
+            self._metrics[metric] += 1
+            self._owner_rejections[owner.email] = self._owner_rejections.get(owner.email, 0) + 1
+        raise error
+
+    def check_create(self, owner: Owner, current_tasks: int, count: int = 1) -> None:
+        """
+        Admit the creation of tasks, waiting briefly for the rate limit if allowed.
+
+        Callers hold their task list's write lock, so current_tasks cannot
+        change before the tasks are added; keep max_wait short.
+
+        Args:
+            owner (Owner): Owner creating the tasks
+            current_tasks (int): Tasks the owner already has
+            count (int): Tasks about to be created
+
+        Raises:
+            QuotaExceededError: If the owner lacks permission, would exceed a
+            quota, or is creating tasks too fast
+        """
+        if (self.CREATE_PERMISSION not in owner.permissions
+                and self.UNLIMITED_PERMISSION not in owner.permissions):
+            self._reject(owner, "denied", QuotaExceededError(
+                "denied", f"Owner '{owner.email}' is not allowed to create tasks"))
+        policy = self.policy_for(owner)
+        if self.UNLIMITED_PERMISSION in owner.permissions or policy.unlimited:
+            with self._lock:
+                self._metrics["allowed"] += count
+            return
+
+        new_total = current_tasks + count
+        if policy.max_tasks is not None and new_total > policy.max_tasks:
+            self._reject(owner, "task_quota_rejections", QuotaExceededError(
+                "task_quota", f"Task quota of {policy.max_tasks} reached for '{owner.email}'"))
+        if policy.max_bytes is not None and new_total * policy.bytes_per_task > policy.max_bytes:
+            self._reject(owner, "memory_quota_rejections", QuotaExceededError(
+                "memory_quota", f"Memory quota of {policy.max_bytes:,} bytes reached for '{owner.email}'"))
+
+        if policy.rate is not None:
+            if count > policy.burst:
+                self._reject(owner, "throttled", QuotaExceededError(
+                    "throttled", f"Batch of {count} exceeds the burst limit of {policy.burst}"))
+            bucket = self._bucket_for(owner.email, policy)
+            wait = bucket.try_acquire(count)
+            patience = policy.max_wait
+            while wait:
+                if wait > patience or self.sleep is None:
+                    self._reject(owner, "throttled", QuotaExceededError(
+                        "throttled", f"Too many tasks created by '{owner.email}'; retry in {wait:.2f}s", wait))
+                self.sleep(wait)
+                patience -= wait
+                wait = bucket.try_acquire(count)
+            if patience < policy.max_wait:
+                with self._lock:
+                    self._metrics["delayed"] += 1
+
+        with self._lock:
+            self._metrics["allowed"] += count
+
+    def get_metrics(self) -> Dict[str, object]:
+        """
+        Get quota statistics.
+
+        Returns:
+            Dict[str, object]: Allowed creations, delayed, throttled, denied and
+            quota-rejected requests, and the owners with the most rejections
+        """
+        with self._lock:
+            metrics: Dict[str, object] = dict(self._metrics)
+            top = sorted(self._owner_rejections.items(), key=lambda item: -item[1])[:10]
+        metrics["top_rejected_owners"] = dict(top)
+        return metrics
@@ -0,0 +1,301 @@
+"""
+Reminders Module - Portfolio Quality Implementation
+
+This module alerts when tasks come due, without polling the task list.
+
+The reminder engine provides:
+- One min-heap of (due date, token, task) entries for all pending reminders
+- One worker thread that sleeps until the earliest due date or a change
+- O(log n) scheduling: a changed task gets a fresh entry and its old entry
+  is invalidated lazily (skipped when it reaches the top of the heap)
+- Periodic compaction so invalidated entries cannot accumulate
+- Automatic rescheduling from controller mutations; a completed
+  RecurringTask is reminded again at its next occurrence
+- Time taken from AbstractTask.clock unless a clock is injected; with a
+  VirtualClock, fire_due() delivers what is due without the worker
+
+Classes:
+- ReminderEngine: Timer heap that calls back when tasks come due
+
+Author: [Moses Gana]
+Date: 2024
+Version: 8.0 (Portfolio Quality with PriorityTask Support)
+"""
+
+
+# IMPORTS
+
+
+import datetime  # For due date comparisons
+import heapq  # For the timer min-heap
+import itertools  # For unique entry tokens
+import threading  # For the worker thread and its condition variable
+from typing import Callable, Dict, Iterable, List, Optional, Tuple  # For type hints
+from task import AbstractTask  # Import the task base class
+from clock import Clock  # Import the clock interface
+
+
+# REMINDER ENGINE CLASS DEFINITION
+
+
+class ReminderEngine:
+    """
+    Timer heap that invokes a callback when tasks come due.
+
+    Each scheduled task has exactly one valid heap entry, identified by the
+    token stored in a dictionary keyed by task identity. Rescheduling pushes
+    a new entry and replaces the token; the old entry stays in the heap until
+    it surfaces and is discarded. When more than half the heap is stale it is
+    rebuilt in O(n).
+
+    Callbacks run on the worker thread and must not block for long.
+    """
+
+    COMPACT_MIN_SIZE = 1024  # Below this heap size, stale entries are simply skipped
+
+    def __init__(self, callback: Callable[[AbstractTask], None],
+                 clock: Optional[Clock] = None) -> None:
+        """
+        Initialize the engine (call start() to begin delivering reminders).
+
+        Args:
+            callback (Callable[[AbstractTask], None]): Called with each task that comes due
+            clock (Optional[Clock]): Source of the current time (AbstractTask.clock if None)
+        """
+        self.callback = callback
+        self._clock = clock
+        self._heap: List[Tuple[datetime.datetime, int, AbstractTask]] = []
+        self._tokens: Dict[int, int] = {}  # id(task) -> token of its valid heap entry
+        self._counter = itertools.count()
+        self._stale = 0
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+        self._controller = None  # Set by attach()
+        self._include_overdue = False
+        self._metrics: Dict[str, int] = {"scheduled": 0, "cancelled": 0, "fired": 0, "compactions": 0}
+
+    @property
+    def clock(self) -> Clock:
+        """Get the clock the engine reads the time from."""
+        return self._clock or AbstractTask.clock
+
+    def start(self) -> None:
+        """Start the worker thread."""
+        with self._condition:
+            if self._running:
+                return
+            self._running = True
+        self._thread = threading.Thread(target=self._run, name="reminders", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the worker thread; pending reminders are kept."""
+        with self._condition:
+            self._running = False
+            self._condition.notify()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _push_locked(self, task: AbstractTask) -> bool:
+        """Invalidate a task's current entry and push a new one; caller holds the condition."""
+        if self._tokens.pop(id(task), None) is not None:
+            self._stale += 1
+        if task.completed:
+            return False
+        token = next(self._counter)
+        self._tokens[id(task)] = token
+        heapq.heappush(self._heap, (task.date_due, token, task))
+        return True
+
+    def schedule(self, task: AbstractTask) -> None:
+        """
+        Schedule (or reschedule) a reminder at the task's due date.
+
+        Completed tasks are unscheduled instead.
+
+        Args:
+            task (AbstractTask): Task to remind about
+        """
+        with self._condition:
+            earliest = self._heap[0] if self._heap else None
+            if self._push_locked(task):
+                self._metrics["scheduled"] += 1
+            self._compact_if_needed_locked()
+            if not self._heap or self._heap[0] is not earliest:
+                self._condition.notify()  # The worker may need to wake sooner
+
+    def schedule_all(self, tasks: Iterable[AbstractTask], include_overdue: bool = True) -> int:
+        """
+        Schedule many tasks at once, rebuilding the heap in O(n).
+
+        Args:
+            tasks (Iterable[AbstractTask]): Tasks to schedule or reschedule
+            include_overdue (bool): Also remind about tasks already past due
+
+        Returns:
+            int: Number of reminders scheduled
+        """
+        now = self.clock.now()
+        scheduled = 0
+        with self._condition:
+            for task in tasks:
+                if self._tokens.pop(id(task), None) is not None:
+                    self._stale += 1
+                if task.completed or (not include_overdue and task.date_due <= now):
+                    continue
+                token = next(self._counter)
+                self._tokens[id(task)] = token
+                self._heap.append((task.date_due, token, task))
+                scheduled += 1
+            self._metrics["scheduled"] += scheduled
+            if self._stale:
+                self._compact_locked()  # Drops stale entries and heapifies in one pass
+            else:
+                heapq.heapify(self._heap)
+            self._condition.notify()
+        return scheduled
+
+    def cancel(self, task: AbstractTask) -> bool:
+        """
+        Cancel a task's pending reminder.
+
+        Args:
+            task (AbstractTask): Task whose reminder is cancelled
+
+        Returns:
+            bool: True if a reminder was pending
+        """
+        with self._condition:
+            if self._tokens.pop(id(task), None) is None:
+                return False
+            self._stale += 1
+            self._metrics["cancelled"] += 1
+            self._compact_if_needed_locked()
+            return True
+
+    def _compact_if_needed_locked(self) -> None:
+        """Rebuild the heap when stale entries outnumber valid ones."""
+        if len(self._heap) >= self.COMPACT_MIN_SIZE and self._stale * 2 > len(self._heap):
+            self._compact_locked()
+
+    def _compact_locked(self) -> None:
+        """Drop stale entries and restore the heap invariant."""
+        tokens = self._tokens
+        self._heap = [entry for entry in self._heap if tokens.get(id(entry[2])) == entry[1]]
+        heapq.heapify(self._heap)
+        self._stale = 0
+        self._metrics["compactions"] += 1
+
+    def _pop_due_locked(self, now: datetime.datetime) -> List[AbstractTask]:
+        """Remove and return every valid entry due at or before now."""
+        due = []
+        heap, tokens = self._heap, self._tokens
+        while heap and heap[0][0] <= now:
+            _, token, task = heapq.heappop(heap)
+            if tokens.get(id(task)) == token:
+                del tokens[id(task)]
+                due.append(task)
+            else:
+                self._stale -= 1
+        return due
+
+    def _run(self) -> None:
+        """Worker loop: sleep until the earliest reminder, then deliver what is due."""
+        while True:
+            with self._condition:
+                if not self._running:
+                    return
+                due = self._pop_due_locked(self.clock.now())
+                if not due:
+                    if self._heap:
+                        delay = (self._heap[0][0] - self.clock.now()).total_seconds()
+                        self._condition.wait(max(delay, 0.0))
+                    else:
+                        self._condition.wait()
+                    continue
+                self._metrics["fired"] += len(due)
+
+            for task in due:  # Deliver outside the lock so callbacks can reschedule
+                self.callback(task)
+
+    def fire_due(self) -> int:
+        """
+        Deliver every reminder due by the clock's current time on the calling thread.
+
+        The worker sleeps in real seconds, so after moving a VirtualClock call
+        this (or run without the worker) to deliver reminders deterministically.
+
+        Returns:
+            int: Number of reminders delivered
+        """
+        with self._condition:
+            due = self._pop_due_locked(self.clock.now())
+            self._metrics["fired"] += len(due)
+            self._condition.notify()  # The worker's earliest entry may be gone
+        for task in due:
+            self.callback(task)
+        return len(due)
+
+    def attach(self, controller, include_overdue: bool = False) -> None:
+        """
+        Keep reminders in step with a controller's task list.
+
+        Existing tasks are scheduled immediately; afterwards additions, edits,
+        completions, removals and loads reschedule the affected tasks.
+
+        Args:
+            controller (TaskManagerController): Controller to follow
+            include_overdue (bool): Remind about tasks that are already overdue
+        """
+        self._include_overdue = include_overdue
+        self.schedule_all(controller.get_all_tasks(), include_overdue)
+        self._controller = controller
+        controller.add_mutation_listener(self._on_mutation)
+
+    def detach(self) -> None:
+        """Stop following the controller passed to attach()."""
+        if self._controller is not None:
+            self._controller.remove_mutation_listener(self._on_mutation)
+            self._controller = None
+
+    def _on_mutation(self, kind: str, task: Optional[AbstractTask]) -> None:
+        """Reschedule the tasks affected by a controller mutation."""
+        if kind == "remove":
+            self.cancel(task)
+        elif kind == "load":
+            self.schedule_all(self._controller.get_all_tasks(), self._include_overdue)
+        elif task is not None:
+            self.schedule(task)
+
+    def next_due(self) -> Optional[datetime.datetime]:
+        """
+        Get the due date of the earliest pending reminder.
+
+        Returns:
+            Optional[datetime.datetime]: Earliest due date, or None if nothing is pending
+        """
+        with self._condition:
+            while self._heap and self._tokens.get(id(self._heap[0][2])) != self._heap[0][1]:
+                heapq.heappop(self._heap)
+                self._stale -= 1
+            return self._heap[0][0] if self._heap else None
+
+    def __len__(self) -> int:
+        """Get the number of pending reminders."""
+        return len(self._tokens)
+
+    def get_metrics(self) -> Dict[str, int]:
+        """
+        Get reminder statistics.
+
+        Returns:
+            Dict[str, int]: Scheduled, cancelled and fired reminders, compactions,
+            pending reminders and heap size (including stale entries)
+        """
+        with self._condition:
+            metrics = dict(self._metrics)
+            metrics["pending"] = len(self._tokens)
+            metrics["heap_size"] = len(self._heap)
+        return metrics
@@ -0,0 +1,131 @@
+"""
+String Pool Module - Portfolio Quality Implementation
+
+This module deduplicates the text stored on tasks. Task lists repeat the
+same titles and descriptions heavily (recurring chores, imported exports),
+and without pooling every loaded task keeps its own copy of each string.
+
+The string pool provides:
+- One canonical copy of each distinct string, so text memory scales with
+  the number of unique strings instead of the number of tasks
+- Statistics on lookups, unique strings, duplicates dropped and bytes saved
+- A size limit, beyond which new strings are passed through unpooled
+- A default pool shared by single-owner processes; WorkspaceManager gives
+  each owner's controller its own pool, so evicting an owner releases the
+  strings only that owner used
+
+Classes:
+- StringPool: Dictionary-backed interning pool with deduplication statistics
+
+Author: [Moses Gana]
+Date: 2024
+Version: 8.0 (Portfolio Quality with PriorityTask Support)
+"""
+
+
+# IMPORTS
+
+
+import sys  # For string sizes
+import threading  # For the statistics lock
+from typing import Any, Dict  # For type hints
+
+
+# STRING POOL CLASS DEFINITION
+
+
+class StringPool:
+    """
+    Interning pool mapping each distinct string to one canonical instance.
+
+    Unlike sys.intern, the pool can be cleared and measured. Pooled strings
+    stay alive until clear() is called or the pool itself is dropped, so the
+    pool is bounded by max_size. Lookups and statistics are safe from
+    several threads.
+    """
+
+    def __init__(self, max_size: int = 1_000_000) -> None:
+        """
+        Initialize an empty pool.
+
+        Args:
+            max_size (int): Maximum number of distinct strings to keep
+        """
+        self.max_size = max_size
+        self._strings: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._lookups = 0
+        self._duplicates = 0
+        self._bytes_saved = 0
+
+    def intern(self, value: str) -> str:
+        """
+        Get the canonical copy of a string, adding it to the pool if new.
+
+        Args:
+            value (str): String to deduplicate
+
+        Returns:
+            str: The pooled string equal to value (value itself if it is new,
+            empty or the pool is full)
+        """
+        if not value:
+            return value  # The empty string is already a singleton
+        with self._lock:
+            self._lookups += 1
+            pooled = self._strings.get(value)
+            if pooled is None:
+                if len(self._strings) >= self.max_size:
+                    return value
+                pooled = self._strings[value] = value
+            elif pooled is not value:
+                self._duplicates += 1
+                self._bytes_saved += sys.getsizeof(value)
+            return pooled
+
+    def __len__(self) -> int:
+        """Get the number of distinct strings in the pool."""
+        return len(self._strings)
+
+    def __contains__(self, value: object) -> bool:
+        """Check whether a string is pooled."""
+        return value in self._strings
+
+    @property
+    def dedup_ratio(self) -> float:
+        """
+        Get the average number of lookups served by each pooled string.
+
+        Returns:
+            float: Lookups per distinct string (1.0 means no duplication)
+        """
+        return self._lookups / len(self._strings) if self._strings else 1.0
+
+    def clear(self) -> None:
+        """Drop all pooled strings and reset the statistics."""
+        with self._lock:
+            self._strings = {}
+            self._lookups = 0
+            self._duplicates = 0
+            self._bytes_saved = 0
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get pool statistics.
+
+        Returns:
+            Dict[str, Any]: Lookups, distinct strings, duplicate copies dropped,
+            estimated bytes saved and the deduplication ratio
+        """
+        with self._lock:
+            return {
+                "lookups": self._lookups,
+                "unique": len(self._strings),
+                "duplicates": self._duplicates,
+                "bytes_saved": self._bytes_saved,
+                "dedup_ratio": self.dedup_ratio,
+            }
+
+
+# Default pool of TaskFactory, the DAOs and controllers, so loaded and created tasks share text
+shared_pool = StringPool()
@@ -7,25 +7,202 @@ Demonstrates comprehensive OOP concepts integration:
 - Advanced task types (regular, recurring, priority)
 - Professional class design and validation
 - Type hints and comprehensive documentation
+- Change events published to the model event bus on every mutation
+- Injectable clock (AbstractTask.clock) for all time-dependent behaviour
 
 Author: [IKENNA FRAKLIN EZEMA]
 """
 
 import datetime
-from typing import List, Optional, Dict, ClassVar
+import itertools
+from typing import Any, Callable, Iterator, List, Optional, Dict, ClassVar, Tuple, Type
 from abc import ABC, abstractmethod
+from events import EventBus, task_events
+from clock import Clock, system_clock
+
+
+class DateFormatter:
+    """
+    Memoizing date formatter for a single render pass.
+
+    Many tasks share the same creation and due dates, so formatting each
+    distinct datetime once per pass avoids repeated formatting work.
+    Create a new formatter for each pass to keep the memo small.
+    """
+
+    def __init__(self, pattern: Optional[str] = None) -> None:
+        """
+        Initialize the formatter.
+
+        Args:
+            pattern (Optional[str]): strftime pattern, or None to match str(datetime)
+        """
+        self.pattern = pattern
+        self._formatted: Dict[datetime.datetime, str] = {}
+
+    def __call__(self, value: datetime.datetime) -> str:
+        """Format a datetime, reusing the result for repeated values."""
+        text = self._formatted.get(value)
+        if text is None:
+            text = str(value) if self.pattern is None else value.strftime(self.pattern)
+            self._formatted[value] = text
+        return text
 
 
 class AbstractTask(ABC):
-    """Abstract base class for all task types - demonstrates Week 8 abstract classes."""
+    """
+    Abstract base class for all task types - demonstrates Week 8 abstract classes.
+
+    Concrete task classes register themselves by type name when they are
+    defined, e.g. ``class Task(AbstractTask, task_type="Task")``, so the
+    factory and the DAOs can look them up without if/elif chains.
+    """
+
+    _registry: ClassVar[Dict[str, Type["AbstractTask"]]] = {}  # Type name -> concrete class
+    TASK_TYPE: ClassVar[str] = ""  # Registered type name
+    TYPE_PARAMS: ClassVar[Tuple[str, ...]] = ()  # Constructor parameters between date_due and description
+    TYPE_FIELDS: ClassVar[Tuple[str, ...]] = ()  # Type-specific attributes restored by restore_many
+    TYPE_DESCRIPTION: ClassVar[str] = ""
+    clock: ClassVar[Clock] = system_clock  # Source of "now"; assign a VirtualClock to drive time
+    _ids: ClassVar[Iterator[int]] = itertools.count(1)  # Source of task_id values
+    event_bus: EventBus = task_events  # Bus "changed" events go to; a TaskList sets its own on adding the task
+
+    def __init_subclass__(cls, task_type: Optional[str] = None, **kwargs: Any) -> None:
+        """Register a concrete task class under its type name."""
+        super().__init_subclass__(**kwargs)
+        if task_type is not None:
+            if task_type in AbstractTask._registry:
+                raise ValueError(f"Task type '{task_type}' is already registered")
+            cls.TASK_TYPE = task_type
+            AbstractTask._registry[task_type] = cls
+
+    @staticmethod
+    def registered_types() -> Dict[str, Type["AbstractTask"]]:
+        """
+        Get the registered task classes in registration order.
+
+        Returns:
+            Dict[str, Type[AbstractTask]]: Type name -> concrete class
+        """
+        return dict(AbstractTask._registry)
+
+    @classmethod
+    def validate_params(cls, params: Dict[str, Any]) -> bool:
+        """
+        Check type-specific constructor parameters (none for the common fields).
+
+        Args:
+            params (Dict[str, Any]): Parameters keyed by name
+
+        Returns:
+            bool: True if the values are acceptable
+        """
+        return True
+
+    @classmethod
+    def type_info(cls) -> Dict[str, Any]:
+        """
+        Describe the task type and its parameters.
+
+        Returns:
+            Dict[str, Any]: Description, required and optional parameters
+        """
+        return {
+            "description": cls.TYPE_DESCRIPTION,
+            "required_params": ["title", "date_due", *cls.TYPE_PARAMS],
+            "optional_params": ["description"],
+        }
+
+    @classmethod
+    def validate_rows(cls, rows: List[tuple]) -> None:
+        """
+        Check a batch of trusted rows before restoring them (nothing to check by default).
+
+        Args:
+            rows (List[tuple]): Rows as accepted by restore_many
+
+        Raises:
+            ValueError: If any row holds an invalid value
+        """
+
+    @classmethod
+    def restore_many(cls, rows: List[tuple]) -> List["AbstractTask"]:
+        """
+        Rebuild many tasks from trusted stored data, e.g. in a DAO load.
+
+        Each row is (title, date_due, description, date_created, completed,
+        <type fields>), where the type fields are those listed in the class's
+        TYPE_FIELDS. The batch is validated once by validate_rows; per-object
+        validation, feedback and the datetime.now() call of __init__ are skipped.
+        Attributes are assigned in the same order as __init__, so restored
+        tasks share the compact attribute layout of normally created ones.
+
+        Args:
+            rows (List[tuple]): One row per task
+
+        Returns:
+            List[AbstractTask]: The restored tasks, in row order
+
+        Raises:
+            ValueError: If validate_rows rejects the batch
+        """
+        cls.validate_rows(rows)
+        new = object.__new__
+        next_id = AbstractTask._ids.__next__
+        restore_type_fields = cls._restore_type_fields
+        tasks = []
+        for title, date_due, description, date_created, completed, *type_fields in rows:
+            task = new(cls)
+            task.title = title
+            task.date_due = date_due
+            task.completed = completed
+            task.date_created = date_created
+            task.description = description
+            task.task_id = next_id()
+            task._version = 0
+            task._display_cache = None
+            task._frozen = None
+            if type_fields:
+                restore_type_fields(task, *type_fields)
+            tasks.append(task)
+        return tasks
+
+    def _restore_type_fields(self, *values: Any) -> None:
+        """Assign the TYPE_FIELDS of a restored task (none for the common fields)."""
 
     def __init__(self, title: str, date_due: datetime.datetime, description: str = "") -> None:
         """Initialize abstract task with common attributes."""
         self.title = title
         self.date_due = date_due
         self.completed = False
-        self.date_created = datetime.datetime.now()
+        self.date_created = self.clock.now()
         self.description = description
+        self.task_id = next(AbstractTask._ids)  # Identifies the task across copies, undo and storage
+        self._version = 0  # Incremented on every mutation
+        self._display_cache: Optional[str] = None  # Memoized string representation
+        self._frozen: Optional["AbstractTask"] = None  # Detached copy of the current version
+
+    def _touch(self) -> None:
+        """
+        Record a mutation of the task.
+
+        Every mutating method calls this to bump the version and drop the
+        memoized display string. Code that assigns task attributes directly
+        after the task has been displayed must call it as well.
+        """
+        self._version += 1
+        self._display_cache = None
+        self.event_bus.publish("changed", self)
+
+    @property
+    def version(self) -> int:
+        """
+        Get the mutation counter of the task.
+
+        Returns:
+            int: Number of mutations applied since the task was created
+        """
+        return self._version
 
     @abstractmethod
     def mark_as_completed(self) -> None:
@@ -52,40 +229,124 @@ class AbstractTask(ABC):
         if not new_title.strip():
             raise ValueError("Task title cannot be empty")
         self.title = new_title.strip()
+        self._touch()
         print(f"Task title changed to '{self.title}'")
 
     def change_date(self, new_date: datetime.datetime) -> None:
         """Change the due date (common implementation)."""
-        if new_date < datetime.datetime.now():
+        if new_date < self.clock.now():
             print("Warning: Setting due date in the past")
         self.date_due = new_date
+        self._touch()
         print(f"Task due date changed to '{self.date_due}'")
 
     def change_description(self, new_description: str) -> None:
         """Change the task description (common implementation)."""
         self.description = new_description
+        self._touch()
         print(f"Task description changed to '{self.description}'")
 
     def is_overdue(self) -> bool:
         """Check if task is overdue (common implementation)."""
-        return datetime.datetime.now() > self.date_due and not self.completed
+        return self.clock.now() > self.date_due and not self.completed
 
     def days_until_due(self) -> int:
         """Calculate days until due date (common implementation)."""
-        delta = self.date_due - datetime.datetime.now()
+        delta = self.date_due - self.clock.now()
         return delta.days
 
-    def __str__(self) -> str:
-        """String representation (common implementation)."""
+    def frozen_copy(self) -> "AbstractTask":
+        """
+        Get a detached copy of the task as it is now, for consistent snapshots.
+
+        The copy is shallow: it shares the task's immutable field values and
+        only duplicates mutable containers. It is cached until the next
+        mutation, so successive snapshots of an unchanged task share one copy.
+        The copy must be treated as read-only.
+
+        Returns:
+            AbstractTask: Copy of the current version of the task
+        """
+        frozen = self._frozen
+        if frozen is not None and frozen._version == self._version:
+            return frozen
+
+        frozen = object.__new__(type(self))
+        frozen.__dict__.update(self.__dict__)
+        self._detach_fields(frozen)
+        frozen._frozen = None
+        self._frozen = frozen
+        return frozen
+
+    def restore_state(self, state: "AbstractTask") -> None:
+        """
+        Return the task to an earlier state captured with frozen_copy(), e.g. to undo an edit.
+
+        The version keeps increasing, so caches keyed on it are invalidated.
+
+        Args:
+            state (AbstractTask): Frozen copy of this task
+        """
+        version = self._version
+        self.__dict__.update(state.__dict__)
+        state._detach_fields(self)  # Own containers, not the frozen copy's
+        self._frozen = None
+        self._version = version
+        self._touch()
+
+    def _detach_fields(self, frozen: "AbstractTask") -> None:
+        """Give a frozen copy its own mutable containers (none for the common fields)."""
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Get a JSON-compatible dictionary of the task's fields (common implementation).
+
+        Returns:
+            Dict[str, Any]: Task fields with dates in ISO 8601 format
+        """
+        return {
+            "type": self.get_task_type(),
+            "title": self.title,
+            "date_due": self.date_due.isoformat(),
+            "completed": self.completed,
+            "date_created": self.date_created.isoformat(),
+            "description": self.description,
+        }
+
+    def render(self, format_date: Optional[Callable[[datetime.datetime], str]] = None) -> str:
+        """
+        Get the memoized string representation of the task.
+
+        The string is built once and reused until the next mutation.
+
+        Args:
+            format_date (Optional[Callable]): Date formatter used if the string must be
+                rebuilt, e.g. a DateFormatter shared across one render pass.
+                Must produce the same text as str(datetime).
+
+        Returns:
+            str: Formatted task details
+        """
+        if self._display_cache is None:
+            self._display_cache = self._build_display(format_date or str)
+        return self._display_cache
+
+    def _build_display(self, format_date: Callable[[datetime.datetime], str]) -> str:
+        """Build the string representation (common implementation)."""
         status = "Completed" if self.completed else "Not Completed"
         desc_part = f" Description: {self.description}" if self.description else ""
-        return f"{self.title} [{status}] Created: {self.date_created} Due: {self.date_due}{desc_part}"
+        return (f"{self.title} [{status}] Created: {format_date(self.date_created)} "
+                f"Due: {format_date(self.date_due)}{desc_part}")
+
+    def __str__(self) -> str:
+        """String representation (common implementation)."""
+        return self.render()
 
 
 # ENHANCED TASK CLASS DEFINITION
 
 
-class Task(AbstractTask):
+class Task(AbstractTask, task_type="Task"):
     """
     Enhanced Task class representing a basic task with description.
 
@@ -95,6 +356,8 @@ class Task(AbstractTask):
     Inherits all attributes from AbstractTask and implements required abstract methods.
     """
 
+    TYPE_DESCRIPTION = "Basic task with title, due date, and optional description"
+
     def __init__(self, title: str, date_due: datetime.datetime, description: str = "") -> None:
         """
         Initialize a new enhanced Task instance with description.
@@ -118,6 +381,7 @@ class Task(AbstractTask):
         Sets completed flag to True and provides user feedback.
         """
         self.completed = True
+        self._touch()
         print(f"Task '{self.title}' is completed.")
 
     def get_task_type(self) -> str:
@@ -130,7 +394,7 @@ class Task(AbstractTask):
         return "Task"
 
 
-class RecurringTask(AbstractTask):
+class RecurringTask(AbstractTask, task_type="RecurringTask"):
     """
     Represents a recurring task in the to-do list.
 
@@ -142,6 +406,10 @@ class RecurringTask(AbstractTask):
         completed_dates (List[datetime.datetime]): List of dates when task was completed
     """
 
+    TYPE_PARAMS = ("interval",)
+    TYPE_FIELDS = ("interval", "completed_dates")
+    TYPE_DESCRIPTION = "Task that repeats at specified intervals"
+
     def __init__(self, title: str, date_due: datetime.datetime, interval: datetime.timedelta, description: str = "") -> None:
         """
         Creates a new recurring task.
@@ -156,6 +424,11 @@ class RecurringTask(AbstractTask):
         self.interval = interval
         self.completed_dates: List[datetime.datetime] = []  # List of completion dates
 
+    def _restore_type_fields(self, interval: datetime.timedelta, completed_dates: List[datetime.datetime]) -> None:
+        """Assign the recurrence fields of a restored task."""
+        self.interval = interval
+        self.completed_dates = completed_dates
+
     def _compute_next_due_date(self) -> datetime.datetime:
         """
         Computes the next due date of the task.
@@ -177,10 +450,11 @@ class RecurringTask(AbstractTask):
         This demonstrates polymorphism - same method name, different behavior.
         """
         # Add current date to completed dates
-        self.completed_dates.append(datetime.datetime.now())
+        self.completed_dates.append(self.clock.now())
 
         # Update due date to next occurrence
         self.date_due = self._compute_next_due_date()
+        self._touch()
 
         # Provide user feedback
         print(f"Recurring task '{self.title}' completed. Next due date: {self.date_due}")
@@ -196,25 +470,43 @@ class RecurringTask(AbstractTask):
         """
         return "RecurringTask"
 
-    def __str__(self) -> str:
+    def _detach_fields(self, frozen: AbstractTask) -> None:
+        """Give a frozen copy its own completion history."""
+        frozen.completed_dates = list(self.completed_dates)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Get a JSON-compatible dictionary including the recurrence fields.
+
+        Returns:
+            Dict[str, Any]: Task fields with interval in days and completion history
         """
-        String representation of the recurring task.
+        data = super().to_dict()
+        data["interval_days"] = self.interval.days
+        data["completed_dates"] = [date.isoformat() for date in self.completed_dates]
+        return data
+
+    def _build_display(self, format_date: Callable[[datetime.datetime], str]) -> str:
+        """
+        Build the string representation of the recurring task.
+
+        Args:
+            format_date (Callable): Formatter applied to the created and due dates
 
         Returns:
             str: Formatted string showing recurring task details
         """
         completed_count = len(self.completed_dates)
-        status = "Completed" if self.completed else "Not Completed"
         desc_part = f" Description: {self.description}" if self.description else ""
-        return (f"{self.title} - Recurring (created: {self.date_created}, "
-                f"due: {self.date_due}, completed {completed_count} times, "
+        return (f"{self.title} - Recurring (created: {format_date(self.date_created)}, "
+                f"due: {format_date(self.date_due)}, completed {completed_count} times, "
                 f"interval: {self.interval}){desc_part}")
 
 
 # PRIORITY TASK CLASS DEFINITION
 
 
-class PriorityTask(AbstractTask):
+class PriorityTask(AbstractTask, task_type="PriorityTask"):
     """
     Represents a task with priority levels.
 
@@ -236,6 +528,10 @@ class PriorityTask(AbstractTask):
         3: "high"
     }
 
+    TYPE_PARAMS = ("priority_level",)
+    TYPE_FIELDS = ("priority_level",)
+    TYPE_DESCRIPTION = "Task with priority levels (1=low, 2=medium, 3=high)"
+
     def __init__(self, title: str, date_due: datetime.datetime, priority_level: int, description: str = "") -> None:
         """
         Initialize a new PriorityTask with validated priority level.
@@ -256,6 +552,32 @@ class PriorityTask(AbstractTask):
         super().__init__(title, date_due, description)
         self._set_priority_level(priority_level)  # Use private method for validation
 
+    @classmethod
+    def validate_rows(cls, rows: List[tuple]) -> None:
+        """
+        Check the priority levels of a whole batch at once.
+
+        The distinct levels of the batch are collected in one pass and
+        compared with the valid levels, instead of validating every task.
+        Levels are keyed by type too, since True and 1.0 compare equal to 1
+        but are not valid levels.
+
+        Args:
+            rows (List[tuple]): Rows as accepted by restore_many
+
+        Raises:
+            ValueError: If any row holds an invalid priority level
+        """
+        levels = {(type(row[5]), row[5]) for row in rows}
+        invalid = [level for kind, level in levels if kind is not int or level not in cls.PRIORITY_MAPPING]
+        if invalid:
+            valid_levels = list(cls.PRIORITY_MAPPING.keys())
+            raise ValueError(f"Priority level must be one of {valid_levels}, got {sorted(invalid, key=str)}")
+
+    def _restore_type_fields(self, priority_level: int) -> None:
+        """Assign the priority level of a restored task (validated by validate_rows)."""
+        self._priority_level = priority_level
+
     def _set_priority_level(self, priority_level: int) -> None:
         """
         Private method to set and validate priority level.
@@ -297,6 +619,7 @@ class PriorityTask(AbstractTask):
             ValueError: If value is not 1, 2, or 3
         """
         self._set_priority_level(value)
+        self._touch()
         print(f"Priority level changed to {value} ({self.get_priority_string()})")
 
     def get_priority_string(self) -> str:
@@ -323,6 +646,7 @@ class PriorityTask(AbstractTask):
         Includes priority information in the completion message.
         """
         self.completed = True
+        self._touch()
         priority_str = self.get_priority_string()
         print(f"{priority_str.capitalize()} priority task '{self.title}' is completed.")
 
@@ -335,13 +659,27 @@ class PriorityTask(AbstractTask):
         """
         return "PriorityTask"
 
-    def __str__(self) -> str:
+    def to_dict(self) -> Dict[str, Any]:
         """
-        Enhanced string representation including priority information.
+        Get a JSON-compatible dictionary including the priority level.
+
+        Returns:
+            Dict[str, Any]: Task fields with priority_level
+        """
+        data = super().to_dict()
+        data["priority_level"] = self._priority_level
+        return data
+
+    def _build_display(self, format_date: Callable[[datetime.datetime], str]) -> str:
+        """
+        Build the enhanced string representation including priority information.
 
         This demonstrates the requirement for suitable string representation
         that uses the mapping attribute and returns task details with priority.
 
+        Args:
+            format_date (Callable): Formatter applied to the created and due dates
+
         Returns:
             str: Formatted string with all task details including priority
 
@@ -354,7 +692,32 @@ class PriorityTask(AbstractTask):
         desc_part = f" Description: {self.description}" if self.description else ""
 
         return (f"{self.title} [{status}] Priority: {priority_str} "
-                f"Created: {self.date_created} Due: {self.date_due}{desc_part}")
+                f"Created: {format_date(self.date_created)} Due: {format_date(self.date_due)}{desc_part}")
+
+    @classmethod
+    def validate_params(cls, params: Dict[str, Any]) -> bool:
+        """
+        Check that a priority level, if given, is one of the valid levels.
+
+        Args:
+            params (Dict[str, Any]): Parameters keyed by name
+
+        Returns:
+            bool: True if the priority level is valid or absent
+        """
+        return params.get("priority_level", 1) in cls.PRIORITY_MAPPING
+
+    @classmethod
+    def type_info(cls) -> Dict[str, Any]:
+        """
+        Describe the priority task type, including its priority levels.
+
+        Returns:
+            Dict[str, Any]: Common type information plus the priority level mapping
+        """
+        info = super().type_info()
+        info["priority_levels"] = cls.get_priority_descriptions()
+        return info
 
     @classmethod
     def get_valid_priority_levels(cls) -> List[int]:
@@ -6,13 +6,87 @@ Demonstrates Factory pattern and Open/Closed Principle:
 - Open/Closed Principle implementation
 - Support for Task, RecurringTask, and PriorityTask
 - Centralized object creation logic
+- Type registry with precompiled per-type constructors and validators
+- Titles and descriptions deduplicated through a string pool (the shared
+  pool unless the caller passes its own)
 
 Author: [IKENNA FRAKLIN EZEMA]
 """
 
 import datetime
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Type, Union
 from task import AbstractTask, Task, RecurringTask, PriorityTask
+from string_pool import StringPool, shared_pool
+
+
+# TASK TYPE SPEC CLASS DEFINITION
+
+
+class TaskTypeSpec:
+    """
+    Precompiled creation data for one registered task type.
+
+    Attributes:
+        task_class (Type[AbstractTask]): Concrete task class
+        type_params (Tuple[str, ...]): Type-specific constructor parameters
+        info (Dict[str, Any]): Type description from the class
+        construct (Callable): Builds a task from (title, date_due, kwargs, intern)
+    """
+
+    def __init__(self, task_class: Type[AbstractTask]) -> None:
+        """Precompile the constructor for a task class."""
+        self.task_class = task_class
+        self.type_params = task_class.TYPE_PARAMS
+        self.info = task_class.type_info()
+        self.construct = self._compile_constructor(task_class, self.type_params)
+
+    @staticmethod
+    def _compile_constructor(task_class: Type[AbstractTask], type_params: Tuple[str, ...]
+                             ) -> Callable[[str, datetime.datetime, Dict[str, Any], Callable[[str], str]], AbstractTask]:
+        """Build a constructor that maps keyword arguments to positional ones without looping."""
+        if not type_params:
+            return lambda title, date_due, kwargs, intern: task_class(
+                intern(title), date_due, intern(kwargs.get("description", "")))
+        if len(type_params) == 1:
+            param = type_params[0]
+            return lambda title, date_due, kwargs, intern: task_class(
+                intern(title), date_due, kwargs[param], intern(kwargs.get("description", "")))
+        return lambda title, date_due, kwargs, intern: task_class(
+            intern(title), date_due, *[kwargs[param] for param in type_params],
+            intern(kwargs.get("description", "")))
+
+    def validate(self, kwargs: Dict[str, Any]) -> bool:
+        """Check that required parameters are present and acceptable to the class."""
+        for param in self.type_params:
+            if param not in kwargs:
+                return False
+        return self.task_class.validate_params(kwargs)
+
+
+# Precompiled specs, rebuilt only when a new task class registers
+_type_specs: Dict[str, TaskTypeSpec] = {}
+_detection_order: List[Tuple[str, TaskTypeSpec]] = []
+
+
+def _get_type_specs() -> Dict[str, TaskTypeSpec]:
+    """
+    Get the precompiled specs for all registered task types.
+
+    Type names cannot be registered twice, so the registry only changes
+    size when a class registers, and comparing sizes detects every change.
+    The detection order used by TaskFactory.create_task is rebuilt with the
+    specs: types with parameters are matched by their first parameter, the
+    most recently registered type first. PriorityTask therefore wins over
+    RecurringTask when both parameters are given, and a type registered
+    later wins over both.
+    """
+    registry = AbstractTask._registry
+    if len(_type_specs) != len(registry):
+        _type_specs.clear()
+        _type_specs.update((name, TaskTypeSpec(task_class)) for name, task_class in registry.items())
+        _detection_order[:] = [(spec.type_params[0], spec)
+                               for spec in reversed(list(_type_specs.values())) if spec.type_params]
+    return _type_specs
 
 
 # TASK FACTORY CLASS DEFINITION
@@ -34,18 +108,22 @@ class TaskFactory:
     """
     
     @staticmethod
-    def create_task(title: str, date_due: datetime.datetime, **kwargs: Any) -> AbstractTask:
+    def create_task(title: str, date_due: datetime.datetime, string_pool: StringPool = shared_pool,
+                    **kwargs: Any) -> AbstractTask:
         """
         Create a Task, RecurringTask, or PriorityTask based on provided parameters.
         
         This static method implements the Factory pattern by creating the
         appropriate task type based on the presence of specific parameters.
         It follows the Open/Closed Principle - new task types can be added
-        without modifying this method.
+        without modifying this method. When the parameters of several types
+        are given, the most recently registered type wins: priority_level
+        takes precedence over interval.
         
         Args:
             title (str): The title of the task
             date_due (datetime.datetime): The due date of the task
+            string_pool (StringPool): Pool deduplicating the title and description
             **kwargs (Any): Additional parameters that determine task type:
                 - interval (datetime.timedelta): If present, creates RecurringTask
                 - priority_level (int): If present, creates PriorityTask
@@ -81,26 +159,19 @@ class TaskFactory:
             ...     description="Board meeting preparation"
             ... )
         """
-        # Extract common parameters
-        description = kwargs.get("description", "")
-        
-        # Check for priority task first (has priority_level parameter)
-        if "priority_level" in kwargs:
-            priority_level = kwargs["priority_level"]
-            return PriorityTask(title, date_due, priority_level, description)
+        specs = _get_type_specs()
         
-        # Check for recurring task (has interval parameter)
-        elif "interval" in kwargs:
-            interval = kwargs["interval"]
-            return RecurringTask(title, date_due, interval, description)
+        # The latest registered type whose marker parameter is present decides the type
+        for marker, spec in _detection_order:
+            if marker in kwargs:
+                return spec.construct(title, date_due, kwargs, string_pool.intern)
         
         # Default to regular task
-        else:
-            return Task(title, date_due, description)
+        return specs["Task"].construct(title, date_due, kwargs, string_pool.intern)
     
     @staticmethod
-    def create_task_by_type(task_type: str, title: str, date_due: datetime.datetime, 
-                           **kwargs: Any) -> AbstractTask:
+    def create_task_by_type(task_type: str, title: str, date_due: datetime.datetime,
+                            string_pool: StringPool = shared_pool, **kwargs: Any) -> AbstractTask:
         """
         Create a task by explicitly specifying the task type.
         
@@ -111,6 +182,7 @@ class TaskFactory:
             task_type (str): Type of task to create ("Task", "RecurringTask", "PriorityTask")
             title (str): The title of the task
             date_due (datetime.datetime): The due date of the task
+            string_pool (StringPool): Pool deduplicating the title and description
             **kwargs (Any): Additional parameters specific to task type
             
         Returns:
@@ -126,26 +198,51 @@ class TaskFactory:
             ...     priority_level=3, description="High priority item"
             ... )
         """
-        description = kwargs.get("description", "")
-        
-        if task_type == "Task":
-            return Task(title, date_due, description)
+        spec = _get_type_specs().get(task_type)
+        if spec is None:
+            valid_types = list(_type_specs)
+            raise ValueError(f"Unknown task type '{task_type}'. Valid types: {valid_types}")
         
-        elif task_type == "RecurringTask":
-            if "interval" not in kwargs:
-                raise ValueError("RecurringTask requires 'interval' parameter")
-            interval = kwargs["interval"]
-            return RecurringTask(title, date_due, interval, description)
+        for param in spec.type_params:
+            if param not in kwargs:
+                raise ValueError(f"{task_type} requires '{param}' parameter")
+        return spec.construct(title, date_due, kwargs, string_pool.intern)
+    
+    @staticmethod
+    def create_many(task_type: str, rows: Iterable[Sequence[Any]],
+                    string_pool: StringPool = shared_pool) -> List[AbstractTask]:
+        """
+        Create many tasks of one type from row tuples.
         
-        elif task_type == "PriorityTask":
-            if "priority_level" not in kwargs:
-                raise ValueError("PriorityTask requires 'priority_level' parameter")
-            priority_level = kwargs["priority_level"]
-            return PriorityTask(title, date_due, priority_level, description)
+        Each row holds the constructor arguments in positional order:
+        (title, date_due, <type parameters>, description), where the
+        description may be omitted. This avoids building a keyword
+        dictionary per task, which dominates bulk creation.
         
-        else:
-            valid_types = ["Task", "RecurringTask", "PriorityTask"]
-            raise ValueError(f"Unknown task type '{task_type}'. Valid types: {valid_types}")
+        Args:
+            task_type (str): Registered task type name
+            rows (Iterable[Sequence[Any]]): One argument tuple per task
+            string_pool (StringPool): Pool deduplicating titles and descriptions
+            
+        Returns:
+            List[AbstractTask]: The created tasks, in row order
+            
+        Raises:
+            ValueError: If task_type is not recognized or a row is invalid
+            
+        Examples:
+            >>> due = datetime.datetime(2024, 12, 25)
+            >>> tasks = TaskFactory.create_many("PriorityTask", [("Wrap gifts", due, 2), ("Cook", due, 3, "Dinner")])
+        """
+        spec = _get_type_specs().get(task_type)
+        if spec is None:
+            raise ValueError(f"Unknown task type '{task_type}'. Valid types: {list(_type_specs)}")
+        task_class = spec.task_class
+        intern = string_pool.intern
+        description_index = 2 + len(spec.type_params)
+        return [task_class(intern(row[0]), *row[1:description_index], intern(row[description_index]))
+                if len(row) > description_index else task_class(intern(row[0]), *row[1:])
+                for row in rows]
     
     @staticmethod
     def create_priority_task(title: str, date_due: datetime.datetime, 
@@ -165,7 +262,7 @@ class TaskFactory:
         Raises:
             ValueError: If priority_level is not 1, 2, or 3
         """
-        return PriorityTask(title, date_due, priority_level, description)
+        return PriorityTask(shared_pool.intern(title), date_due, priority_level, shared_pool.intern(description))
     
     @staticmethod
     def create_recurring_task(title: str, date_due: datetime.datetime,
@@ -182,7 +279,7 @@ class TaskFactory:
         Returns:
             RecurringTask: New recurring task instance
         """
-        return RecurringTask(title, date_due, interval, description)
+        return RecurringTask(shared_pool.intern(title), date_due, interval, shared_pool.intern(description))
     
     @staticmethod
     def get_supported_task_types() -> List[str]:
@@ -195,34 +292,20 @@ class TaskFactory:
         Returns:
             List[str]: List of supported task type names
         """
-        return ["Task", "RecurringTask", "PriorityTask"]
+        return list(_get_type_specs())
     
     @staticmethod
     def get_task_type_info() -> Dict[str, Dict[str, Any]]:
         """
         Get detailed information about each task type and their parameters.
         
+        The information is built once per registered type and shared between
+        calls, so callers must treat it as read-only.
+        
         Returns:
             Dict[str, Dict[str, Any]]: Information about each task type
         """
-        return {
-            "Task": {
-                "description": "Basic task with title, due date, and optional description",
-                "required_params": ["title", "date_due"],
-                "optional_params": ["description"]
-            },
-            "RecurringTask": {
-                "description": "Task that repeats at specified intervals",
-                "required_params": ["title", "date_due", "interval"],
-                "optional_params": ["description"]
-            },
-            "PriorityTask": {
-                "description": "Task with priority levels (1=low, 2=medium, 3=high)",
-                "required_params": ["title", "date_due", "priority_level"],
-                "optional_params": ["description"],
-                "priority_levels": PriorityTask.get_priority_descriptions()
-            }
-        }
+        return {name: spec.info for name, spec in _get_type_specs().items()}
     
     @staticmethod
     def validate_task_parameters(task_type: str, **kwargs: Any) -> bool:
@@ -239,23 +322,9 @@ class TaskFactory:
         Raises:
             ValueError: If task_type is not recognized
         """
-        task_info = TaskFactory.get_task_type_info()
+        spec = _get_type_specs().get(task_type)
         
-        if task_type not in task_info:
+        if spec is None:
             raise ValueError(f"Unknown task type '{task_type}'")
         
-        required_params = task_info[task_type]["required_params"]
-        
-        # Check if all required parameters are present (excluding title and date_due which are always provided)
-        for param in required_params:
-            if param not in ["title", "date_due"] and param not in kwargs:
-                return False
-        
-        # Validate priority level if it's a PriorityTask
-        if task_type == "PriorityTask" and "priority_level" in kwargs:
-            priority_level = kwargs["priority_level"]
-            valid_levels = PriorityTask.get_valid_priority_levels()
-            if priority_level not in valid_levels:
-                return False
-        
-        return True
+        return spec.validate(kwargs)
@@ -24,11 +24,22 @@ Version: 8.0 (Portfolio Quality with PriorityTask Support)
 
 
 import datetime  # For date/time operations
-from typing import Optional, Any, List, Tuple  # For type hints
-from tasklist import TaskList  # Import TaskList class
+import itertools  # For lazy slicing of task views
+import threading  # For serializing saves from the UI and the autosave thread
+from typing import Optional, Any, Callable, Dict, Iterator, List, Sequence, Tuple, Union  # For type hints
+from tasklist import TaskList, TaskListSnapshot  # Import TaskList classes
+from users import Owner  # Import Owner class for task list ownership
 from task import AbstractTask, Task, RecurringTask, PriorityTask  # Import Task classes
 from task_factory import TaskFactory  # Import Factory for task creation
-from abstract_dao import AbstractDAO, TaskTestDAO, TaskCsvDAO  # Import DAO classes
+from abstract_dao import AbstractDAO, TaskTestDAO, TaskCsvDAO, TaskAppendCsvDAO  # Import DAO classes
+from export_pipeline import TaskJsonlDAO, TaskColumnarDAO  # Import streaming export DAOs
+from autosave import AutosaveScheduler  # Import background saver
+from rate_limiter import QuotaManager  # Import per-owner quotas and rate limits
+from command_log import CommandLog  # Import undo/redo history and change feed
+from overdue_tracker import OverdueTracker  # Import incremental overdue tracking
+from priority_index import PriorityIndex  # Import incremental priority buckets
+from forecast import Forecast, ForecastEngine  # Import workload forecasting
+from string_pool import StringPool, shared_pool  # Import text deduplication
 
 
 # TASK MANAGER CONTROLLER CLASS DEFINITION
@@ -49,16 +60,161 @@ class TaskManagerController:
     while providing a clean interface for the UI layer.
     """
     
-    def __init__(self, owner: str) -> None:
+    VIEW_CHUNK = 64  # Rows copied out of an ordered view at a time by get_task_page
+    
+    def __init__(self, owner: Union[str, Owner], thread_safe: bool = False, announce: bool = True,
+                 string_pool: StringPool = shared_pool) -> None:
         """
         Initialize the controller with a task list owner.
         
         Args:
-            owner (str): Name of the task list owner
-        """
-        self.task_list = TaskList(owner)
+            owner (Union[str, Owner]): Owner instance, or the name of the task list owner
+            thread_safe (bool): Use a TaskList guarded by a read-write lock, for
+                controllers shared between worker threads
+            announce (bool): Print a confirmation when the task list is created
+            string_pool (StringPool): Pool deduplicating the text of created and
+                loaded tasks (one per workspace in multi-owner processes)
+        """
+        if isinstance(owner, str):
+            owner = Owner(owner, "")  # TaskList expects an Owner instance
+        self.task_list = TaskList(owner, thread_safe=thread_safe, announce=announce)
         self.dao: Optional[AbstractDAO] = None  # Will be set when loading/saving
-    
+        self.string_pool = string_pool
+        self.autosave: Optional[AutosaveScheduler] = None  # Set by enable_autosave()
+        self.quotas: Optional[QuotaManager] = None  # Set by enable_quotas()
+        self.history = CommandLog()  # Undo/redo history and change feed of all mutations
+        self._mutation_listeners: List[Callable[[str, Optional[AbstractTask]], None]] = []
+        self._save_lock = threading.Lock()  # One writer per storage file at a time
+        # (DAO, change feed sequence, generation) the DAO's storage is known to match
+        self._saved_position: Optional[Tuple[AbstractDAO, int, int]] = None
+        self.overdue = OverdueTracker()  # Overdue set advanced by AbstractTask.clock
+        self.overdue.attach(self)
+        self.forecaster: Optional[ForecastEngine] = None  # Created by the first get_workload_forecast()
+        self.priority_index = PriorityIndex()  # Priority tasks bucketed by level, in list order
+        self.priority_index.attach(self)
+        
+        # Lazy row generators backing get_task_page, keyed by view name
+        self._page_views: Dict[str, Callable[[], Iterator[Tuple[int, AbstractTask]]]] = {
+            "uncompleted": self._iter_uncompleted_rows,
+            "overdue": self._iter_overdue_rows,
+            "priority": self._iter_priority_rows,
+        }
+
+    def add_mutation_listener(self, listener: Callable[[str, Optional[AbstractTask]], None]) -> None:
+        """
+        Register a callback invoked after every successful mutation.
+
+        Listeners run on the mutating thread after the task list lock has
+        been released; they must still return quickly and never block.
+
+        Args:
+            listener (Callable[[str, Optional[AbstractTask]], None]): Receives the
+                kind of mutation ('add', 'complete', 'remove', 'edit', 'load') and
+                the affected task (None for 'load', which affects many tasks)
+        """
+        self._mutation_listeners.append(listener)
+
+    def remove_mutation_listener(self, listener: Callable[[str, Optional[AbstractTask]], None]) -> None:
+        """Unregister a callback added with add_mutation_listener."""
+        if listener in self._mutation_listeners:
+            self._mutation_listeners.remove(listener)
+
+    def _notify_mutation(self, kind: str, task: Optional[AbstractTask] = None) -> None:
+        """
+        Inform registered listeners, and event bus subscribers, that the task list changed.
+
+        Called after the write lock has been released, so subscribers of the
+        task list's bus never run inside another thread's critical section.
+        """
+        for listener in self._mutation_listeners:
+            listener(kind, task)
+        self.task_list.events.flush()
+
+    def enable_quotas(self, quotas: Optional[QuotaManager]) -> None:
+        """
+        Enforce task quotas and creation rate limits for this controller's owner.
+
+        Args:
+            quotas (Optional[QuotaManager]): Manager shared by all controllers
+                of the process (None removes the limits)
+        """
+        self.quotas = quotas
+
+    def _check_quota(self) -> None:
+        """
+        Admit the creation of one task for the owner.
+
+        Called with the task list's write lock held and after the task has
+        been validated, so concurrent creations cannot both pass a quota
+        that only one of them fits, and invalid tasks use no quota.
+
+        Raises:
+            QuotaExceededError: If the owner's quota or rate limit refuses it
+        """
+        if self.quotas is not None:
+            self.quotas.check_create(self.task_list.owner, len(self.task_list.tasks))
+
+    def enable_autosave(self, debounce_seconds: float = 2.0, max_delay_seconds: float = 10.0,
+                        max_pending: int = 1000,
+                        on_failure: Optional[Callable[[str], None]] = None) -> AutosaveScheduler:
+        """
+        Save changes in the background through the configured DAO.
+
+        Saves happen on a worker thread, so the task list is switched to its
+        thread-safe mode. Until a DAO is configured (by loading or saving),
+        pending changes are kept and saved after the next mutation.
+
+        Args:
+            debounce_seconds (float): Quiet period after which changes are saved
+            max_delay_seconds (float): Longest time a change may stay unsaved
+            max_pending (int): Capacity of the notification queue
+            on_failure (Optional[Callable[[str], None]]): Called with the error
+                message of each failed background save, on the worker thread
+
+        Returns:
+            AutosaveScheduler: The running scheduler
+        """
+        if self.autosave is not None:
+            self.disable_autosave()
+
+        self.task_list.enable_thread_safety()
+        self.autosave = AutosaveScheduler(self, debounce_seconds, max_delay_seconds, max_pending, on_failure)
+        self.add_mutation_listener(self.autosave.notify)
+        self.autosave.start()
+        return self.autosave
+
+    def disable_autosave(self, flush: bool = True) -> None:
+        """
+        Stop background saving.
+
+        Args:
+            flush (bool): Save pending changes before returning
+        """
+        if self.autosave is None:
+            return
+        self.remove_mutation_listener(self.autosave.notify)
+        self.autosave.stop(flush)
+        self.autosave = None
+
+    def close(self, flush: bool = True) -> None:
+        """
+        Release the controller's background resources.
+
+        Stops autosave, unsubscribes the forecast engine from the task
+        list's bus and detaches the overdue tracker and priority index.
+        Call it when the controller is discarded, e.g. on workspace
+        eviction or at exit.
+
+        Args:
+            flush (bool): Save pending autosave changes before returning
+        """
+        self.disable_autosave(flush)
+        if self.forecaster is not None:
+            self.forecaster.close()
+            self.forecaster = None
+        self.overdue.detach()
+        self.priority_index.detach()
+
     def create_regular_task(self, title: str, due_date: datetime.datetime, description: str = "") -> bool:
         """
         Create a new regular task using the TaskFactory.
@@ -72,8 +228,12 @@ class TaskManagerController:
             bool: True if task created successfully, False otherwise
         """
         try:
-            task = TaskFactory.create_task(title, due_date, description=description)
-            self.task_list.add_task(task)
+            task = TaskFactory.create_task(title, due_date, self.string_pool, description=description)
+            with self.task_list.write_locked():
+                self._check_quota()
+                self.task_list.add_task(task)
+                self.history.record("add", task, len(self.task_list.tasks) - 1)
+            self._notify_mutation("add", task)
             return True
         except Exception as e:
             print(f"Error creating regular task: {e}")
@@ -95,8 +255,13 @@ class TaskManagerController:
         """
         try:
             interval = datetime.timedelta(days=interval_days)
-            task = TaskFactory.create_task(title, due_date, interval=interval, description=description)
-            self.task_list.add_task(task)
+            task = TaskFactory.create_task(title, due_date, self.string_pool, interval=interval,
+                                           description=description)
+            with self.task_list.write_locked():
+                self._check_quota()
+                self.task_list.add_task(task)
+                self.history.record("add", task, len(self.task_list.tasks) - 1)
+            self._notify_mutation("add", task)
             return True
         except Exception as e:
             print(f"Error creating recurring task: {e}")
@@ -117,8 +282,13 @@ class TaskManagerController:
             bool: True if task created successfully, False otherwise
         """
         try:
-            task = TaskFactory.create_task(title, due_date, priority_level=priority_level, description=description)
-            self.task_list.add_task(task)
+            task = TaskFactory.create_task(title, due_date, self.string_pool, priority_level=priority_level,
+                                           description=description)
+            with self.task_list.write_locked():
+                self._check_quota()
+                self.task_list.add_task(task)
+                self.history.record("add", task, len(self.task_list.tasks) - 1)
+            self._notify_mutation("add", task)
             return True
         except Exception as e:
             print(f"Error creating priority task: {e}")
@@ -133,30 +303,27 @@ class TaskManagerController:
         """
         return self.task_list.uncompleted_tasks
     
-    def get_all_tasks(self) -> List[AbstractTask]:
+    def get_all_tasks(self) -> Sequence[AbstractTask]:
         """
         Get all tasks in the task list.
         
         Returns:
-            List[AbstractTask]: List of all tasks
+            Sequence[AbstractTask]: Immutable snapshot of all tasks
         """
-        return self.task_list.tasks
+        return self.task_list.snapshot()
     
     def get_overdue_tasks(self) -> List[AbstractTask]:
         """
-        Get all overdue tasks.
+        Get all overdue tasks in list order.
+        
+        The overdue tracker only examines tasks that became overdue since
+        its previous tick and keeps the overdue tasks in list order, so no
+        call sorts them again.
         
         Returns:
             List[AbstractTask]: List of overdue tasks
         """
-        overdue_tasks = []
-        current_time = datetime.datetime.now()
-        
-        for task in self.task_list.tasks:
-            if task.date_due < current_time and not task.completed:
-                overdue_tasks.append(task)
-        
-        return overdue_tasks
+        return [task for _, task in self._iter_overdue_rows()]
     
     def get_priority_tasks(self) -> List[PriorityTask]:
         """
@@ -165,11 +332,87 @@ class TaskManagerController:
         Returns:
             List[PriorityTask]: List of priority tasks sorted by priority
         """
-        priority_tasks = [task for task in self.task_list.tasks if isinstance(task, PriorityTask)]
+        priority_tasks = [task for task in self.task_list.snapshot() if isinstance(task, PriorityTask)]
         # Sort by priority level (3=high, 2=medium, 1=low) - descending order
         priority_tasks.sort(key=lambda task: task.priority_level, reverse=True)
         return priority_tasks
     
+    def _iter_uncompleted_rows(self) -> Iterator[Tuple[int, AbstractTask]]:
+        """Yield (display number, task) pairs for uncompleted tasks in list order."""
+        for number, task in enumerate(self.task_list.snapshot(), start=1):
+            if not task.completed:
+                yield number, task
+    
+    def _iter_overdue_rows(self) -> Iterator[Tuple[int, AbstractTask]]:
+        """Yield (display number, task) pairs for overdue tasks in list order."""
+        positions = self.task_list.positions()
+        yield from self._iter_view_rows(
+            lambda start, stop: self.overdue.ordered_tasks(positions, start, stop), positions)
+    
+    def _iter_priority_rows(self) -> Iterator[Tuple[int, AbstractTask]]:
+        """
+        Yield (display number, task) pairs for priority tasks, high to low.
+        
+        The priority index keeps the buckets up to date as tasks are added,
+        removed and edited, so no mutation rescans the list. Rows come out
+        in the same order as get_priority_tasks.
+        """
+        yield from self._iter_view_rows(self.priority_index.ordered_tasks, self.task_list.positions())
+    
+    def _iter_view_rows(self, ordered_tasks: Callable[[int, int], List[AbstractTask]],
+                        positions: Dict[int, int]) -> Iterator[Tuple[int, AbstractTask]]:
+        """
+        Yield (display number, task) pairs from an incrementally ordered view.
+        
+        Tasks are copied out of the view VIEW_CHUNK at a time, so a page
+        costs O(offset + limit) however many tasks the view holds.
+        
+        Args:
+            ordered_tasks (Callable[[int, int], List[AbstractTask]]): Returns
+                the view's tasks from a start index to a stop index
+            positions (Dict[int, int]): id(task) -> list index, from TaskList.positions()
+        """
+        start = 0
+        while True:
+            chunk = ordered_tasks(start, start + self.VIEW_CHUNK)
+            for task in chunk:
+                position = positions.get(id(task))
+                if position is not None:  # Removed by another thread since the view was read
+                    yield position + 1, task
+            if len(chunk) < self.VIEW_CHUNK:
+                return
+            start += self.VIEW_CHUNK
+    
+    def get_task_page(self, view: str, offset: int = 0,
+                      limit: int = 20) -> Tuple[List[Tuple[int, AbstractTask]], bool]:
+        """
+        Get one page of a task view with precomputed display numbers.
+        
+        Rows are produced lazily from views kept in order incrementally, so
+        once the list's position map is built (after each membership change)
+        a page costs O(offset + limit) rather than O(n).
+        
+        Args:
+            view (str): View to page through ('uncompleted', 'overdue', 'priority')
+            offset (int): Number of rows to skip
+            limit (int): Maximum number of rows to return
+            
+        Returns:
+            Tuple[List[Tuple[int, AbstractTask]], bool]: ((display number, task) rows,
+            whether more rows follow this page)
+            
+        Raises:
+            ValueError: If view is not recognized or offset/limit are invalid
+        """
+        if view not in self._page_views:
+            raise ValueError(f"Unknown view '{view}'. Valid views: {list(self._page_views)}")
+        if offset < 0 or limit < 1:
+            raise ValueError("Offset must be non-negative and limit must be positive")
+        
+        # Fetch one extra row to find out whether another page follows
+        rows = list(itertools.islice(self._page_views[view](), offset, offset + limit + 1))
+        return rows[:limit], len(rows) > limit
+    
     def get_task_by_number(self, task_number: int) -> Optional[AbstractTask]:
         """
         Get a task by its display number (1-based).
@@ -202,13 +445,18 @@ class TaskManagerController:
             # Convert to 0-based index
             index = task_index - 1
             
-            # Check if index is valid using the DRY principle method
-            if not self.task_list.check_task_index(index):
-                return False, "Invalid task number. Please try again."
+            # Validate and modify the task atomically with respect to other threads
+            with self.task_list.write_locked():
+                # Check if index is valid using the DRY principle method
+                if not self.task_list.check_task_index(index):
+                    return False, "Invalid task number. Please try again."
             
-            # Get and mark task as completed
-            task = self.task_list.get_task(index)
-            task.mark_as_completed()
+                # Get and mark task as completed
+                task = self.task_list.get_task(index)
+                before = task.frozen_copy()
+                task.mark_as_completed()
+                self.history.record("complete", task, index, before)
+            self._notify_mutation("complete", task)
             
             task_type = task.get_task_type()
             if isinstance(task, PriorityTask):
@@ -236,17 +484,21 @@ class TaskManagerController:
             # Convert to 0-based index
             index = task_index - 1
             
-            # Check if index is valid
-            if not self.task_list.check_task_index(index):
-                return False, "Invalid task number. Please try again."
-            
-            # Get task info before removal
-            task = self.task_list.get_task(index)
-            task_title = task.title
-            task_type = task.get_task_type()
-            
-            # Remove task
-            self.task_list.remove_task(index)
+            # Validate and modify the task atomically with respect to other threads
+            with self.task_list.write_locked():
+                # Check if index is valid
+                if not self.task_list.check_task_index(index):
+                    return False, "Invalid task number. Please try again."
+            
+                # Get task info before removal
+                task = self.task_list.get_task(index)
+                task_title = task.title
+                task_type = task.get_task_type()
+            
+                # Remove task
+                self.task_list.remove_task(index)
+                self.history.record("remove", task, index)
+            self._notify_mutation("remove", task)
             return True, f"{task_type} '{task_title}' removed successfully."
             
         except Exception as e:
@@ -267,14 +519,19 @@ class TaskManagerController:
             # Convert to 0-based index
             index = task_index - 1
             
-            # Check if index is valid
-            if not self.task_list.check_task_index(index):
-                return False, "Invalid task number. Please try again."
+            # Validate and modify the task atomically with respect to other threads
+            with self.task_list.write_locked():
+                # Check if index is valid
+                if not self.task_list.check_task_index(index):
+                    return False, "Invalid task number. Please try again."
             
-            # Edit task title
-            task = self.task_list.get_task(index)
-            old_title = task.title
-            task.change_title(new_title)
+                # Edit task title
+                task = self.task_list.get_task(index)
+                old_title = task.title
+                before = task.frozen_copy()
+                task.change_title(new_title)
+                self.history.record("edit", task, index, before)
+            self._notify_mutation("edit", task)
             
             return True, f"Task title updated from '{old_title}' to '{new_title}'."
             
@@ -296,14 +553,19 @@ class TaskManagerController:
             # Convert to 0-based index
             index = task_index - 1
             
-            # Check if index is valid
-            if not self.task_list.check_task_index(index):
-                return False, "Invalid task number. Please try again."
+            # Validate and modify the task atomically with respect to other threads
+            with self.task_list.write_locked():
+                # Check if index is valid
+                if not self.task_list.check_task_index(index):
+                    return False, "Invalid task number. Please try again."
             
-            # Edit task date
-            task = self.task_list.get_task(index)
-            old_date = task.date_due
-            task.change_date(new_date)
+                # Edit task date
+                task = self.task_list.get_task(index)
+                old_date = task.date_due
+                before = task.frozen_copy()
+                task.change_date(new_date)
+                self.history.record("edit", task, index, before)
+            self._notify_mutation("edit", task)
             
             return True, f"Task due date updated from {old_date.strftime('%Y-%m-%d')} to {new_date.strftime('%Y-%m-%d')}."
             
@@ -325,14 +587,18 @@ class TaskManagerController:
             # Convert to 0-based index
             index = task_index - 1
             
-            # Check if index is valid
-            if not self.task_list.check_task_index(index):
-                return False, "Invalid task number. Please try again."
+            # Validate and modify the task atomically with respect to other threads
+            with self.task_list.write_locked():
+                # Check if index is valid
+                if not self.task_list.check_task_index(index):
+                    return False, "Invalid task number. Please try again."
             
-            # Edit task description
-            task = self.task_list.get_task(index)
-            old_description = task.description
-            task.change_description(new_description)
+                # Edit task description
+                task = self.task_list.get_task(index)
+                before = task.frozen_copy()
+                task.change_description(new_description)
+                self.history.record("edit", task, index, before)
+            self._notify_mutation("edit", task)
             
             return True, f"Task description updated."
             
@@ -354,49 +620,105 @@ class TaskManagerController:
             # Convert to 0-based index
             index = task_index - 1
             
-            # Check if index is valid
-            if not self.task_list.check_task_index(index):
-                return False, "Invalid task number. Please try again."
-            
-            # Get task and check if it's a priority task
-            task = self.task_list.get_task(index)
-            if not isinstance(task, PriorityTask):
-                return False, "Selected task is not a priority task."
-            
-            # Edit priority level
-            old_priority = task.get_priority_string()
-            task.priority_level = new_priority
-            new_priority_str = task.get_priority_string()
+            # Validate and modify the task atomically with respect to other threads
+            with self.task_list.write_locked():
+                # Check if index is valid
+                if not self.task_list.check_task_index(index):
+                    return False, "Invalid task number. Please try again."
+            
+                # Get task and check if it's a priority task
+                task = self.task_list.get_task(index)
+                if not isinstance(task, PriorityTask):
+                    return False, "Selected task is not a priority task."
+            
+                # Edit priority level
+                old_priority = task.get_priority_string()
+                before = task.frozen_copy()
+                task.priority_level = new_priority
+                self.history.record("edit", task, index, before)
+                new_priority_str = task.get_priority_string()
+            self._notify_mutation("edit", task)
             
             return True, f"Task priority updated from {old_priority} to {new_priority_str}."
             
         except Exception as e:
             return False, f"Error editing task priority: {e}"
 
+    def undo(self) -> Tuple[bool, str]:
+        """
+        Undo the latest change to the task list.
+        
+        Returns:
+            Tuple[bool, str]: (Success status, Message)
+        """
+        try:
+            with self.task_list.write_locked():
+                change = self.history.undo(self.task_list)
+                if change is None:
+                    return False, "Nothing to undo."
+            self._notify_mutation(change.kind, change.task)
+            return True, f"Undid change to '{change.task.title}'."
+        except Exception as e:
+            return False, f"Error undoing change: {e}"
+    
+    def redo(self) -> Tuple[bool, str]:
+        """
+        Redo the latest undone change.
+        
+        Returns:
+            Tuple[bool, str]: (Success status, Message)
+        """
+        try:
+            with self.task_list.write_locked():
+                change = self.history.redo(self.task_list)
+                if change is None:
+                    return False, "Nothing to redo."
+            self._notify_mutation(change.kind, change.task)
+            return True, f"Redid change to '{change.task.title}'."
+        except Exception as e:
+            return False, f"Error redoing change: {e}"
+
+    def _create_dao(self, file_path: str, dao_type: str) -> AbstractDAO:
+        """Create the DAO for a type name ('test', 'csv-append', 'jsonl', 'columnar'; anything else is CSV)."""
+        dao_type = dao_type.lower()
+        if dao_type == 'test':
+            return TaskTestDAO(file_path, self.string_pool)
+        elif dao_type == 'csv-append':
+            return TaskAppendCsvDAO(file_path, self.string_pool)
+        elif dao_type == 'jsonl':
+            return TaskJsonlDAO(file_path, self.string_pool)
+        elif dao_type == 'columnar':
+            return TaskColumnarDAO(file_path, self.string_pool)
+        return TaskCsvDAO(file_path, self.string_pool)  # Default to CSV
+
     def load_tasks_from_dao(self, file_path: str, dao_type: str) -> Tuple[bool, str]:
         """
         Load tasks from DAO with proper error handling.
 
         Args:
             file_path (str): Path to the data file
-            dao_type (str): Type of DAO ('test', 'csv')
+            dao_type (str): Type of DAO ('test', 'csv', 'csv-append', 'jsonl', 'columnar')
 
         Returns:
             Tuple[bool, str]: (Success status, Message)
         """
         try:
             # Create appropriate DAO instance
-            if dao_type.lower() == 'test':
-                self.dao = TaskTestDAO(file_path)
-            else:  # Default to CSV
-                self.dao = TaskCsvDAO(file_path)
+            self.dao = self._create_dao(file_path, dao_type)
+
+            self._saved_position = None
 
             # Load tasks
             loaded_tasks = self.dao.get_all_tasks()
 
-            # Add loaded tasks to task list
-            for task in loaded_tasks:
-                self.task_list.add_task(task)
+            # Add loaded tasks to task list in one batch
+            with self.task_list.write_locked():
+                was_empty = not self.task_list.tasks
+                self.task_list.add_tasks(loaded_tasks)
+                self.history.reset()  # Loaded tasks are the new baseline
+                if was_empty:  # The file holds exactly the list, so the next save can be incremental
+                    self._saved_position = (self.dao, self.history.sequence, self.task_list.generation)
+            self._notify_mutation("load")
 
             # Count task types
             regular_count = sum(1 for task in loaded_tasks if task.get_task_type() == "Task")
@@ -423,21 +745,107 @@ class TaskManagerController:
         try:
             # Create DAO if not already set
             if self.dao is None and file_path and dao_type:
-                if dao_type.lower() == 'test':
-                    self.dao = TaskTestDAO(file_path)
-                else:  # Default to CSV
-                    self.dao = TaskCsvDAO(file_path)
+                self.dao = self._create_dao(file_path, dao_type)
+                self._saved_position = None
+
+            if self.dao is None:
+                return False, "No DAO configured for saving. Please load tasks first or specify DAO type."
+
+            return self.save_snapshot(self.take_snapshot())
+
+        except Exception as e:
+            return False, f"Error saving tasks: {e}"
+
+    def take_snapshot(self) -> TaskListSnapshot:
+        """
+        Take a consistent snapshot of the task list for saving.
 
+        The snapshot also records the changes made since the last save, so
+        save_snapshot() can pass them to the DAO instead of the whole list.
+
+        Returns:
+            TaskListSnapshot: Frozen view of the tasks
+        """
+        return self.task_list.consistent_snapshot(self._capture_changes)
+
+    def _capture_changes(self) -> tuple:
+        """
+        Get the last save's position, the current position and the changes in between.
+
+        Runs under the task list's read lock, so the changes match the
+        snapshot's tasks exactly.
+
+        Returns:
+            tuple: (saved position or None, feed sequence, generation, changes
+            from the command log or None if they are unknown)
+        """
+        base = self._saved_position
+        changes = self.history.changes_since(base[1]) if base is not None else None
+        return base, self.history.sequence, self.task_list.generation, changes
+
+    def _changes_to_save(self, snapshot: TaskListSnapshot, dao: AbstractDAO) -> Optional[list]:
+        """
+        Get the changes the DAO needs on top of its last save; caller holds the save lock.
+
+        Returns:
+            Optional[list]: Changes since the DAO's last save, or None if the
+            whole list must be saved (another DAO, a missed save, history no
+            longer available, or membership changed outside the command log)
+        """
+        if snapshot.marker is None:
+            return None
+        base, _, generation, changes = snapshot.marker
+        if changes is None or base != self._saved_position or base[0] is not dao:
+            return None
+        if generation - base[2] != sum(1 for change in changes if change.kind in ("add", "remove")):
+            return None
+        return changes
+
+    def save_snapshot(self, snapshot: TaskListSnapshot, announce: bool = True) -> Tuple[bool, str]:
+        """
+        Save a previously taken snapshot through the configured DAO.
+
+        Serialization works on frozen copies, so it needs no lock and other
+        threads may keep modifying the task list meanwhile. If the DAO saved
+        the list at an earlier feed position, only the changes since then are
+        passed to it (AbstractDAO.save_changes).
+
+        Args:
+            snapshot (TaskListSnapshot): Snapshot from take_snapshot()
+            announce (bool): Let the DAO print its confirmation (off for
+                background saves, which must not write into the menu)
+
+        Returns:
+            Tuple[bool, str]: (Success status, Message)
+        """
+        try:
             if self.dao is None:
                 return False, "No DAO configured for saving. Please load tasks first or specify DAO type."
 
-            # Save tasks
-            self.dao.save_all_tasks(self.task_list.tasks)
+            tasks = list(snapshot.tasks)
+            with self._save_lock:
+                dao = self.dao
+                changes = self._changes_to_save(snapshot, dao)
+                silenced = dao.announce and not announce
+                if silenced:
+                    dao.announce = False
+                try:
+                    if changes is None:
+                        dao.save_all_tasks(tasks)
+                    else:
+                        dao.save_changes(tasks, changes)
+                finally:
+                    if silenced:
+                        dao.announce = True
+                if snapshot.marker is None:
+                    self._saved_position = None
+                else:
+                    self._saved_position = (dao, snapshot.marker[1], snapshot.marker[2])
 
             # Count task types
-            regular_count = sum(1 for task in self.task_list.tasks if task.get_task_type() == "Task")
-            recurring_count = sum(1 for task in self.task_list.tasks if task.get_task_type() == "RecurringTask")
-            priority_count = sum(1 for task in self.task_list.tasks if task.get_task_type() == "PriorityTask")
+            regular_count = sum(1 for task in tasks if task.get_task_type() == "Task")
+            recurring_count = sum(1 for task in tasks if task.get_task_type() == "RecurringTask")
+            priority_count = sum(1 for task in tasks if task.get_task_type() == "PriorityTask")
 
             return True, (f"Tasks saved successfully. "
                          f"({regular_count} regular, {recurring_count} recurring, {priority_count} priority)")
@@ -445,6 +853,25 @@ class TaskManagerController:
         except Exception as e:
             return False, f"Error saving tasks: {e}"
 
+    def get_workload_forecast(self, periods: int = 365, include_one_off: bool = False) -> Forecast:
+        """
+        Forecast how many task occurrences land on each day from today.
+
+        The forecast engine is created on first use; afterwards it follows
+        the task list through the model event bus and caches its results
+        until the list changes.
+
+        Args:
+            periods (int): Number of days to forecast
+            include_one_off (bool): Also count uncompleted non-recurring tasks
+
+        Returns:
+            Forecast: Occurrence counts per day
+        """
+        if self.forecaster is None:
+            self.forecaster = ForecastEngine(self.task_list)
+        return self.forecaster.forecast(periods, include_one_off=include_one_off)
+
     def get_task_count(self) -> dict[str, int]:
         """
         Get comprehensive task count statistics.
@@ -452,22 +879,23 @@ class TaskManagerController:
         Returns:
             dict[str, int]: Dictionary with task count statistics
         """
-        total_tasks = len(self.task_list.tasks)
-        uncompleted_tasks = len(self.task_list.uncompleted_tasks)
+        tasks = self.task_list.snapshot()
+        total_tasks = len(tasks)
+        uncompleted_tasks = sum(1 for task in tasks if not task.completed)
         completed_tasks = total_tasks - uncompleted_tasks
-        overdue_tasks = len(self.get_overdue_tasks())
+        overdue_tasks = self.overdue.count()
 
         # Count by task type
-        regular_tasks = sum(1 for task in self.task_list.tasks if task.get_task_type() == "Task")
-        recurring_tasks = sum(1 for task in self.task_list.tasks if task.get_task_type() == "RecurringTask")
-        priority_tasks = sum(1 for task in self.task_list.tasks if task.get_task_type() == "PriorityTask")
+        regular_tasks = sum(1 for task in tasks if task.get_task_type() == "Task")
+        recurring_tasks = sum(1 for task in tasks if task.get_task_type() == "RecurringTask")
+        priority_tasks = sum(1 for task in tasks if task.get_task_type() == "PriorityTask")
 
         # Count priority levels
-        high_priority = sum(1 for task in self.task_list.tasks
+        high_priority = sum(1 for task in tasks
                            if isinstance(task, PriorityTask) and task.priority_level == 3)
-        medium_priority = sum(1 for task in self.task_list.tasks
+        medium_priority = sum(1 for task in tasks
                              if isinstance(task, PriorityTask) and task.priority_level == 2)
-        low_priority = sum(1 for task in self.task_list.tasks
+        low_priority = sum(1 for task in tasks
                           if isinstance(task, PriorityTask) and task.priority_level == 1)
 
         return {
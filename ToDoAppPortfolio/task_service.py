@@ -0,0 +1,287 @@
+"""
+Task Service Module - Portfolio Quality Implementation
+
+This module exposes TaskManagerController operations as a local HTTP/JSON
+service built only on the standard library, so internal tools can call the
+controller without spawning a process per operation.
+
+The service provides:
+- JSON endpoints for every controller operation
+- Many owners' task lists kept resident in memory, keyed by email (see WorkspaceManager)
+- HTTP/1.1 keep-alive connections and request batching
+- Per-owner workspace locks so concurrent requests for one owner are serialized
+
+Endpoints:
+    GET  /health       Service status
+    GET  /metrics      Workspace cache metrics (hits, misses, evictions, memory estimate)
+                       and quota metrics (throttled and rejected creations)
+    POST /api          {"owner": email, "op": name, "args": {...}}
+    POST /api/batch    {"requests": [request, ...]} - one round trip for many operations
+
+Classes:
+- TaskService: Owner registry and operation dispatch
+- TaskRequestHandler: HTTP request handler translating JSON to service calls
+
+Author: [Moses Gana]
+Date: 2024
+Version: 8.0 (Portfolio Quality with PriorityTask Support)
+"""
+
+
+# IMPORTS
+
+
+import argparse  # For command-line options
+import datetime  # For date parsing
+import json  # For request and response bodies
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer  # Standard library HTTP server
+from typing import Any, Callable, Dict, List, Optional, Tuple  # For type hints
+from batch_runner import model_output  # For silencing model-layer console feedback
+from rate_limiter import QuotaManager, QuotaPolicy  # Import per-owner quotas and rate limits
+from task_manager_controller import TaskManagerController  # Import controller
+from workspace_manager import WorkspaceManager  # Import owner workspace cache
+
+
+# HELPER FUNCTIONS
+
+
+def _parse_date(value: str) -> datetime.datetime:
+    """Parse an ISO 8601 date or datetime string from a request."""
+    return datetime.datetime.fromisoformat(value)
+
+
+def _task_rows(rows: List[Tuple[int, Any]]) -> List[Dict[str, Any]]:
+    """Convert (display number, task) rows to JSON-compatible dictionaries."""
+    return [dict(task.to_dict(), number=number) for number, task in rows]
+
+
+# Operation name -> handler(controller, args) returning the raw controller result
+OPERATIONS: Dict[str, Callable[[TaskManagerController, Dict[str, Any]], Any]] = {
+    "create_regular_task": lambda c, a: c.create_regular_task(
+        a["title"], _parse_date(a["due_date"]), a.get("description", "")),
+    "create_recurring_task": lambda c, a: c.create_recurring_task(
+        a["title"], _parse_date(a["due_date"]), int(a.get("interval_days", 7)), a.get("description", "")),
+    "create_priority_task": lambda c, a: c.create_priority_task(
+        a["title"], _parse_date(a["due_date"]), int(a["priority_level"]), a.get("description", "")),
+    "mark_task_completed": lambda c, a: c.mark_task_completed(int(a["task_number"])),
+    "remove_task": lambda c, a: c.remove_task(int(a["task_number"])),
+    "edit_task_title": lambda c, a: c.edit_task_title(int(a["task_number"]), a["title"]),
+    "edit_task_date": lambda c, a: c.edit_task_date(int(a["task_number"]), _parse_date(a["due_date"])),
+    "edit_task_description": lambda c, a: c.edit_task_description(int(a["task_number"]), a["description"]),
+    "edit_task_priority": lambda c, a: c.edit_task_priority(int(a["task_number"]), int(a["priority_level"])),
+    "get_task_page": lambda c, a: _task_rows(c.get_task_page(
+        a.get("view", "uncompleted"), int(a.get("offset", 0)), int(a.get("limit", 20)))[0]),
+    "get_all_tasks": lambda c, a: [task.to_dict() for task in c.get_all_tasks()],
+    "get_task_count": lambda c, a: c.get_task_count(),
+    "undo": lambda c, a: c.undo(),
+    "redo": lambda c, a: c.redo(),
+}
+
+
+# TASK SERVICE CLASS DEFINITION
+
+
+class TaskService:
+    """
+    Keeps owners' controllers resident and dispatches JSON operations to them.
+
+    This class demonstrates:
+    - Separation of concerns (transport handled by TaskRequestHandler)
+    - Reuse of the controller as the single home of business logic
+    - Fine-grained locking (one lock per owner workspace)
+
+    Attributes:
+        workspaces (WorkspaceManager): Resident owner workspaces
+    """
+
+    def __init__(self, workspaces: Optional[WorkspaceManager] = None) -> None:
+        """
+        Initialize the service.
+
+        Args:
+            workspaces (Optional[WorkspaceManager]): Owner workspaces (memory only if None)
+        """
+        self.workspaces = workspaces or WorkspaceManager()
+
+    def dispatch(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Execute one JSON operation.
+
+        Failures are reported in the response rather than raised, so one
+        bad request never aborts a batch or the connection.
+
+        Args:
+            request (Dict[str, Any]): {"owner": email, "op": name, "args": {...}}
+
+        Returns:
+            Dict[str, Any]: {"ok": bool, "message": str, "result": Any}
+        """
+        try:
+            op = request["op"]
+            owner = request["owner"]
+            args = request.get("args", {})
+            if op != "save" and op not in OPERATIONS:
+                return {"ok": False, "message": f"Unknown operation '{op}'", "result": None}
+
+            with self.workspaces.checkout(owner) as controller:
+                if op == "save":
+                    if not self.workspaces.storage_dir:
+                        return {"ok": False, "message": "Service has no storage directory", "result": None}
+                    result = controller.save_tasks_to_dao()
+                else:
+                    result = OPERATIONS[op](controller, args)
+
+            # Controller methods report (success, message) or a bare success flag
+            if isinstance(result, tuple):
+                return {"ok": result[0], "message": result[1], "result": None}
+            if isinstance(result, bool):
+                return {"ok": result, "message": "", "result": None}
+            return {"ok": True, "message": "", "result": result}
+
+        except (KeyError, TypeError, ValueError, AttributeError) as e:
+            return {"ok": False, "message": f"Invalid request: {e}", "result": None}
+        except Exception as e:
+            # Any other failure belongs to this request alone, so a batch carries on
+            return {"ok": False, "message": f"Error executing request: {e}", "result": None}
+
+    def dispatch_batch(self, requests: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Execute several operations in order, returning one response per request.
+
+        Each request succeeds or fails on its own; a failed request does not
+        stop the ones after it.
+
+        Args:
+            requests (List[Dict[str, Any]]): Requests as accepted by dispatch
+
+        Returns:
+            List[Dict[str, Any]]: Responses in request order
+        """
+        return [self.dispatch(request) for request in requests]
+
+    def owner_count(self) -> int:
+        """Get the number of owners with resident task lists."""
+        return self.workspaces.resident_count()
+
+
+# HTTP REQUEST HANDLER CLASS DEFINITION
+
+
+class TaskRequestHandler(BaseHTTPRequestHandler):
+    """
+    HTTP handler translating JSON requests into TaskService calls.
+
+    HTTP/1.1 is used so clients can keep connections alive across requests.
+    """
+
+    protocol_version = "HTTP/1.1"  # Enables persistent (keep-alive) connections
+    disable_nagle_algorithm = True  # Headers and body are separate writes; avoid delayed-ACK stalls
+
+    def _send_json(self, status: int, payload: Any) -> None:
+        """Send a JSON response with an explicit length, as keep-alive requires."""
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        """Handle GET /health and GET /metrics."""
+        if self.path == "/health":
+            self._send_json(200, {"ok": True, "owners": self.server.service.owner_count()})
+        elif self.path == "/metrics":
+            workspaces = self.server.service.workspaces
+            metrics = {"ok": True, "workspaces": workspaces.get_metrics()}
+            if workspaces.quotas is not None:
+                metrics["quotas"] = workspaces.quotas.get_metrics()
+            self._send_json(200, metrics)
+        else:
+            self._send_json(404, {"ok": False, "message": f"Unknown path '{self.path}'"})
+
+    def do_POST(self) -> None:
+        """Handle POST /api and POST /api/batch."""
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            payload = json.loads(self.rfile.read(length) or b"null")
+        except (ValueError, json.JSONDecodeError) as e:
+            self._send_json(400, {"ok": False, "message": f"Invalid JSON: {e}"})
+            return
+
+        service = self.server.service
+        if self.path == "/api" and isinstance(payload, dict):
+            self._send_json(200, service.dispatch(payload))
+        elif self.path == "/api/batch" and isinstance(payload, dict) and isinstance(payload.get("requests"), list):
+            self._send_json(200, {"ok": True, "responses": service.dispatch_batch(payload["requests"])})
+        elif self.path in ("/api", "/api/batch"):
+            self._send_json(400, {"ok": False, "message": "Malformed request body"})
+        else:
+            self._send_json(404, {"ok": False, "message": f"Unknown path '{self.path}'"})
+
+    def log_message(self, format: str, *args: Any) -> None:
+        """Log requests only when the server runs in verbose mode."""
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+# SERVER FACTORY
+
+
+def make_server(service: TaskService, host: str = "127.0.0.1", port: int = 8765,
+                verbose: bool = False) -> ThreadingHTTPServer:
+    """
+    Create a threaded HTTP server bound to a TaskService.
+
+    Args:
+        service (TaskService): Service handling the requests
+        host (str): Interface to bind (local only by default)
+        port (int): Port to bind (0 picks a free port)
+        verbose (bool): Log every request to standard error
+
+    Returns:
+        ThreadingHTTPServer: Server ready for serve_forever()
+    """
+    server = ThreadingHTTPServer((host, port), TaskRequestHandler)
+    server.daemon_threads = True
+    server.service = service
+    server.verbose = verbose
+    return server
+
+
+# PROGRAM ENTRY POINT
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local HTTP/JSON service for the ToDo controller")
+    parser.add_argument("--host", default="127.0.0.1", help="interface to bind")
+    parser.add_argument("--port", type=int, default=8765, help="port to bind")
+    parser.add_argument("--storage-dir", help="directory for per-owner CSV files")
+    parser.add_argument("--max-owners", type=int, default=1000, help="maximum resident owners")
+    parser.add_argument("--memory-budget-mb", type=int, help="estimated memory budget for resident tasks")
+    parser.add_argument("--max-tasks-per-owner", type=int, help="task quota for each owner")
+    parser.add_argument("--owner-memory-mb", type=int, help="estimated memory quota for each owner's tasks")
+    parser.add_argument("--create-rate", type=float, help="sustained task creations per second per owner")
+    parser.add_argument("--create-burst", type=int, default=100, help="task creations allowed in a burst")
+    parser.add_argument("--verbose", action="store_true", help="log requests and model feedback")
+    cli_args = parser.parse_args()
+
+    budget = cli_args.memory_budget_mb * 1024 * 1024 if cli_args.memory_budget_mb else None
+    owner_policy = QuotaPolicy(
+        max_tasks=cli_args.max_tasks_per_owner,
+        max_bytes=cli_args.owner_memory_mb * 1024 * 1024 if cli_args.owner_memory_mb else None,
+        rate=cli_args.create_rate, burst=cli_args.create_burst)
+    task_workspaces = WorkspaceManager(cli_args.storage_dir, max_resident=cli_args.max_owners,
+                                       memory_budget_bytes=budget,
+                                       quotas=None if owner_policy.unlimited else QuotaManager(owner_policy))
+    task_server = make_server(TaskService(task_workspaces), cli_args.host, cli_args.port, cli_args.verbose)
+    print(f"Serving ToDo controller on http://{cli_args.host}:{task_server.server_port}")
+    with model_output(cli_args.verbose):
+        try:
+            task_server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+    task_server.server_close()
+    try:
+        task_workspaces.save_directory()
+    except OSError as e:
+        print(f"Error saving the user directory: {e}")
@@ -23,9 +23,47 @@ Author: [Moses Gana]
 # IMPORTS
 
 
+import contextlib  # For the write section context manager
 import datetime  # For date/time operations and comparisons
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple, TypeVar  # For type hints
 from task import Task, RecurringTask  # Import enhanced Task classes from task module
 from users import Owner  # Import Owner class from users module
+from concurrency import ReadWriteLock, NullReadWriteLock  # Locks for the thread-safe mode
+from events import EventBus  # Model event bus for membership changes
+
+
+T = TypeVar("T")  # Result type of apply_batch operations
+
+
+# TASKLIST SNAPSHOT CLASS DEFINITION
+
+
+class TaskListSnapshot:
+    """
+    Immutable, consistent view of a task list at one point in time.
+
+    The tasks are frozen copies, so later edits to the live tasks do not
+    show through. Unchanged tasks share their frozen copy with earlier
+    snapshots, so taking a snapshot copies only what changed.
+
+    Attributes:
+        generation (int): TaskList membership generation when the snapshot was taken
+        tasks (Tuple[Task, ...]): Frozen copies of the tasks, in list order
+        taken_at (datetime.datetime): When the snapshot was taken
+        marker (Any): Value the caller's marker function returned at the same
+            point in time (None without a marker)
+    """
+
+    def __init__(self, generation: int, tasks: Tuple[Task, ...], marker: Any = None) -> None:
+        """Initialize the snapshot."""
+        self.generation = generation
+        self.tasks = tasks
+        self.taken_at = datetime.datetime.now()
+        self.marker = marker
+
+    def __len__(self) -> int:
+        """Get the number of tasks in the snapshot."""
+        return len(self.tasks)
 
 
 # ENHANCED TASKLIST CLASS DEFINITION
@@ -42,18 +80,30 @@ class TaskList:
     - Comprehensive documentation
     - Portfolio-quality implementation
     - Owner-based task list management
+    - Optional thread-safe mode with read-write locking and snapshots
+
+    In thread-safe mode, mutations take the write side of a read-write lock
+    and readers should use snapshot(), which returns an immutable tuple that
+    is rebuilt only after the list changes. Code outside this class must not
+    mutate the tasks list directly; use apply_batch() instead.
 
     Attributes:
         owner (Owner): The Owner instance who owns this task list
         tasks (list[Task]): A list containing enhanced Task objects
+        events (EventBus): Bus for changes to this list and its tasks; tasks
+            publish to the bus of the list they were last added to
     """
 
-    def __init__(self, owner: Owner) -> None:
+    SNAPSHOT_ATTEMPTS = 3  # Lock-free copies tried before consistent_snapshot() copies under the lock
+
+    def __init__(self, owner: Owner, thread_safe: bool = False, announce: bool = True) -> None:
         """
         Initialize a new enhanced TaskList instance with Owner.
 
         Args:
             owner (Owner): The Owner instance who owns this task list
+            thread_safe (bool): Guard mutations with a read-write lock
+            announce (bool): Let the owner print a confirmation of the new list
 
         Returns:
             None: Constructors don't return values
@@ -65,7 +115,152 @@ class TaskList:
         """
         self.owner = owner  # Store Owner instance
         self.tasks: list[Task] = []  # Initialize empty list with type hint
-        self.owner.create_task_list()  # Increment owner's task list counter
+        self.events = EventBus()  # Per-list bus, so one owner's events never reach another's subscribers
+        self._lock = ReadWriteLock() if thread_safe else NullReadWriteLock()
+        self._generation = 0  # Incremented whenever tasks are added or removed
+        self._writes = 0  # Write sections entered; lets snapshots detect concurrent writers
+        self._snapshot: Tuple[Task, ...] = ()
+        self._snapshot_generation = 0
+        self._positions: Dict[int, int] = {}
+        self._positions_generation = -1
+        self.owner.create_task_list(announce)  # Increment owner's task list counter
+
+    @property
+    def thread_safe(self) -> bool:
+        """Check whether the list guards mutations with a read-write lock."""
+        return isinstance(self._lock, ReadWriteLock)
+
+    def enable_thread_safety(self) -> None:
+        """
+        Switch to thread-safe mode.
+
+        Call this before the list is shared with another thread; the switch
+        itself is not synchronized.
+        """
+        if not self.thread_safe:
+            self._lock = ReadWriteLock()
+
+    @property
+    def generation(self) -> int:
+        """
+        Get the membership version of the list.
+
+        Returns:
+            int: Counter incremented by every add, remove or batch operation
+        """
+        return self._generation
+
+    def read_locked(self):
+        """Context manager holding the read side of the list lock."""
+        return self._lock.read_locked()
+
+    @contextlib.contextmanager
+    def write_locked(self) -> Iterator[None]:
+        """
+        Context manager holding the write side of the list lock.
+
+        Use it to make check-then-act sequences (validate an index, then
+        modify that task) atomic, and around any change to the tasks that
+        consistent_snapshot() must not tear. The write side is reentrant.
+        """
+        with self._lock.write_locked():
+            self._writes += 1
+            yield
+
+    def snapshot(self) -> Tuple[Task, ...]:
+        """
+        Get an immutable view of the tasks.
+
+        The tuple is cached and rebuilt only after the list changes, so
+        repeated reads between mutations cost no copying.
+
+        Returns:
+            Tuple[Task, ...]: The tasks in list order at the time of the call
+        """
+        with self._lock.read_locked():
+            return self._snapshot_locked()
+
+    def _snapshot_locked(self) -> Tuple[Task, ...]:
+        """Get the cached tuple of tasks, rebuilding it if stale; caller holds the lock."""
+        if self._snapshot_generation != self._generation or len(self._snapshot) != len(self.tasks):
+            self._snapshot = tuple(self.tasks)
+            self._snapshot_generation = self._generation
+        return self._snapshot
+
+    def positions(self) -> Dict[int, int]:
+        """
+        Get the list index of every task, keyed by id(task).
+
+        The map is cached and rebuilt only after the list changes, so views
+        holding a subset of the tasks can put it into list order cheaply.
+
+        Returns:
+            Dict[int, int]: id(task) -> 0-based index in the list
+        """
+        with self._lock.read_locked():
+            if self._positions_generation != self._generation or len(self._positions) != len(self.tasks):
+                self._positions = {id(task): ix for ix, task in enumerate(self.tasks)}
+                self._positions_generation = self._generation
+            return self._positions
+
+    def consistent_snapshot(self, marker: Optional[Callable[[], Any]] = None) -> TaskListSnapshot:
+        """
+        Take a consistent snapshot for serialization, e.g. by a background saver.
+
+        The read lock is held only to pick up the cached snapshot() tuple, so
+        writers are never blocked for the length of a copy. The tasks are
+        then frozen without the lock; frozen copies are cached per task
+        version, so only tasks changed since the previous snapshot are
+        copied (copy-on-write). If a write section ran during the copy, the
+        copy may mix states and is taken again; after SNAPSHOT_ATTEMPTS
+        such races it is taken under the read lock.
+
+        Args:
+            marker (Optional[Callable[[], Any]]): Called under the read lock,
+                so state that writers change under the write lock (such as a
+                change log position) is captured at the same point as the tasks
+
+        Returns:
+            TaskListSnapshot: Frozen view of the list and its tasks
+        """
+        for _ in range(self.SNAPSHOT_ATTEMPTS):
+            with self._lock.read_locked():
+                writes, generation = self._writes, self._generation
+                tasks = self._snapshot_locked()
+                marked = marker() if marker is not None else None
+            frozen = tuple(task.frozen_copy() for task in tasks)
+            if self._writes == writes:  # No writer ran while the tasks were copied
+                return TaskListSnapshot(generation, frozen, marked)
+
+        with self._lock.read_locked():
+            return TaskListSnapshot(self._generation,
+                                    tuple(task.frozen_copy() for task in self._snapshot_locked()),
+                                    marker() if marker is not None else None)
+
+    def apply_batch(self, operation: Callable[[list], T]) -> T:
+        """
+        Apply several changes to the task list atomically.
+
+        The operation receives the mutable task list and runs while the
+        write lock is held, so readers see either none or all of its changes.
+
+        Args:
+            operation (Callable[[list], T]): Function modifying the list in place
+
+        Returns:
+            T: Whatever the operation returns
+
+        Example:
+            >>> task_list.apply_batch(lambda tasks: tasks.extend(new_tasks))
+        """
+        with self.write_locked():
+            try:
+                return operation(self.tasks)
+            finally:
+                self._generation += 1
+                for task in self.tasks:
+                    task.event_bus = self.events  # The operation may have added tasks
+                self.events.publish("reset", None, self)  # Subscribers must re-read the whole list
 
     def add_task(self, task: Task) -> None:
         """
@@ -82,9 +277,54 @@ class TaskList:
             >>> task_list.add_task(task)
             Task 'Buy groceries [Not Completed] ...' added.
         """
-        self.tasks.append(task)  # Add task to the collection
+        with self.write_locked():
+            self.tasks.append(task)  # Add task to the collection
+            self._generation += 1
+        task.event_bus = self.events
+        self.events.publish("added", task, self)
+        print(f"Task '{task}' added.")  # Provide user feedback
+
+    def insert_task(self, ix: int, task: Task) -> None:
+        """
+        Insert a task at a position, such as where a removed task used to be.
+
+        Args:
+            ix (int): Index the task will have (0-based)
+            task (Task): Task to insert
+
+        Example:
+            >>> task_list.insert_task(0, task)
+            Task 'Buy groceries [Not Completed] ...' added.
+        """
+        with self.write_locked():
+            self.tasks.insert(ix, task)
+            self._generation += 1
+        task.event_bus = self.events
+        self.events.publish("added", task, self)
         print(f"Task '{task}' added.")  # Provide user feedback
 
+    def add_tasks(self, tasks: list[Task]) -> None:
+        """
+        Add many tasks at once, such as a freshly loaded file.
+
+        The whole batch is appended under one write lock with one
+        generation bump, and reported with a single summary line.
+
+        Args:
+            tasks (list[Task]): Tasks to append, in order
+
+        Example:
+            >>> task_list.add_tasks(dao.get_all_tasks())
+            3 tasks added.
+        """
+        with self.write_locked():
+            self.tasks.extend(tasks)
+            self._generation += 1
+            for task in tasks:
+                task.event_bus = self.events
+        self.events.publish_many("added", tasks, self)
+        print(f"{len(tasks)} tasks added.")  # Provide user feedback
+
     def remove_task(self, ix: int) -> None:
         """
         Remove a task from the list by index with error handling.
@@ -100,12 +340,29 @@ class TaskList:
             Task 'Buy groceries [Not Completed] ...' removed.
         """
         try:
-            my_task = self.tasks[ix]  # Get task at specified index
-            del self.tasks[ix]  # Remove task from list
+            with self.write_locked():
+                my_task = self.tasks[ix]  # Get task at specified index
+                del self.tasks[ix]  # Remove task from list
+                self._generation += 1
+            self.events.publish("removed", my_task, self)
             print(f"Task '{my_task}' removed.")  # Confirm removal
         except IndexError:  # Handle invalid index gracefully
             print("Please enter a valid number.")
 
+    @property
+    def uncompleted_tasks(self) -> list[Task]:
+        """
+        Property to get all uncompleted tasks using list comprehension.
+
+        Returns:
+            list[Task]: A list of all tasks that are not completed
+
+        Example:
+            >>> uncompleted = task_list.uncompleted_tasks
+            >>> print(len(uncompleted))  # Number of uncompleted tasks
+        """
+        return [task for task in self.snapshot() if not task.completed]
+
     def view_tasks(self) -> None:
         """
         Display all tasks in the list with numbering.
@@ -118,12 +375,13 @@ class TaskList:
             Current tasks:
             1. Buy groceries [Not Completed] Created: ... Due: ... Description: Weekly shopping
         """
-        if not self.tasks:  # Check if collection is empty
+        tasks = self.snapshot()
+        if not tasks:  # Check if collection is empty
             print("No tasks in the list.")
         else:
             print("Current tasks:")
             # Use enumerate to provide user-friendly numbering (1-based)
-            for i, task in enumerate(self.tasks, start=1):
+            for i, task in enumerate(tasks, start=1):
                 print(f"{i}. {task}")  # Print number and task details
 
     def view_overdue_tasks(self) -> None:
@@ -146,16 +404,18 @@ class TaskList:
             Overdue tasks:
             1. Buy groceries [Not Completed] Created: ... Due: 2024-01-10 Description: Weekly shopping
         """
-        if not self.tasks:  # Check if collection is empty
+        tasks = self.snapshot()
+        if not tasks:  # Check if collection is empty
             print("No tasks in the list.")
         else:
             print("Overdue tasks:")
             overdue_count = 0  # Track number of overdue tasks found
+            current_time = Task.clock.now()
 
             # Iterate through all tasks to find overdue ones
-            for i, task in enumerate(self.tasks, start=1):
+            for i, task in enumerate(tasks, start=1):
                 # Compare task due date with current time
-                if task.date_due < datetime.datetime.now():
+                if task.date_due < current_time:
                     print(f"{i}. {task}")  # Print overdue task details
                     overdue_count += 1
 
@@ -163,6 +423,10 @@ class TaskList:
             if overdue_count == 0:
                 print("No overdue tasks found.")
 
+    def check_task_index(self, ix: int) -> bool:
+        """Check if task index is valid - demonstrates DRY principle."""
+        return 0 <= ix < len(self.tasks)
+
     def get_task(self, index: int) -> Task:
         """
         Get a task at the specified index using encapsulation.
@@ -183,7 +447,7 @@ class TaskList:
         Example:
             >>> task = task_list.get_task(0)  # Get first task
         """
-        if 0 <= index < len(self.tasks):
-            return self.tasks[index]
-        else:
-            raise IndexError("Task index out of range")
+        with self._lock.read_locked():
+            if self.check_task_index(index):
+                return self.tasks[index]
+        raise IndexError("Task index out of range")
@@ -0,0 +1,7 @@
+"""
+Tests for the portfolio ToDo application.
+
+Run from the ToDoAppPortfolio directory with either runner:
+    python -m unittest discover -s tests -t .
+    python -m pytest tests
+"""
@@ -0,0 +1,250 @@
+"""
+Tests for the append-mode CSV DAO: round trips, appends, tombstones and compaction.
+"""
+
+import csv
+import datetime
+import itertools
+import os
+import random
+import tempfile
+import unittest
+from abstract_dao import TaskAppendCsvDAO, TaskCsvDAO
+from batch_runner import model_output
+from task import AbstractTask
+from task_manager_controller import TaskManagerController
+
+
+DUE = datetime.datetime(2030, 1, 1)
+
+
+def state(task) -> tuple:
+    """Everything the CSV format stores about a task (dates at day precision)."""
+    result = (task.get_task_type(), task.title, task.date_due.date(), task.completed,
+              task.date_created.date(), task.description)
+    if hasattr(task, "priority_level"):
+        result += (task.priority_level,)
+    if hasattr(task, "interval"):
+        result += (task.interval.days, tuple(date.date() for date in task.completed_dates))
+    return result
+
+
+class AppendCsvTestCase(unittest.TestCase):
+    """Provides a controller saving to an append-mode file in a temporary directory."""
+
+    def setUp(self) -> None:
+        self.enterContext(model_output())
+        directory = self.enterContext(tempfile.TemporaryDirectory())
+        self.path = os.path.join(directory, "tasks.csv")
+        self.controller = self.open_controller()
+
+    def open_controller(self) -> TaskManagerController:
+        controller = TaskManagerController("Ann")
+        controller.load_tasks_from_dao(self.path, "csv-append")
+        return controller
+
+    def save(self, controller: TaskManagerController = None) -> None:
+        success, message = (controller or self.controller).save_tasks_to_dao()
+        self.assertTrue(success, message)
+
+    def reload(self) -> list:
+        return [state(task) for task in TaskAppendCsvDAO(self.path).get_all_tasks()]
+
+    def file_rows(self) -> list:
+        with open(self.path, encoding="utf-8") as file:
+            return list(csv.DictReader(file))
+
+
+class AppendTest(AppendCsvTestCase):
+    """Saves append one row per change and reload to the same list."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.controller.create_regular_task("Report", DUE, "Two pages, \"final\"")
+        self.controller.create_recurring_task("Standup", DUE, 7)
+        self.controller.create_priority_task("Call", DUE, 3)
+        self.save()
+
+    def test_round_trip(self) -> None:
+        self.controller.mark_task_completed(2)
+        self.save()
+        self.assertEqual(self.reload(), [state(task) for task in self.controller.get_all_tasks()])
+
+    def test_add_and_edit_append_one_row_each(self) -> None:
+        rows = len(self.file_rows())
+        self.controller.create_regular_task("Invoice", DUE)
+        self.save()
+        self.controller.edit_task_title(1, "Summary")
+        self.save()
+        new_rows = self.file_rows()[rows:]
+        self.assertEqual([(row["title"], row["op"]) for row in new_rows], [("Invoice", "put"), ("Summary", "put")])
+        self.assertEqual(new_rows[1]["task_id"], self.file_rows()[0]["task_id"])  # Overrides the first task
+
+    def test_removal_appends_a_tombstone(self) -> None:
+        rows = len(self.file_rows())
+        self.controller.remove_task(2)
+        self.save()
+        tombstone = self.file_rows()[rows:]
+        self.assertEqual([row["op"] for row in tombstone], ["delete"])
+        self.assertEqual([title for _, title, *_ in self.reload()], ["Report", "Call"])
+        self.assertEqual(self.controller.dao.get_metrics()["tombstones"], 1)
+
+    def test_reloaded_list_keeps_appending(self) -> None:
+        other = self.open_controller()
+        rows = len(self.file_rows())
+        other.edit_task_title(3, "Call back")
+        other.create_regular_task("Invoice", DUE)
+        self.save(other)
+        self.assertEqual(len(self.file_rows()), rows + 2)
+        self.assertEqual([title for _, title, *_ in self.reload()], ["Report", "Standup", "Call back", "Invoice"])
+
+    def test_tasks_created_before_a_load_keep_their_own_rows(self) -> None:
+        path = os.path.join(os.path.dirname(self.path), "fresh.csv")
+        previous = AbstractTask._ids
+        self.addCleanup(setattr, AbstractTask, "_ids", previous)
+
+        # Each process numbers its tasks from 1, so the file's ids repeat this session's
+        AbstractTask._ids = itertools.count(1)
+        writer = TaskManagerController("Ann")
+        writer.load_tasks_from_dao(path, "csv-append")
+        for title in ("Report", "Standup", "Call"):
+            writer.create_regular_task(title, DUE)
+        self.save(writer)
+
+        AbstractTask._ids = itertools.count(1)
+        controller = TaskManagerController("Bob")
+        controller.create_regular_task("Bob 1", DUE)
+        controller.create_regular_task("Bob 2", DUE)
+        controller.load_tasks_from_dao(path, "csv-append")
+        controller.edit_task_title(1, "Bob 1 edited")
+        self.save(controller)
+
+        reloaded = TaskAppendCsvDAO(path).get_all_tasks()
+        self.assertEqual([task.title for task in reloaded], ["Bob 1 edited", "Bob 2", "Report", "Standup", "Call"])
+        self.assertEqual(len({task.task_id for task in controller.get_all_tasks()}), 5)
+
+    def test_legacy_csv_is_converted_on_first_save(self) -> None:
+        TaskCsvDAO(self.path).save_all_tasks(self.controller.get_all_tasks())
+        controller = self.open_controller()
+        self.assertEqual(len(controller.get_all_tasks()), 3)
+        controller.create_regular_task("Invoice", DUE)
+        self.save(controller)
+        self.assertEqual([row["task_id"] for row in self.file_rows()], ["1", "2", "3", "4"])
+        self.assertEqual(len(self.reload()), 4)
+
+
+class ChangeFeedTest(AppendCsvTestCase):
+    """Saves pass the command log's changes to the DAO instead of scanning every task."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        for number in range(5):
+            self.controller.create_recurring_task(f"Task {number}", DUE, 7)
+        self.save()
+        self.controller = self.open_controller()
+        self.scans = 0
+        dao = self.controller.dao
+        scan = dao._append_changes
+
+        def counting_scan(tasks):
+            self.scans += 1
+            return scan(tasks)
+
+        dao._append_changes = counting_scan
+
+    def assert_file_matches(self) -> None:
+        self.assertEqual(self.reload(), [state(task) for task in self.controller.get_all_tasks()])
+
+    def test_controller_changes_need_no_scan(self) -> None:
+        controller = self.controller
+        rows = len(self.file_rows())
+        controller.edit_task_title(2, "Renamed")
+        controller.mark_task_completed(3)
+        controller.create_priority_task("Call", DUE, 3)
+        self.save()
+        controller.remove_task(1)
+        controller.edit_task_description(5, "Later")
+        controller.undo()
+        self.save()
+        controller.create_regular_task("Invoice", DUE)
+        controller.remove_task(6)
+        self.save()
+        self.assertEqual(self.scans, 0)
+        self.assertEqual([row["op"] for row in self.file_rows()[rows:]],
+                         ["put", "put", "put", "delete"])  # The undone edit and the removed new task need no rows
+        self.assert_file_matches()
+
+    def test_reinserted_task_falls_back_to_a_scan(self) -> None:
+        self.controller.remove_task(2)
+        self.save()
+        self.controller.undo()
+        self.save()
+        self.assertEqual(self.scans, 1)
+        self.assert_file_matches()
+
+    def test_changes_outside_the_command_log_fall_back_to_a_scan(self) -> None:
+        self.controller.task_list.apply_batch(lambda tasks: tasks.reverse())
+        self.save()
+        self.assertEqual(self.scans, 1)
+        self.assert_file_matches()
+
+    def test_failed_save_keeps_the_changes(self) -> None:
+        dao = self.controller.dao
+        self.controller.edit_task_title(1, "Renamed")
+        dao.storage_path = os.path.join(self.path, "missing")  # Appending there fails
+        self.assertFalse(self.controller.save_tasks_to_dao()[0])
+        dao.storage_path = self.path
+        self.controller.edit_task_title(2, "Renamed too")
+        self.save()
+        self.assertEqual(self.scans, 0)
+        self.assertEqual([row["title"] for row in self.file_rows()[-2:]], ["Renamed", "Renamed too"])
+        self.assert_file_matches()
+
+
+class CompactionTest(AppendCsvTestCase):
+    """Compaction drops superseded rows without losing concurrent saves."""
+
+    def churn(self, steps: int, seed: int = 7) -> None:
+        """Apply random adds, edits, completions, removals, undos and redos, saving after each."""
+        rng = random.Random(seed)
+        controller = self.controller
+        for step in range(steps):
+            count = len(controller.get_all_tasks())
+            choice = rng.random()
+            if choice < 0.35 or count < 3:
+                controller.create_priority_task(f"Task {step}", DUE + datetime.timedelta(days=step % 30), 2)
+            elif choice < 0.6:
+                controller.edit_task_title(rng.randrange(1, count + 1), f"Edit {step}")
+            elif choice < 0.7:
+                controller.mark_task_completed(rng.randrange(1, count + 1))
+            elif choice < 0.85:
+                controller.remove_task(rng.randrange(1, count + 1))
+            elif choice < 0.93:
+                controller.undo()
+            else:
+                controller.redo()
+            self.save()
+
+    def assert_file_matches(self) -> None:
+        self.controller.dao.wait_for_compaction()
+        self.assertEqual(self.reload(), [state(task) for task in self.controller.get_all_tasks()])
+
+    def test_foreground_compaction(self) -> None:
+        self.controller.dao.background_compaction = False
+        self.controller.dao.compact_min_rows = 20
+        self.churn(300)
+        metrics = self.controller.dao.get_metrics()
+        self.assertGreater(metrics["compactions"], 0)
+        self.assertLessEqual(metrics["file_rows"], 2 * metrics["live_tasks"] + 1)
+        self.assert_file_matches()
+
+    def test_background_compaction_replays_concurrent_saves(self) -> None:
+        self.controller.dao.compact_min_rows = 20
+        for seed in range(3):
+            self.churn(200, seed)
+            self.assert_file_matches()
+        self.assertGreater(self.controller.dao.get_metrics()["compactions"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+"""
+Tests for the debounced autosave scheduler.
+"""
+
+import datetime
+import time
+import unittest
+from typing import List
+from abstract_dao import AbstractDAO
+from batch_runner import model_output
+from task_manager_controller import TaskManagerController
+
+
+DUE = datetime.datetime(2030, 1, 1)
+
+
+class FlakyDAO(AbstractDAO):
+    """In-memory DAO whose saves fail while fail is set."""
+
+    def __init__(self) -> None:
+        super().__init__("memory")
+        self.fail = False
+        self.saved: List[int] = []  # Task count of each successful save
+        self.announced: List[bool] = []  # Announce flag seen by each successful save
+
+    def get_all_tasks(self) -> list:
+        return []
+
+    def save_all_tasks(self, tasks: list) -> None:
+        if self.fail:
+            raise OSError("disk full")
+        self.saved.append(len(tasks))
+        self.announced.append(self.announce)
+
+
+def wait_until(condition, timeout: float = 5.0) -> bool:
+    """Poll condition until it holds or the timeout passes."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.005)
+    return True
+
+
+class AutosaveFailureTest(unittest.TestCase):
+    """Failed saves stay pending, are counted, reported and retried."""
+
+    def setUp(self) -> None:
+        self.enterContext(model_output())
+        self.controller = TaskManagerController("Ann")
+        self.dao = FlakyDAO()
+        self.controller.dao = self.dao
+        self.errors: List[str] = []
+
+    def tearDown(self) -> None:
+        self.dao.fail = False
+        self.controller.disable_autosave(flush=False)
+
+    def test_failed_flush_keeps_changes_pending(self) -> None:
+        scheduler = self.controller.enable_autosave(debounce_seconds=60, max_delay_seconds=60,
+                                                    on_failure=self.errors.append)
+        self.dao.fail = True
+        self.controller.create_regular_task("Write report", DUE)
+
+        self.assertFalse(scheduler.flush_now())
+        self.assertTrue(scheduler.pending)
+        self.assertEqual(scheduler.get_metrics()["failures"], 1)
+        self.assertIn("disk full", scheduler.last_error)
+        self.assertEqual(len(self.errors), 1)
+
+        self.dao.fail = False
+        self.assertTrue(scheduler.flush_now())
+        self.assertFalse(scheduler.pending)
+        self.assertIsNone(scheduler.last_error)
+        self.assertEqual(self.dao.saved, [1])
+
+    def test_worker_retries_without_new_mutations(self) -> None:
+        self.dao.fail = True
+        scheduler = self.controller.enable_autosave(debounce_seconds=0.01, max_delay_seconds=0.05,
+                                                    on_failure=self.errors.append)
+        self.controller.create_regular_task("Write report", DUE)
+        self.assertTrue(wait_until(lambda: self.errors))
+        self.assertTrue(scheduler.pending)
+
+        self.dao.fail = False
+        self.assertTrue(wait_until(lambda: self.dao.saved))
+        self.assertFalse(scheduler.pending)
+        metrics = scheduler.get_metrics()
+        self.assertGreaterEqual(metrics["failures"], 1)
+        self.assertEqual(metrics["saves"], 1)
+
+    def test_background_saves_are_silent(self) -> None:
+        scheduler = self.controller.enable_autosave(debounce_seconds=0.01, max_delay_seconds=0.05)
+        self.controller.create_regular_task("Write report", DUE)
+        self.assertTrue(wait_until(lambda: self.dao.saved))
+        self.controller.create_regular_task("Send invoice", DUE)
+        scheduler.flush_now()
+
+        self.assertEqual(self.dao.announced[0], False)
+        self.assertEqual(self.dao.announced[-1], True)
+        self.assertTrue(self.dao.announce)
+
+
+if __name__ == "__main__":
+    unittest.main()
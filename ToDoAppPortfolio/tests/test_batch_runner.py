@@ -0,0 +1,145 @@
+"""
+Tests for the batch runner: quoting, each command, and the single load and save.
+"""
+
+import argparse
+import datetime
+import io
+import os
+import shlex
+import tempfile
+import unittest
+from unittest import mock
+from abstract_dao import TaskCsvDAO
+from batch_runner import BatchCommandRunner, model_output
+from main import run_batch
+from task_manager_controller import TaskManagerController
+
+
+class SplitCommandTest(unittest.TestCase):
+    """Command lines split exactly as shlex.split does."""
+
+    LINES = [
+        'edit 3 description ""',
+        "edit 3 description ''",
+        'add task "Write report" 2030-01-01 "Two pages, \\"final\\""',
+        "add task 'It''s done' 2030-01-01",
+        'add task "Tab\tinside" 2030-01-01 ""',
+        'add task Report\\ draft 2030-01-01 "C:\\\\temp\\n"',
+        'add priority "a"b\'c\' 2030-01-01 2',
+        "list    priority",
+    ]
+
+    def test_matches_shlex(self) -> None:
+        for line in self.LINES:
+            with self.subTest(line=line):
+                self.assertEqual(BatchCommandRunner._split_command(line), shlex.split(line))
+
+    def test_unbalanced_quoting_is_rejected(self) -> None:
+        for line in ('add task "Report 2030-01-01', "add task 'Report", "edit 1 title Report\\"):
+            with self.subTest(line=line):
+                with self.assertRaises(ValueError):
+                    BatchCommandRunner._split_command(line)
+
+
+class CommandTest(unittest.TestCase):
+    """Each command reaches the controller; bad lines are reported and skipped."""
+
+    def setUp(self) -> None:
+        self.enterContext(model_output())
+        self.controller = TaskManagerController("Ann", announce=False)
+        self.output = io.StringIO()
+        self.runner = BatchCommandRunner(self.controller, self.output)
+
+    def run_script(self, script: str) -> int:
+        return self.runner.run(script.splitlines())
+
+    def titles(self) -> list:
+        return [task.title for task in self.controller.get_all_tasks()]
+
+    def test_add_commands(self) -> None:
+        errors = self.run_script("""
+            # One of each task type
+            add task "Write report" 2030-01-01 "Two pages"
+            add recurring Standup 2030-01-02 7
+            add priority "Call client" 2030-01-03 3 ""
+        """)
+        self.assertEqual(errors, 0, self.output.getvalue())
+        report, standup, call = self.controller.get_all_tasks()
+        self.assertEqual((report.title, report.description), ("Write report", "Two pages"))
+        self.assertEqual(standup.interval.days, 7)
+        self.assertEqual((call.priority_level, call.description), (3, ""))
+
+    def test_complete_remove_undo_redo(self) -> None:
+        self.run_script("add task A 2030-01-01\nadd task B 2030-01-01\nadd task C 2030-01-01")
+        self.assertEqual(self.run_script("complete 1\nremove 2\nundo\nredo"), 0, self.output.getvalue())
+        self.assertEqual(self.titles(), ["A", "C"])
+        self.assertTrue(self.controller.get_all_tasks()[0].completed)
+
+    def test_edit_fields(self) -> None:
+        self.run_script('add priority Call 2030-01-01 1 "Notes"')
+        errors = self.run_script("""
+            edit 1 title "Call back"
+            edit 1 date 2030-02-01
+            edit 1 description ""
+            edit 1 priority 3
+        """)
+        self.assertEqual(errors, 0, self.output.getvalue())
+        task = self.controller.get_all_tasks()[0]
+        self.assertEqual((task.title, task.date_due.month, task.description, task.priority_level),
+                         ("Call back", 2, "", 3))
+
+    def test_list_views(self) -> None:
+        self.run_script("add priority Low 2030-01-01 1\nadd priority High 2030-01-01 3\nadd task Plain 2030-01-01")
+        self.assertEqual(self.run_script("list\nlist priority\nlist overdue"), 0)
+        lines = self.output.getvalue().splitlines()
+        self.assertEqual([line.split(".")[0] for line in lines], ["1", "2", "3", "2", "1"])
+
+    def test_bad_lines_are_counted_and_skipped(self) -> None:
+        errors = self.run_script("""
+            frobnicate 1
+            add task "Report 2030-01-01
+            add task Report not-a-date
+            complete
+            edit 1 colour red
+            add task Report 2030-01-01
+        """)
+        self.assertEqual(errors, 5)
+        self.assertEqual(self.titles(), ["Report"])
+        self.assertEqual([line.split(":")[0] for line in self.output.getvalue().splitlines()],
+                         ["line 2", "line 3", "line 4", "line 5", "line 6"])
+
+    def test_save_is_deferred(self) -> None:
+        self.assertEqual(self.runner.finish(), (True, "No save requested."))
+        self.run_script("save\nsave")
+        self.assertTrue(self.runner.save_requested)
+
+
+class SingleLoadAndSaveTest(unittest.TestCase):
+    """A script of any length costs one load and one save."""
+
+    def setUp(self) -> None:
+        self.enterContext(model_output())
+        directory = self.enterContext(tempfile.TemporaryDirectory())
+        self.path = os.path.join(directory, "tasks.csv")
+        self.script = os.path.join(directory, "commands.txt")
+        controller = TaskManagerController("Ann", announce=False)
+        controller.create_regular_task("Existing", datetime.datetime(2030, 1, 1))
+        controller.save_tasks_to_dao(self.path, "csv")
+
+    def test_run_batch(self) -> None:
+        with open(self.script, "w", encoding="utf-8") as file:
+            file.write("".join(f'add task "Task {number}" 2030-01-01\nsave\n' for number in range(50)))
+        args = argparse.Namespace(owner="Ann", load=self.path, save=None, dao="csv", verbose=False,
+                                  batch=self.script)
+        with mock.patch.object(TaskCsvDAO, "get_all_tasks", autospec=True,
+                               side_effect=TaskCsvDAO.get_all_tasks) as loads, \
+                mock.patch.object(TaskCsvDAO, "save_all_tasks", autospec=True,
+                                  side_effect=TaskCsvDAO.save_all_tasks) as saves:
+            self.assertEqual(run_batch(args), 0)
+        self.assertEqual((loads.call_count, saves.call_count), (1, 1))
+        self.assertEqual(len(TaskCsvDAO(self.path).get_all_tasks()), 51)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+"""
+Tests for the command log: undo, redo, ring buffers and the change feed.
+"""
+
+import datetime
+import unittest
+from batch_runner import model_output
+from command_log import CommandLog
+from task_manager_controller import TaskManagerController
+
+
+DUE = datetime.datetime(2030, 1, 1)
+
+
+class CommandLogTestCase(unittest.TestCase):
+    """Provides a controller with three tasks and a fresh, small command log."""
+
+    def setUp(self) -> None:
+        self.enterContext(model_output())
+        self.controller = TaskManagerController("Ann", announce=False)
+        self.controller.history = CommandLog(capacity=4, feed_capacity=6)
+        for title in ("Report", "Invoice", "Review"):
+            self.controller.create_regular_task(title, DUE)
+
+    def titles(self) -> list:
+        return [task.title for task in self.controller.get_all_tasks()]
+
+
+class UndoRedoTest(CommandLogTestCase):
+    """Every kind of change can be undone and redone."""
+
+    def test_add(self) -> None:
+        self.assertTrue(self.controller.undo()[0])
+        self.assertEqual(self.titles(), ["Report", "Invoice"])
+        self.assertTrue(self.controller.redo()[0])
+        self.assertEqual(self.titles(), ["Report", "Invoice", "Review"])
+
+    def test_remove_restores_the_position(self) -> None:
+        removed = self.controller.get_all_tasks()[1]
+        self.controller.remove_task(2)
+        self.controller.undo()
+        self.assertEqual(self.titles(), ["Report", "Invoice", "Review"])
+        self.assertIs(self.controller.get_all_tasks()[1], removed)
+        self.controller.redo()
+        self.assertEqual(self.titles(), ["Report", "Review"])
+
+    def test_edit_and_completion(self) -> None:
+        self.controller.edit_task_title(1, "Summary")
+        self.controller.mark_task_completed(1)
+        self.controller.undo()
+        self.assertFalse(self.controller.get_all_tasks()[0].completed)
+        self.controller.undo()
+        self.assertEqual(self.titles()[0], "Report")
+        self.controller.redo()
+        self.controller.redo()
+        task = self.controller.get_all_tasks()[0]
+        self.assertEqual((task.title, task.completed), ("Summary", True))
+
+    def test_new_change_clears_redo(self) -> None:
+        self.controller.undo()
+        self.assertTrue(self.controller.history.can_redo)
+        self.controller.edit_task_title(1, "Summary")
+        self.assertFalse(self.controller.history.can_redo)
+        self.assertFalse(self.controller.redo()[0])
+
+    def test_undo_after_changes_outside_the_log(self) -> None:
+        self.controller.remove_task(1)
+        self.controller.undo()
+        self.controller.task_list.apply_batch(lambda tasks: tasks.reverse())
+        self.controller.redo()  # The recorded index no longer matches; the task is found by a scan
+        self.assertEqual(self.titles(), ["Review", "Invoice"])
+
+
+class RingBufferTest(CommandLogTestCase):
+    """The buffers keep only the newest changes."""
+
+    def test_oldest_change_is_evicted(self) -> None:
+        self.controller.create_regular_task("Call", DUE)
+        self.controller.create_regular_task("Invoice 2", DUE)  # Five changes; the first add is gone
+        undone = 0
+        while self.controller.undo()[0]:
+            undone += 1
+        self.assertEqual(undone, 4)
+        self.assertEqual(self.titles(), ["Report"])
+
+    def test_changes_since(self) -> None:
+        history = self.controller.history
+        self.assertEqual([change.kind for change in history.changes_since(0)], ["add"] * 3)
+        self.assertEqual(history.changes_since(history.sequence), [])
+        self.controller.edit_task_title(1, "Summary")
+        self.controller.undo()
+        self.assertEqual([(change.sequence, change.kind) for change in history.changes_since(3)],
+                         [(4, "edit"), (5, "edit")])
+
+    def test_changes_since_returns_none_after_overflow(self) -> None:
+        history = self.controller.history
+        for number in range(4):
+            self.controller.edit_task_title(1, f"Edit {number}")  # Seven changes, feed keeps six
+        self.assertIsNone(history.changes_since(0))
+        self.assertEqual([change.sequence for change in history.changes_since(1)], [2, 3, 4, 5, 6, 7])
+
+    def test_changes_since_returns_none_after_reset(self) -> None:
+        history = self.controller.history
+        position = history.sequence
+        history.reset()
+        self.assertIsNone(history.changes_since(position - 1))
+        self.assertEqual(history.changes_since(position), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
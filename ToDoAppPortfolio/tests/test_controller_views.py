@@ -0,0 +1,136 @@
+"""
+Tests for the controller's paged task views.
+"""
+
+import datetime
+import time
+import unittest
+from batch_runner import model_output
+from clock import VirtualClock
+from task import AbstractTask, PriorityTask, Task
+from task_manager_controller import TaskManagerController
+
+
+class PriorityViewTest(unittest.TestCase):
+    """Paging through the priority view."""
+
+    def setUp(self) -> None:
+        self.enterContext(model_output())
+        self.controller = TaskManagerController("Tester", announce=False)
+        due = datetime.datetime(2030, 1, 1)
+        for number, level in enumerate([1, 3, 2, 3, 1, 2]):
+            self.controller.create_priority_task(f"p{number}", due, level)
+        self.controller.create_regular_task("plain", due)
+
+    def rows(self, offset: int = 0, limit: int = 20):
+        rows, _ = self.controller.get_task_page("priority", offset, limit)
+        return [(number, task.title) for number, task in rows]
+
+    def test_rows_match_get_priority_tasks(self) -> None:
+        expected = [task.title for task in self.controller.get_priority_tasks()]
+        self.assertEqual([title for _, title in self.rows()], expected)
+        self.assertEqual(self.rows(), [(2, "p1"), (4, "p3"), (3, "p2"), (6, "p5"), (1, "p0"), (5, "p4")])
+
+    def test_pages_are_slices_of_the_view(self) -> None:
+        everything = self.rows()
+        self.assertEqual(self.rows(0, 2) + self.rows(2, 2) + self.rows(4, 2), everything)
+        _, more = self.controller.get_task_page("priority", 4, 2)
+        self.assertFalse(more)
+
+    def test_mutations_do_not_rescan_the_list(self) -> None:
+        self.rows()
+        rebuilds = self.controller.priority_index.get_metrics()["rebuilds"]
+        self.controller.edit_task_priority(1, 3)
+        self.controller.create_priority_task("p6", datetime.datetime(2030, 1, 1), 2)
+        self.controller.remove_task(2)
+        self.controller.mark_task_completed(3)
+        self.assertEqual(self.rows(), [(1, "p0"), (3, "p3"), (2, "p2"), (5, "p5"), (7, "p6"), (4, "p4")])
+        self.assertEqual(self.controller.priority_index.get_metrics()["rebuilds"], rebuilds)
+
+    def test_pages_span_levels_and_chunks(self) -> None:
+        self.controller.VIEW_CHUNK = 4
+        expected = self.rows()
+        for offset in range(len(expected)):
+            with self.subTest(offset=offset):
+                self.assertEqual(self.rows(offset, 3), expected[offset:offset + 3])
+
+    def test_cache_follows_edits_and_removals(self) -> None:
+        self.rows()
+        self.controller.edit_task_priority(1, 3)
+        self.assertEqual(self.rows()[:3], [(1, "p0"), (2, "p1"), (4, "p3")])
+        self.controller.remove_task(1)
+        self.assertEqual(self.rows()[:2], [(1, "p1"), (3, "p3")])
+        self.controller.undo()
+        self.assertEqual(self.rows()[0], (1, "p0"))
+
+
+class OverdueViewTest(unittest.TestCase):
+    """Paging through the overdue view as tasks enter and leave it."""
+
+    def setUp(self) -> None:
+        self.enterContext(model_output())
+        self.clock = VirtualClock(datetime.datetime(2030, 1, 1))
+        previous, AbstractTask.clock = AbstractTask.clock, self.clock
+        self.addCleanup(setattr, AbstractTask, "clock", previous)
+        self.controller = TaskManagerController("Tester", announce=False)
+        self.controller.VIEW_CHUNK = 3
+        for days in (5, 1, 3, 2, 4, 6):
+            self.controller.create_regular_task(f"d{days}", datetime.datetime(2030, 1, 1 + days))
+
+    def rows(self, offset: int = 0, limit: int = 20):
+        rows, _ = self.controller.get_task_page("overdue", offset, limit)
+        return [(number, task.title) for number, task in rows]
+
+    def expected(self) -> list:
+        return [(number, task.title) for number, task in enumerate(self.controller.get_all_tasks(), start=1)
+                if task.is_overdue()]
+
+    def test_rows_stay_in_list_order(self) -> None:
+        for days in range(1, 8):
+            self.clock.set(datetime.datetime(2030, 1, 1 + days, 12))
+            self.assertEqual(self.rows(), self.expected())
+            self.assertEqual(self.rows(1, 2), self.expected()[1:3])
+
+    def test_mutations_update_the_order(self) -> None:
+        self.clock.set(datetime.datetime(2030, 1, 5, 12))
+        self.rows()
+        self.controller.mark_task_completed(2)
+        self.controller.edit_task_date(1, datetime.datetime(2030, 1, 2))
+        self.controller.edit_task_title(3, "renamed")
+        self.controller.create_regular_task("late", datetime.datetime(2029, 12, 31))
+        self.controller.remove_task(4)
+        self.assertEqual(self.rows(), self.expected())
+        self.controller.undo()
+        self.controller.undo()
+        self.assertEqual(self.rows(), self.expected())
+
+
+class PageScalingTest(unittest.TestCase):
+    """The first page costs the same whatever the size of the list."""
+
+    def first_page_seconds(self, count: int) -> float:
+        """Time the first page of each view after an edit, with `count` overdue priority tasks."""
+        controller = TaskManagerController("Tester", announce=False)
+        due = AbstractTask.clock.now() - datetime.timedelta(days=1)
+        controller.task_list.add_tasks([PriorityTask(f"p{number}", due, number % 3 + 1) for number in range(count)]
+                                       + [Task("plain", due)])
+        timings = []
+        for attempt in range(20):
+            controller.edit_task_priority(1 + attempt % 3, 1 + attempt % 3)
+            controller.edit_task_title(count + 1, f"plain {attempt}")
+            began = time.perf_counter()
+            controller.get_task_page("overdue", 0, 20)
+            controller.get_task_page("priority", 0, 20)
+            timings.append(time.perf_counter() - began)
+        controller.close(flush=False)
+        return min(timings)
+
+    def test_first_page_does_not_grow_with_the_list(self) -> None:
+        with model_output():
+            small = self.first_page_seconds(1000)
+            large = self.first_page_seconds(50000)
+        self.assertLess(large, small * 10 + 0.0005)  # A rescan or sort would take 50 times longer
+
+
+if __name__ == "__main__":
+    unittest.main()
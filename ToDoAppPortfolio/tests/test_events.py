@@ -0,0 +1,75 @@
+"""
+Tests for per-list event buses and their delivery.
+"""
+
+import datetime
+import threading
+import unittest
+from typing import List
+from batch_runner import model_output
+from task_manager_controller import TaskManagerController
+
+
+DUE = datetime.datetime(2030, 1, 1)
+
+
+class PerListBusTest(unittest.TestCase):
+    """Each task list delivers only its own events."""
+
+    def setUp(self) -> None:
+        self.enterContext(model_output())
+        self.ann = TaskManagerController("Ann")
+        self.bob = TaskManagerController("Bob")
+        self.ann_events: List[tuple] = []
+        self.ann.task_list.events.subscribe(
+            lambda batch: self.ann_events.extend((event.kind, event.task.title) for event in batch))
+
+    def test_other_lists_do_not_reach_subscribers(self) -> None:
+        self.bob.create_regular_task("Bob's task", DUE)
+        self.bob.edit_task_title(1, "Bob's edited task")
+        self.ann.create_regular_task("Ann's task", DUE)
+        self.ann.edit_task_title(1, "Ann's edited task")
+        self.assertEqual(self.ann_events, [("added", "Ann's task"), ("changed", "Ann's edited task")])
+
+    def test_loaded_tasks_publish_to_their_list(self) -> None:
+        self.ann.load_tasks_from_dao("unused", "test")
+        self.ann_events.clear()
+        self.ann.mark_task_completed(1)
+        self.assertEqual([kind for kind, _ in self.ann_events], ["changed"])
+
+
+class FlushOutsideLockTest(unittest.TestCase):
+    """Subscribers run after the write lock is released."""
+
+    def setUp(self) -> None:
+        self.enterContext(model_output())
+        self.controller = TaskManagerController("Ann", thread_safe=True)
+        self.blocked: List[str] = []
+        self.controller.task_list.events.subscribe(self.read_from_another_thread)
+
+    def read_from_another_thread(self, batch: list) -> None:
+        """Record the batch if another thread cannot read the list right now."""
+        reader = threading.Thread(target=self.controller.task_list.snapshot, daemon=True)
+        reader.start()
+        reader.join(timeout=1.0)
+        if reader.is_alive():
+            self.blocked.append(batch[0].kind)
+
+    def test_every_mutation_path_flushes_outside_the_lock(self) -> None:
+        controller = self.controller
+        controller.create_regular_task("Write report", DUE)
+        controller.create_priority_task("Call client", DUE, 2)
+        controller.edit_task_title(1, "Write summary")
+        controller.edit_task_date(1, DUE + datetime.timedelta(days=1))
+        controller.edit_task_description(1, "Two pages")
+        controller.edit_task_priority(2, 3)
+        controller.mark_task_completed(1)
+        controller.undo()
+        controller.redo()
+        controller.remove_task(2)
+        self.assertEqual(controller.task_list.events.get_metrics()["batches"], 10)
+        self.assertEqual(self.blocked, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
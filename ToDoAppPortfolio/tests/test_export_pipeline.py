@@ -0,0 +1,128 @@
+"""
+Round-trip tests for the JSON Lines and columnar DAOs.
+"""
+
+import datetime
+import os
+import tempfile
+import threading
+import unittest
+from batch_runner import model_output
+from export_pipeline import ExportPipeline, TaskColumnarDAO, TaskJsonlDAO, task_record
+from task import PriorityTask, RecurringTask, Task
+
+
+DUE = datetime.datetime(2030, 1, 1, 9, 30, 15, 123456)
+
+
+def sample_tasks() -> list:
+    """Tasks of every type, with full-precision dates and non-ASCII text."""
+    tasks = []
+    for number in range(7):
+        due = DUE + datetime.timedelta(days=number, microseconds=number)
+        tasks.append(Task(f"Tâche {number}", due, "Beschreibung, mit \"Zitat\""))
+        recurring = RecurringTask(f"Standup {number}", due, datetime.timedelta(days=1, seconds=1.5))
+        recurring.completed_dates.append(due - datetime.timedelta(days=1))
+        tasks.append(recurring)
+        priority = PriorityTask(f"Call {number}", due, number % 3 + 1, "")
+        priority.completed = number % 2 == 0
+        tasks.append(priority)
+    return tasks
+
+
+class RoundTripTest(unittest.TestCase):
+    """Saving and loading again preserves every field of every task type."""
+
+    def setUp(self) -> None:
+        self.enterContext(model_output())
+        self.directory = self.enterContext(tempfile.TemporaryDirectory())
+        self.tasks = sample_tasks()
+
+    def assert_round_trip(self, dao) -> None:
+        dao.save_all_tasks(self.tasks)
+        loaded = dao.get_all_tasks()
+        self.assertEqual([task_record(task) for task in loaded], [task_record(task) for task in self.tasks])
+        self.assertEqual([type(task) for task in loaded], [type(task) for task in self.tasks])
+
+    def test_jsonl_round_trip(self) -> None:
+        for workers in (0, 3):
+            with self.subTest(workers=workers):
+                pipeline = ExportPipeline(chunk_size=4, workers=workers)
+                self.assert_round_trip(TaskJsonlDAO(os.path.join(self.directory, "tasks.jsonl"),
+                                                    pipeline=pipeline))
+
+    def test_columnar_round_trip(self) -> None:
+        for workers in (0, 3):
+            with self.subTest(workers=workers):
+                pipeline = ExportPipeline(chunk_size=4, workers=workers)
+                self.assert_round_trip(TaskColumnarDAO(os.path.join(self.directory, "tasks.tcol"),
+                                                       pipeline=pipeline))
+
+    def test_empty_list_round_trip(self) -> None:
+        self.tasks = []
+        self.assert_round_trip(TaskJsonlDAO(os.path.join(self.directory, "tasks.jsonl")))
+        self.assert_round_trip(TaskColumnarDAO(os.path.join(self.directory, "tasks.tcol")))
+
+    def test_malformed_jsonl_line_is_skipped(self) -> None:
+        dao = TaskJsonlDAO(os.path.join(self.directory, "tasks.jsonl"))
+        dao.save_all_tasks(self.tasks[:3])
+        with open(dao.storage_path, "ab") as file:
+            file.write(b"{not json\n\n")
+        self.assertEqual(len(dao.get_all_tasks()), 3)
+
+    def test_failed_save_raises_and_leaves_no_file(self) -> None:
+        path = os.path.join(self.directory, "missing", "tasks.jsonl")
+        for dao in (TaskJsonlDAO(path), TaskColumnarDAO(path)):
+            with self.subTest(dao=type(dao).__name__):
+                with self.assertRaises(OSError):
+                    dao.save_all_tasks(self.tasks)
+        self.assertFalse(os.path.exists(os.path.dirname(path)))
+
+    def test_concurrent_saves_to_one_path(self) -> None:
+        path = os.path.join(self.directory, "tasks.jsonl")
+        batches = [self.tasks[number::3] for number in range(3)]
+        threads = [threading.Thread(target=TaskJsonlDAO(path).save_all_tasks, args=(batch,)) for batch in batches * 4]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        loaded = [task_record(task) for task in TaskJsonlDAO(path).get_all_tasks()]
+        self.assertIn(loaded, [[task_record(task) for task in batch] for batch in batches])  # One whole save won
+        self.assertEqual(os.listdir(self.directory), ["tasks.jsonl"])  # No temporary files left behind
+
+
+class ColumnarReadTest(unittest.TestCase):
+    """Readers can load single columns and get the footer's row groups."""
+
+    def setUp(self) -> None:
+        self.enterContext(model_output())
+        directory = self.enterContext(tempfile.TemporaryDirectory())
+        self.tasks = sample_tasks()
+        self.dao = TaskColumnarDAO(os.path.join(directory, "tasks.tcol"),
+                                   pipeline=ExportPipeline(chunk_size=5, workers=2))
+        self.dao.save_all_tasks(self.tasks)
+
+    def test_footer_describes_row_groups(self) -> None:
+        footer = self.dao.read_footer()
+        self.assertEqual(footer["rows"], len(self.tasks))
+        self.assertEqual([group["rows"] for group in footer["row_groups"]], [5, 5, 5, 5, 1])
+
+    def test_read_selected_columns(self) -> None:
+        groups = list(self.dao.read_columns(["title", "priority_level"]))
+        self.assertTrue(all(set(group) == {"title", "priority_level"} for group in groups))
+        titles = [title for group in groups for title in group["title"]]
+        levels = [level for group in groups for level in group["priority_level"]]
+        self.assertEqual(titles, [task.title for task in self.tasks])
+        self.assertEqual(levels, [getattr(task, "priority_level", None) for task in self.tasks])
+
+    def test_unknown_column_and_foreign_file_are_rejected(self) -> None:
+        with self.assertRaises(ValueError):
+            list(self.dao.read_columns(["colour"]))
+        with open(self.dao.storage_path, "wb") as file:
+            file.write(b"title,date_due\n")
+        with self.assertRaises(ValueError):
+            self.dao.read_footer()
+
+
+if __name__ == "__main__":
+    unittest.main()
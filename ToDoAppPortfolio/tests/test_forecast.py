@@ -0,0 +1,98 @@
+"""
+Tests for the workload forecast engine against a brute-force stepping count.
+"""
+
+import datetime
+import random
+import time
+import unittest
+from batch_runner import model_output
+from forecast import ForecastEngine
+from task import RecurringTask, Task
+from task_manager_controller import TaskManagerController
+
+
+START = datetime.datetime(2030, 1, 1, 9, 0)
+
+
+def stepped_counts(tasks: list, start: datetime.datetime, bucket: datetime.timedelta,
+                   periods: int, include_one_off: bool) -> list:
+    """Count occurrences per bucket by stepping every task one interval at a time."""
+    counts = [0] * periods
+    end = start + periods * bucket
+    for task in tasks:
+        if task.completed:
+            continue
+        due = task.date_due
+        step = getattr(task, "interval", None)
+        if step is None and not include_one_off:
+            continue
+        while due < end:
+            if due >= start:
+                counts[(due - start) // bucket] += 1
+            if step is None:
+                break
+            due += step
+    return counts
+
+
+class ForecastTest(unittest.TestCase):
+    """Arithmetic counts match stepping every occurrence."""
+
+    def setUp(self) -> None:
+        self.enterContext(model_output())
+        self.controller = TaskManagerController("Ann")
+
+    def engine(self, bucket: datetime.timedelta) -> ForecastEngine:
+        engine = ForecastEngine(self.controller.task_list, bucket)
+        self.addCleanup(engine.close)
+        return engine
+
+    def test_matches_brute_force(self) -> None:
+        rng = random.Random(11)
+        intervals = [datetime.timedelta(hours=36), datetime.timedelta(hours=1), datetime.timedelta(days=7),
+                     datetime.timedelta(hours=5, minutes=30), datetime.timedelta(days=10, hours=3)]
+        tasks = []
+        for number in range(400):
+            due = START + datetime.timedelta(days=rng.randrange(-60, 120), hours=rng.randrange(24),
+                                             minutes=rng.choice((0, 15, 45)))
+            if number % 5 == 0:
+                task = Task(f"Task {number}", due)
+            else:
+                task = RecurringTask(f"Task {number}", due, rng.choice(intervals))
+            task.completed = number % 11 == 0
+            tasks.append(task)
+        self.controller.task_list.add_tasks(tasks)
+
+        for bucket in (datetime.timedelta(days=1), datetime.timedelta(days=7), datetime.timedelta(hours=5)):
+            engine = self.engine(bucket)
+            for include_one_off in (False, True):
+                with self.subTest(bucket=bucket, include_one_off=include_one_off):
+                    forecast = engine.forecast(90, START, include_one_off)
+                    expected = stepped_counts(tasks, forecast.start, bucket, 90, include_one_off)
+                    self.assertEqual(list(forecast.counts), expected)
+
+    def test_follows_edits(self) -> None:
+        self.controller.create_recurring_task("Standup", START + datetime.timedelta(days=3), 7)
+        self.controller.task_list.add_task(RecurringTask("Shift", START, datetime.timedelta(hours=36)))
+        engine = self.engine(datetime.timedelta(days=1))
+        self.assertEqual(engine.forecast(30, START).total(), 4 + 20)
+        self.controller.edit_task_date(2, START + datetime.timedelta(days=20, hours=12))
+        self.controller.mark_task_completed(1)
+        tasks = self.controller.get_all_tasks()
+        forecast = engine.forecast(30, START)
+        self.assertEqual(list(forecast.counts), stepped_counts(tasks, forecast.start, engine.bucket, 30, False))
+
+    def test_sub_bucket_interval_cost_does_not_step(self) -> None:
+        tasks = [RecurringTask(f"Ping {number}", START + datetime.timedelta(days=number % 365),
+                               datetime.timedelta(minutes=10)) for number in range(5000)]
+        self.controller.task_list.add_tasks(tasks)
+        engine = self.engine(datetime.timedelta(days=1))
+        began = time.perf_counter()
+        forecast = engine.forecast(365, START)
+        self.assertLess(time.perf_counter() - began, 1.0)  # Stepping would take 5000 * 52560 steps
+        self.assertEqual(forecast.counts[0], 15 * 6 * (5000 // 365 + 1))  # Due at 9:00, six pings an hour to midnight
+
+
+if __name__ == "__main__":
+    unittest.main()
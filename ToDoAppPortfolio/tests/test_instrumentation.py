@@ -0,0 +1,97 @@
+"""
+Tests for the timing instrumentation: histograms, attach and detach, and the lazily created DAO.
+"""
+
+import datetime
+import os
+import tempfile
+import unittest
+from batch_runner import model_output
+from instrumentation import Instrumentation, LatencyHistogram
+from task_manager_controller import TaskManagerController
+
+
+DUE = datetime.datetime(2030, 1, 1)
+
+
+class LatencyHistogramTest(unittest.TestCase):
+    """Percentiles come from the bucket holding the rank, within one bucket of the exact value."""
+
+    def setUp(self) -> None:
+        self.histogram = LatencyHistogram()
+        for number in range(1, 1001):
+            self.histogram.record(number * 1000, failed=number % 100 == 0)
+
+    def test_percentiles_are_ordered_and_close(self) -> None:
+        stats = self.histogram.to_dict()
+        self.assertEqual((stats["calls"], stats["errors"], stats["min_us"], stats["max_us"]), (1000, 10, 1.0, 1000.0))
+        self.assertEqual(stats["mean_us"], 500.5)
+        self.assertLessEqual(stats["min_us"], stats["p50_us"])
+        self.assertLessEqual(stats["p50_us"], stats["p90_us"])
+        self.assertLessEqual(stats["p90_us"], stats["p99_us"])
+        self.assertLessEqual(stats["p99_us"], stats["max_us"])
+        bucket_ratio = 2 ** (1 / LatencyHistogram.BUCKETS_PER_OCTAVE)
+        for key, exact in (("p50_us", 500), ("p90_us", 900), ("p99_us", 990)):
+            with self.subTest(key=key):
+                self.assertGreaterEqual(stats[key], exact)
+                self.assertLess(stats[key], exact * bucket_ratio)
+
+    def test_empty_and_cleared(self) -> None:
+        self.histogram.clear()
+        self.assertEqual((self.histogram.count, self.histogram.percentile(0.5)), (0, 0.0))
+        self.histogram.record(0)
+        self.assertEqual(self.histogram.percentile(0.99), 0)
+
+
+class AttachTest(unittest.TestCase):
+    """Attaching times a controller and its DAO; detaching restores the original methods."""
+
+    def setUp(self) -> None:
+        self.enterContext(model_output())
+        self.path = os.path.join(self.enterContext(tempfile.TemporaryDirectory()), "tasks.csv")
+        saved = TaskManagerController("Ann", announce=False)
+        saved.create_regular_task("Report", DUE)
+        saved.save_tasks_to_dao(self.path, "csv")
+        self.controller = TaskManagerController("Ann", announce=False)
+        self.instrumentation = Instrumentation()
+        self.addCleanup(self.instrumentation.close)
+
+    def calls(self) -> dict:
+        return {name: histogram.count for name, histogram in self.instrumentation.histograms.items() if histogram.count}
+
+    def test_only_the_attached_controller_is_timed(self) -> None:
+        other = TaskManagerController("Bob", announce=False)
+        self.instrumentation.attach(self.controller)
+        self.assertTrue(self.instrumentation.active)
+        self.controller.create_regular_task("Invoice", DUE)
+        other.create_regular_task("Invoice", DUE)
+        self.assertEqual(self.calls(), {"controller.create_regular_task": 1})
+
+    def test_lazily_created_dao_is_instrumented(self) -> None:
+        self.instrumentation.attach(self.controller)
+        self.assertTrue(self.controller.load_tasks_from_dao(self.path, "csv")[0])  # Creates the DAO
+        self.controller.create_regular_task("Invoice", DUE)
+        self.assertTrue(self.controller.save_tasks_to_dao()[0])
+        dao_calls = {name for name in self.calls() if name.startswith("dao.TaskCsvDAO.")}
+        self.assertTrue(dao_calls)
+        self.assertIn("get_all_tasks", vars(self.controller.dao))
+
+    def test_detach_restores_the_original_methods(self) -> None:
+        self.controller.load_tasks_from_dao(self.path, "csv")
+        controller_attributes = set(vars(self.controller))
+        dao_attributes = set(vars(self.controller.dao))
+        self.instrumentation.attach(self.controller)
+        self.assertIn("create_regular_task", vars(self.controller))
+        self.instrumentation.detach()
+        self.assertFalse(self.instrumentation.active)
+        self.assertEqual(set(vars(self.controller)), controller_attributes)
+        self.assertEqual(set(vars(self.controller.dao)), dao_attributes)
+        self.assertEqual(self.controller.create_regular_task.__func__, TaskManagerController.create_regular_task)
+
+        self.controller.create_regular_task("Invoice", DUE)
+        self.assertEqual(self.calls(), {})
+        self.assertIn("controller.create_regular_task", self.instrumentation.histograms)  # Collected data is kept
+
+
+if __name__ == "__main__":
+    unittest.main()
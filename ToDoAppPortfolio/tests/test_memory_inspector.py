@@ -0,0 +1,88 @@
+"""
+Tests for the memory inspector: per-type accounting, shared objects and projections.
+"""
+
+import datetime
+import sys
+import unittest
+from batch_runner import model_output
+from memory_inspector import LIST_GROWTH_FACTOR, POINTER_BYTES, MemoryInspector, MemoryReport
+from task import PriorityTask, Task
+from tasklist import TaskList
+from users import Owner
+
+
+DUE = datetime.datetime(2030, 1, 1)
+
+
+class InspectTest(unittest.TestCase):
+    """Tasks are counted per type and shared objects are counted once."""
+
+    def setUp(self) -> None:
+        self.enterContext(model_output())
+        self.task_list = TaskList(Owner("Ann", "ann@example.com"), announce=False)
+        self.title = "".join(["Rep", "ort"])  # One string object, shared by both regular tasks
+        self.task_list.add_tasks([Task(self.title, DUE), Task(self.title, DUE, "Two pages"),
+                                  PriorityTask("Call", DUE, 2)])
+        self.report = MemoryInspector().inspect(self.task_list)
+
+    def test_counts_per_type(self) -> None:
+        self.assertEqual({name: usage.count for name, usage in self.report.by_type.items()},
+                         {"Task": 2, "PriorityTask": 1})
+        self.assertEqual(self.report.task_count, 3)
+
+    def test_shared_objects_are_counted_once(self) -> None:
+        regular = self.report.by_type["Task"]
+        priority = self.report.by_type["PriorityTask"]
+        self.assertEqual(regular.field_bytes["title"], sys.getsizeof(self.title))
+        self.assertEqual(regular.field_bytes["date_due"], sys.getsizeof(DUE))
+        self.assertEqual(priority.field_bytes["date_due"], 0)  # Already counted under Task
+        self.assertEqual(priority.field_bytes["_priority_level"], 0)  # Small integers are not counted
+
+    def test_totals_add_up(self) -> None:
+        for name, usage in self.report.by_type.items():
+            with self.subTest(task_type=name):
+                self.assertEqual(sum(usage.category_bytes.values()), usage.total_bytes)
+                self.assertEqual(usage.bytes_per_task, usage.total_bytes / usage.count)
+        self.assertEqual(self.report.total_bytes,
+                         sum(usage.total_bytes for usage in self.report.by_type.values()) + self.report.list_bytes)
+        self.assertIn("Memory report: 3 tasks", self.report.format_text([1000]))
+
+    def test_inspecting_twice_gives_the_same_report(self) -> None:
+        self.assertEqual(MemoryInspector().inspect(self.task_list).to_dict(), self.report.to_dict())
+
+
+class ProjectTest(unittest.TestCase):
+    """Projections scale the measured per-task costs."""
+
+    def setUp(self) -> None:
+        self.enterContext(model_output())
+        task_list = TaskList(Owner("Ann", "ann@example.com"), announce=False)
+        task_list.add_tasks([Task("Report", DUE), Task("Invoice", DUE), Task("Review", DUE),
+                             PriorityTask("Call", DUE, 2)])
+        self.report = MemoryInspector().inspect(task_list)
+
+    def test_default_mix(self) -> None:
+        projected = self.report.project(1000)
+        list_bytes = int(1000 * POINTER_BYTES * (LIST_GROWTH_FACTOR + 1))
+        self.assertEqual(projected["by_type"], {
+            "Task": int(1000 * 0.75 * self.report.by_type["Task"].bytes_per_task),
+            "PriorityTask": int(1000 * 0.25 * self.report.by_type["PriorityTask"].bytes_per_task),
+        })
+        self.assertEqual(projected["list_bytes"], list_bytes)
+        self.assertEqual(projected["total_bytes"], sum(projected["by_type"].values()) + list_bytes)
+
+    def test_custom_mix(self) -> None:
+        projected = self.report.project(100, {"PriorityTask": 1.0})
+        per_task = self.report.by_type["PriorityTask"].bytes_per_task
+        self.assertEqual(projected["by_type"], {"PriorityTask": int(100 * per_task)})
+
+    def test_invalid_projections_raise(self) -> None:
+        with self.assertRaises(ValueError):
+            self.report.project(100, {"RecurringTask": 1.0})
+        with self.assertRaises(ValueError):
+            MemoryReport({}, 0).project(100)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+"""
+Tests for the incremental overdue tracker, driven by a virtual clock.
+"""
+
+import datetime
+import unittest
+from batch_runner import model_output
+from clock import VirtualClock
+from task import AbstractTask
+from task_manager_controller import TaskManagerController
+
+
+START = datetime.datetime(2030, 1, 1, 9, 0)
+
+
+class VirtualTimeTestCase(unittest.TestCase):
+    """Runs each test with AbstractTask.clock set to a fresh VirtualClock."""
+
+    def setUp(self) -> None:
+        self.enterContext(model_output())
+        self.clock = VirtualClock(START)
+        previous, AbstractTask.clock = AbstractTask.clock, self.clock
+        self.addCleanup(setattr, AbstractTask, "clock", previous)
+        self.controller = TaskManagerController("Ann")
+
+    def add_task(self, title: str, days: float) -> None:
+        self.controller.create_regular_task(title, START + datetime.timedelta(days=days))
+
+    def overdue_titles(self) -> list:
+        return [task.title for task in self.controller.get_overdue_tasks()]
+
+
+class OverdueTrackerTest(VirtualTimeTestCase):
+    """Tasks move into the overdue view exactly when virtual time passes them."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.add_task("Report", 1)
+        self.add_task("Invoice", 2)
+        self.add_task("Review", 3)
+
+    def test_tasks_become_overdue_as_time_advances(self) -> None:
+        self.assertEqual(self.overdue_titles(), [])
+        self.clock.advance(days=1)
+        self.assertEqual(self.overdue_titles(), [])  # Due now is not yet overdue
+        self.clock.advance(seconds=1)
+        self.assertEqual(self.overdue_titles(), ["Report"])
+        self.clock.advance(days=2)
+        self.assertEqual(self.overdue_titles(), ["Report", "Invoice", "Review"])
+
+    def test_edits_and_completion_reclassify_tasks(self) -> None:
+        self.clock.advance(days=2, hours=1)
+        self.assertEqual(self.overdue_titles(), ["Report", "Invoice"])
+        self.controller.mark_task_completed(1)
+        self.controller.edit_task_date(2, START + datetime.timedelta(days=5))
+        self.assertEqual(self.overdue_titles(), [])
+        self.clock.advance(days=3)
+        self.assertEqual(self.overdue_titles(), ["Invoice", "Review"])
+
+    def test_clock_moved_back_rebuilds(self) -> None:
+        self.clock.advance(days=4)
+        self.assertEqual(len(self.overdue_titles()), 3)
+        self.clock.set(START)
+        self.assertEqual(self.overdue_titles(), [])
+
+    def test_matches_is_overdue(self) -> None:
+        for hours in (12, 24, 36, 48, 60, 72, 84):
+            self.clock.set(START + datetime.timedelta(hours=hours))
+            expected = [task.title for task in self.controller.get_all_tasks() if task.is_overdue()]
+            self.assertEqual(self.overdue_titles(), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
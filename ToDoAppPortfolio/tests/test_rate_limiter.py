@@ -0,0 +1,93 @@
+"""
+Tests for per-owner quotas and creation rate limits.
+"""
+
+import datetime
+import threading
+import time
+import unittest
+from batch_runner import model_output
+from rate_limiter import QuotaExceededError, QuotaManager, QuotaPolicy
+from task_manager_controller import TaskManagerController
+from users import Owner
+
+
+DUE = datetime.datetime(2030, 1, 1)
+
+
+class FakeClock:
+    """Monotonic clock that only moves when told to."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class RateLimitClockTest(unittest.TestCase):
+    """An injected clock never leads to real sleeps."""
+
+    def setUp(self) -> None:
+        self.clock = FakeClock()
+        self.owner = Owner("Ann", "ann@example.com")
+
+    def test_wait_uses_the_injected_sleep(self) -> None:
+        quotas = QuotaManager(QuotaPolicy(rate=2.0, burst=1, max_wait=1.0), clock=self.clock,
+                              sleep=self.clock.sleep)
+        quotas.check_create(self.owner, 0)
+        quotas.check_create(self.owner, 1)
+        self.assertEqual(self.clock.sleeps, [0.5])
+        self.assertEqual(quotas.get_metrics()["delayed"], 1)
+
+    def test_custom_clock_without_sleep_throttles_at_once(self) -> None:
+        quotas = QuotaManager(QuotaPolicy(rate=0.01, burst=1, max_wait=60.0), clock=self.clock)
+        quotas.check_create(self.owner, 0)
+        started = time.monotonic()
+        with self.assertRaises(QuotaExceededError) as raised:
+            quotas.check_create(self.owner, 1)
+        self.assertLess(time.monotonic() - started, 1.0)
+        self.assertEqual(raised.exception.reason, "throttled")
+        self.assertAlmostEqual(raised.exception.retry_after, 100.0)
+
+
+class ControllerQuotaTest(unittest.TestCase):
+    """Quota checks run under the write lock, after validation."""
+
+    def setUp(self) -> None:
+        self.enterContext(model_output())
+        self.controller = TaskManagerController("Ann", thread_safe=True)
+
+    def test_concurrent_creations_respect_the_task_quota(self) -> None:
+        self.controller.enable_quotas(QuotaManager(QuotaPolicy(max_tasks=10)))
+        barrier = threading.Barrier(8)
+
+        def create() -> None:
+            barrier.wait()
+            for number in range(5):
+                self.controller.create_regular_task(f"Task {number}", DUE)
+
+        threads = [threading.Thread(target=create) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(self.controller.get_all_tasks()), 10)
+        self.assertEqual(self.controller.quotas.get_metrics()["task_quota_rejections"], 30)
+
+    def test_invalid_task_uses_no_quota(self) -> None:
+        clock = FakeClock()
+        self.controller.enable_quotas(QuotaManager(QuotaPolicy(rate=1.0, burst=1), clock=clock))
+        self.assertFalse(self.controller.create_priority_task("Bad level", DUE, 7))
+        self.assertTrue(self.controller.create_regular_task("Write report", DUE))
+        self.assertEqual(self.controller.quotas.get_metrics()["allowed"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
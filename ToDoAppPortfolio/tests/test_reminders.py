@@ -0,0 +1,73 @@
+"""
+Tests for the reminder engine, driven by a virtual clock.
+"""
+
+import datetime
+import unittest
+from clock import VirtualClock
+from reminders import ReminderEngine
+from task import AbstractTask
+from tests.test_overdue_tracker import START, VirtualTimeTestCase
+
+
+class ReminderClockTest(VirtualTimeTestCase):
+    """Reminders follow the shared task clock unless a clock is injected."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.fired = []
+        self.reminders = ReminderEngine(lambda task: self.fired.append(task.title))
+
+    def test_defaults_to_the_shared_clock(self) -> None:
+        self.assertIs(self.reminders.clock, self.clock)
+        injected = VirtualClock(START)
+        self.assertIs(ReminderEngine(print, injected).clock, injected)
+        self.assertIsNot(AbstractTask.clock, injected)
+
+    def test_reminders_fire_as_virtual_time_passes(self) -> None:
+        self.add_task("Report", 1)
+        self.add_task("Invoice", 2)
+        self.reminders.attach(self.controller)
+        self.add_task("Review", 1.5)
+
+        self.assertEqual(self.reminders.fire_due(), 0)
+        self.clock.advance(days=1)
+        self.assertEqual(self.reminders.fire_due(), 1)
+        self.clock.advance(days=1)
+        self.assertEqual(self.reminders.fire_due(), 2)
+        self.assertEqual(self.fired, ["Report", "Review", "Invoice"])
+        self.assertEqual(len(self.reminders), 0)
+
+    def test_overdue_tasks_are_skipped_on_attach(self) -> None:
+        self.add_task("Report", 1)
+        self.add_task("Invoice", 3)
+        self.clock.advance(days=2)
+        self.reminders.attach(self.controller)
+        self.clock.advance(days=2)
+        self.reminders.fire_due()
+        self.assertEqual(self.fired, ["Invoice"])
+
+    def test_completed_recurring_task_is_reminded_again(self) -> None:
+        self.controller.create_recurring_task("Standup", START + datetime.timedelta(days=1), 7)
+        self.reminders.attach(self.controller)
+        self.controller.mark_task_completed(1)
+        self.clock.advance(days=1)
+        self.assertEqual(self.reminders.fire_due(), 0)
+        self.clock.advance(days=7)
+        self.assertEqual(self.reminders.fire_due(), 1)
+
+    def test_edits_and_removals_reschedule(self) -> None:
+        self.add_task("Report", 1)
+        self.add_task("Invoice", 1)
+        self.reminders.attach(self.controller)
+        self.controller.edit_task_date(1, START + datetime.timedelta(days=3))
+        self.controller.remove_task(2)
+        self.clock.advance(days=2)
+        self.assertEqual(self.reminders.fire_due(), 0)
+        self.clock.advance(days=1)
+        self.assertEqual(self.reminders.fire_due(), 1)
+        self.assertEqual(self.fired, ["Report"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+"""
+Tests for the string pool: deduplication, the size cap, threads and per-workspace pools.
+"""
+
+import datetime
+import threading
+import unittest
+from batch_runner import model_output
+from string_pool import StringPool, shared_pool
+from workspace_manager import WorkspaceManager
+
+
+def fresh(text: str) -> str:
+    """Build a string equal to text but not identical to it."""
+    return "".join(list(text))
+
+
+class StringPoolTest(unittest.TestCase):
+    """Equal strings share one instance, within the size cap."""
+
+    def test_duplicates_share_the_first_instance(self) -> None:
+        pool = StringPool()
+        first = fresh("Weekly report")
+        copies = [pool.intern(fresh("Weekly report")) for _ in range(3)]
+        self.assertIs(pool.intern(first), copies[0])
+        self.assertTrue(all(copy is copies[0] for copy in copies))
+        pool.intern(fresh("Invoice"))
+        metrics = pool.get_metrics()
+        self.assertEqual((metrics["lookups"], metrics["unique"], metrics["duplicates"]), (5, 2, 3))
+        self.assertEqual(metrics["dedup_ratio"], 2.5)
+        self.assertGreater(metrics["bytes_saved"], 0)
+
+    def test_empty_strings_are_not_pooled(self) -> None:
+        pool = StringPool()
+        self.assertEqual(pool.intern(""), "")
+        self.assertEqual((len(pool), pool.dedup_ratio), (0, 1.0))
+
+    def test_max_size_passes_new_strings_through(self) -> None:
+        pool = StringPool(max_size=2)
+        a = pool.intern(fresh("a1"))
+        pool.intern(fresh("b1"))
+        c = fresh("c1")
+        self.assertIs(pool.intern(c), c)
+        self.assertIsNot(pool.intern(fresh("c1")), c)  # Never pooled
+        self.assertIs(pool.intern(fresh("a1")), a)  # Pooled strings are still shared
+        self.assertEqual(len(pool), 2)
+        self.assertNotIn("c1", pool)
+        pool.clear()
+        self.assertEqual((len(pool), pool.get_metrics()["lookups"]), (0, 0))
+        self.assertIs(pool.intern(c), c)
+
+    def test_statistics_are_exact_across_threads(self) -> None:
+        pool = StringPool()
+        texts = [fresh(f"Task {number % 10}") for number in range(1000)]
+
+        def intern_all() -> None:
+            for text in texts:
+                pool.intern(text)
+
+        threads = [threading.Thread(target=intern_all) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        metrics = pool.get_metrics()
+        self.assertEqual((metrics["lookups"], metrics["unique"]), (8000, 10))
+        self.assertEqual(metrics["duplicates"], 8000 - 8 * 10)  # Each thread also looks up the ten pooled instances
+
+
+class WorkspacePoolTest(unittest.TestCase):
+    """Each workspace has its own pool, dropped with the workspace."""
+
+    def setUp(self) -> None:
+        self.enterContext(model_output())
+
+    def test_workspaces_do_not_share_the_global_pool(self) -> None:
+        manager = WorkspaceManager()
+        before = len(shared_pool)
+        pools = []
+        for email in ("ann@example.com", "bob@example.com"):
+            with manager.checkout(email) as controller:
+                controller.create_regular_task(fresh("Unique workspace title 41"), datetime.datetime(2030, 1, 1))
+                pools.append(controller.string_pool)
+        self.assertIsNot(pools[0], pools[1])
+        self.assertEqual([len(pool) for pool in pools], [1, 1])
+        self.assertEqual(len(shared_pool), before)
+        self.assertNotIn("Unique workspace title 41", shared_pool)
+
+
+if __name__ == "__main__":
+    unittest.main()
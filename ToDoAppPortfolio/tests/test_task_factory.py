@@ -0,0 +1,115 @@
+"""
+Tests for the task factory: type detection, bulk creation and newly registered types.
+"""
+
+import datetime
+import unittest
+from batch_runner import model_output
+from string_pool import StringPool
+from task import AbstractTask, PriorityTask, RecurringTask, Task
+from task_factory import TaskFactory
+
+
+DUE = datetime.datetime(2030, 1, 1)
+WEEK = datetime.timedelta(days=7)
+
+
+class DetectionTest(unittest.TestCase):
+    """The parameters given decide the task type."""
+
+    def setUp(self) -> None:
+        self.enterContext(model_output())
+
+    def test_marker_parameters(self) -> None:
+        cases = [
+            ({}, Task),
+            ({"description": "Two pages"}, Task),
+            ({"interval": WEEK}, RecurringTask),
+            ({"priority_level": 2}, PriorityTask),
+        ]
+        for kwargs, task_class in cases:
+            with self.subTest(kwargs=kwargs):
+                self.assertIs(type(TaskFactory.create_task("Report", DUE, **kwargs)), task_class)
+
+    def test_priority_level_wins_over_interval(self) -> None:
+        task = TaskFactory.create_task("Report", DUE, interval=WEEK, priority_level=3, description="Two pages")
+        self.assertIs(type(task), PriorityTask)
+        self.assertEqual((task.priority_level, task.description), (3, "Two pages"))
+
+
+class CreateManyTest(unittest.TestCase):
+    """Rows create the same tasks as create_task_by_type, with or without a description."""
+
+    CASES = [
+        ("Task", ()),
+        ("RecurringTask", (WEEK,)),
+        ("PriorityTask", (2,)),
+    ]
+
+    def setUp(self) -> None:
+        self.enterContext(model_output())
+
+    def test_rows_with_and_without_description(self) -> None:
+        for task_type, type_fields in self.CASES:
+            with self.subTest(task_type=task_type):
+                plain, described = TaskFactory.create_many(task_type, [("Report", DUE, *type_fields),
+                                                                      ("Report", DUE, *type_fields, "Two pages")])
+                self.assertEqual((type(plain).__name__, type(described).__name__), (task_type, task_type))
+                self.assertEqual((plain.description, described.description), ("", "Two pages"))
+                expected = TaskFactory.create_task_by_type(task_type, "Report", DUE, description="Two pages",
+                                                           **dict(zip(described.TYPE_PARAMS, type_fields)))
+                for name, value in vars(expected).items():
+                    if name not in ("task_id", "date_created"):
+                        self.assertEqual(getattr(described, name), value, name)
+
+    def test_strings_go_through_the_given_pool(self) -> None:
+        pool = StringPool()
+        first, second = TaskFactory.create_many("PriorityTask", [("".join(["Re", "port"]), DUE, 1, "Notes"),
+                                                                 ("".join(["Rep", "ort"]), DUE, 2, "Notes")],
+                                                 string_pool=pool)
+        self.assertIs(first.title, second.title)
+        self.assertEqual(len(pool), 2)
+
+    def test_unknown_type_raises(self) -> None:
+        with self.assertRaises(ValueError):
+            TaskFactory.create_many("MissingTask", [("Report", DUE)])
+
+
+class RegistrationTest(unittest.TestCase):
+    """A task class registered later is picked up without changing the factory."""
+
+    def setUp(self) -> None:
+        self.enterContext(model_output())
+        TaskFactory.get_supported_task_types()  # Build the specs before the new class registers
+
+        class EstimatedTask(Task, task_type="EstimatedTask"):
+            TYPE_PARAMS = ("estimate",)
+
+            def __init__(self, title: str, date_due: datetime.datetime, estimate: int, description: str = "") -> None:
+                super().__init__(title, date_due, description)
+                self.estimate = estimate
+
+        self.addCleanup(AbstractTask._registry.pop, "EstimatedTask")
+        self.task_class = EstimatedTask
+
+    def test_specs_are_rebuilt(self) -> None:
+        self.assertEqual(TaskFactory.get_supported_task_types()[-1], "EstimatedTask")
+        task = TaskFactory.create_task("Report", DUE, estimate=3)
+        self.assertIs(type(task), self.task_class)
+        self.assertEqual(task.estimate, 3)
+        task, = TaskFactory.create_many("EstimatedTask", [("Report", DUE, 5, "Two pages")])
+        self.assertEqual((task.estimate, task.description), (5, "Two pages"))
+
+    def test_latest_registration_wins(self) -> None:
+        task = TaskFactory.create_task("Report", DUE, priority_level=2, interval=WEEK, estimate=3)
+        self.assertIs(type(task), self.task_class)
+
+    def test_removed_class_is_dropped(self) -> None:
+        AbstractTask._registry.pop("EstimatedTask")
+        self.addCleanup(AbstractTask._registry.__setitem__, "EstimatedTask", self.task_class)
+        self.assertNotIn("EstimatedTask", TaskFactory.get_supported_task_types())
+        self.assertIs(type(TaskFactory.create_task("Report", DUE, priority_level=2, estimate=3)), PriorityTask)
+
+
+if __name__ == "__main__":
+    unittest.main()
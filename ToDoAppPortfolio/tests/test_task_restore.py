@@ -0,0 +1,89 @@
+"""
+Tests for the bulk restore path used by the DAOs.
+"""
+
+import datetime
+import unittest
+from abstract_dao import AbstractDAO
+from batch_runner import model_output
+from task import PriorityTask, RecurringTask, Task
+
+
+DUE = datetime.datetime(2030, 1, 1)
+CREATED = datetime.datetime(2024, 5, 1, 9, 30)
+WEEK = datetime.timedelta(days=7)
+
+
+def constructed(task_class, *type_fields):
+    """Build a task through its constructor, with the fixed creation date used by the rows."""
+    task = task_class("Report", DUE, *type_fields, "Two pages")
+    task.date_created = CREATED
+    return task
+
+
+class RestoreManyTest(unittest.TestCase):
+    """Restored tasks are indistinguishable from constructed ones."""
+
+    CASES = [
+        (Task, (), ()),
+        (RecurringTask, (WEEK,), (WEEK, [])),
+        (PriorityTask, (2,), (2,)),
+    ]
+
+    def setUp(self) -> None:
+        self.enterContext(model_output())
+
+    def test_matches_constructed_tasks(self) -> None:
+        for task_class, arguments, type_fields in self.CASES:
+            with self.subTest(task_class=task_class.__name__):
+                expected = constructed(task_class, *arguments)
+                first, second = task_class.restore_many([("Report", DUE, "Two pages", CREATED, False, *type_fields)] * 2)
+                self.assertEqual(list(vars(first)), list(vars(expected)))  # Same attributes, same layout
+                for name, value in vars(expected).items():
+                    if name != "task_id":
+                        self.assertEqual(getattr(first, name), value, name)
+                self.assertEqual((first.version, first._frozen, first._display_cache), (0, None, None))
+                self.assertEqual(second.task_id, first.task_id + 1)
+                self.assertGreater(first.task_id, expected.task_id)
+                self.assertEqual(str(first), str(expected))
+
+    def test_restored_tasks_behave_like_constructed_ones(self) -> None:
+        task, = PriorityTask.restore_many([("Call", DUE, "", CREATED, False, 3)])
+        frozen = task.frozen_copy()
+        task.priority_level = 1
+        self.assertEqual((task.version, frozen.priority_level), (1, 3))
+        task.restore_state(frozen)
+        self.assertEqual(task.priority_level, 3)
+
+    def test_invalid_level_rejects_the_batch(self) -> None:
+        for level in (4, 0, True, 1.0, "2", None):
+            with self.subTest(level=level):
+                with self.assertRaises(ValueError):
+                    PriorityTask.restore_many([("Call", DUE, "", CREATED, False, 2),
+                                               ("Call", DUE, "", CREATED, False, level)])
+
+
+class RestoreTasksFallbackTest(unittest.TestCase):
+    """A DAO batch with a bad row restores the other rows one by one."""
+
+    def setUp(self) -> None:
+        self.enterContext(model_output())
+        self.rows = [
+            ("PriorityTask", ("Call", DUE, "", CREATED, False, 3)),
+            ("Task", ("Report", DUE, "", CREATED, False)),
+            ("PriorityTask", ("Broken", DUE, "", CREATED, False, 7)),
+            ("PriorityTask", ("Review", DUE, "", CREATED, True, 1)),
+        ]
+
+    def test_invalid_rows_are_skipped(self) -> None:
+        tasks = AbstractDAO._restore_tasks(self.rows)
+        self.assertEqual([task.title for task in tasks], ["Call", "Report", "Review"])
+        self.assertTrue(tasks[2].completed)
+
+    def test_placeholders_line_up_with_the_rows(self) -> None:
+        tasks = AbstractDAO._restore_tasks(self.rows, keep_placeholders=True)
+        self.assertEqual([task and task.title for task in tasks], ["Call", "Report", None, "Review"])
+
+
+if __name__ == "__main__":
+    unittest.main()
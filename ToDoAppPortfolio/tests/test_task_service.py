@@ -0,0 +1,101 @@
+"""
+Tests for the HTTP/JSON task service: dispatch, batches and a real server.
+"""
+
+import http.client
+import json
+import threading
+import unittest
+from batch_runner import model_output
+from task_service import TaskService, make_server
+
+
+def create(owner: str, title: str, **args) -> dict:
+    """Build a create_regular_task request."""
+    return {"owner": owner, "op": "create_regular_task",
+            "args": dict({"title": title, "due_date": "2030-01-01T09:00"}, **args)}
+
+
+class DispatchTest(unittest.TestCase):
+    """Every request gets a response; failures stay with their request."""
+
+    def setUp(self) -> None:
+        self.enterContext(model_output())
+        self.service = TaskService()
+
+    def titles(self, owner: str) -> list:
+        response = self.service.dispatch({"owner": owner, "op": "get_all_tasks"})
+        return [task["title"] for task in response["result"]]
+
+    def test_operations_reach_the_owner_controller(self) -> None:
+        self.assertTrue(self.service.dispatch(create("ann@example.com", "Report"))["ok"])
+        self.assertTrue(self.service.dispatch(create("bob@example.com", "Invoice"))["ok"])
+        response = self.service.dispatch({"owner": "ANN@example.com", "op": "edit_task_title",
+                                          "args": {"task_number": 1, "title": "Summary"}})
+        self.assertTrue(response["ok"], response["message"])
+        self.assertEqual(self.titles("ann@example.com"), ["Summary"])
+        self.assertEqual(self.service.owner_count(), 2)
+
+    def test_invalid_requests_are_reported(self) -> None:
+        requests = [
+            {"owner": "ann@example.com", "op": "frobnicate"},
+            {"owner": "ann@example.com"},
+            create("ann@example.com", "Report", due_date="next week"),
+            {"owner": "ann@example.com", "op": "remove_task", "args": {"task_number": 5}},
+            {"owner": "ann@example.com", "op": "save"},
+            ["not", "a", "request"],
+        ]
+        for request in requests:
+            with self.subTest(request=request):
+                response = self.service.dispatch(request)
+                self.assertFalse(response["ok"])
+                self.assertTrue(response["message"])
+
+    def test_unexpected_errors_do_not_abort_a_batch(self) -> None:
+        responses = self.service.dispatch_batch([
+            create("ann@example.com", "Report"),
+            {"owner": "ann@example.com", "op": "create_priority_task",
+             "args": {"title": "Call", "due_date": "2030-01-01", "priority_level": float("inf")}},  # OverflowError
+            create("ann@example.com", "Invoice"),
+        ])
+        self.assertEqual([response["ok"] for response in responses], [True, False, True])
+        self.assertEqual(self.titles("ann@example.com"), ["Report", "Invoice"])
+
+
+class ServerTest(unittest.TestCase):
+    """Requests over HTTP reach the service through a keep-alive connection."""
+
+    def setUp(self) -> None:
+        self.enterContext(model_output())
+        self.server = make_server(TaskService(), port=0)
+        thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        self.connection = http.client.HTTPConnection("127.0.0.1", self.server.server_port, timeout=5)
+        self.addCleanup(self.connection.close)
+
+    def request(self, method: str, path: str, payload=None) -> tuple:
+        body = None if payload is None else json.dumps(payload)
+        self.connection.request(method, path, body, {"Content-Type": "application/json"})
+        response = self.connection.getresponse()
+        return response.status, json.loads(response.read())
+
+    def test_api_batch_and_health(self) -> None:
+        status, response = self.request("POST", "/api", create("ann@example.com", "Report"))
+        self.assertEqual((status, response["ok"]), (200, True))
+
+        status, response = self.request("POST", "/api/batch", {"requests": [
+            create("ann@example.com", "Invoice"),
+            {"owner": "ann@example.com", "op": "get_task_page", "args": {"limit": 5}},
+        ]})
+        self.assertEqual(status, 200)
+        self.assertEqual([row["title"] for row in response["responses"][1]["result"]], ["Report", "Invoice"])
+
+        self.assertEqual(self.request("GET", "/health"), (200, {"ok": True, "owners": 1}))
+        self.assertEqual(self.request("POST", "/api/batch", {"requests": "none"})[0], 400)
+        self.assertEqual(self.request("GET", "/missing")[0], 404)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,155 @@
+"""
+Stress tests for the thread-safe TaskList mode.
+"""
+
+import datetime
+import threading
+import time
+import unittest
+from batch_runner import model_output
+from task import Task
+from tasklist import TaskList
+from users import Owner
+
+
+DUE = datetime.datetime(2030, 1, 1)
+
+
+def make_list(count: int = 100) -> TaskList:
+    """Create a thread-safe list holding count tasks."""
+    task_list = TaskList(Owner("Tester", "tester@example.com"), thread_safe=True, announce=False)
+    task_list.add_tasks([Task(f"t{number}", DUE) for number in range(count)])
+    return task_list
+
+
+def run_threads(count: int, target) -> float:
+    """Run target on count threads at once and return the elapsed seconds."""
+    threads = [threading.Thread(target=target) for _ in range(count)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(10)
+    return time.perf_counter() - started
+
+
+class ReadScalingTest(unittest.TestCase):
+    """Readers share the lock, so read capacity grows with the number of threads."""
+
+    READ_SECONDS = 0.05  # Time each reader spends inside the lock, e.g. waiting on I/O
+
+    def setUp(self) -> None:
+        self.enterContext(model_output())
+        self.task_list = make_list()
+
+    def test_readers_hold_the_lock_together(self) -> None:
+        readers = 8
+        barrier = threading.Barrier(readers, timeout=5)
+        broken = []
+
+        def read() -> None:
+            with self.task_list.read_locked():
+                try:
+                    barrier.wait()  # Only passes if every reader is inside at once
+                except threading.BrokenBarrierError:
+                    broken.append(True)
+
+        run_threads(readers, read)
+        self.assertEqual(broken, [])
+
+    def test_read_throughput_scales_linearly(self) -> None:
+        def read() -> None:
+            with self.task_list.read_locked():
+                time.sleep(self.READ_SECONDS)
+                len(self.task_list.snapshot())
+
+        single = run_threads(1, read)
+        for readers in (2, 4, 8, 16):
+            elapsed = run_threads(readers, read)
+            speedup = readers * single / elapsed
+            # Serialized readers would give a speedup of 1; allow for scheduling noise
+            self.assertGreater(speedup, readers * 0.6, f"{readers} readers: speedup {speedup:.1f}")
+
+    def test_writer_excludes_readers(self) -> None:
+        inside_write = threading.Event()
+        release = threading.Event()
+        reads = []
+
+        def write() -> None:
+            with self.task_list.write_locked():
+                inside_write.set()
+                release.wait(5)
+
+        writer = threading.Thread(target=write)
+        writer.start()
+        inside_write.wait(5)
+        reader = threading.Thread(target=lambda: reads.append(len(self.task_list.snapshot())))
+        reader.start()
+        reader.join(0.1)
+        self.assertTrue(reader.is_alive())  # Blocked behind the writer
+        release.set()
+        writer.join(5)
+        reader.join(5)
+        self.assertEqual(reads, [100])
+
+
+class ConcurrentMutationTest(unittest.TestCase):
+    """Readers never see a half-applied change while writers run."""
+
+    def setUp(self) -> None:
+        self.enterContext(model_output())
+        self.task_list = make_list(0)
+
+    def test_batches_are_atomic_for_snapshot_readers(self) -> None:
+        stop = threading.Event()
+        problems = []
+
+        def add_pairs() -> None:
+            for number in range(300):
+                pair = [Task(f"pair {number}", DUE), Task(f"pair {number}", DUE)]
+                self.task_list.apply_batch(lambda tasks: tasks.extend(pair))
+                if number % 3 == 0:
+                    self.task_list.apply_batch(lambda tasks: tasks.__delitem__(slice(0, 2)))
+
+        def read() -> None:
+            while not stop.is_set():
+                tasks = self.task_list.snapshot()
+                if len(tasks) % 2:
+                    problems.append(len(tasks))
+                if len({id(task) for task in tasks}) != len(tasks):
+                    problems.append("duplicate")
+
+        readers = [threading.Thread(target=read) for _ in range(4)]
+        for reader in readers:
+            reader.start()
+        writers = [threading.Thread(target=add_pairs) for _ in range(2)]
+        for writer in writers:
+            writer.start()
+        for writer in writers:
+            writer.join(30)
+        stop.set()
+        for reader in readers:
+            reader.join(5)
+
+        self.assertEqual(problems, [])
+        self.assertEqual(len(self.task_list.snapshot()), 2 * (600 - 200))
+
+    def test_concurrent_adds_and_removes_keep_every_task(self) -> None:
+        def add() -> None:
+            for number in range(500):
+                self.task_list.add_task(Task(f"t{number}", DUE))
+
+        run_threads(4, add)
+        self.assertEqual(len(self.task_list.tasks), 2000)
+        self.assertEqual(self.task_list.generation, 2001)
+
+        def remove() -> None:
+            for _ in range(250):
+                self.task_list.remove_task(0)
+
+        run_threads(4, remove)
+        self.assertEqual(len(self.task_list.snapshot()), 1000)
+
+
+if __name__ == "__main__":
+    unittest.main()
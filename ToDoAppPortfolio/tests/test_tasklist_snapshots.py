@@ -0,0 +1,80 @@
+"""
+Tests for consistent, copy-on-write task list snapshots.
+"""
+
+import datetime
+import threading
+import unittest
+from batch_runner import model_output
+from task import Task
+from tasklist import TaskList
+from users import Owner
+
+
+DUE = datetime.datetime(2030, 1, 1)
+
+
+class RacingTask(Task):
+    """Task whose first freeze lets another thread edit the list meanwhile."""
+
+    writer = None  # Callable run on another thread during the first freeze
+
+    def frozen_copy(self):
+        writer, RacingTask.writer = RacingTask.writer, None
+        if writer is not None:
+            thread = threading.Thread(target=writer)
+            thread.start()
+            thread.join(5)
+            RacingTask.writer_finished = not thread.is_alive()
+        return super().frozen_copy()
+
+
+class ConsistentSnapshotTest(unittest.TestCase):
+    """Snapshots for background savers."""
+
+    def setUp(self) -> None:
+        self.enterContext(model_output())
+        self.task_list = TaskList(Owner("Tester", "tester@example.com"), thread_safe=True, announce=False)
+        self.task_list.add_tasks([RacingTask(f"t{number}", DUE) for number in range(10)])
+
+    def test_later_edits_do_not_show_through(self) -> None:
+        snapshot = self.task_list.consistent_snapshot()
+        with self.task_list.write_locked():
+            self.task_list.tasks[0].change_title("edited")
+            self.task_list.remove_task(1)
+        self.assertEqual([task.title for task in snapshot.tasks[:2]], ["t0", "t1"])
+        self.assertEqual(len(snapshot), 10)
+
+    def test_unchanged_tasks_share_their_copies(self) -> None:
+        first = self.task_list.consistent_snapshot()
+        with self.task_list.write_locked():
+            self.task_list.tasks[3].change_title("edited")
+        second = self.task_list.consistent_snapshot()
+        shared = [a is b for a, b in zip(first.tasks, second.tasks)]
+        self.assertEqual(shared.count(False), 1)
+        self.assertFalse(shared[3])
+
+    def test_writers_proceed_during_the_copy(self) -> None:
+        def edit_two_tasks() -> None:
+            with self.task_list.write_locked():
+                self.task_list.tasks[0].change_title("first")
+                self.task_list.tasks[9].change_title("last")
+
+        RacingTask.writer = edit_two_tasks
+        snapshot = self.task_list.consistent_snapshot()
+
+        # The writer was not blocked by the snapshot, and the copy that raced it
+        # was discarded, so both edits or neither are visible
+        self.assertTrue(RacingTask.writer_finished)
+        self.assertEqual((snapshot.tasks[0].title, snapshot.tasks[9].title), ("first", "last"))
+
+    def test_snapshot_taken_inside_a_write_section(self) -> None:
+        with self.task_list.write_locked():
+            self.task_list.tasks[0].change_title("inside")
+            snapshot = self.task_list.consistent_snapshot()
+        self.assertEqual(snapshot.tasks[0].title, "inside")
+        self.assertEqual(snapshot.generation, self.task_list.generation)
+
+
+if __name__ == "__main__":
+    unittest.main()
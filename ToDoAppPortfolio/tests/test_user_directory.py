@@ -0,0 +1,109 @@
+"""
+Tests for the user directory: registration, get-or-create and persistence.
+"""
+
+import datetime
+import os
+import tempfile
+import threading
+import unittest
+from abstract_dao import UserCsvDAO
+from batch_runner import model_output
+from user_directory import UserDirectory
+from users import Owner
+from workspace_manager import WorkspaceManager
+
+
+class RegistrationTest(unittest.TestCase):
+    """Bulk registration is all-or-nothing and get_or_create is atomic."""
+
+    def setUp(self) -> None:
+        self.directory = UserDirectory([Owner("Ann", "ann@example.com")])
+
+    def test_register_many_is_all_or_nothing(self) -> None:
+        batches = [
+            [Owner("Bob", "bob@example.com"), Owner("Ann again", " ANN@example.com")],  # Already registered
+            [Owner("Bob", "bob@example.com"), Owner("Bob again", "Bob@Example.com")],  # Repeated in the batch
+            [Owner("Bob", "bob@example.com"), Owner("Nobody", "  ")],  # Empty email
+        ]
+        for batch in batches:
+            with self.subTest(batch=[owner.email for owner in batch]):
+                with self.assertRaises(ValueError):
+                    self.directory.register_many(batch)
+                self.assertEqual([owner.name for owner in self.directory], ["Ann"])
+
+    def test_register_many_with_replace(self) -> None:
+        added = self.directory.register_many([Owner("Ann B", "ann@example.com"), Owner("Bob", "bob@example.com")],
+                                             replace=True)
+        self.assertEqual(added, 2)
+        self.assertEqual([owner.name for owner in self.directory], ["Ann B", "Bob"])
+
+    def test_get_or_create_returns_one_shared_owner(self) -> None:
+        self.assertIs(self.directory.get_or_create(" Ann@Example.com "), self.directory.get("ann@example.com"))
+        bob = self.directory.get_or_create("Bob@Example.com")
+        self.assertEqual((bob.email, bob.name), ("bob@example.com", "Bob"))
+        self.assertEqual(self.directory.get_or_create("carol@example.com", "Carol C").name, "Carol C")
+        with self.assertRaises(ValueError):
+            self.directory.get_or_create(" ")
+
+    def test_concurrent_get_or_create_creates_once(self) -> None:
+        results = []
+        barrier = threading.Barrier(8)
+
+        def create() -> None:
+            barrier.wait()
+            results.append(self.directory.get_or_create("dave@example.com"))
+
+        threads = [threading.Thread(target=create) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len({id(owner) for owner in results}), 1)
+        self.assertEqual(len(self.directory), 2)
+
+
+class PersistenceTest(unittest.TestCase):
+    """Owners survive a save and load; failed saves are reported."""
+
+    def setUp(self) -> None:
+        self.enterContext(model_output())
+        self.storage = self.enterContext(tempfile.TemporaryDirectory())
+        self.path = os.path.join(self.storage, "owners.csv")
+
+    def test_round_trip(self) -> None:
+        ann = Owner("Ann", "ann@example.com")
+        ann.date_joined = datetime.datetime(2024, 5, 1, 9, 30, 15)
+        ann.permissions = ["read", "write"]
+        ann.tasks_created = 7
+        saved = UserDirectory([ann, Owner("Bob", "bob@example.com")])
+        saved.save(UserCsvDAO(self.path))
+
+        loaded = UserDirectory()
+        self.assertEqual(loaded.load(UserCsvDAO(self.path)), 2)
+        owner = loaded.get("ann@example.com")
+        self.assertEqual((owner.name, owner.date_joined, owner.permissions, owner.tasks_created),
+                         ("Ann", ann.date_joined, ["read", "write"], 7))
+        self.assertEqual([owner.email for owner in loaded], ["ann@example.com", "bob@example.com"])
+
+    def test_failed_save_raises(self) -> None:
+        directory = UserDirectory([Owner("Ann", "ann@example.com")])
+        with self.assertRaises(OSError):
+            directory.save(UserCsvDAO(os.path.join(self.storage, "missing", "owners.csv")))
+
+    def test_workspace_manager_reports_failed_directory_save(self) -> None:
+        manager = WorkspaceManager(self.storage)
+        with manager.checkout("ann@example.com") as controller:
+            controller.create_regular_task("Report", datetime.datetime(2030, 1, 1))
+        self.assertEqual(manager.flush_all(), 1)
+        self.assertTrue(os.path.exists(os.path.join(self.storage, WorkspaceManager.DIRECTORY_FILE)))
+
+        manager.storage_dir = os.path.join(self.storage, "missing")
+        with self.assertRaises(OSError):
+            manager.save_directory()
+        with self.assertRaises(OSError):
+            manager.flush_all()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,157 @@
+"""
+Tests for the multi-owner workspace manager.
+"""
+
+import datetime
+import os
+import tempfile
+import threading
+import unittest
+from batch_runner import model_output
+from workspace_manager import WorkspaceManager
+
+
+DUE = datetime.datetime(2030, 1, 1)
+
+
+class EvictionTest(unittest.TestCase):
+    """Saving and dropping idle workspaces."""
+
+    def setUp(self) -> None:
+        self.enterContext(model_output())
+        self.storage_dir = self.enterContext(tempfile.TemporaryDirectory())
+        self.manager = WorkspaceManager(self.storage_dir, max_resident=None)
+
+    def add_tasks(self, email: str, count: int) -> None:
+        with self.manager.checkout(email) as controller:
+            for number in range(count):
+                controller.create_regular_task(f"{email} {number}", DUE)
+
+    def test_evicted_workspace_reloads_its_tasks(self) -> None:
+        self.add_tasks("ann@example.com", 3)
+        self.assertTrue(self.manager.evict("ann@example.com"))
+        self.assertEqual(self.manager.resident_count(), 0)
+        with self.manager.checkout("ann@example.com") as controller:
+            self.assertEqual(len(controller.get_all_tasks()), 3)
+        self.assertEqual(self.manager.get_metrics()["evictions"], 1)
+
+    def test_failed_save_keeps_the_workspace(self) -> None:
+        email = "bob@example.com"
+        os.mkdir(self.manager.storage_path(email))  # Saving to a directory fails
+        self.add_tasks(email, 2)
+
+        self.assertFalse(self.manager.evict(email))
+        metrics = self.manager.get_metrics()
+        self.assertEqual((metrics["evictions"], metrics["eviction_failures"]), (0, 1))
+        with self.manager.checkout(email) as controller:
+            self.assertEqual(len(controller.get_all_tasks()), 2)
+
+    def test_eviction_closes_the_controller(self) -> None:
+        email = "cy@example.com"
+        self.add_tasks(email, 2)
+        with self.manager.checkout(email) as controller:
+            controller.get_workload_forecast(30, include_one_off=True)
+            bus = controller.task_list.events
+        self.assertEqual(bus.get_metrics()["subscribers"], 1)
+
+        self.assertTrue(self.manager.evict(email))
+        self.assertIsNone(controller.forecaster)
+        self.assertEqual(bus.get_metrics()["subscribers"], 0)
+        self.assertNotIn(controller.overdue._on_mutation, controller._mutation_listeners)
+
+    def test_lru_eviction_under_owner_limit(self) -> None:
+        self.manager.max_resident = 2
+        for email in ("a@example.com", "b@example.com", "c@example.com"):
+            self.add_tasks(email, 1)
+        self.assertEqual(self.manager.resident_count(), 2)
+        with self.manager.checkout("a@example.com") as controller:
+            self.assertEqual(controller.get_all_tasks()[0].title, "a@example.com 0")
+        metrics = self.manager.get_metrics()
+        self.assertEqual(metrics["misses"], 4)
+        self.assertGreaterEqual(metrics["evictions"], 2)
+
+
+class SlowLoadManager(WorkspaceManager):
+    """Manager whose loads of one owner wait until released by the test."""
+
+    def __init__(self, *args, slow_email: str, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.slow_email = slow_email
+        self.load_started = threading.Event()
+        self.release_load = threading.Event()
+
+    def _load_controller(self, owner):
+        if owner.email == self.slow_email:
+            self.load_started.set()
+            self.release_load.wait(5)
+        return super()._load_controller(owner)
+
+
+class CheckoutTest(unittest.TestCase):
+    """Loading workspaces on demand."""
+
+    def setUp(self) -> None:
+        self.enterContext(model_output())
+        self.storage_dir = self.enterContext(tempfile.TemporaryDirectory())
+
+    def test_cold_load_does_not_block_other_owners(self) -> None:
+        manager = SlowLoadManager(self.storage_dir, slow_email="slow@example.com")
+        titles = []
+
+        def use_slow_owner() -> None:
+            with manager.checkout("slow@example.com") as controller:
+                controller.create_regular_task("slow", DUE)
+
+        def use_slow_owner_again() -> None:
+            with manager.checkout("slow@example.com") as controller:
+                titles.extend(task.title for task in controller.get_all_tasks())
+
+        loader = threading.Thread(target=use_slow_owner)
+        loader.start()
+        self.assertTrue(manager.load_started.wait(5))
+        waiter = threading.Thread(target=use_slow_owner_again)
+        waiter.start()
+
+        # The slow owner's load is still in progress; another owner is served meanwhile
+        with manager.checkout("fast@example.com") as controller:
+            controller.create_regular_task("fast", DUE)
+        self.assertFalse(manager.release_load.is_set())
+
+        manager.release_load.set()
+        loader.join(5)
+        waiter.join(5)
+        self.assertEqual(titles, ["slow"])
+        self.assertEqual(manager.get_metrics()["misses"], 2)
+
+    def test_failed_load_is_retried_by_the_next_checkout(self) -> None:
+        manager = WorkspaceManager(self.storage_dir)
+        calls = []
+        original = manager._load_controller
+
+        def failing_once(owner):
+            calls.append(owner.email)
+            if len(calls) == 1:
+                raise ValueError("disk unavailable")
+            return original(owner)
+
+        manager._load_controller = failing_once
+        with self.assertRaises(ValueError):
+            with manager.checkout("ann@example.com"):
+                pass
+        self.assertEqual(manager.resident_count(), 0)
+        with manager.checkout("ann@example.com") as controller:
+            self.assertEqual(len(controller.get_all_tasks()), 0)
+        self.assertEqual(len(calls), 2)
+
+    def test_invalid_email_is_not_registered(self) -> None:
+        manager = WorkspaceManager(self.storage_dir)
+        for email in ("../etc", ".hidden@example.com", "a/b@example.com", "  "):
+            with self.assertRaises(ValueError):
+                with manager.checkout(email):
+                    pass
+        self.assertEqual(len(manager.directory), 0)
+        self.assertEqual(manager.resident_count(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -24,10 +24,15 @@ Version: 8.0 (Portfolio Quality with PriorityTask Support)
 # IMPORTS
 
 
+import collections  # For the queue of reminders awaiting display
 import datetime  # For date parsing
-from typing import Optional, Dict, Any
+import sys  # For buffered writes to standard output
+from typing import Optional, Dict, Any, Callable, List, Tuple
 from task_manager_controller import TaskManagerController  # Import controller
-from task import PriorityTask  # Import for priority level validation
+from task import AbstractTask, DateFormatter, PriorityTask  # Import for the clock, priority validation and rendering
+from reminders import ReminderEngine  # Import due-date reminders
+from instrumentation import Instrumentation  # Import opt-in timing instrumentation
+from memory_inspector import MemoryInspector  # Import memory accounting
 
 
 # COMMAND LINE UI CLASS DEFINITION
@@ -47,9 +52,20 @@ class CommandLineUI:
     logic to the TaskManagerController.
     """
     
+    PAGE_SIZE = 20  # Number of tasks rendered per page in list views
+    
     def __init__(self) -> None:
         """Initialize the UI with a controller instance."""
         self.controller: Optional[TaskManagerController] = None
+        # Reminders fire on a worker thread and are shown before the next menu
+        self._due_reminders: collections.deque = collections.deque()
+        self.reminders = ReminderEngine(self._due_reminders.append)
+        # Background save failures are reported the same way
+        self._autosave_errors: collections.deque = collections.deque()
+        self.instrumentation: Optional[Instrumentation] = None  # Set from the diagnostics menu
+        # Date formatters shared by all rows of the current render pass
+        self._format_date = DateFormatter()
+        self._format_day = DateFormatter("%Y-%m-%d")
     
     def run(self) -> None:
         """
@@ -62,6 +78,15 @@ class CommandLineUI:
         self._initialize_application()
         
         # Main application loop
+        try:
+            self._run_menu_loop()
+        finally:
+            self.reminders.stop()
+            self.reminders.detach()
+            self.controller.close()  # Save anything still pending and stop background work
+    
+    def _run_menu_loop(self) -> None:
+        """Read and dispatch menu choices until the user quits."""
         while True:
             try:
                 self._print_menu()
@@ -86,6 +111,12 @@ class CommandLineUI:
                 elif choice == "9":
                     self._handle_save_tasks()
                 elif choice == "10":
+                    self._handle_undo()
+                elif choice == "11":
+                    self._handle_redo()
+                elif choice == "12":
+                    self._handle_diagnostics()
+                elif choice == "13":
                     self._handle_quit()
                     break
                 else:
@@ -108,7 +139,11 @@ class CommandLineUI:
             owner_name = "Default User"
             
         self.controller = TaskManagerController(owner_name)
+        self.controller.enable_autosave(on_failure=self._autosave_errors.append)  # Saving never blocks the menu
+        self.reminders.attach(self.controller)
+        self.reminders.start()
         print(f"Welcome, {owner_name}!")
+        print("Changes are saved automatically once you load or save a task file.")
         
         # Display task statistics
         stats = self.controller.get_task_count()
@@ -116,20 +151,61 @@ class CommandLineUI:
     
     def _print_menu(self) -> None:
         """Display the enhanced main menu with priority task support."""
-        print("\n" + "="*60)
-        print("Enhanced ToDo List Manager - Portfolio Implementation")
-        print("="*60)
-        print("1. Add a task (Regular/Recurring/Priority)")
-        print("2. View tasks (uncompleted only)")
-        print("3. View overdue tasks")
-        print("4. View tasks by priority")
-        print("5. Remove a task")
-        print("6. Mark task as completed")
-        print("7. Edit task")
-        print("8. Load tasks from DAO")
-        print("9. Save tasks to DAO")
-        print("10. Quit")
-        print("="*60)
+        reminders = []
+        while self._due_reminders:
+            task = self._due_reminders.popleft()
+            reminders.append(f"Reminder: '{task.title}' is due now.")
+        while self._autosave_errors:
+            reminders.append(f"Autosave failed: {self._autosave_errors.popleft()}")
+        
+        self._write_lines(reminders + [
+            "\n" + "="*60,
+            "Enhanced ToDo List Manager - Portfolio Implementation",
+            "="*60,
+            "1. Add a task (Regular/Recurring/Priority)",
+            "2. View tasks (uncompleted only)",
+            "3. View overdue tasks",
+            "4. View tasks by priority",
+            "5. Remove a task",
+            "6. Mark task as completed",
+            "7. Edit task",
+            "8. Load tasks from DAO",
+            "9. Save tasks to DAO",
+            "10. Undo last change",
+            "11. Redo",
+            "12. Diagnostics",
+            "13. Quit",
+            "="*60,
+        ])
+    
+    @staticmethod
+    def _write_lines(lines: List[str]) -> None:
+        """
+        Write a block of output lines with a single write call.
+        
+        Assembling a whole view before writing avoids one system call per
+        line, which dominates render time over SSH and in piped output.
+        
+        Args:
+            lines (List[str]): Lines to write, without trailing newlines
+        """
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+    
+    def _render_task(self, task: Any) -> str:
+        """
+        Get the display string for a task within the current render pass.
+        
+        Tasks memoize their own strings, so unchanged tasks cost no formatting;
+        changed tasks share the pass's date formatter.
+        
+        Args:
+            task: Task to render
+            
+        Returns:
+            str: The task's string representation
+        """
+        return task.render(self._format_date)
     
     def _handle_add_task(self) -> None:
         """Handle adding a new task with support for all task types."""
@@ -213,30 +289,64 @@ class CommandLineUI:
         for level, description in priority_mapping.items():
             print(f"{level}. {description.capitalize()}")
     
+    def _page_through(self, view: str, heading: str,
+                      render_rows: Callable[[List[Tuple[int, Any]]], List[str]]) -> bool:
+        """
+        Render a controller view one page at a time.
+        
+        Only the rows of the current page are fetched from the controller and
+        formatted, so the first page of a very large list renders immediately.
+        
+        Args:
+            view (str): Controller view name passed to get_task_page
+            heading (str): Heading printed above each page
+            render_rows (Callable): Turns a page of (display number, task) rows into output lines
+            
+        Returns:
+            bool: True if the view contained any tasks, False otherwise
+        """
+        offset = 0
+        
+        while True:
+            rows, has_more = self.controller.get_task_page(view, offset, self.PAGE_SIZE)
+            if not rows:
+                return offset > 0
+            
+            # Assemble the whole page and write it in one go
+            self._format_date = DateFormatter()
+            self._format_day = DateFormatter("%Y-%m-%d")
+            page_number = offset // self.PAGE_SIZE + 1
+            self._write_lines([f"\n{heading} (page {page_number})", "-" * 80] + render_rows(rows))
+            
+            # Single-page views need no navigation prompt
+            if not has_more and offset == 0:
+                return True
+            
+            nav = input("[n]ext page, [p]revious page, or Enter to continue: ").strip().lower()
+            if nav in ['n', 'next'] and has_more:
+                offset += self.PAGE_SIZE
+            elif nav in ['p', 'previous'] and offset > 0:
+                offset -= self.PAGE_SIZE
+            else:
+                return True
+    
+    @staticmethod
+    def _priority_suffix(task: Any) -> str:
+        """Get the priority tag appended to task lines in list views."""
+        if hasattr(task, 'get_priority_string'):
+            return f" [Priority: {task.get_priority_string().upper()}]"
+        return ""
+    
     def _handle_view_tasks(self) -> None:
         """Handle viewing uncompleted tasks with enhanced display."""
         try:
-            tasks = self.controller.get_uncompleted_tasks()
+            def render_rows(rows: List[Tuple[int, Any]]) -> List[str]:
+                # Enhanced display with task type and priority info
+                return [f"{number:2d}. {self._render_task(task)}{self._priority_suffix(task)}"
+                        for number, task in rows]
             
-            if not tasks:
+            if not self._page_through("uncompleted", "📋 Uncompleted Tasks", render_rows):
                 print("No uncompleted tasks found.")
-                return
-            
-            print("\n📋 Uncompleted Tasks:")
-            print("-" * 80)
-            
-            all_tasks = self.controller.get_all_tasks()
-            for task in tasks:
-                # Get original index for display
-                original_index = all_tasks.index(task) + 1
-                task_type = task.get_task_type()
-                
-                # Enhanced display with task type and priority info
-                priority_info = ""
-                if hasattr(task, 'get_priority_string'):
-                    priority_info = f" [Priority: {task.get_priority_string().upper()}]"
-                
-                print(f"{original_index:2d}. {task}{priority_info}")
                 
         except Exception as e:
             print(f"Error viewing tasks: {e}")
@@ -244,26 +354,17 @@ class CommandLineUI:
     def _handle_view_overdue_tasks(self) -> None:
         """Handle viewing overdue tasks."""
         try:
-            overdue_tasks = self.controller.get_overdue_tasks()
-            
-            if not overdue_tasks:
+            def render_rows(rows: List[Tuple[int, Any]]) -> List[str]:
+                current_time = AbstractTask.clock.now()
+                lines = []
+                for number, task in rows:
+                    days_overdue = (current_time - task.date_due).days
+                    lines.append(f"{number:2d}. {self._render_task(task)} (Overdue by {days_overdue} days)"
+                                 f"{self._priority_suffix(task)}")
+                return lines
+            
+            if not self._page_through("overdue", "⚠️  Overdue Tasks", render_rows):
                 print("No overdue tasks found.")
-                return
-            
-            print("\n⚠️  Overdue Tasks:")
-            print("-" * 80)
-            
-            all_tasks = self.controller.get_all_tasks()
-            for task in overdue_tasks:
-                # Get original index for display
-                original_index = all_tasks.index(task) + 1
-                days_overdue = (datetime.datetime.now() - task.date_due).days
-                
-                priority_info = ""
-                if hasattr(task, 'get_priority_string'):
-                    priority_info = f" [Priority: {task.get_priority_string().upper()}]"
-                
-                print(f"{original_index:2d}. {task} (Overdue by {days_overdue} days){priority_info}")
                 
         except Exception as e:
             print(f"Error viewing overdue tasks: {e}")
@@ -271,35 +372,24 @@ class CommandLineUI:
     def _handle_view_priority_tasks(self) -> None:
         """Handle viewing tasks filtered by priority level."""
         try:
-            priority_tasks = self.controller.get_priority_tasks()
+            def render_rows(rows: List[Tuple[int, Any]]) -> List[str]:
+                # Rows arrive grouped high to low; print a header at each level change
+                lines = []
+                current_level = None
+                for number, task in rows:
+                    if task.priority_level != current_level:
+                        current_level = task.priority_level
+                        priority_name = PriorityTask.PRIORITY_MAPPING[current_level].upper()
+                        lines.append(f"\n{priority_name} PRIORITY:")
+                    
+                    status = "✓" if task.completed else "○"
+                    lines.append(f"  {status} {number:2d}. {task.title} - Due: {self._format_day(task.date_due)}")
+                    if task.description:
+                        lines.append(f"      Description: {task.description}")
+                return lines
             
-            if not priority_tasks:
+            if not self._page_through("priority", "🎯 Priority Tasks (sorted by priority)", render_rows):
                 print("No priority tasks found.")
-                return
-            
-            print("\n🎯 Priority Tasks (sorted by priority):")
-            print("-" * 80)
-            
-            # Group tasks by priority level
-            priority_groups = {1: [], 2: [], 3: []}
-            all_tasks = self.controller.get_all_tasks()
-            
-            for task in priority_tasks:
-                priority_groups[task.priority_level].append(task)
-            
-            # Display by priority level (high to low)
-            for priority_level in [3, 2, 1]:
-                tasks_at_level = priority_groups[priority_level]
-                if tasks_at_level:
-                    priority_name = PriorityTask.PRIORITY_MAPPING[priority_level].upper()
-                    print(f"\n{priority_name} PRIORITY:")
-                    
-                    for task in tasks_at_level:
-                        original_index = all_tasks.index(task) + 1
-                        status = "✓" if task.completed else "○"
-                        print(f"  {status} {original_index:2d}. {task.title} - Due: {task.date_due.strftime('%Y-%m-%d')}")
-                        if task.description:
-                            print(f"      Description: {task.description}")
                 
         except Exception as e:
             print(f"Error viewing priority tasks: {e}")
@@ -484,12 +574,91 @@ class CommandLineUI:
         except Exception as e:
             print(f"Error saving tasks: {e}")
     
+    def _handle_undo(self) -> None:
+        """Handle undoing the latest change."""
+        success, message = self.controller.undo()
+        print(message)
+    
+    def _handle_redo(self) -> None:
+        """Handle redoing the latest undone change."""
+        success, message = self.controller.redo()
+        print(message)
+    
+    def _handle_diagnostics(self) -> None:
+        """Handle the diagnostics submenu (timing instrumentation and reports)."""
+        while True:
+            active = self.instrumentation is not None and self.instrumentation.active
+            self._write_lines([
+                "\nDiagnostics:",
+                f"1. {'Stop' if active else 'Start'} timing instrumentation",
+                "2. Show timing report",
+                "3. Export timing report as JSON",
+                "4. Show memory report",
+                "5. Back to main menu",
+            ])
+            choice = input("Enter your choice: ").strip()
+            
+            if choice == "1":
+                if active:
+                    self.instrumentation.close()
+                    print("✓ Timing instrumentation stopped. Reports keep the collected data.")
+                else:
+                    profile = input("Also capture a cProfile profile? (y/n): ").strip().lower() in ['y', 'yes']
+                    trace = input("Also trace memory allocations? (y/n): ").strip().lower() in ['y', 'yes']
+                    self.instrumentation = Instrumentation(profile, trace).attach(self.controller)
+                    print("✓ Timing instrumentation started.")
+            elif choice == "2":
+                if self.instrumentation is None:
+                    print("Start timing instrumentation first.")
+                else:
+                    self._write_lines([self.instrumentation.report_text()])
+            elif choice == "3":
+                if self.instrumentation is None:
+                    print("Start timing instrumentation first.")
+                    continue
+                file_path = input("Enter file path for the JSON report: ").strip()
+                if not file_path:
+                    print("File path cannot be empty.")
+                    continue
+                try:
+                    with open(file_path, "w", encoding="utf-8") as report_file:
+                        report_file.write(self.instrumentation.report_json() + "\n")
+                    print(f"✓ Report written to {file_path}")
+                except OSError as e:
+                    print(f"✗ Could not write report: {e}")
+            elif choice == "4":
+                self._show_memory_report()
+            elif choice == "5":
+                return
+            else:
+                print("Invalid choice. Please try again.")
+    
+    def _show_memory_report(self) -> None:
+        """Show deep memory usage by task type, with an optional capacity projection."""
+        report = MemoryInspector().inspect(self.controller.task_list)
+        if not report.task_count:
+            print("No tasks to measure.")
+            return
+        
+        projection = input("Project memory for how many tasks? [press Enter to skip]: ").strip()
+        try:
+            projections = [int(projection)] if projection else []
+        except ValueError:
+            print("Invalid number; showing the report without a projection.")
+            projections = []
+        pool = self.controller.string_pool.get_metrics()
+        self._write_lines([report.format_text(projections),
+                           f"String pool: {pool['unique']:,} unique strings, "
+                           f"{pool['dedup_ratio']:.1f} uses each, ~{pool['bytes_saved']:,} bytes saved"])
+    
     def _handle_quit(self) -> None:
         """Handle application quit with optional auto-save."""
         try:
             stats = self.controller.get_task_count()
             
-            if stats['total'] > 0:
+            if self.controller.dao is not None:
+                print("All changes are saved automatically.")
+            elif stats['total'] > 0:
                 save_choice = input("Would you like to save your tasks before quitting? (y/n): ").strip().lower()
                 
                 if save_choice in ['y', 'yes']:
@@ -0,0 +1,215 @@
+"""
+User Directory Module - Portfolio Quality Implementation
+
+This module keeps track of every known owner, so multi-owner code can find
+an owner by email without scanning or rebuilding Owner objects per request.
+
+The user directory provides:
+- A dictionary index of owners by normalized email for O(1) lookup
+- Atomic get-or-create for request handlers running on many threads
+- All-or-nothing bulk registration with one lock acquisition per batch
+- Loading and saving through a user DAO, next to the owners' task files
+
+Classes:
+- UserDirectory: Thread-safe index of owners keyed by normalized email
+
+Author: [Moses Gana]
+Date: 2024
+Version: 8.0 (Portfolio Quality with PriorityTask Support)
+"""
+
+
+# IMPORTS
+
+
+import threading  # For the index lock
+from typing import Dict, Iterable, Iterator, List, Optional  # For type hints
+from abstract_dao import AbstractUserDAO  # Import the user DAO interface
+from users import Owner  # Import Owner class
+
+
+# USER DIRECTORY CLASS DEFINITION
+
+
+class UserDirectory:
+    """
+    Thread-safe index of owners keyed by normalized email.
+
+    Owners are shared objects: every lookup of an email returns the same
+    Owner instance, so counters such as tasks_created stay accurate.
+    """
+
+    def __init__(self, owners: Iterable[Owner] = ()) -> None:
+        """
+        Initialize the directory.
+
+        Args:
+            owners (Iterable[Owner]): Owners to register up front
+        """
+        self._owners: Dict[str, Owner] = {}
+        self._lock = threading.Lock()
+        self.register_many(owners)
+
+    @staticmethod
+    def normalize_email(email: str) -> str:
+        """
+        Normalize an email address for use as a directory key.
+
+        Raises:
+            ValueError: If the email is empty
+        """
+        normalized = email.strip().lower()
+        if not normalized:
+            raise ValueError("Owner email cannot be empty")
+        return normalized
+
+    def register(self, owner: Owner, replace: bool = False) -> Owner:
+        """
+        Add an owner to the directory.
+
+        Args:
+            owner (Owner): Owner to add
+            replace (bool): Replace an existing owner with the same email
+
+        Returns:
+            Owner: The registered owner
+
+        Raises:
+            ValueError: If the email is empty, or already registered and replace is False
+        """
+        email = self.normalize_email(owner.email)
+        with self._lock:
+            if not replace and email in self._owners:
+                raise ValueError(f"Owner '{email}' is already registered")
+            self._owners[email] = owner
+        return owner
+
+    def register_if_absent(self, owner: Owner) -> Owner:
+        """
+        Add an owner unless one with the same email is already registered.
+
+        Args:
+            owner (Owner): Owner to add
+
+        Returns:
+            Owner: The registered owner for that email (possibly an earlier instance)
+        """
+        email = self.normalize_email(owner.email)
+        with self._lock:
+            return self._owners.setdefault(email, owner)
+
+    def register_many(self, owners: Iterable[Owner], replace: bool = False) -> int:
+        """
+        Add many owners at once; either all are added or none.
+
+        Args:
+            owners (Iterable[Owner]): Owners to add
+            replace (bool): Replace existing owners with the same email
+
+        Returns:
+            int: Number of owners added or replaced
+
+        Raises:
+            ValueError: If an email is empty, repeated within the batch, or
+            already registered and replace is False
+        """
+        batch: Dict[str, Owner] = {}
+        for owner in owners:
+            email = self.normalize_email(owner.email)
+            if email in batch:
+                raise ValueError(f"Owner '{email}' appears more than once")
+            batch[email] = owner
+
+        with self._lock:
+            if not replace:
+                existing = batch.keys() & self._owners.keys()
+                if existing:
+                    raise ValueError(f"Owner(s) already registered: {sorted(existing)}")
+            self._owners.update(batch)
+        return len(batch)
+
+    def get(self, email: str) -> Optional[Owner]:
+        """
+        Find an owner by email.
+
+        Args:
+            email (str): Owner email, in any case
+
+        Returns:
+            Optional[Owner]: The owner, or None if not registered
+        """
+        return self._owners.get(email.strip().lower())
+
+    def get_or_create(self, email: str, name: Optional[str] = None) -> Owner:
+        """
+        Find an owner by email, registering a new one if needed.
+
+        Args:
+            email (str): Owner email, in any case
+            name (Optional[str]): Name for a new owner (defaults to the part before '@')
+
+        Returns:
+            Owner: The existing or newly registered owner
+        """
+        key = self.normalize_email(email)
+        owner = self._owners.get(key)
+        if owner is None:
+            with self._lock:
+                owner = self._owners.get(key)  # Another thread may have created it meanwhile
+                if owner is None:
+                    owner = self._owners[key] = Owner(name or key.split("@")[0], key)
+        return owner
+
+    def remove(self, email: str) -> bool:
+        """
+        Remove an owner from the directory.
+
+        Args:
+            email (str): Owner email, in any case
+
+        Returns:
+            bool: True if the owner was registered
+        """
+        with self._lock:
+            return self._owners.pop(email.strip().lower(), None) is not None
+
+    def owners(self) -> List[Owner]:
+        """Get all registered owners, in registration order."""
+        with self._lock:
+            return list(self._owners.values())
+
+    def __len__(self) -> int:
+        """Get the number of registered owners."""
+        return len(self._owners)
+
+    def __contains__(self, email: object) -> bool:
+        """Check whether an email is registered."""
+        return isinstance(email, str) and email.strip().lower() in self._owners
+
+    def __iter__(self) -> Iterator[Owner]:
+        """Iterate over a copy of the registered owners."""
+        return iter(self.owners())
+
+    def load(self, dao: AbstractUserDAO) -> int:
+        """
+        Register every owner stored by a user DAO, replacing owners with the same email.
+
+        Args:
+            dao (AbstractUserDAO): Source of owners
+
+        Returns:
+            int: Number of owners loaded
+        """
+        return self.register_many(dao.get_all_owners(), replace=True)
+
+    def save(self, dao: AbstractUserDAO) -> None:
+        """
+        Store every registered owner through a user DAO.
+
+        Args:
+            dao (AbstractUserDAO): Destination for the owners
+
+        Raises:
+            OSError: If the DAO cannot write its storage
+        """
+        dao.save_all_owners(self.owners())
@@ -88,14 +88,18 @@ class Owner(User):
         task_info = f"Task Lists: {self.tasks_created}"
         return f"{base_info} - {join_info} - {task_info}"
     
-    def create_task_list(self) -> None:
+    def create_task_list(self, announce: bool = True) -> None:
         """
         Increment the task list counter when owner creates a new task list.
         
         This method demonstrates owner-specific functionality.
         
+        Args:
+            announce (bool): Print a confirmation (off for lists created in bulk)
+        
         Returns:
             None: Method modifies instance state but doesn't return a value
         """
         self.tasks_created += 1
-        print(f"Task list created. Total task lists: {self.tasks_created}")
+        if announce:
+            print(f"Task list created. Total task lists: {self.tasks_created}")
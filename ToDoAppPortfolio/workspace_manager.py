@@ -0,0 +1,374 @@
+"""
+Workspace Manager Module - Portfolio Quality Implementation
+
+This module lets many owners' task lists share one process by keeping a
+bounded set of controllers resident and persisting idle ones to their DAO.
+
+The workspace manager provides:
+- One TaskManagerController per owner, keyed by Owner.email
+- Owners resolved through a UserDirectory and persisted next to their task files
+- Optional per-owner task quotas and creation rate limits shared by all workspaces
+- On-demand loading from the owner's DAO on first access, outside the
+  registry lock so one cold load never delays other owners
+- LRU eviction under an owner-count limit and an estimated memory budget
+- A string pool per workspace, so an evicted owner's text is released with
+  its controller instead of staying in a process-wide pool
+- Hit, miss and eviction metrics
+
+Classes:
+- Workspace: A resident owner's controller with its lock
+- WorkspaceManager: LRU cache of workspaces backed by DAO storage
+
+Author: [Moses Gana]
+Date: 2024
+Version: 8.0 (Portfolio Quality with PriorityTask Support)
+"""
+
+
+# IMPORTS
+
+
+import contextlib  # For the checkout context manager
+import os  # For storage paths
+import threading  # For registry and workspace locks
+from collections import OrderedDict  # For LRU ordering
+from typing import Dict, Iterator, Optional, Union  # For type hints
+from abstract_dao import UserCsvDAO  # Import owner storage
+from rate_limiter import QuotaManager  # Import per-owner quotas and rate limits
+from string_pool import StringPool  # Import per-workspace text deduplication
+from task_manager_controller import TaskManagerController  # Import controller
+from user_directory import UserDirectory  # Import owner index
+from users import Owner  # Import Owner class
+
+
+# WORKSPACE CLASS DEFINITION
+
+
+class Workspace:
+    """
+    A resident owner's controller together with the lock guarding it.
+
+    Attributes:
+        controller (Optional[TaskManagerController]): The owner's controller
+            (None while the workspace is being loaded)
+        lock (threading.Lock): Held while the controller is in use, loaded or evicted
+        evicted (bool): True once the workspace has been saved and dropped,
+            or its load has failed
+        task_count (int): Task count observed at the last checkout
+    """
+
+    def __init__(self, controller: Optional[TaskManagerController] = None) -> None:
+        """Initialize a workspace for a loaded controller, or a placeholder to load into."""
+        self.controller = controller
+        self.lock = threading.Lock()
+        self.evicted = False
+        self.task_count = len(controller.task_list.tasks) if controller is not None else 0
+
+
+# WORKSPACE MANAGER CLASS DEFINITION
+
+
+class WorkspaceManager:
+    """
+    LRU cache of owner workspaces with DAO-backed loading and eviction.
+
+    Memory use is estimated from task counts, which are refreshed each time
+    a workspace is checked out. When either the resident-owner limit or the
+    memory budget is exceeded, least recently used idle workspaces are saved
+    to their DAO and dropped. Workspaces in use are never evicted.
+
+    Without a storage directory there is nowhere to evict to, so every
+    workspace stays resident.
+    """
+
+    ESTIMATED_BYTES_PER_TASK = 1024  # Rough per-task footprint used for the memory budget
+    DIRECTORY_FILE = ".owners.csv"  # Owner file; never clashes with an owner's task file
+
+    def __init__(self, storage_dir: Optional[str] = None, dao_type: str = "csv",
+                 max_resident: Optional[int] = 1000,
+                 memory_budget_bytes: Optional[int] = None,
+                 directory: Optional[UserDirectory] = None,
+                 quotas: Optional[QuotaManager] = None) -> None:
+        """
+        Initialize the manager.
+
+        Args:
+            storage_dir (Optional[str]): Directory holding one task file per owner
+            dao_type (str): Type of DAO used for owner files ('test', 'csv')
+            max_resident (Optional[int]): Maximum number of resident owners (None for no limit)
+            memory_budget_bytes (Optional[int]): Estimated memory budget (None for no limit)
+            directory (Optional[UserDirectory]): Known owners (loaded from the
+                storage directory if None)
+            quotas (Optional[QuotaManager]): Limits applied to every owner's
+                task creation (None for no limits)
+        """
+        self.storage_dir = storage_dir
+        self.directory = directory if directory is not None else UserDirectory()
+        if directory is None and storage_dir and os.path.exists(self._directory_path()):
+            self.directory.load(UserCsvDAO(self._directory_path()))
+        self.quotas = quotas
+        self.dao_type = dao_type
+        self.max_resident = max_resident
+        self.memory_budget_bytes = memory_budget_bytes
+        self._workspaces: "OrderedDict[str, Workspace]" = OrderedDict()
+        self._registry_lock = threading.Lock()
+        self._resident_tasks = 0
+        self._metrics: Dict[str, int] = {"hits": 0, "misses": 0, "evictions": 0, "eviction_failures": 0}
+
+    @staticmethod
+    def normalize_email(email: str) -> str:
+        """Normalize an email address for use as a workspace key."""
+        return email.strip().lower()
+
+    def validate_email(self, email: str) -> str:
+        """
+        Normalize an owner email and check that it can name a task file.
+
+        Args:
+            email (str): Owner email, in any case
+
+        Returns:
+            str: The normalized email
+
+        Raises:
+            ValueError: If the email is empty or could escape the storage directory
+        """
+        normalized = self.normalize_email(email)
+        if (not normalized or os.sep in normalized or (os.altsep and os.altsep in normalized)
+                or normalized.startswith(".")):
+            raise ValueError(f"Invalid owner email '{email}'")
+        return normalized
+
+    def storage_path(self, email: str) -> str:
+        """
+        Get the file used to persist an owner's tasks.
+
+        Args:
+            email (str): Normalized owner email
+
+        Returns:
+            str: Path inside the storage directory
+
+        Raises:
+            ValueError: If the email could escape the storage directory
+        """
+        return os.path.join(self.storage_dir, f"{self.validate_email(email)}.csv")
+
+    def _directory_path(self) -> str:
+        """Get the file used to persist the user directory."""
+        return os.path.join(self.storage_dir, self.DIRECTORY_FILE)
+
+    def save_directory(self) -> bool:
+        """
+        Persist the user directory next to the owners' task files.
+
+        Returns:
+            bool: True if there is a storage directory to save to
+
+        Raises:
+            OSError: If the directory file cannot be written
+        """
+        if not self.storage_dir:
+            return False
+        self.directory.save(UserCsvDAO(self._directory_path()))
+        return True
+
+    def _load_controller(self, owner: Owner) -> TaskManagerController:
+        """Create an owner's controller and load its tasks from storage."""
+        controller = TaskManagerController(owner, announce=False, string_pool=StringPool())
+        controller.enable_quotas(self.quotas)
+        if self.storage_dir:
+            success, message = controller.load_tasks_from_dao(self.storage_path(owner.email), self.dao_type)
+            if not success:
+                raise ValueError(message)
+        return controller
+
+    def _load_into(self, email: str, owner: Owner, workspace: Workspace) -> None:
+        """
+        Load an owner's controller into a registered placeholder whose lock the caller holds.
+
+        The registry lock is not held, so other owners' checkouts proceed while
+        the file is read; checkouts of the same owner wait on the workspace lock.
+        If the load fails the placeholder is dropped and marked evicted, so
+        those waiters try the load again themselves.
+        """
+        try:
+            workspace.controller = self._load_controller(owner)
+        except BaseException:
+            with self._registry_lock:
+                if self._workspaces.get(email) is workspace:
+                    del self._workspaces[email]
+                workspace.evicted = True
+            workspace.lock.release()
+            raise
+        task_count = len(workspace.controller.task_list.tasks)
+        with self._registry_lock:
+            workspace.task_count = task_count
+            self._resident_tasks += task_count
+
+    @contextlib.contextmanager
+    def checkout(self, owner: Union[Owner, str]) -> Iterator[TaskManagerController]:
+        """
+        Use an owner's controller exclusively, loading it if not resident.
+
+        Args:
+            owner (Union[Owner, str]): Owner whose workspace is needed, or their
+                email (unknown emails are registered in the directory)
+
+        Yields:
+            TaskManagerController: The owner's controller
+
+        Raises:
+            ValueError: If the email cannot name a task file, or loading fails
+        """
+        email = self.validate_email(owner if isinstance(owner, str) else owner.email)
+        if isinstance(owner, str):
+            owner = self.directory.get_or_create(email)
+        else:
+            owner = self.directory.register_if_absent(owner)
+
+        while True:
+            with self._registry_lock:
+                workspace = self._workspaces.get(email)
+                loading = workspace is None
+                if loading:
+                    self._metrics["misses"] += 1
+                    workspace = self._workspaces[email] = Workspace()
+                    workspace.lock.acquire()  # Uncontended: nobody else has seen the placeholder yet
+                else:
+                    self._metrics["hits"] += 1
+                    self._workspaces.move_to_end(email)
+
+            if loading:
+                self._load_into(email, owner, workspace)
+                break
+            workspace.lock.acquire()
+            if not workspace.evicted:
+                break
+            # Evicted, or its load failed, between lookup and lock: try again
+            workspace.lock.release()
+
+        try:
+            yield workspace.controller
+        finally:
+            new_count = len(workspace.controller.task_list.tasks)
+            with self._registry_lock:
+                self._resident_tasks += new_count - workspace.task_count
+                workspace.task_count = new_count
+            workspace.lock.release()
+            self._enforce_limits()
+
+    def _over_limits(self) -> bool:
+        """Check whether the resident set exceeds the owner limit or memory budget."""
+        if self.max_resident is not None and len(self._workspaces) > self.max_resident:
+            return True
+        if self.memory_budget_bytes is not None:
+            return self.estimated_bytes() > self.memory_budget_bytes
+        return False
+
+    def _enforce_limits(self) -> None:
+        """Evict least recently used idle workspaces until within limits."""
+        if not self.storage_dir:
+            return
+
+        with self._registry_lock:
+            if not self._over_limits():
+                return
+            candidates = list(self._workspaces.items())
+
+        for email, workspace in candidates:
+            with self._registry_lock:
+                # Keep at least the most recently used workspace resident
+                if not self._over_limits() or len(self._workspaces) <= 1:
+                    return
+            if workspace.lock.acquire(blocking=False):  # Skip workspaces in use
+                try:
+                    self._evict_locked(email, workspace)
+                finally:
+                    workspace.lock.release()
+
+    def _evict_locked(self, email: str, workspace: Workspace) -> bool:
+        """Save and drop a workspace whose lock the caller holds."""
+        # A stale reference must never overwrite a newer save of the same owner
+        with self._registry_lock:
+            if workspace.evicted or self._workspaces.get(email) is not workspace:
+                return False
+
+        success, _ = workspace.controller.save_tasks_to_dao()
+        with self._registry_lock:
+            if not success:
+                self._metrics["eviction_failures"] += 1
+                return False
+            del self._workspaces[email]
+            self._resident_tasks -= workspace.task_count
+            workspace.evicted = True
+            self._metrics["evictions"] += 1
+        workspace.controller.close(flush=False)  # Already saved; stop its forecaster and trackers
+        return True
+
+    def evict(self, email: str) -> bool:
+        """
+        Save and drop one owner's workspace, waiting if it is in use.
+
+        Args:
+            email (str): Owner email
+
+        Returns:
+            bool: True if the workspace was evicted
+        """
+        email = self.normalize_email(email)
+        with self._registry_lock:
+            workspace = self._workspaces.get(email)
+        if workspace is None or not self.storage_dir:
+            return False
+        with workspace.lock:
+            return self._evict_locked(email, workspace)
+
+    def flush_all(self) -> int:
+        """
+        Save every resident workspace without evicting it, then the user directory.
+
+        The workspaces are saved first, so a directory that cannot be
+        written does not also cost the owners' task changes.
+
+        Returns:
+            int: Number of workspaces saved successfully
+
+        Raises:
+            OSError: If the directory file cannot be written
+        """
+        if not self.storage_dir:
+            return 0
+        with self._registry_lock:
+            workspaces = list(self._workspaces.values())
+        saved = 0
+        for workspace in workspaces:
+            with workspace.lock:
+                if not workspace.evicted and workspace.controller.save_tasks_to_dao()[0]:
+                    saved += 1
+        self.save_directory()
+        return saved
+
+    def estimated_bytes(self) -> int:
+        """Get the estimated memory used by resident task lists."""
+        return self._resident_tasks * self.ESTIMATED_BYTES_PER_TASK
+
+    def resident_count(self) -> int:
+        """Get the number of resident workspaces."""
+        with self._registry_lock:
+            return len(self._workspaces)
+
+    def get_metrics(self) -> Dict[str, int]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dict[str, int]: Hits, misses, evictions, eviction failures, resident owners,
+            resident tasks and estimated bytes
+        """
+        with self._registry_lock:
+            metrics = dict(self._metrics)
+            metrics["resident_owners"] = len(self._workspaces)
+            metrics["resident_tasks"] = self._resident_tasks
+        metrics["estimated_bytes"] = self.estimated_bytes()
+        return metrics